@@ -93,6 +93,10 @@ def main():
             from . import actions
             actions.parse_signals(signals)
 
+        # write pending batch archive entries when getting terminated
+        from . import archive
+        archive.signals_install()
+
         # enable ANSI escape sequences on Windows
         if util.WINDOWS and config.get(("output",), "ansi", output.COLORS):
             from ctypes import windll, wintypes, byref
@@ -157,6 +161,12 @@ def main():
 
             log.debug("Configuration Files %s", config._files)
 
+            import atexit
+            from . import cache
+            from .extractor import common
+            atexit.register(cache.log_stats)
+            atexit.register(common.log_connection_stats)
+
         if args.clear_cache:
             from . import cache
             log = logging.getLogger("cache")
@@ -170,6 +180,11 @@ def main():
                      cnt, "y" if cnt == 1 else "ies", cache._path())
             return 0
 
+        if args.archive_daemon:
+            from . import archive
+            return archive.serve(*args.archive_daemon, config.get(
+                ("extractor",), "archive-pragma"))
+
         if args.config:
             if args.config == "init":
                 return config.initialize()
@@ -238,7 +253,7 @@ def main():
             fmt = ("{}{}\nCategory: {} - Subcategory: {}"
                    "\nExample : {}\n\n").format
 
-            extractors = extractor.extractors()
+            extractors = extractor.registry()
             if args.list_extractors:
                 fltr = util.build_extractor_filter(
                     args.list_extractors, negate=False)
@@ -246,8 +261,8 @@ def main():
 
             for extr in extractors:
                 write(fmt(
-                    extr.__name__,
-                    "\n" + extr.__doc__ if extr.__doc__ else "",
+                    extr.name,
+                    "\n" + extr.doc if extr.doc else "",
                     extr.category, extr.subcategory,
                     extr.example,
                 ))
@@ -332,6 +347,15 @@ def main():
                 common.CATEGORY_MAP = catmap
 
             # process input URLs
+            if args.jobs > 1:
+                # only write complete lines to prevent output
+                # of concurrent jobs from getting interleaved
+                config.set(("downloader",), "progress", None)
+                if config.get(("output",), "mode") in (None, "auto"):
+                    config.set(("output",), "mode", "pipe")
+                return process_concurrent(
+                    jobtype, input_manager, args.jobs, log)
+
             retval = 0
             for url in input_manager:
                 try:
@@ -376,6 +400,82 @@ def main():
     return 1
 
 
+def process_concurrent(jobtype, input_manager, workers, log):
+    """Run jobs for all input URLs with up to 'workers' at the same time"""
+    from concurrent.futures import (
+        ThreadPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED)
+
+    retval = 0
+    pending = {}
+
+    def collect(return_when):
+        nonlocal retval
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            entry = pending.pop(future)
+            try:
+                status = future.result()
+            except exception.ControlException:
+                continue
+            except exception.NoExtractorError:
+                log.error("Unsupported URL '%s'", entry[0])
+                retval |= 64
+                input_manager.error(entry)
+                continue
+
+            if status:
+                retval |= status
+                input_manager.error(entry)
+            else:
+                input_manager.success(entry)
+
+    executor = ThreadPoolExecutor(workers, "job")
+    try:
+        for url in input_manager:
+            if isinstance(url, ExtendedUrl):
+                # URL-specific options modify the global config;
+                # wait for all other jobs to finish and run it on its own
+                if pending:
+                    collect(ALL_COMPLETED)
+                pending[executor.submit(
+                    _run_job, jobtype, url, log)] = input_manager.entry()
+                collect(ALL_COMPLETED)
+            else:
+                while len(pending) >= workers:
+                    collect(FIRST_COMPLETED)
+                pending[executor.submit(
+                    _run_job, jobtype, url, log)] = input_manager.entry()
+            input_manager.next()
+
+        while pending:
+            collect(ALL_COMPLETED)
+    except BaseException:
+        # cancel jobs that have not been started yet
+        # and let all running ones terminate early
+        # ('cancel_futures' for 'shutdown()' requires Python 3.9)
+        for future in pending:
+            future.cancel()
+        util.FLAGS.terminate()
+        raise
+    finally:
+        executor.shutdown(wait=False)
+    return retval
+
+
+def _run_job(jobtype, url, log):
+    while True:
+        log.debug("Starting %s for '%s'", jobtype.__name__, url)
+        try:
+            if isinstance(url, ExtendedUrl):
+                for opts in url.gconfig:
+                    config.set(*opts)
+                with config.apply(url.lconfig):
+                    return jobtype(url.value).run()
+            return jobtype(url).run()
+        except exception.RestartExtraction:
+            log.debug("Restarting '%s'", url)
+
+
 class InputManager():
 
     def __init__(self):
@@ -519,25 +619,31 @@ class InputManager():
     def next(self):
         self._index += 1
 
-    def success(self):
-        if self._item:
-            self._rewrite()
+    def entry(self):
+        """Return the current input URL and its input file data"""
+        return self._url, self._item
+
+    def success(self, entry=None):
+        item = self._item if entry is None else entry[1]
+        if item:
+            self._rewrite(item)
 
-    def error(self):
+    def error(self, entry=None):
         if self.err:
-            if self._item:
-                url, path, action, indicies = self._item
+            url, item = self.entry() if entry is None else entry
+            if item:
+                url, path, action, indicies = item
                 lines = self.files[path]
                 out = "".join(lines[i] for i in indicies)
                 if out and out[-1] == "\n":
                     out = out[:-1]
-                self._rewrite()
+                self._rewrite(item)
             else:
-                out = str(self._url)
+                out = str(url)
             self.err.info(out)
 
-    def _rewrite(self):
-        url, path, action, indicies = self._item
+    def _rewrite(self, item):
+        url, path, action, indicies = item
         lines = self.files[path]
         action(lines, indicies)
         try:
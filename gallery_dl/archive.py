@@ -9,20 +9,40 @@
 """Download Archives"""
 
 import os
+import math
+import time
+import struct
+import hashlib
+import weakref
 import logging
-from . import util, formatter
+import threading
+from . import text, util, formatter
 
 log = logging.getLogger("archive")
 
 
 def connect(path, prefix, format,
-            table=None, mode=None, pragma=None, kwdict=None, cache_key=None):
+            table=None, mode=None, pragma=None, kwdict=None, cache_key=None,
+            filter=None):
     keygen = formatter.parse(prefix + format).format_map
 
-    if isinstance(path, str) and path.startswith(
+    if mode and mode.startswith("batch"):
+        mode, _, args = mode.partition(":")
+        size, _, interval = args.partition(":")
+        batch = (text.parse_int(size, None), text.parse_float(interval, None))
+
+    if isinstance(path, str) and path.startswith("unix:"):
+        path = util.expand_path(path[5:])
+        if kwdict is not None and "{" in path:
+            path = formatter.parse(path).format_map(kwdict)
+        cls = DownloadArchiveDaemon
+        mode = filter = None  # the daemon already holds all entries in memory
+    elif isinstance(path, str) and path.startswith(
             ("postgres://", "postgresql://")):
         if mode == "memory":
             cls = DownloadArchivePostgresqlMemory
+        elif mode == "batch":
+            cls = DownloadArchivePostgresqlBatch
         else:
             cls = DownloadArchivePostgresql
     else:
@@ -31,13 +51,32 @@ def connect(path, prefix, format,
             path = formatter.parse(path).format_map(kwdict)
         if mode == "memory":
             cls = DownloadArchiveMemory
+        elif mode == "batch":
+            cls = DownloadArchiveBatch
         else:
             cls = DownloadArchive
 
     if kwdict is not None and table:
         table = formatter.parse(table).format_map(kwdict)
 
-    return cls(path, keygen, table, pragma, cache_key)
+    if mode == "batch":
+        archive = cls(path, keygen, table, pragma, cache_key, *batch)
+    else:
+        archive = cls(path, keygen, table, pragma, cache_key)
+
+    if filter:
+        if isinstance(filter, str):
+            filter = util.expand_path(filter)
+            if kwdict is not None and "{" in filter:
+                filter = formatter.parse(filter).format_map(kwdict)
+        else:
+            filter = None
+        try:
+            _filter_apply(archive, (path, table, filter), filter)
+        except Exception as exc:
+            log.warning("Failed to set up archive filter (%s: %s)",
+                        exc.__class__.__name__, exc)
+    return archive
 
 
 def sanitize(name):
@@ -75,6 +114,7 @@ class DownloadArchive():
         self._stmt_insert = (
             f"INSERT OR IGNORE INTO {table} "
             f"(entry) VALUES (?)")
+        self._table = table
 
         if pragma:
             for stmt in pragma:
@@ -102,6 +142,34 @@ class DownloadArchive():
     def finalize(self):
         pass
 
+    def count(self):
+        """Return the number of archive entries"""
+        return self.connection.execute(
+            f"SELECT count(*) FROM {self._table}").fetchone()[0]
+
+    def entries(self):
+        """Yield all archive entries"""
+        for entry, in self.connection.execute(
+                f"SELECT entry FROM {self._table}"):
+            yield entry
+
+    def watermark(self, key):
+        """Return the high-water mark stored for 'key'"""
+        try:
+            row = self.connection.execute(
+                "SELECT value FROM watermark WHERE key=?", (key,)).fetchone()
+        except self._sqlite3.OperationalError:
+            return None  # no 'watermark' table
+        return util.json_loads(row[0]) if row else None
+
+    def watermark_update(self, key, value):
+        """Set the high-water mark for 'key' to 'value'"""
+        con = self.connection
+        con.execute("CREATE TABLE IF NOT EXISTS watermark "
+                    "(key TEXT PRIMARY KEY, value TEXT)")
+        con.execute("INSERT OR REPLACE INTO watermark VALUES (?,?)",
+                    (key, util.json_dumps(value)))
+
 
 class DownloadArchiveMemory(DownloadArchive):
 
@@ -141,6 +209,60 @@ class DownloadArchiveMemory(DownloadArchive):
                 cursor.executemany(stmt, ((key,) for key in self.keys))
 
 
+class BatchMixin():
+    """Write archive entries in batches of up to 'size' entries
+    or after 'interval' seconds, whichever comes first"""
+
+    def _init_batch(self, size, interval):
+        self._batch_size = size or 1000
+        self._batch_interval = 10.0 if interval is None else interval
+        self._batch_time = time.monotonic() + self._batch_interval
+        # entries might get flushed by another thread after a signal
+        self._batch_lock = threading.RLock()
+        self.close = self._close
+        _batch_register(self)
+
+    def add(self, kwdict):
+        key = kwdict.get(self._cache_key) or self.keygen(kwdict)
+        with self._batch_lock:
+            self.keys.add(key)
+            if len(self.keys) >= self._batch_size or \
+                    time.monotonic() >= self._batch_time:
+                self.flush()
+
+    def check(self, kwdict):
+        with self._batch_lock:
+            return self._check(kwdict)
+
+    def flush(self):
+        """Write all pending entries"""
+        with self._batch_lock:
+            if self.keys:
+                self._write_keys()
+                self.keys.clear()
+            self._batch_time = time.monotonic() + self._batch_interval
+
+    finalize = flush
+
+    def _close(self):
+        _batch_archives.discard(self)
+        try:
+            self.flush()
+        finally:
+            self.connection.close()
+
+
+class DownloadArchiveBatch(BatchMixin, DownloadArchiveMemory):
+    _check = DownloadArchiveMemory.check
+    _write_keys = DownloadArchiveMemory.finalize
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None,
+                 size=None, interval=None):
+        DownloadArchiveMemory.__init__(
+            self, path, keygen, table, pragma, cache_key)
+        self._init_batch(size, interval)
+
+
 class DownloadArchivePostgresql():
     _psycopg = None
 
@@ -164,6 +286,7 @@ class DownloadArchivePostgresql():
             f"INSERT INTO {table} (entry) "
             f"VALUES (%s) "
             f"ON CONFLICT DO NOTHING")
+        self._table = table
 
         try:
             cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} "
@@ -199,6 +322,54 @@ class DownloadArchivePostgresql():
     def finalize(self):
         pass
 
+    def count(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {self._table}")
+            count = cursor.fetchone()[0]
+        self.connection.commit()
+        return count
+
+    def entries(self):
+        # use a server-side cursor to avoid loading all rows at once
+        con = self.connection
+        try:
+            with con.cursor(name="gallery_dl_archive_entries") as cursor:
+                cursor.itersize = 10000
+                cursor.execute(f"SELECT entry FROM {self._table}")
+                for entry, in cursor:
+                    yield entry
+        finally:
+            con.commit()
+
+    def watermark(self, key):
+        con = self.connection
+        try:
+            with con.cursor() as cursor:
+                cursor.execute(
+                    "SELECT value FROM watermark WHERE key=%s", (key,))
+                row = cursor.fetchone()
+        except Exception:
+            con.rollback()
+            return None  # no 'watermark' table
+        con.commit()
+        return util.json_loads(row[0]) if row else None
+
+    def watermark_update(self, key, value):
+        con = self.connection
+        try:
+            with con.cursor() as cursor:
+                cursor.execute("CREATE TABLE IF NOT EXISTS watermark "
+                               "(key TEXT PRIMARY KEY, value TEXT)")
+                cursor.execute(
+                    "INSERT INTO watermark VALUES (%s, %s) "
+                    "ON CONFLICT (key) DO UPDATE SET value=EXCLUDED.value",
+                    (key, util.json_dumps(value)))
+            con.commit()
+        except Exception as exc:
+            log.error("%s: %s when writing high-water mark: %s",
+                      con, exc.__class__.__name__, exc)
+            con.rollback()
+
 
 class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
 
@@ -237,3 +408,584 @@ class DownloadArchivePostgresqlMemory(DownloadArchivePostgresql):
             log.error("%s: %s when writing entries: %s",
                       self.connection, exc.__class__.__name__, exc)
             self.connection.rollback()
+
+
+class DownloadArchivePostgresqlBatch(
+        BatchMixin, DownloadArchivePostgresqlMemory):
+    _check = DownloadArchivePostgresqlMemory.check
+    _write_keys = DownloadArchivePostgresqlMemory.finalize
+
+    def __init__(self, uri, keygen, table=None, pragma=None, cache_key=None,
+                 size=None, interval=None):
+        DownloadArchivePostgresqlMemory.__init__(
+            self, uri, keygen, table, pragma, cache_key)
+        self._init_batch(size, interval)
+
+
+class DownloadArchiveDaemon():
+    """Archive client for an archive daemon listening on a Unix socket
+
+    Entries added with 'add()' get buffered and sent together with
+    the next 'check()' request, without waiting for a response.
+    """
+    _socket = None
+    BUFFER = 100
+
+    def __init__(self, path, keygen, table=None, pragma=None, cache_key=None):
+        if self._socket is None:
+            DownloadArchiveDaemon._socket = __import__("socket")
+
+        sock = self._socket.socket(self._socket.AF_UNIX)
+        try:
+            sock.connect(path)
+        except Exception:
+            sock.close()
+            raise
+        self.connection = sock
+        self.keygen = keygen
+        self.keys = []
+        self._rfile = sock.makefile("rb")
+        self._cache_key = cache_key or "_archive_key"
+        self._path = path
+        self._table = self._request({"table": table})["table"]
+
+    def add(self, kwdict):
+        self.keys.append(
+            kwdict.get(self._cache_key) or
+            self.keygen(kwdict))
+        if len(self.keys) >= self.BUFFER:
+            try:
+                self.connection.sendall(self._pop_keys())
+            except OSError as exc:
+                log.error("%s: %s when writing entries: %s",
+                          self._path, exc.__class__.__name__, exc)
+
+    def check(self, kwdict):
+        key = kwdict[self._cache_key] = self.keygen(kwdict)
+        try:
+            return self._request(("check", key))[0]
+        except Exception as exc:
+            log.error("%s: %s when checking entry: %s",
+                      self._path, exc.__class__.__name__, exc)
+            return False
+
+    def finalize(self):
+        """Wait until all entries are written to disk"""
+        try:
+            if not self._request(("sync",)):
+                log.warning("%s: Timeout when waiting for entries "
+                            "to get written", self._path)
+        except Exception as exc:
+            log.error("%s: %s when writing entries: %s",
+                      self._path, exc.__class__.__name__, exc)
+
+    def close(self):
+        try:
+            if self.keys:
+                self.finalize()
+        finally:
+            self._rfile.close()
+            self.connection.close()
+
+    def count(self):
+        """Return the number of archive entries"""
+        return self._request(("count",))
+
+    def _pop_keys(self):
+        if not self.keys:
+            return b""
+        data = _daemon_encode(("add", *self.keys))
+        self.keys.clear()
+        return data
+
+    def _request(self, message):
+        self.connection.sendall(self._pop_keys() + _daemon_encode(message))
+        if not (line := self._rfile.readline()):
+            raise ConnectionError("Connection closed by archive daemon")
+        result = util.json_loads(line.decode())
+        if isinstance(result, dict) and "error" in result:
+            raise ValueError(result["error"])
+        return result
+
+
+# --------------------------------------------------------------------
+# probabilistic membership filter
+
+class BloomFilter():
+    """Set-like structure with false positives but no false negatives"""
+    MAGIC = b"GDL-BLOOM-1\n"
+
+    def __init__(self, capacity, error_rate=0.001, bits=None, hashes=None):
+        capacity = max(capacity, 1024)
+        if bits is None:
+            bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+            bits = (bits + 7) // 8 * 8
+        if hashes is None:
+            hashes = max(1, round(bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.bits = bits
+        self.hashes = hashes
+        self.data = bytearray(bits // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def add(self, key):
+        data = self.data
+        for pos in self._positions(key):
+            data[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        data = self.data
+        for pos in self._positions(key):
+            if not data[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def save(self, path, count):
+        """Write filter data to 'path', tagged with an entry 'count'"""
+        header = struct.pack("<QQQI", count, self.capacity,
+                             self.bits, self.hashes)
+        temp = path + ".part"
+        with open(temp, "wb") as fp:
+            fp.write(self.MAGIC)
+            fp.write(header)
+            fp.write(self.data)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Return entry count and filter stored in 'path'"""
+        with open(path, "rb") as fp:
+            if fp.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError("invalid file header")
+            count, capacity, bits, hashes = struct.unpack(
+                "<QQQI", fp.read(struct.calcsize("<QQQI")))
+            self = cls(capacity, bits=bits, hashes=hashes)
+            if fp.readinto(self.data) != len(self.data):
+                raise ValueError("truncated file")
+        return count, self
+
+
+class ArchiveFilter():
+    """Bloom filter shared by all archives of the same file and table"""
+
+    def __init__(self, bloom, count, path=None):
+        self.bloom = bloom
+        self.count = count
+        self.path = path
+        self.added = set()
+        self.users = 0
+        self.changed = False
+        self.lock = threading.Lock()
+
+    def add(self, key):
+        with self.lock:
+            if key not in self.added:
+                self.bloom.add(key)
+                self.added.add(key)
+                self.changed = True
+
+    def release(self):
+        """Store the filter after its last user is done and it changed"""
+        with self.lock:
+            self.users -= 1
+            if self.users or not self.changed or not self.path:
+                return
+            self.changed = False
+            # store it together with the number of entries
+            # it is known to contain; entries written by other processes
+            # in the meantime result in a mismatch and a rebuild on next use
+            total = self.count + len(self.added)
+            if total > self.bloom.capacity:
+                return
+            try:
+                self.bloom.save(self.path, total)
+            except Exception as exc:
+                log.warning("Failed to update archive filter at '%s' "
+                            "(%s: %s)", self.path, exc.__class__.__name__, exc)
+
+
+def _filter_load(archive, path=None):
+    """Return a filter for all entries of 'archive'"""
+    count = archive.count()
+
+    if path:
+        try:
+            stored, bloom = BloomFilter.load(path)
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            log.warning("Failed to load archive filter from '%s' (%s: %s)",
+                        path, exc.__class__.__name__, exc)
+        else:
+            if stored == count and count <= bloom.capacity:
+                return ArchiveFilter(bloom, count, path)
+            log.debug("Archive filter at '%s' is out of date", path)
+
+    # leave room for entries added in the meantime
+    bloom = BloomFilter(count * 2)
+    add = bloom.add
+    for entry in archive.entries():
+        add(entry)
+    if path:
+        try:
+            bloom.save(path, count)
+        except OSError as exc:
+            log.warning("Failed to write archive filter to '%s' (%s: %s)",
+                        path, exc.__class__.__name__, exc)
+    log.debug("Built archive filter for %s entries", count)
+    return ArchiveFilter(bloom, count, path)
+
+
+def _filter_apply(archive, key, path=None):
+    """Answer 'archive.check()' calls for new entries without a query
+
+    Filters are built once per process for each archive file and table,
+    and are shared by all archives opened for them, e.g. by child jobs.
+    """
+    with _filters_lock:
+        if (shared := _filters.get(key)) is None:
+            shared = _filters[key] = _filter_load(archive, path)
+        shared.users += 1
+
+    bloom = shared.bloom
+    check_orig = archive.check
+    add_orig = archive.add
+    close_orig = archive.close
+
+    def check(kwdict):
+        key = archive.keygen(kwdict)
+        if key not in bloom:
+            kwdict[archive._cache_key] = key
+            return False
+        return check_orig(kwdict)
+
+    def add(kwdict):
+        key = kwdict.get(archive._cache_key) or archive.keygen(kwdict)
+        shared.add(key)
+        add_orig(kwdict)
+
+    def close():
+        close_orig()
+        shared.release()
+
+    archive.check = check
+    archive.add = add
+    archive.close = close
+    archive.filter = bloom
+
+
+_filters = {}
+_filters_lock = threading.Lock()
+
+
+# --------------------------------------------------------------------
+# flush pending batch entries when getting terminated by a signal
+
+_batch_archives = weakref.WeakSet()
+_batch_handlers = None
+
+
+def signals_install():
+    """Install handlers for flushing batch archives on SIGTERM and SIGHUP
+
+    Needs to be called from the main thread.
+    """
+    global _batch_handlers
+    if _batch_handlers is not None:
+        return
+
+    import signal
+    _batch_handlers = {}
+    for name in ("SIGTERM", "SIGHUP"):
+        if signum := getattr(signal, name, None):
+            try:
+                _batch_handlers[signum] = signal.signal(signum, _batch_signal)
+            except (OSError, ValueError):
+                pass
+
+
+def _batch_register(archive):
+    _batch_archives.add(archive)
+    if _batch_handlers is None and \
+            threading.current_thread() is threading.main_thread():
+        # not started by 'main()'
+        signals_install()
+
+
+def _batch_signal(signum, frame):
+    # the interrupted code might be in the middle of writing entries;
+    # write them from another thread once it is done
+    import signal
+    handler = _batch_handlers.get(signum)
+    if callable(handler):
+        threading.Thread(
+            target=_batch_flush, name="archive-signal", daemon=True).start()
+        return handler(signum, frame)
+
+    if handler != signal.SIG_IGN:
+        # terminate like without custom handler after flushing,
+        # or right away on a second signal
+        signal.signal(signum, signal.SIG_DFL)
+    else:
+        signum = None
+    threading.Thread(
+        target=_batch_flush, args=(signum,),
+        name="archive-signal", daemon=True).start()
+
+
+def _batch_flush(signum=None):
+    for archive in tuple(_batch_archives):
+        try:
+            archive.flush()
+        except Exception as exc:
+            log.error("Failed to write archive entries (%s: %s)",
+                      exc.__class__.__name__, exc)
+    if signum is not None:
+        os.kill(os.getpid(), signum)
+
+
+# --------------------------------------------------------------------
+# archive daemon
+
+def _daemon_encode(message):
+    return (util.json_dumps(message) + "\n").encode()
+
+
+class ArchiveDaemon():
+    """Share an SQLite archive file between processes
+
+    Clients connect over a Unix socket and send one JSON message per line:
+
+    {"table": TABLE}       select table, reply {"table": NAME, "count": N}
+    ["check", KEY, ...]    reply [true|false, ...]
+    ["add", KEY, ...]      no reply
+    ["sync"]               reply true once all entries are written
+    ["count"]              reply number of entries in the selected table
+
+    All entries are kept in memory and get written
+    in batches of up to 'size' entries or every 'interval' seconds.
+    """
+
+    def __init__(self, path, pragma=None, size=1000, interval=1.0):
+        import sqlite3
+        import threading
+
+        try:
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        except sqlite3.OperationalError:
+            os.makedirs(os.path.dirname(path))
+            con = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        con.isolation_level = None
+        if pragma:
+            for stmt in pragma:
+                con.execute(f"PRAGMA {stmt}")
+
+        self.path = path
+        self.size = size
+        self.interval = interval
+        self.connection = con
+        self.tables = {}
+        self.pending = []
+        self.queued = self.written = 0
+        self.closed = self.syncing = False
+        self._sqlite3 = sqlite3
+        self._lock_db = threading.Lock()
+        self._cond = cond = threading.Condition()
+        self._wait = cond.wait_for
+        self._writer = threading.Thread(
+            target=self._write_loop, name="archive-writer", daemon=True)
+        self._writer.start()
+
+    def table(self, name):
+        """Return the set of all entries of table 'name'"""
+        table = "archive" if name is None else sanitize(name)
+        try:
+            return table, self.tables[table]
+        except KeyError:
+            pass
+
+        with self._lock_db:
+            if table in self.tables:
+                return table, self.tables[table]
+
+            con = self.connection
+            try:
+                con.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                            f"(entry TEXT PRIMARY KEY) WITHOUT ROWID")
+            except self._sqlite3.OperationalError:
+                con.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                            f"(entry TEXT PRIMARY KEY)")
+            keys = self.tables[table] = {
+                entry for entry, in con.execute(f"SELECT entry FROM {table}")}
+            log.info("Loaded %s entries from table %s", len(keys), table)
+        return table, keys
+
+    def add(self, table, keys, entries):
+        """Add 'entries' to the 'keys' set of 'table'"""
+        with self._cond:
+            pending = self.pending
+            count = len(pending)
+            for entry in entries:
+                if entry not in keys:
+                    keys.add(entry)
+                    pending.append((table, entry))
+            self.queued += len(pending) - count
+            if not count or len(pending) >= self.size:
+                self._cond.notify_all()
+
+    def sync(self, timeout=60.0):
+        """Wait until all currently pending entries are written"""
+        with self._cond:
+            target = self.queued
+            if self.written >= target:
+                return True
+            self.syncing = True
+            self._cond.notify_all()
+            return self._wait(lambda: self.written >= target, timeout)
+
+    def close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self.connection.close()
+
+    def _write_loop(self):
+        cond = self._cond
+        while True:
+            with cond:
+                self._wait(lambda: self.pending or self.closed)
+                if not self.closed:
+                    self._wait(lambda: (self.closed or self.syncing or
+                                        len(self.pending) >= self.size),
+                               self.interval)
+                pending = self.pending
+                self.pending = []
+                self.syncing = False
+                if not pending:
+                    return
+
+            try:
+                self._write(pending)
+            except Exception as exc:
+                log.error("Failed to write %s entries (%s: %s)",
+                          len(pending), exc.__class__.__name__, exc)
+                with cond:
+                    self.pending[:0] = pending
+                    closed = self.closed
+                if closed:
+                    return
+                time.sleep(self.interval)
+            else:
+                with cond:
+                    self.written += len(pending)
+                    cond.notify_all()
+
+    def _write(self, pending):
+        tables = {}
+        for table, entry in pending:
+            try:
+                tables[table].append((entry,))
+            except KeyError:
+                tables[table] = [(entry,)]
+
+        with self._lock_db, self.connection as con:
+            con.execute("BEGIN")
+            for table, entries in tables.items():
+                con.executemany(
+                    f"INSERT OR IGNORE INTO {table} (entry) VALUES (?)",
+                    entries)
+        log.debug("Wrote %s entries", len(pending))
+
+    def handle(self, sock):
+        """Process requests from a client connection"""
+        rfile = sock.makefile("rb")
+        table = keys = None
+        try:
+            for line in rfile:
+                message = util.json_loads(line.decode())
+
+                if isinstance(message, dict):
+                    table, keys = self.table(message.get("table"))
+                    result = {"table": table, "count": len(keys)}
+                elif keys is None:
+                    result = {"error": "No table selected"}
+                else:
+                    cmd = message[0]
+                    if cmd == "add":
+                        self.add(table, keys, message[1:])
+                        continue
+                    elif cmd == "check":
+                        result = [entry in keys for entry in message[1:]]
+                    elif cmd == "sync":
+                        result = self.sync()
+                    elif cmd == "count":
+                        result = len(keys)
+                    else:
+                        result = {"error": f"Unknown command '{cmd}'"}
+                sock.sendall(_daemon_encode(result))
+        except Exception as exc:
+            log.debug("Client connection error (%s: %s)",
+                      exc.__class__.__name__, exc)
+        finally:
+            rfile.close()
+            sock.close()
+
+    def serve(self, address):
+        """Accept client connections on Unix socket 'address'"""
+        import socket
+        import threading
+
+        server = socket.socket(socket.AF_UNIX)
+        try:
+            server.bind(address)
+        except OSError:
+            # remove a stale socket file of a previous daemon
+            probe = socket.socket(socket.AF_UNIX)
+            try:
+                probe.connect(address)
+            except ConnectionRefusedError:
+                os.unlink(address)
+            else:
+                raise
+            finally:
+                probe.close()
+            server.bind(address)
+
+        log.info("Listening on %s", address)
+        try:
+            server.listen(64)
+            while True:
+                sock, _ = server.accept()
+                threading.Thread(
+                    target=self.handle, args=(sock,), daemon=True).start()
+        finally:
+            server.close()
+            try:
+                os.unlink(address)
+            except OSError:
+                pass
+
+
+def serve(address, path, pragma=None):
+    """Run an archive daemon for 'path' until interrupted"""
+    import signal
+    import threading
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    daemon = ArchiveDaemon(util.expand_path(path), pragma)
+    try:
+        daemon.serve(util.expand_path(address))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
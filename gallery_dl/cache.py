@@ -12,7 +12,11 @@ import sqlite3
 import pickle
 import time
 import os
+import atexit
+import logging
 import functools
+import threading
+import collections
 from . import config, util
 
 
@@ -22,6 +26,8 @@ class CacheDecorator():
         self.func = func
         self.cache = {}
         self.keyarg = keyarg
+        self.hits = self.misses = self.evictions = 0
+        _memory_caches.append(self)
 
     def __get__(self, instance, cls):
         return functools.partial(self.__call__, instance)
@@ -30,7 +36,9 @@ class CacheDecorator():
         key = "" if self.keyarg is None else args[self.keyarg]
         try:
             value = self.cache[key]
+            self.hits += 1
         except KeyError:
+            self.misses += 1
             value = self.cache[key] = self.func(*args, **kwargs)
         return value
 
@@ -58,19 +66,77 @@ class MemoryCacheDecorator(CacheDecorator):
         except KeyError:
             expires = 0
         if expires <= timestamp:
+            self.misses += 1
             value = self.func(*args, **kwargs)
             expires = timestamp + self.maxage
             self.cache[key] = value, expires
+        else:
+            self.hits += 1
         return value
 
     def update(self, key, value):
         self.cache[key] = value, int(time.time()) + self.maxage
 
 
+class LRUCacheDecorator(CacheDecorator):
+    """In-memory cache with at most 'maxsize' entries
+
+    Evicts the least recently used entry when full
+    and entries older than 'maxage' seconds, if set.
+    """
+    def __init__(self, func, keyarg, maxage, maxsize):
+        CacheDecorator.__init__(self, func, keyarg)
+        self.cache = collections.OrderedDict()
+        self.maxage = maxage
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        key = "" if self.keyarg is None else args[self.keyarg]
+        with self._lock:
+            try:
+                value, expires = self.cache[key]
+            except KeyError:
+                pass
+            else:
+                if not expires or expires > int(time.time()):
+                    self.hits += 1
+                    self.cache.move_to_end(key)
+                    return value
+            self.misses += 1
+
+        # compute without holding the lock
+        value = self.func(*args, **kwargs)
+        self.update(key, value)
+        return value
+
+    def update(self, key, value):
+        cache = self.cache
+        expires = int(time.time()) + self.maxage if self.maxage else 0
+        with self._lock:
+            cache[key] = value, expires
+            cache.move_to_end(key)
+            while len(cache) > self.maxsize:
+                cache.popitem(False)
+                self.evictions += 1
+
+    def invalidate(self, key=""):
+        with self._lock:
+            self.cache.pop(key, None)
+
+
 class DatabaseCacheDecorator():
-    """Database cache"""
+    """Database cache
+
+    Values get computed without holding a database lock.
+    Concurrent misses for the same key wait for a single computation,
+    coordinated by a per-key lock between threads
+    and by a 'lease' entry between processes.
+    Results get written to the database by a background thread.
+    """
     db = None
     _init = True
+    LEASE = 60
 
     def __init__(self, func, keyarg, maxage):
         self.key = f"{func.__module__}.{func.__name__}"
@@ -78,87 +144,274 @@ class DatabaseCacheDecorator():
         self.cache = {}
         self.keyarg = keyarg
         self.maxage = maxage
+        self._locks = {}
 
     def __get__(self, obj, objtype):
         return functools.partial(self.__call__, obj)
 
     def __call__(self, *args, **kwargs):
         key = "" if self.keyarg is None else args[self.keyarg]
-        timestamp = int(time.time())
 
         # in-memory cache lookup
         try:
             value, expires = self.cache[key]
-            if expires > timestamp:
+            if expires > int(time.time()):
                 return value
         except KeyError:
             pass
 
-        # database lookup
-        fullkey = f"{self.key}-{key}"
-        with self.database() as db:
-            cursor = db.cursor()
+        try:
+            lock = self._locks[key]
+        except KeyError:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            timestamp = int(time.time())
             try:
-                cursor.execute("BEGIN EXCLUSIVE")
-            except sqlite3.OperationalError:
-                pass  # Silently swallow exception - workaround for Python 3.6
-            cursor.execute(
-                "SELECT value, expires FROM data WHERE key=? LIMIT 1",
-                (fullkey,),
-            )
-            result = cursor.fetchone()
-
-            if result and result[1] > timestamp:
-                value, expires = result
-                value = pickle.loads(value)
-            else:
-                value = self.func(*args, **kwargs)
-                expires = timestamp + self.maxage
-                cursor.execute(
-                    "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                    (fullkey, pickle.dumps(value), expires),
-                )
+                value, expires = self.cache[key]
+                if expires > timestamp:
+                    return value  # computed by another thread
+            except KeyError:
+                pass
+
+            # database lookup
+            fullkey = f"{self.key}-{key}"
+            self.database()
+            delay = 0.1
+            while True:
+                if result := _load(fullkey, timestamp):
+                    value, expires = result
+                    break
+
+                if _lease_acquire(fullkey, timestamp, self.LEASE):
+                    try:
+                        value = self.func(*args, **kwargs)
+                    except BaseException:
+                        _store(fullkey, None, True)
+                        raise
+                    expires = timestamp + self.maxage
+                    _store(fullkey, (pickle.dumps(value), expires), True)
+                    break
+
+                # wait for another process to provide a value
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+                timestamp = int(time.time())
 
-        self.cache[key] = value, expires
+            self.cache[key] = value, expires
         return value
 
     def update(self, key, value):
         expires = int(time.time()) + self.maxage
         self.cache[key] = value, expires
-        with self.database() as db:
-            db.execute(
-                "INSERT OR REPLACE INTO data VALUES (?,?,?)",
-                (f"{self.key}-{key}", pickle.dumps(value), expires),
-            )
+        self.database()
+        _store(f"{self.key}-{key}", (pickle.dumps(value), expires))
 
     def invalidate(self, key):
         try:
             del self.cache[key]
         except KeyError:
             pass
-        with self.database() as db:
-            db.execute(
-                "DELETE FROM data WHERE key=?",
-                (f"{self.key}-{key}",),
-            )
-
-    def database(self):
-        if self._init:
-            self.db.execute(
-                "CREATE TABLE IF NOT EXISTS data "
-                "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)"
-            )
-            DatabaseCacheDecorator._init = False
-        return self.db
-
-
-def memcache(maxage=None, keyarg=None):
-    if maxage:
-        def wrap(func):
+        self.database()
+        _store(f"{self.key}-{key}", None)
+
+    @classmethod
+    def database(cls):
+        if cls._init:
+            with _lock_db:
+                if DatabaseCacheDecorator._init:
+                    cls.db.execute(
+                        "CREATE TABLE IF NOT EXISTS data "
+                        "(key TEXT PRIMARY KEY, value TEXT, expires INTEGER)"
+                    )
+                    cls.db.execute(
+                        "CREATE TABLE IF NOT EXISTS lease "
+                        "(key TEXT PRIMARY KEY, owner INTEGER, "
+                        "expires INTEGER)"
+                    )
+                    DatabaseCacheDecorator._init = False
+        return cls.db
+
+
+# --------------------------------------------------------------------
+# write-behind queue
+
+_lock_db = threading.RLock()
+_cond = threading.Condition()
+_pending = {}     # key -> (value, expires) or None to delete
+_release = set()  # leases to release
+_writer = None
+_compact_next = 0
+
+WRITE_DELAY = 0.5
+COMPACT_INTERVAL = 3600
+
+
+def _load(key, timestamp):
+    """Return (value, expires) of 'key' if it exists and is not expired"""
+    with _cond:
+        if key in _pending:
+            result = _pending[key]
+        else:
+            result = False
+
+    if result is False:
+        try:
+            with _lock_db:
+                result = DatabaseCacheDecorator.db.execute(
+                    "SELECT value, expires FROM data WHERE key=? LIMIT 1",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    if result and result[1] > timestamp:
+        return pickle.loads(result[0]), result[1]
+    return None
+
+
+def _lease_acquire(key, timestamp, duration):
+    """Return True if this process may compute a value for 'key'"""
+    pid = os.getpid()
+    expires = timestamp + duration
+    db = DatabaseCacheDecorator.db
+    try:
+        with _lock_db, db:
+            if db.execute(
+                "INSERT OR IGNORE INTO lease VALUES (?,?,?)",
+                (key, pid, expires),
+            ).rowcount > 0:
+                return True
+            # take over own or expired leases
+            return db.execute(
+                "UPDATE lease SET owner=?, expires=? "
+                "WHERE key=? AND (owner=? OR expires<=?)",
+                (pid, expires, key, pid, timestamp),
+            ).rowcount > 0
+    except sqlite3.Error:
+        return True
+
+
+def _store(key, entry, release=False):
+    """Queue a write of 'entry' for 'key'"""
+    with _cond:
+        if entry is not None or not release:
+            _pending[key] = entry
+        if release:
+            _release.add(key)
+        _writer_start()
+        _cond.notify()
+
+
+def _writer_start():
+    """Start the background writer thread if necessary"""
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(
+            target=_write_loop, name="cache-writer", daemon=True)
+        _writer.start()
+        atexit.register(_write_pending)
+
+
+def _write_loop():
+    while True:
+        with _cond:
+            _cond.wait_for(lambda: _pending or _release or _http_pending)
+        time.sleep(WRITE_DELAY)
+        _write_pending()
+        _compact()
+
+
+def _write_pending():
+    """Write all queued entries to the database"""
+    global _http_size
+
+    with _cond:
+        if not _pending and not _release and \
+                not _http_pending and not _http_atime:
+            return True
+        items = tuple(_pending.items())
+        release = tuple(_release)
+        http_items = tuple(_http_pending.items())
+        http_atime = tuple(_http_atime.items())
+
+    pid = os.getpid()
+    db = DatabaseCacheDecorator.db
+    try:
+        with _lock_db, db:
+            cursor = db.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            for key, entry in items:
+                if entry is None:
+                    cursor.execute(
+                        "DELETE FROM data WHERE key=?", (key,))
+                else:
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO data VALUES (?,?,?)",
+                        (key, *entry))
+            cursor.executemany(
+                "DELETE FROM lease WHERE key=? AND owner=?",
+                [(key, pid) for key in release])
+            if http_items or http_atime:
+                _http_write(cursor, http_items, http_atime)
+    except sqlite3.Error as exc:
+        _http_size = None
+        logging.getLogger("cache").warning(
+            "Failed to write cache entries (%s: %s)",
+            exc.__class__.__name__, exc)
+        return False
+
+    with _cond:
+        for key, entry in items:
+            if key in _pending and _pending[key] is entry:
+                del _pending[key]
+        _release.difference_update(release)
+        for key, entry in http_items:
+            if key in _http_pending and _http_pending[key] is entry:
+                del _http_pending[key]
+        for key, atime in http_atime:
+            if _http_atime.get(key) == atime:
+                del _http_atime[key]
+    return True
+
+
+def _compact():
+    """Delete expired entries and reclaim unused space"""
+    global _compact_next, _http_size
+
+    timestamp = int(time.time())
+    if timestamp < _compact_next:
+        return
+    _compact_next = timestamp + COMPACT_INTERVAL
+    # recount HTTP cache sizes to include entries of other processes
+    _http_size = None
+
+    db = DatabaseCacheDecorator.db
+    try:
+        with _lock_db:
+            with db:
+                deleted = db.execute(
+                    "DELETE FROM data WHERE expires<=?", (timestamp,),
+                ).rowcount
+                db.execute(
+                    "DELETE FROM lease WHERE expires<=?", (timestamp,))
+            if deleted:
+                pages = db.execute("PRAGMA page_count").fetchone()[0]
+                free = db.execute("PRAGMA freelist_count").fetchone()[0]
+                if free > 256 and free * 4 > pages:
+                    db.execute("VACUUM")
+    except sqlite3.Error:
+        pass
+
+
+def memcache(maxage=None, keyarg=None, maxsize=None):
+    def wrap(func):
+        size = _maxsize(func, maxsize)
+        if size:
+            return LRUCacheDecorator(func, keyarg, maxage, size)
+        if maxage:
             return MemoryCacheDecorator(func, keyarg, maxage)
-    else:
-        def wrap(func):
-            return CacheDecorator(func, keyarg)
+        return CacheDecorator(func, keyarg)
     return wrap
 
 
@@ -170,32 +423,246 @@ def cache(maxage=3600, keyarg=None):
 
 def clear(module):
     """Delete database entries for 'module'"""
+    global _http_size
     db = DatabaseCacheDecorator.db
     if not db:
         return None
 
+    _write_pending()
     rowcount = 0
-    cursor = db.cursor()
 
-    try:
-        if module == "ALL":
-            cursor.execute("DELETE FROM data")
+    with _lock_db:
+        cursor = db.cursor()
+
+        try:
+            if module == "ALL":
+                cursor.execute("DELETE FROM data")
+            else:
+                cursor.execute(
+                    "DELETE FROM data "
+                    "WHERE key LIKE 'gallery_dl.extractor.' || ? || '.%'",
+                    (module.lower(),)
+                )
+        except sqlite3.OperationalError:
+            pass  # database not initialized, cannot be modified, etc.
         else:
-            cursor.execute(
-                "DELETE FROM data "
-                "WHERE key LIKE 'gallery_dl.extractor.' || ? || '.%'",
-                (module.lower(),)
-            )
-    except sqlite3.OperationalError:
-        pass  # database not initialized, cannot be modified, etc.
-    else:
-        rowcount = cursor.rowcount
-        db.commit()
-        if rowcount:
-            cursor.execute("VACUUM")
+            rowcount = cursor.rowcount
+            try:
+                if module == "ALL":
+                    cursor.execute("DELETE FROM http")
+                else:
+                    cursor.execute("DELETE FROM http WHERE category=?",
+                                   (module.lower(),))
+                rowcount += cursor.rowcount
+            except sqlite3.OperationalError:
+                pass  # no 'http' table
+            db.commit()
+            if rowcount:
+                cursor.execute("VACUUM")
+        _http_size = None
     return rowcount
 
 
+def entry_load(key):
+    """Return the value stored for 'key' by 'entry_store()'"""
+    if not DatabaseCacheDecorator.db:
+        return None
+    DatabaseCacheDecorator.database()
+    if result := _load(key, int(time.time())):
+        return result[0]
+    return None
+
+
+def entry_store(key, value, maxage):
+    """Queue 'value' to be stored for 'key'
+
+    Unlike the '@cache' decorator, this neither keeps values in memory
+    nor coordinates concurrent computations of the same value.
+    """
+    if not DatabaseCacheDecorator.db:
+        return
+    DatabaseCacheDecorator.database()
+    _store(key, (pickle.dumps(value), int(time.time()) + maxage))
+
+
+def checkpoint_load(key):
+    """Return the checkpoint value stored for 'key'"""
+    if not DatabaseCacheDecorator.db:
+        return None
+    DatabaseCacheDecorator.database()
+    if result := _load("checkpoint:" + key, int(time.time())):
+        return result[0]
+    return None
+
+
+def checkpoint_store(key, value):
+    """Store 'value' as checkpoint for 'key' or delete it if None"""
+    if not DatabaseCacheDecorator.db:
+        return
+    DatabaseCacheDecorator.database()
+    if value is not None:
+        value = pickle.dumps(value), int(time.time()) + CHECKPOINT_MAXAGE
+    _store("checkpoint:" + key, value)
+
+
+CHECKPOINT_MAXAGE = 86400 * 30
+
+
+# --------------------------------------------------------------------
+# HTTP revalidation cache
+
+def http_load(key):
+    """Return (etag, last_modified, headers, body) stored for 'key'"""
+    db = DatabaseCacheDecorator.db
+    if not db or not _http_init():
+        return None
+
+    with _cond:
+        result = _http_pending.get(key)
+    if result is None:
+        try:
+            with _lock_db:
+                result = db.execute(
+                    "SELECT etag, modified, headers, body FROM http "
+                    "WHERE key=? LIMIT 1", (key,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not result:
+            return None
+    else:
+        result = result[1:5]
+
+    # access times get written in batches by the background writer
+    with _cond:
+        _http_atime[key] = time.time()
+        _writer_start()
+
+    etag, modified, headers, body = result
+    return etag, modified, util.json_loads(headers), body
+
+
+def http_store(key, category, etag, modified, headers, body, maxsize):
+    """Queue a response body and its validators to be stored for 'key'
+
+    Evicts least recently used entries
+    when the total size of all bodies exceeds 'maxsize' bytes.
+    """
+    global _http_maxsize
+    db = DatabaseCacheDecorator.db
+    if not db or not _http_init() or len(body) > maxsize:
+        return
+    entry = (category, etag, modified, util.json_dumps(headers),
+             body, len(body), time.time())
+    with _cond:
+        _http_maxsize = maxsize
+        _http_pending[key] = entry
+        _http_atime.pop(key, None)
+        _writer_start()
+        _cond.notify()
+
+
+def _http_write(cursor, items, atimes):
+    """Write queued responses and access times and evict old entries
+
+    Keeps a running total of the size of all stored bodies
+    to only count them once.
+    """
+    global _http_size
+    if items and _http_size is None:
+        _http_size = cursor.execute(
+            "SELECT SUM(size) FROM http").fetchone()[0] or 0
+
+    for key, entry in items:
+        if old := cursor.execute(
+                "SELECT size FROM http WHERE key=?", (key,)).fetchone():
+            _http_size -= old[0]
+        cursor.execute(
+            "INSERT OR REPLACE INTO http VALUES (?,?,?,?,?,?,?,?)",
+            (key, *entry))
+        _http_size += entry[5]
+
+    cursor.executemany(
+        "UPDATE http SET atime=? WHERE key=?",
+        [(atime, key) for key, atime in atimes])
+
+    if items and _http_size > _http_maxsize:
+        evict = []
+        for old, size in cursor.execute(
+                "SELECT key, size FROM http ORDER BY atime").fetchall():
+            evict.append((old,))
+            _http_size -= size
+            if _http_size <= _http_maxsize:
+                break
+        cursor.executemany("DELETE FROM http WHERE key=?", evict)
+
+
+def _http_init():
+    global _http_init_done
+    if not _http_init_done:
+        try:
+            with _lock_db:
+                DatabaseCacheDecorator.db.execute(
+                    "CREATE TABLE IF NOT EXISTS http "
+                    "(key TEXT PRIMARY KEY, category TEXT, etag TEXT, "
+                    "modified TEXT, headers TEXT, body BLOB, "
+                    "size INTEGER, atime REAL)")
+        except sqlite3.Error:
+            return False
+        _http_init_done = True
+    return True
+
+
+_http_init_done = False
+_http_pending = {}  # key -> row values
+_http_atime = {}    # key -> access time
+_http_size = None   # total size of all stored bodies
+_http_maxsize = 0
+
+_memory_caches = []
+
+
+def stats():
+    """Return name, size, hits, misses, and evictions of in-memory caches"""
+    return [
+        (_name(deco.func), len(deco.cache),
+         deco.hits, deco.misses, deco.evictions)
+        for deco in _memory_caches
+        if deco.hits or deco.misses
+    ]
+
+
+def log_stats():
+    """Log usage statistics of in-memory caches"""
+    if entries := stats():
+        log = logging.getLogger("cache")
+        for name, size, hits, misses, evictions in sorted(entries):
+            log.debug("%s: %s entries, %s hits, %s misses, %s evictions",
+                      name, size, hits, misses, evictions)
+
+
+def _name(func):
+    name = f"{func.__module__}.{func.__qualname__}"
+    if name.startswith("gallery_dl."):
+        name = name[11:]
+        if name.startswith("extractor."):
+            name = name[10:]
+    return name
+
+
+def _maxsize(func, default):
+    """Return 'cache.memory-maxsize' for 'func'"""
+    maxsize = config.get(("cache",), "memory-maxsize")
+    if maxsize is None:
+        return default
+    if isinstance(maxsize, dict):
+        name = _name(func)
+        if name in maxsize:
+            return maxsize[name]
+        return maxsize.get("*", default)
+    return maxsize
+
+
 def _path():
     path = config.get(("cache",), "file", util.SENTINEL)
     if path is not util.SENTINEL:
@@ -8,12 +8,14 @@
 
 """Downloader module for http:// and https:// URLs"""
 
+import os
 import time
 import mimetypes
 from requests.exceptions import RequestException, ConnectionError, Timeout
 from .common import DownloaderBase
 from .. import text, util, output, exception
 from ssl import SSLError
+from http.client import HTTPException
 FLAGS = util.FLAGS
 
 
@@ -24,6 +26,7 @@ class HttpDownloader(DownloaderBase):
         DownloaderBase.__init__(self, job)
         extractor = job.extractor
         self.downloading = False
+        self.hooks = getattr(job, "hooks", ())
 
         self.adjust_extension = self.config("adjust-extensions", True)
         self.chunk_size = self.config("chunk-size", 32768)
@@ -42,11 +45,17 @@ class HttpDownloader(DownloaderBase):
         self.rate = self.config("rate")
         interval_429 = self.config("sleep-429")
 
-        if not self.config("consume-content", False):
+        consume = self.config("consume-content", 65536)
+        if not consume:
             # this resets the underlying TCP connection, and therefore
             # if the program makes another request to the same domain,
             # a new connection (either TLS or plain TCP) must be made
             self.release_conn = lambda resp: resp.close()
+        elif consume is not True:
+            if isinstance(consume, str):
+                consume = text.parse_bytes(consume)
+            self.consume_max = consume
+            self.release_conn = self._release_conn_small
 
         if self.retries < 0:
             self.retries = float("inf")
@@ -62,7 +71,18 @@ class HttpDownloader(DownloaderBase):
                 self.log.warning(
                     "Invalid maximum file size (%r)", self.maxsize)
             self.maxsize = maxsize
-        if isinstance(self.chunk_size, str):
+        if (segments := self.config("segments", 1)) > 1:
+            self.segments = segments
+            segments_min = self.config("segments-min", "32M")
+            if isinstance(segments_min, str):
+                segments_min = text.parse_bytes(segments_min)
+            self.segments_min = segments_min
+        else:
+            self.segments = None
+        if self.chunk_size == "auto":
+            self.chunk_size = CHUNK_MIN
+            self.iter_content = self._iter_content_auto
+        elif isinstance(self.chunk_size, str):
             chunk_size = text.parse_bytes(self.chunk_size)
             if not chunk_size:
                 self.log.warning(
@@ -75,6 +95,9 @@ class HttpDownloader(DownloaderBase):
                 if rmax < self.chunk_size:
                     # reduce chunk_size to allow for one iteration each second
                     self.chunk_size = rmax
+                if "iter_content" in self.__dict__:
+                    # fixed-size chunks for accurate rate limiting
+                    del self.iter_content
                 self.rate = func
                 self.receive = self._receive_rate
             else:
@@ -101,11 +124,13 @@ class HttpDownloader(DownloaderBase):
             # remove file from incomplete downloads
             if self.downloading and not self.part:
                 util.remove_file(pathfmt.temppath)
+                util.remove_file(pathfmt.temppath + ".segments")
 
     def _download_impl(self, url, pathfmt):
         response = None
         tries = code = 0
         msg = ""
+        preallocated = False
 
         metadata = self.metadata
         kwdict = pathfmt.kwdict
@@ -146,8 +171,22 @@ class HttpDownloader(DownloaderBase):
             if self.headers:
                 headers.update(self.headers)
             #   partial content
+            segments = None
             if file_size := pathfmt.part_size():
-                headers["Range"] = f"bytes={file_size}-"
+                segments = self._segments_load(pathfmt.temppath)
+                if segments is not None:
+                    # '.part' file got preallocated by a segmented download
+                    preallocated = True
+                    if segments:
+                        # keep data before the first remaining segment
+                        file_size = segments[1][0][0]
+                    else:
+                        file_size = 0
+                    if not segments or not self.segments:
+                        self._segments_discard(pathfmt.temppath, file_size)
+                        segments = None
+                if file_size:
+                    headers["Range"] = f"bytes={file_size}-"
 
             # connect to (remote) source
             try:
@@ -185,7 +224,13 @@ class HttpDownloader(DownloaderBase):
                 offset = file_size
                 size = response.headers["Content-Range"].rpartition("/")[2]
             elif code == 416 and file_size:  # Requested Range Not Satisfiable
-                break
+                if not preallocated:
+                    break
+                # the size of a preallocated '.part' file
+                # does not indicate a completed download
+                self._segments_discard(pathfmt.temppath, 0)
+                msg = f"'{code} {response.reason}' for '{url}'"
+                continue
             else:
                 msg = f"'{code} {response.reason}' for '{url}'"
 
@@ -279,7 +324,7 @@ class HttpDownloader(DownloaderBase):
                     pathfmt.part_enable(self.partdir)
                 metadata = False
 
-            content = response.iter_content(self.chunk_size)
+            content = self.iter_content(response)
 
             validate_sig = kwdict.get("_http_signature")
             validate_ext = (adjust_extension and
@@ -307,6 +352,26 @@ class HttpDownloader(DownloaderBase):
                     response.close()
                     return True
 
+            # download multiple byte ranges at the same time
+            if self.segments and self._segments_supported(
+                    response, kwdict, size, offset, segments):
+                self.downloading = True
+                try:
+                    result = self._download_segmented(
+                        url, headers, pathfmt, response, content,
+                        file_header, size, offset, segments,
+                        adjust_extension)
+                except exception.StopExtraction:
+                    return False
+                if result is not True:
+                    response = None
+                    msg = result
+                    output.stderr_write("\n")
+                    continue
+                break
+            elif segments is not None:
+                util.remove_file(pathfmt.temppath + ".segments")
+
             # set open mode
             if not offset:
                 mode = "w+b"
@@ -316,6 +381,10 @@ class HttpDownloader(DownloaderBase):
                 mode = "r+b"
                 self.log.debug("Resuming download at byte %d", offset)
 
+            # pass all data of fresh downloads to 'stream' hooks
+            if not offset and "stream" in self.hooks:
+                content = self._stream(pathfmt, content, file_header)
+
             # download content
             self.downloading = True
             with pathfmt.open(mode) as fp:
@@ -382,6 +451,83 @@ class HttpDownloader(DownloaderBase):
                 "closing the connection anyway", exc.__class__.__name__, exc)
             response.close()
 
+    def _release_conn_small(self, response):
+        """Consume small response bodies, close the connection otherwise"""
+        size = text.parse_int(response.headers.get("Content-Length"), None)
+        if size is None or size > self.consume_max:
+            response.close()
+        else:
+            HttpDownloader.release_conn(self, response)
+
+    def iter_content(self, response):
+        return response.iter_content(self.chunk_size)
+
+    def _iter_content_auto(self, response):
+        """Read response content into a reusable buffer
+
+        Yields memoryviews of this buffer, which are only valid
+        until the next iteration. Its size grows or shrinks
+        depending on how long it takes to fill it.
+        """
+        raw = response.raw
+        fp = raw._fp
+        if raw.chunked or not hasattr(fp, "readinto") or \
+                response.headers.get("Content-Encoding", "identity") != \
+                "identity":
+            yield from response.iter_content(self.chunk_size)
+            return
+
+        size = CHUNK_MIN
+        buffer = bytearray(CHUNK_MAX)
+        view = memoryview(buffer)
+        readinto = fp.readinto
+        remaining = raw.length_remaining
+        time_read = time.monotonic()
+
+        try:
+            while num := readinto(view[:size]):
+                yield view[:num]
+
+                if remaining is not None:
+                    remaining -= num
+                now = time.monotonic()
+                elapsed = now - time_read
+                time_read = now
+
+                if elapsed < 0.05:
+                    if size < CHUNK_MAX:
+                        size *= 2
+                elif elapsed > 0.5:
+                    if size > CHUNK_MIN:
+                        size //= 2
+        except (OSError, HTTPException) as exc:
+            raise ConnectionError(exc)
+
+        if remaining:
+            raise ConnectionError(f"IncompleteRead ({remaining} bytes left)")
+        if fp.isclosed():
+            raw.release_conn()
+
+    def _stream(self, pathfmt, content, file_header):
+        """Call the consumers returned by 'stream' hooks for each chunk"""
+        consumers = [
+            consumer
+            for callback in self.hooks["stream"]
+            if (consumer := callback(pathfmt)) is not None
+        ]
+        if not consumers:
+            return content
+        if file_header:
+            for consumer in consumers:
+                consumer(file_header)
+        return self._stream_content(content, consumers)
+
+    def _stream_content(self, content, consumers):
+        for data in content:
+            for consumer in consumers:
+                consumer(data)
+            yield data
+
     def receive(self, fp, content, bytes_total, bytes_start):
         write = fp.write
         for data in content:
@@ -420,6 +566,192 @@ class HttpDownloader(DownloaderBase):
                 if time_expected > time_elapsed:
                     time.sleep(time_expected - time_elapsed)
 
+    def _segments_supported(self, response, kwdict, size, offset, segments):
+        """Return True if 'response' can be downloaded in segments"""
+        headers = response.headers
+        return (
+            size and (segments is not None or
+                      size - offset >= self.segments_min) and
+            (response.status_code == 206 or
+             headers.get("Accept-Ranges") == "bytes") and
+            headers.get("Content-Encoding", "identity") == "identity" and
+            kwdict.get("_http_method", "GET") == "GET" and
+            not kwdict.get("_http_data")
+        )
+
+    def _download_segmented(self, url, headers, pathfmt, response, content,
+                            file_header, size, offset, segments,
+                            adjust_extension):
+        """Download byte ranges of 'url' in parallel
+
+        Returns True on success or an error message
+        """
+        path = pathfmt.temppath
+        if segments is not None and (
+                segments[0] != size or segments[1][0][0] != offset):
+            self.log.debug("Unable to resume segmented download")
+            segments = None
+
+        if segments is None:
+            step = -(-(size - offset) // self.segments)
+            segments = [[start, min(start + step, size)]
+                        for start in range(offset, size, step)]
+            mode = "r+b" if offset else "w+b"
+        else:
+            segments = segments[1]
+            mode = "r+b"
+            self.log.debug("Resuming segmented download (%s segments)",
+                           len(segments))
+
+        with pathfmt.open(mode) as fp:
+            if fp is None:
+                return "'.part' file no longer exists"
+            if offset and not file_header and adjust_extension and \
+                    pathfmt.extension in SIGNATURE_CHECKS:
+                self._adjust_extension(pathfmt, fp.read(16))
+            # store progress before extending the file,
+            # since its size no longer indicates where to resume
+            self._segments_save(path, size, segments)
+            fp.truncate(size)
+
+        from concurrent.futures import \
+            ThreadPoolExecutor, wait, FIRST_EXCEPTION
+        rate = self.rate() / len(segments) if self.rate else None
+        state = {"abort": False}
+        progress = self.progress
+        bytes_start = sum(end - pos for pos, end in segments)
+        time_start = time_save = time.monotonic()
+
+        self.out.start(pathfmt.path)
+        executor = ThreadPoolExecutor(len(segments), "segment")
+        try:
+            pending = {
+                executor.submit(
+                    self._segment_fetch, url, headers, path, segment,
+                    rate, state, *((content, file_header) if i == 0 else ()))
+                for i, segment in enumerate(segments)
+                if segment[0] < segment[1]
+            }
+            while pending:
+                done, pending = wait(pending, 1.0, FIRST_EXCEPTION)
+                for future in done:
+                    if exc := future.exception():
+                        return f"{exc.__class__.__name__}: {exc}"
+
+                if FLAGS.DOWNLOAD is not None:
+                    FLAGS.process("DOWNLOAD")
+
+                now = time.monotonic()
+                if now - time_save >= 10.0:
+                    self._segments_save(path, size, segments)
+                    time_save = now
+                if progress is not None and now - time_start > progress:
+                    bytes_left = sum(end - pos for pos, end in segments)
+                    self.out.progress(
+                        size, size - bytes_left,
+                        int((bytes_start - bytes_left) / (now - time_start)))
+        finally:
+            state["abort"] = True
+            executor.shutdown()
+            response.close()
+            if any(pos < end for pos, end in segments):
+                self._segments_save(path, size, segments)
+
+        util.remove_file(path + ".segments")
+        return True
+
+    def _segment_fetch(self, url, headers, path, segment, rate, state,
+                       content=None, prefix=None):
+        """Write the byte range described by 'segment' to 'path'"""
+        pos, end = segment
+        response = None
+
+        if content is None:
+            headers = headers.copy()
+            headers["Range"] = f"bytes={pos}-{end - 1}"
+            response = self.session.request(
+                "GET", url,
+                stream=True,
+                headers=headers,
+                timeout=self.timeout,
+                proxies=self.proxies,
+                verify=self.verify,
+            )
+            if response.status_code != 206:
+                response.close()
+                raise exception.HttpError(
+                    f"'{response.status_code} {response.reason}' "
+                    f"for bytes {pos}-{end - 1}", response)
+            content = self.iter_content(response)
+
+        bytes_received = 0
+        time_start = time.monotonic()
+        try:
+            # unbuffered, to only report progress for data passed to the OS
+            with open(path, "r+b", buffering=0) as fp:
+                fp.seek(pos)
+                if prefix:
+                    fp.write(prefix)
+                    segment[0] = pos = pos + len(prefix)
+
+                for data in content:
+                    if state["abort"]:
+                        return
+                    if len(data) > end - pos:
+                        data = data[:end - pos]
+                    fp.write(data)
+                    segment[0] = pos = pos + len(data)
+                    if pos >= end:
+                        return
+
+                    if rate is not None:
+                        bytes_received += len(data)
+                        time_expected = bytes_received / rate
+                        time_elapsed = time.monotonic() - time_start
+                        if time_expected > time_elapsed:
+                            time.sleep(time_expected - time_elapsed)
+        finally:
+            if response is not None:
+                response.close()
+
+        if pos < end and not state["abort"]:
+            raise exception.HttpError(
+                f"incomplete segment ({pos} < {end})")
+
+    def _segments_load(self, path):
+        """Return total size and remaining byte ranges of a download
+
+        Returns None if there is no progress data for 'path'
+        and False if it cannot be used.
+        """
+        try:
+            with open(path + ".segments") as fp:
+                data = util.json_loads(fp.read())
+            size = data["size"]
+            segments = data["segments"]
+            if segments and segments[0][0] <= size:
+                return size, segments
+        except FileNotFoundError:
+            return None
+        except Exception:
+            pass
+        return False
+
+    def _segments_discard(self, path, size):
+        """Truncate a preallocated '.part' file to 'size' bytes"""
+        try:
+            with open(path, "r+b") as fp:
+                fp.truncate(size)
+        except FileNotFoundError:
+            pass
+        util.remove_file(path + ".segments")
+
+    def _segments_save(self, path, size, segments):
+        temp = path + ".segments.tmp"
+        with open(temp, "w") as fp:
+            fp.write(util.json_dumps({"size": size, "segments": segments}))
+        os.replace(temp, path + ".segments")
+
     def _find_extension(self, response):
         """Get filename extension from MIME type"""
         mtype = response.headers.get("Content-Type", "image/jpeg")
@@ -451,6 +783,9 @@ class HttpDownloader(DownloaderBase):
         return False
 
 
+CHUNK_MIN = 65536
+CHUNK_MAX = 1048576
+
 MIME_TYPES = {
     "image/jpeg"    : "jpg",
     "image/jpg"     : "jpg",
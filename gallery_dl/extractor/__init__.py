@@ -6,9 +6,18 @@
 # it under the terms of the GNU General Public License version 2 as
 # published by the Free Software Foundation.
 
+import os
 import sys
+import threading
+import importlib
+import collections
 from ..text import re_compile
 
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
 modules = [
     "2ch",
     "2chan",
@@ -260,7 +269,7 @@ modules = [
 
 def find(url):
     """Find a suitable extractor for the given URL"""
-    for cls in _list_classes():
+    for cls in _find_classes(url):
         if match := cls.pattern.match(url):
             return cls(match)
     return None
@@ -271,16 +280,14 @@ def add(cls):
     if isinstance(cls.pattern, str):
         cls.pattern = re_compile(cls.pattern)
     _cache.append(cls)
+    _added.append(cls)
     return cls
 
 
 def add_module(module):
     """Add all extractors in 'module' to the list of available extractors"""
-    if classes := _get_classes(module):
-        if isinstance(classes[0].pattern, str):
-            for cls in classes:
-                cls.pattern = re_compile(cls.pattern)
-        _cache.extend(classes)
+    classes = _add_module(module)
+    _added.extend(classes)
     return classes
 
 
@@ -292,20 +299,51 @@ def extractors():
     )
 
 
+def registry():
+    """Return an ExtractorInfo object for each available extractor
+
+    Unlike extractors(), this does not import any extractor modules
+    as long as the generated registry is up to date.
+    """
+    return sorted(
+        _registry_entries(),
+        key=lambda x: x.name
+    )
+
+
 # --------------------------------------------------------------------
 # internals
 
 
 def _list_classes():
     """Yield available extractor classes"""
-    yield from _cache
+    index = 0
+    while True:
+        while index < len(_cache):
+            yield _cache[index]
+            index += 1
 
-    for module in _module_iter:
-        yield from add_module(module)
+        # import the next module;
+        # guarded by a lock to allow concurrent lookups from multiple threads
+        with _lock:
+            if index < len(_cache):
+                continue
+            if (module := next(_module_iter, None)) is None:
+                break
+            _add_module(module)
 
     globals()["_list_classes"] = lambda : _cache
 
 
+def _add_module(module):
+    if classes := _get_classes(module):
+        for cls in classes:
+            if isinstance(cls.pattern, str):
+                cls.pattern = re_compile(cls.pattern)
+        _cache.extend(classes)
+    return classes
+
+
 def _modules_internal():
     globals_ = globals()
     for module_name in modules:
@@ -333,5 +371,359 @@ def _get_classes(module):
     ]
 
 
+# --------------------------------------------------------------------
+# registry & URL index
+
+class ExtractorInfo(collections.namedtuple("ExtractorInfo", (
+        "module", "name", "category", "subcategory", "basecategory",
+        "instances", "pattern", "factors", "example", "doc"))):
+    """Information about an extractor class"""
+    __slots__ = ()
+
+    def load(self):
+        """Import and return the described extractor class"""
+        return _load_class(self.module, self.name)
+
+
+def _class_info(cls):
+    """Collect registry information about extractor class 'cls'"""
+    from .common import BaseExtractor
+
+    pattern = cls.pattern
+    if not isinstance(pattern, str):
+        pattern = pattern.pattern
+
+    module_name = cls.__module__
+    if module_name.rpartition(".")[2] in _modules_dynamic:
+        factors = None
+    elif (factors := _pattern_factors(pattern)) and \
+            min(map(len, factors)) >= 4:
+        factors = tuple(factors)
+    else:
+        factors = None
+
+    return ExtractorInfo(
+        module_name,
+        cls.__name__,
+        cls.category,
+        cls.subcategory,
+        cls.basecategory,
+        bool(issubclass(cls, BaseExtractor) and cls.basecategory),
+        pattern,
+        factors,
+        cls.example,
+        cls.__doc__,
+    )
+
+
+def _registry_entries():
+    """Return registry information about all available extractors"""
+    if (stale := _registry_stale()) is not None:
+        return _registry_merge(stale)
+    return list(map(_class_info, _list_classes()))
+
+
+def _registry_stale():
+    """Return the names of modules the generated registry is out of date for
+
+    Return None if it cannot be used at all.
+    """
+    if modules is not _modules_default or \
+            _module_iter is not _module_iter_default:
+        return None
+    global _registry_checked
+    if _registry_checked is None:
+        from ._registry import BASE, MODULES
+        base, checksums = _registry_checksums()
+        if checksums is None:
+            # frozen executable without source files
+            _registry_checked = set()
+        elif base != BASE:
+            _registry_checked = False
+        else:
+            generated = dict(MODULES)
+            _registry_checked = {
+                name for name in modules
+                if generated.get(name) != checksums.get(name)
+            }
+    return _registry_checked if _registry_checked is not False else None
+
+
+def _registry_merge(stale):
+    """Combine generated entries with ones of modules in 'stale'"""
+    from ._registry import EXTRACTORS
+    if not stale:
+        return list(map(ExtractorInfo._make, EXTRACTORS))
+
+    generated = {}
+    for entry in EXTRACTORS:
+        generated.setdefault(entry[0], []).append(entry)
+
+    globals_ = globals()
+    entries = []
+    for name in modules:
+        if name in stale:
+            module = __import__(name, globals_, None, None, 1)
+            entries.extend(map(_class_info, _get_classes(module)))
+        else:
+            entries.extend(map(ExtractorInfo._make, generated.get(
+                f"{__name__}.{name}", ())))
+    return entries
+
+
+def _registry_checksums():
+    """Return checksums of shared and of extractor module source files"""
+    from .. import version
+    import zlib
+
+    base = zlib.crc32(version.__version__.encode())
+    checksums = {}
+    directory = os.path.dirname(__file__)
+    try:
+        names = sorted(
+            name for name in os.listdir(directory)
+            if name.endswith(".py") and name != "_registry.py"
+        )
+        if not names:
+            return None, None
+        for name in names:
+            with open(os.path.join(directory, name), "rb") as fp:
+                data = fp.read()
+            if (module := name[:-3]) in _modules_set:
+                checksums[module] = f"{zlib.crc32(data):08x}"
+            else:
+                base = zlib.crc32(data, base)
+    except OSError:
+        return None, None
+    return f"{base:08x}", checksums
+
+
+def _load_class(module_name, class_name):
+    """Import and return extractor class 'class_name' from 'module_name'"""
+    module = sys.modules.get(module_name) or \
+        importlib.import_module(module_name)
+    cls = getattr(module, class_name)
+    if isinstance(cls.pattern, str):
+        cls.pattern = re_compile(cls.pattern)
+    return cls
+
+
+def _find_classes(url):
+    """Return extractor classes that could possibly match 'url'"""
+    index = _index
+    if index is None:
+        index = _index_init()
+    if not index or not isinstance(url, str):
+        return _list_classes()
+
+    url_lower = url.lower()
+    found = set(index["always"])
+    grams = index["grams"]
+    for i in range(len(url_lower) - 3):
+        if entries := grams.get(url_lower[i:i+4]):
+            for factor, pos in entries:
+                if factor in url_lower:
+                    found.add(pos)
+
+    for basecategory, positions in index["instances"].items():
+        if _config_instances(basecategory):
+            found.update(positions)
+
+    return _index_iter(_added.copy(), sorted(found))
+
+
+def _index_iter(added, positions):
+    yield from added
+    classes = _index_classes
+    for pos in positions:
+        if (cls := classes[pos]) is None:
+            try:
+                cls = classes[pos] = _load_class(*_index["classes"][pos])
+            except (ImportError, AttributeError):
+                # index does not match the installed modules
+                yield from _index_reset()
+                return
+        yield cls
+
+
+def _index_reset():
+    """Discard the current index and return all extractor classes"""
+    global _index, _index_classes, _registry_checked
+
+    with _index_lock:
+        _registry_checked = False
+        _index = _index_classes = None
+    return _list_classes()
+
+
+def _index_init():
+    """Load the extractor index for the built-in list of modules"""
+    global _index, _index_classes
+
+    with _index_lock:
+        if _index is not None:
+            return _index
+
+        if modules is not _modules_default or \
+                _module_iter is not _module_iter_default:
+            # custom set of modules
+            _index = False
+            return _index
+
+        if (stale := _registry_stale()) is not None:
+            index = _index_create(_registry_merge(stale))
+        else:
+            # generated registry is out of date
+            from .. import cache
+            build = cache.cache(maxage=30*86400, keyarg=0)(_index_build)
+            try:
+                index = build(_index_fingerprint())
+            except Exception:
+                index = _index_build(None)
+
+        if not _index_classes:
+            _index_classes = [None] * len(index["classes"])
+        _index = index
+    return index
+
+
+def _index_fingerprint():
+    from .. import version
+    try:
+        mtime = max(
+            entry.stat().st_mtime_ns
+            for entry in os.scandir(os.path.dirname(__file__))
+            if entry.name.endswith(".py")
+        )
+    except (OSError, ValueError):
+        mtime = 0
+    return f"{version.__version__}:{mtime}"
+
+
+def _index_build(fingerprint):
+    """Build an index from all extractor classes of the built-in modules"""
+    global _index_classes
+
+    prefix = __name__ + "."
+    classes = [
+        cls for cls in _list_classes()
+        if cls.__module__.startswith(prefix)  # not added at runtime
+    ]
+
+    _index_classes = classes
+    return _index_create(map(_class_info, classes))
+
+
+def _index_create(entries):
+    """Build an index of literal strings required by extractor patterns"""
+    classes = []
+    factors = []
+    always = []
+    instances = {}
+
+    for pos, info in enumerate(entries):
+        classes.append((info[0], info[1]))
+        if info[5]:
+            instances.setdefault(info[4], []).append(pos)
+        if info[7]:
+            factors.append((pos, info[7]))
+        else:
+            always.append(pos)
+
+    # index each factor by its least common 4-character substring
+    counts = {}
+    for _, required in factors:
+        for factor in required:
+            for i in range(len(factor) - 3):
+                gram = factor[i:i+4]
+                counts[gram] = counts.get(gram, 0) + 1
+
+    grams = {}
+    for pos, required in factors:
+        for factor in required:
+            gram = min((factor[i:i+4] for i in range(len(factor) - 3)),
+                       key=counts.__getitem__)
+            grams.setdefault(gram, []).append((factor, pos))
+
+    return {
+        "classes"  : classes,
+        "always"   : always,
+        "instances": instances,
+        "grams"    : grams,
+    }
+
+
+def _pattern_factors(pattern):
+    """Return a list of strings one of which is part of every match"""
+    try:
+        return _factors_best(sre_parse.parse(pattern))
+    except Exception:
+        return None
+
+
+def _factors_best(subpattern):
+    best = None
+    score = 0
+    for factors in _factors_required(subpattern):
+        length = min(map(len, factors))
+        if length > score:
+            best = factors
+            score = length
+    return best
+
+
+def _factors_required(subpattern):
+    """Yield lists of lowercase literals required by 'subpattern'"""
+    literal = ""
+    for op, av in subpattern:
+        if op == sre_parse.LITERAL:
+            literal += chr(av)
+            continue
+
+        if literal:
+            yield (literal.lower(),)
+            literal = ""
+
+        if op == sre_parse.SUBPATTERN:
+            yield from _factors_required(av[-1])
+        elif op == sre_parse.MAX_REPEAT or op == sre_parse.MIN_REPEAT:
+            if av[0]:
+                yield from _factors_required(av[2])
+        elif op == sre_parse.BRANCH:
+            alternatives = []
+            for branch in av[1]:
+                if not (factors := _factors_best(branch)):
+                    break
+                alternatives.extend(factors)
+            else:
+                yield alternatives
+
+    if literal:
+        yield (literal.lower(),)
+
+
+def _config_instances(basecategory):
+    """Return True if there are instances configured for 'basecategory'"""
+    from .. import config
+    instances = config.get(("extractor",), basecategory)
+    if isinstance(instances, dict):
+        for info in instances.values():
+            if isinstance(info, dict) and "root" in info:
+                return True
+    return False
+
+
+# modules with patterns depending on config values at import time
+_modules_dynamic = {"bunkr", "generic", "ytdl"}
+_modules_default = modules
+_modules_set = set(modules)
+
+_index = None
+_index_classes = None
+_index_lock = threading.Lock()
+_registry_checked = None
+
 _cache = []
-_module_iter = _modules_internal()
+_added = []
+_lock = threading.Lock()
+_module_iter = _module_iter_default = _modules_internal()
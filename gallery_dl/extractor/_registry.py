@@ -0,0 +1,1150 @@
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+# auto-generated by scripts/registry.py
+# (module, name, category, subcategory, basecategory,
+#  instances, pattern, factors, example, doc)
+
+# checksums of shared source files and of each module;
+# entries of modules with a different checksum get generated at runtime
+BASE = '4577052d'
+
+MODULES = (
+    ('2ch', '2c4d7f7b'),
+    ('2chan', 'dc0e12ac'),
+    ('2chen', '1c103673'),
+    ('35photo', 'a9e68be2'),
+    ('3dbooru', 'ee5eba62'),
+    ('4chan', '09e7ebd3'),
+    ('4archive', 'bc326e8b'),
+    ('4chanarchives', '11ce1baf'),
+    ('500px', 'f3d87845'),
+    ('8chan', '6a7b962f'),
+    ('8muses', 'c7cab001'),
+    ('adultempire', '2e666a46'),
+    ('agnph', '5d2176a7'),
+    ('ao3', '8ba2255d'),
+    ('arcalive', '3fdca796'),
+    ('architizer', 'dce6ffdf'),
+    ('arena', '7eb4232e'),
+    ('artstation', 'c5a80c67'),
+    ('aryion', '6caf7506'),
+    ('audiochan', '05b6113d'),
+    ('batoto', 'fcac4c2d'),
+    ('bbc', '02a58cde'),
+    ('behance', 'e7e741f8'),
+    ('bellazon', '607de15a'),
+    ('bilibili', '149af2c3'),
+    ('blogger', '3e136420'),
+    ('bluesky', 'b5c01189'),
+    ('boosty', '2a0d3cc5'),
+    ('booth', 'da99a226'),
+    ('bunkr', 'e6b15925'),
+    ('catbox', '731bef13'),
+    ('cfake', '4adbebdb'),
+    ('chevereto', 'df6e1d64'),
+    ('cien', '06b6643f'),
+    ('civitai', '9ffe9b64'),
+    ('comedywildlifephoto', '601c4a01'),
+    ('comick', 'd7ae64bc'),
+    ('comicvine', '2484c479'),
+    ('cyberdrop', '76f5ecf6'),
+    ('cyberfile', 'b5360909'),
+    ('danbooru', '57447177'),
+    ('dandadan', 'fd0ac5ed'),
+    ('dankefuerslesen', '8ae29ee5'),
+    ('desktopography', 'bdf97ca8'),
+    ('deviantart', '92243dc6'),
+    ('discord', '4cf1b3c8'),
+    ('dynastyscans', '21f8404d'),
+    ('e621', 'b2cc4aaf'),
+    ('eporner', 'e7d52513'),
+    ('erome', 'f4d6c0bf'),
+    ('everia', 'ffad34de'),
+    ('exhentai', '4b92ad10'),
+    ('facebook', '569640e4'),
+    ('fanbox', 'a3f98612'),
+    ('fansly', '4ceea475'),
+    ('fantia', '1e058248'),
+    ('fapello', 'cfb092d8'),
+    ('fapachi', 'ca916ea0'),
+    ('fikfap', '436a0c80'),
+    ('fitnakedgirls', '29582432'),
+    ('flickr', '4d081792'),
+    ('furaffinity', 'e56c90fc'),
+    ('furry34', '46eeff1c'),
+    ('fuskator', '34473a3f'),
+    ('gelbooru', '75df13be'),
+    ('gelbooru_v01', '6da6e752'),
+    ('gelbooru_v02', '775d848c'),
+    ('girlsreleased', 'ba06fb5e'),
+    ('girlswithmuscle', '7bd49ba7'),
+    ('gofile', '51b5d010'),
+    ('hatenablog', '7bc4ed0d'),
+    ('hdoujin', '949c8d7f'),
+    ('hentai2read', '466c034d'),
+    ('hentaicosplays', '0c65df7f'),
+    ('hentaifoundry', 'ea4676f0'),
+    ('hentaihand', '62ee0063'),
+    ('hentaihere', '1fb92fea'),
+    ('hentainexus', '4c311acb'),
+    ('hiperdex', 'c935d3b4'),
+    ('hitomi', '05d93918'),
+    ('hotleak', 'd534a47a'),
+    ('idolcomplex', 'fbdf71e0'),
+    ('imagebam', 'd7f608d5'),
+    ('imagechest', 'b09ec47c'),
+    ('imagefap', 'c6f36975'),
+    ('imgbb', '379e88ee'),
+    ('imgbox', 'a6ed3b54'),
+    ('imgpile', '74624f57'),
+    ('imgth', 'ea726333'),
+    ('imgur', '981b481b'),
+    ('imhentai', '0926f7cf'),
+    ('inkbunny', '049c006e'),
+    ('instagram', 'c232ea7d'),
+    ('issuu', 'b93d8bdb'),
+    ('itaku', '696912cd'),
+    ('itchio', 'afb8c610'),
+    ('iwara', '659e7fa1'),
+    ('jschan', '35776de5'),
+    ('kabeuchi', 'd568f824'),
+    ('keenspot', 'fb55dcba'),
+    ('kemono', '02ca3ef3'),
+    ('khinsider', 'b8996c23'),
+    ('komikcast', '4b0dc6c7'),
+    ('koofr', '7b10edb7'),
+    ('leakgallery', '635bbabc'),
+    ('lensdump', '693d0302'),
+    ('lexica', 'de79e974'),
+    ('lightroom', 'e099e8c1'),
+    ('livedoor', '57dc89ed'),
+    ('lofter', '8dbbce65'),
+    ('luscious', '7c5489ff'),
+    ('lynxchan', 'b30cadb6'),
+    ('madokami', '7063f045'),
+    ('mangadex', '19f06c63'),
+    ('mangafire', '54cabdf0'),
+    ('mangafox', '7d20f055'),
+    ('mangahere', '61a782b1'),
+    ('manganelo', '3c11946f'),
+    ('mangapark', '7fcda5e3'),
+    ('mangaread', 'af30877b'),
+    ('mangareader', '521065d3'),
+    ('mangataro', '14735f64'),
+    ('mangoxo', '3a116151'),
+    ('misskey', '69b800c2'),
+    ('motherless', 'c2e37bc2'),
+    ('myhentaigallery', '1c221c4e'),
+    ('myportfolio', '7443fb6c'),
+    ('naverblog', 'b5fd3ca9'),
+    ('naverchzzk', '3357287b'),
+    ('naverwebtoon', '68f4333c'),
+    ('nekohouse', 'dd899c7a'),
+    ('newgrounds', 'eeeec8ca'),
+    ('nhentai', 'd65945f7'),
+    ('nijie', '3856d2a1'),
+    ('nitter', '5e97b093'),
+    ('nozomi', '275b2565'),
+    ('nsfwalbum', '58128e5c'),
+    ('nudostar', '4538778f'),
+    ('okporn', 'c39919b5'),
+    ('paheal', '384ab99d'),
+    ('patreon', 'f692f698'),
+    ('pexels', 'a7ec4e6e'),
+    ('philomena', '1f46191d'),
+    ('photovogue', '23e7f059'),
+    ('picarto', 'a78d66b0'),
+    ('pictoa', '0df2df1a'),
+    ('piczel', 'a97fde03'),
+    ('pillowfort', '25db03ce'),
+    ('pinterest', '45eb51ae'),
+    ('pixeldrain', '2b207658'),
+    ('pixiv', '4cebec76'),
+    ('pixnet', '1202eb28'),
+    ('plurk', 'f4ee75d8'),
+    ('poipiku', 'c0806147'),
+    ('poringa', '2b9165ce'),
+    ('pornhub', '9cb2d353'),
+    ('pornpics', '93132e2d'),
+    ('pornstarstube', '2485c156'),
+    ('postmill', '601fe31f'),
+    ('rawkuma', '079631e9'),
+    ('reactor', 'ea209666'),
+    ('readcomiconline', '0b127cc3'),
+    ('realbooru', '44ca1b67'),
+    ('reddit', '99338a97'),
+    ('redgifs', 'c4d4b7d2'),
+    ('rule34us', '4f824504'),
+    ('rule34vault', '3554b1e4'),
+    ('rule34xyz', 'ece22be7'),
+    ('s3ndpics', '440071b2'),
+    ('saint', '4b56c0af'),
+    ('sankaku', '6c3b47ff'),
+    ('sankakucomplex', '5340ebd5'),
+    ('schalenetwork', 'a1449e62'),
+    ('scrolller', '07a05c6c'),
+    ('seiga', '4695d81f'),
+    ('senmanga', 'ceec6302'),
+    ('sexcom', '1c0a2033'),
+    ('shimmie2', '0e64138c'),
+    ('simplyhentai', 'a5db519c'),
+    ('sizebooru', '94d40955'),
+    ('skeb', 'a5617a5d'),
+    ('slickpic', '6d7f5169'),
+    ('slideshare', '2d5be1c5'),
+    ('smugmug', 'c53f4f27'),
+    ('soundgasm', 'f6f80ce8'),
+    ('speakerdeck', '36c788e0'),
+    ('steamgriddb', 'c17f2fe5'),
+    ('subscribestar', '6d837799'),
+    ('sxypix', '82c2fbd7'),
+    ('szurubooru', 'd29d03d8'),
+    ('tapas', '872e852c'),
+    ('tcbscans', '807cde5e'),
+    ('telegraph', '8c48c1dc'),
+    ('tenor', '39a9779d'),
+    ('thehentaiworld', '16052810'),
+    ('tiktok', '5aa658e1'),
+    ('tmohentai', 'a7e2f66a'),
+    ('toyhouse', 'c4538938'),
+    ('tsumino', '9493daab'),
+    ('tumblr', '5e9ea34a'),
+    ('tumblrgallery', '050dec7d'),
+    ('tungsten', 'b0168408'),
+    ('twibooru', '5b60fe48'),
+    ('twitter', '7b869830'),
+    ('urlgalleries', '4eee793e'),
+    ('unsplash', '7e042584'),
+    ('uploadir', '304f15a1'),
+    ('urlshortener', 'a1977e9a'),
+    ('vanillarock', '0b8b8e72'),
+    ('vichan', 'df77f748'),
+    ('vipergirls', '419f9b57'),
+    ('vk', '50a90aa3'),
+    ('vsco', 'd585bd24'),
+    ('wallhaven', '3af0d450'),
+    ('wallpapercave', '9ddbae86'),
+    ('warosu', '5a007027'),
+    ('weasyl', '0ac15b45'),
+    ('webmshare', '9f0e9d00'),
+    ('webtoons', '0d2f487a'),
+    ('weebcentral', 'd5a7bb9e'),
+    ('weibo', 'c8331a5b'),
+    ('wikiart', 'f45f7339'),
+    ('wikifeet', '166d66e2'),
+    ('wikimedia', '0bc6498a'),
+    ('xasiat', 'f99fbf7a'),
+    ('xenforo', '781ea4b4'),
+    ('xfolio', 'abf039ce'),
+    ('xhamster', 'a52cdc86'),
+    ('xvideos', '8eeae459'),
+    ('yiffverse', '2942fd0c'),
+    ('zerochan', '74f2ef44'),
+    ('booru', '746a4833'),
+    ('moebooru', 'e23a9202'),
+    ('foolfuuka', '8d95473a'),
+    ('foolslide', '1a2d8c2e'),
+    ('mastodon', '92646a0c'),
+    ('shopify', '47dfec5a'),
+    ('lolisafe', 'ace39289'),
+    ('imagehosts', 'd5506de2'),
+    ('directlink', 'bcfb9ebf'),
+    ('recursive', 'c5cedc0b'),
+    ('oauth', '6fe4a603'),
+    ('noop', '5b5b7016'),
+    ('ytdl', '9b3d1794'),
+    ('generic', '5c02f69f'),
+)
+
+EXTRACTORS = (
+    ('gallery_dl.extractor.2ch', '_2chThreadExtractor', '2ch', 'thread', '', False, '(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/res/(\\d+)', ('/res/',), 'https://2ch.org/a/res/12345.html', 'Extractor for 2ch threads'),
+    ('gallery_dl.extractor.2ch', '_2chBoardExtractor', '2ch', 'board', '', False, '(?:https?://)?2ch\\.(org|su|life|hk)/([^/?#]+)/?$', ('2ch.',), 'https://2ch.org/a/', 'Extractor for 2ch boards'),
+    ('gallery_dl.extractor.2chan', '_2chanThreadExtractor', '2chan', 'thread', '', False, '(?:https?://)?([\\w-]+)\\.2chan\\.net/([^/?#]+)/res/(\\d+)', ('.2chan.net/',), 'https://dec.2chan.net/12/res/12345.htm', 'Extractor for 2chan threads'),
+    ('gallery_dl.extractor.2chen', '_2chenThreadExtractor', '', 'thread', '2chen', True, '(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2chen\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)/(\\d+)', ('2chen:', 'sturdychan.help', '2chen.', 'schan.help'), 'https://sturdychan.help/a/12345/', 'Extractor for 2chen threads'),
+    ('gallery_dl.extractor.2chen', '_2chenBoardExtractor', '', 'board', '2chen', True, '(?:2chen:(https?://[^/?#]+)|(?:https?://)?(?:(?:sturdychan\\.help|2chen\\.(?:moe|club))()|schan\\.help()))/([^/?#]+)(?:/catalog|/?$)', ('2chen:', 'sturdychan.help', '2chen.', 'schan.help'), 'https://sturdychan.help/a/', 'Extractor for 2chen boards'),
+    ('gallery_dl.extractor.35photo', '_35photoUserExtractor', '35photo', 'user', '', False, '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/(?!photo_|genre_|tags/|rating/)([^/?#]+)', ('35photo.pro/',), 'https://35photo.pro/USER', 'Extractor for all images of a user on 35photo.pro'),
+    ('gallery_dl.extractor.35photo', '_35photoTagExtractor', '35photo', 'tag', '', False, '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/tags/([^/?#]+)', ('35photo.pro/tags/',), 'https://35photo.pro/tags/TAG/', 'Extractor for all photos from a tag listing'),
+    ('gallery_dl.extractor.35photo', '_35photoGenreExtractor', '35photo', 'genre', '', False, '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/genre_(\\d+)(/new/)?', ('35photo.pro/genre_',), 'https://35photo.pro/genre_12345/', 'Extractor for images of a specific genre on 35photo.pro'),
+    ('gallery_dl.extractor.35photo', '_35photoImageExtractor', '35photo', 'image', '', False, '(?:https?://)?(?:[a-z]+\\.)?35photo\\.pro/photo_(\\d+)', ('35photo.pro/photo_',), 'https://35photo.pro/photo_12345/', 'Extractor for individual images from 35photo.pro'),
+    ('gallery_dl.extractor.3dbooru', '_3dbooruTagExtractor', '3dbooru', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?behoimi\\.org/post(?:/(?:index)?)?\\?tags=(?P<tags>[^&#]+)', ('behoimi.org/post',), 'http://behoimi.org/post?tags=TAG', 'Extractor for images from behoimi.org based on search-tags'),
+    ('gallery_dl.extractor.3dbooru', '_3dbooruPoolExtractor', '3dbooru', 'pool', 'booru', True, '(?:https?://)?(?:www\\.)?behoimi\\.org/pool/show/(?P<pool>\\d+)', ('behoimi.org/pool/show/',), 'http://behoimi.org/pool/show/12345', 'Extractor for image-pools from behoimi.org'),
+    ('gallery_dl.extractor.3dbooru', '_3dbooruPostExtractor', '3dbooru', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?behoimi\\.org/post/show/(?P<post>\\d+)', ('behoimi.org/post/show/',), 'http://behoimi.org/post/show/12345', 'Extractor for single images from behoimi.org'),
+    ('gallery_dl.extractor.3dbooru', '_3dbooruPopularExtractor', '3dbooru', 'popular', 'booru', True, '(?:https?://)?(?:www\\.)?behoimi\\.org/post/popular_(?P<scale>by_(?:day|week|month)|recent)(?:\\?(?P<query>[^#]*))?', ('behoimi.org/post/popular_',), 'http://behoimi.org/post/popular_by_month', 'Extractor for popular images from behoimi.org'),
+    ('gallery_dl.extractor.4chan', '_4chanThreadExtractor', '4chan', 'thread', '', False, '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/]+)/thread/(\\d+)', ('boards.4chan',), 'https://boards.4channel.org/a/thread/12345/', 'Extractor for 4chan threads'),
+    ('gallery_dl.extractor.4chan', '_4chanBoardExtractor', '4chan', 'board', '', False, '(?:https?://)?boards\\.4chan(?:nel)?\\.org/([^/?#]+)/\\d*$', ('boards.4chan',), 'https://boards.4channel.org/a/', 'Extractor for 4chan boards'),
+    ('gallery_dl.extractor.4archive', '_4archiveThreadExtractor', '4archive', 'thread', '', False, '(?:https?://)?4archive\\.org/board/([^/?#]+)/thread/(\\d+)', ('4archive.org/board/',), 'https://4archive.org/board/a/thread/12345/', 'Extractor for 4archive threads'),
+    ('gallery_dl.extractor.4archive', '_4archiveBoardExtractor', '4archive', 'board', '', False, '(?:https?://)?4archive\\.org/board/([^/?#]+)(?:/(\\d+))?/?$', ('4archive.org/board/',), 'https://4archive.org/board/a/', 'Extractor for 4archive boards'),
+    ('gallery_dl.extractor.4chanarchives', '_4chanarchivesThreadExtractor', '4chanarchives', 'thread', '', False, '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)/thread/(\\d+)', ('4chanarchives.com/board/',), 'https://4chanarchives.com/board/a/thread/12345/', 'Extractor for threads on 4chanarchives.com'),
+    ('gallery_dl.extractor.4chanarchives', '_4chanarchivesBoardExtractor', '4chanarchives', 'board', '', False, '(?:https?://)?4chanarchives\\.com/board/([^/?#]+)(?:/(\\d+))?/?$', ('4chanarchives.com/board/',), 'https://4chanarchives.com/board/a/', 'Extractor for boards on 4chanarchives.com'),
+    ('gallery_dl.extractor.500px', '_500pxUserExtractor', '500px', 'user', '', False, '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/|liked)(?:p/)?([^/?#]+)/?(?:$|[?#])', ('500px.com/',), 'https://500px.com/USER', "Extractor for photos from a user's photostream on 500px.com"),
+    ('gallery_dl.extractor.500px', '_500pxGalleryExtractor', '500px', 'gallery', '', False, '(?:https?://)?(?:web\\.)?500px\\.com/(?!photo/)(?:p/)?([^/?#]+)/galleries/([^/?#]+)', ('/galleries/',), 'https://500px.com/USER/galleries/GALLERY', 'Extractor for photo galleries on 500px.com'),
+    ('gallery_dl.extractor.500px', '_500pxFavoriteExtractor', '500px', 'favorite', '', False, '(?:https?://)?(?:web\\.)?500px\\.com/liked/?$', ('500px.com/liked',), 'https://500px.com/liked', 'Extractor for favorite 500px photos'),
+    ('gallery_dl.extractor.500px', '_500pxImageExtractor', '500px', 'image', '', False, '(?:https?://)?(?:web\\.)?500px\\.com/photo/(\\d+)', ('500px.com/photo/',), 'https://500px.com/photo/12345/TITLE', 'Extractor for individual images from 500px.com'),
+    ('gallery_dl.extractor.8chan', '_8chanThreadExtractor', '8chan', 'thread', '', False, '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:res|last)/(\\d+)', ('8chan.',), 'https://8chan.moe/a/res/12345.html', 'Extractor for 8chan threads'),
+    ('gallery_dl.extractor.8chan', '_8chanBoardExtractor', '8chan', 'board', '', False, '(?:https?://)?8chan\\.(moe|se|cc)/([^/?#]+)/(?:(\\d+)\\.html)?$', ('8chan.',), 'https://8chan.moe/a/', 'Extractor for 8chan boards'),
+    ('gallery_dl.extractor.8muses', '_8musesAlbumExtractor', '8muses', 'album', '', False, '(?:https?://)?(?:comics\\.|www\\.)?8muses\\.com(/comics/album/[^?#]+)(\\?[^#]+)?', ('/comics/album/',), 'https://comics.8muses.com/comics/album/PATH/TITLE', 'Extractor for image albums on comics.8muses.com'),
+    ('gallery_dl.extractor.adultempire', 'AdultempireGalleryExtractor', 'adultempire', 'gallery', '', False, '(?:https?://)?(?:www\\.)?adult(?:dvd)?empire\\.com(/(\\d+)/gallery\\.html)', ('/gallery.html',), 'https://www.adultempire.com/12345/gallery.html', 'Extractor for image galleries from www.adultempire.com'),
+    ('gallery_dl.extractor.agnph', 'AgnphTagExtractor', 'agnph', 'tag', 'booru', True, '(?:https?://)?agn\\.ph/gallery/post/(?:\\?([^#]+))?$', ('agn.ph/gallery/post/',), 'https://agn.ph/gallery/post/?search=TAG', None),
+    ('gallery_dl.extractor.agnph', 'AgnphPostExtractor', 'agnph', 'post', 'booru', True, '(?:https?://)?agn\\.ph/gallery/post/show/(\\d+)', ('agn.ph/gallery/post/show/',), 'https://agn.ph/gallery/post/show/12345/', None),
+    ('gallery_dl.extractor.ao3', 'Ao3WorkExtractor', 'ao3', 'work', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/works/(\\d+)', ('/works/',), 'https://archiveofourown.org/works/12345', 'Extractor for an AO3 work'),
+    ('gallery_dl.extractor.ao3', 'Ao3SeriesExtractor', 'ao3', 'series', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/series/(\\d+))', ('/series/',), 'https://archiveofourown.org/series/12345', 'Extractor for AO3 works of a series'),
+    ('gallery_dl.extractor.ao3', 'Ao3TagExtractor', 'ao3', 'tag', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/tags/([^/?#]+)/works(?:/?\\?.+)?)', ('/tags/',), 'https://archiveofourown.org/tags/TAG/works', 'Extractor for AO3 works by tag'),
+    ('gallery_dl.extractor.ao3', 'Ao3SearchExtractor', 'ao3', 'search', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/works/search/?\\?.+)', ('/works/search',), 'https://archiveofourown.org/works/search?work_search[query]=air', 'Extractor for AO3 search results'),
+    ('gallery_dl.extractor.ao3', 'Ao3UserExtractor', 'ao3', 'user', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)/users/([^/?#]+(?:/pseuds/[^/?#]+)?)(?:/profile)?/?(?:$|\\?|#)', ('/users/',), 'https://archiveofourown.org/users/USER', 'Extractor for an AO3 user profile'),
+    ('gallery_dl.extractor.ao3', 'Ao3UserWorksExtractor', 'ao3', 'user-works', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?works(?:/?\\?.+)?)', ('/users/',), 'https://archiveofourown.org/users/USER/works', 'Extractor for works of an AO3 user'),
+    ('gallery_dl.extractor.ao3', 'Ao3UserSeriesExtractor', 'ao3', 'user-series', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?series(?:/?\\?.+)?)', ('/users/',), 'https://archiveofourown.org/users/USER/series', 'Extractor for series of an AO3 user'),
+    ('gallery_dl.extractor.ao3', 'Ao3UserBookmarkExtractor', 'ao3', 'user-bookmark', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/(?:pseuds/([^/?#]+)/)?bookmarks(?:/?\\?.+)?)', ('bookmarks',), 'https://archiveofourown.org/users/USER/bookmarks', 'Extractor for bookmarked works of an AO3 user'),
+    ('gallery_dl.extractor.ao3', 'Ao3SubscriptionsExtractor', 'ao3', 'subscriptions', '', False, '(?:https?://)?(?:www\\.)?a(?:rchiveofourown|o3)\\.(?:org|com|net)(/users/([^/?#]+)/subscriptions(?:/?\\?.+)?)', ('/subscriptions',), 'https://archiveofourown.org/users/USER/subscriptions', "Extractor for your AO3 account's subscriptions"),
+    ('gallery_dl.extractor.arcalive', 'ArcalivePostExtractor', 'arcalive', 'post', '', False, '(?:https?://)?(?:www\\.)?arca\\.live/b/(?:\\w+)/(\\d+)', ('arca.live/b/',), 'https://arca.live/b/breaking/123456789', 'Extractor for an arca.live post'),
+    ('gallery_dl.extractor.arcalive', 'ArcaliveBoardExtractor', 'arcalive', 'board', '', False, '(?:https?://)?(?:www\\.)?arca\\.live/b/([^/?#]+)/?(?:\\?([^#]+))?$', ('arca.live/b/',), 'https://arca.live/b/breaking', "Extractor for an arca.live board's posts"),
+    ('gallery_dl.extractor.arcalive', 'ArcaliveUserExtractor', 'arcalive', 'user', '', False, '(?:https?://)?(?:www\\.)?arca\\.live/u/@([^/?#]+)/?(?:\\?([^#]+))?$', ('arca.live/u/@',), 'https://arca.live/u/@USER', "Extractor for an arca.live users's posts"),
+    ('gallery_dl.extractor.architizer', 'ArchitizerProjectExtractor', 'architizer', 'project', '', False, '(?:https?://)?architizer\\.com/projects/([^/?#]+)', ('architizer.com/projects/',), 'https://architizer.com/projects/NAME/', 'Extractor for project pages on architizer.com'),
+    ('gallery_dl.extractor.architizer', 'ArchitizerFirmExtractor', 'architizer', 'firm', '', False, '(?:https?://)?architizer\\.com/firms/([^/?#]+)', ('architizer.com/firms/',), 'https://architizer.com/firms/NAME/', 'Extractor for all projects of a firm'),
+    ('gallery_dl.extractor.arena', 'ArenaChannelExtractor', 'arena', 'channel', '', False, '(?:https?://)?(?:www\\.)?are\\.na/[^/?#]+/([^/?#]+)', ('are.na/',), 'https://are.na/evan-collins-1522646491/cassette-futurism', 'Extractor for are.na channels'),
+    ('gallery_dl.extractor.artstation', 'ArtstationUserExtractor', 'artstation', 'user', '', False, '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)(?:/albums/all)?|((?!www)[\\w-]+)\\.artstation\\.com(?:/projects)?)/?$', ('artstation.com/', '.artstation.com'), 'https://www.artstation.com/USER', 'Extractor for all projects of an artstation user'),
+    ('gallery_dl.extractor.artstation', 'ArtstationAlbumExtractor', 'artstation', 'album', '', False, '(?:https?://)?(?:(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)|((?!www)[\\w-]+)\\.artstation\\.com)/albums/(\\d+)', ('artstation.com/', '.artstation.com'), 'https://www.artstation.com/USER/albums/12345', 'Extractor for all projects in an artstation album'),
+    ('gallery_dl.extractor.artstation', 'ArtstationLikesExtractor', 'artstation', 'likes', '', False, '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/likes', ('artstation.com/',), 'https://www.artstation.com/USER/likes', 'Extractor for liked projects of an artstation user'),
+    ('gallery_dl.extractor.artstation', 'ArtstationCollectionExtractor', 'artstation', 'collection', '', False, '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/(\\d+)', ('artstation.com/',), 'https://www.artstation.com/USER/collections/12345', 'Extractor for an artstation collection'),
+    ('gallery_dl.extractor.artstation', 'ArtstationCollectionsExtractor', 'artstation', 'collections', '', False, '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/collections/?$', ('artstation.com/',), 'https://www.artstation.com/USER/collections', "Extractor for an artstation user's collections"),
+    ('gallery_dl.extractor.artstation', 'ArtstationChallengeExtractor', 'artstation', 'challenge', '', False, '(?:https?://)?(?:www\\.)?artstation\\.com/contests/[^/?#]+/challenges/(\\d+)/?(?:\\?sorting=([a-z]+))?', ('artstation.com/contests/',), 'https://www.artstation.com/contests/NAME/challenges/12345', 'Extractor for submissions of artstation challenges'),
+    ('gallery_dl.extractor.artstation', 'ArtstationSearchExtractor', 'artstation', 'search', '', False, '(?:https?://)?(?:\\w+\\.)?artstation\\.com/search/?\\?([^#]+)', ('artstation.com/search',), 'https://www.artstation.com/search?query=QUERY', 'Extractor for artstation search results'),
+    ('gallery_dl.extractor.artstation', 'ArtstationArtworkExtractor', 'artstation', 'artwork', '', False, '(?:https?://)?(?:\\w+\\.)?artstation\\.com/artwork/?\\?([^#]+)', ('artstation.com/artwork',), 'https://www.artstation.com/artwork?sorting=SORT', "Extractor for projects on artstation's artwork page"),
+    ('gallery_dl.extractor.artstation', 'ArtstationImageExtractor', 'artstation', 'image', '', False, '(?:https?://)?(?:(?:[\\w-]+\\.)?artstation\\.com/(?:artwork|projects|search)|artstn\\.co/p)/(\\w+)', ('artstation.com/', 'artstn.co/p'), 'https://www.artstation.com/artwork/abcde', 'Extractor for images from a single artstation project'),
+    ('gallery_dl.extractor.artstation', 'ArtstationFollowingExtractor', 'artstation', 'following', '', False, '(?:https?://)?(?:www\\.)?artstation\\.com/(?!artwork|projects|search)([^/?#]+)/following', ('artstation.com/',), 'https://www.artstation.com/USER/following', "Extractor for a user's followed users"),
+    ('gallery_dl.extractor.aryion', 'AryionGalleryExtractor', 'aryion', 'gallery', '', False, '(?:https?://)?(?:www\\.)?aryion\\.com/g4/(?:gallery/|user/|latest.php\\?name=)([^/?#]+)', ('aryion.com/g4/',), 'https://aryion.com/g4/gallery/USER', "Extractor for a user's gallery on eka's portal"),
+    ('gallery_dl.extractor.aryion', 'AryionFavoriteExtractor', 'aryion', 'favorite', '', False, '(?:https?://)?(?:www\\.)?aryion\\.com/g4/favorites/([^/?#]+)', ('aryion.com/g4/favorites/',), 'https://aryion.com/g4/favorites/USER', "Extractor for a user's favorites gallery"),
+    ('gallery_dl.extractor.aryion', 'AryionTagExtractor', 'aryion', 'tag', '', False, '(?:https?://)?(?:www\\.)?aryion\\.com/g4/tags\\.php\\?([^#]+)', ('aryion.com/g4/tags.php?',), 'https://aryion.com/g4/tags.php?tag=TAG', "Extractor for tag searches on eka's portal"),
+    ('gallery_dl.extractor.aryion', 'AryionSearchExtractor', 'aryion', 'search', '', False, '(?:https?://)?(?:www\\.)?aryion\\.com/g4/search\\.php\\?([^#]+)', ('aryion.com/g4/search.php?',), 'https://aryion.com/g4/search.php?q=TEXT&tags=TAGS&user=USER', "Extractor for searches on eka's portal"),
+    ('gallery_dl.extractor.aryion', 'AryionPostExtractor', 'aryion', 'post', '', False, '(?:https?://)?(?:www\\.)?aryion\\.com/g4/view/(\\d+)', ('aryion.com/g4/view/',), 'https://aryion.com/g4/view/12345', "Extractor for individual posts on eka's portal"),
+    ('gallery_dl.extractor.audiochan', 'AudiochanAudioExtractor', 'audiochan', 'audio', '', False, '(?:https?://)?(?:www\\.)?audiochan\\.com/a/([^/?#]+)', ('audiochan.com/a/',), 'https://audiochan.com/a/SLUG', None),
+    ('gallery_dl.extractor.audiochan', 'AudiochanUserExtractor', 'audiochan', 'user', '', False, '(?:https?://)?(?:www\\.)?audiochan\\.com/u/([^/?#]+)', ('audiochan.com/u/',), 'https://audiochan.com/u/USER', None),
+    ('gallery_dl.extractor.audiochan', 'AudiochanCollectionExtractor', 'audiochan', 'collection', '', False, '(?:https?://)?(?:www\\.)?audiochan\\.com/c/([^/?#]+)', ('audiochan.com/c/',), 'https://audiochan.com/c/SLUG', None),
+    ('gallery_dl.extractor.audiochan', 'AudiochanSearchExtractor', 'audiochan', 'search', '', False, '(?:https?://)?(?:www\\.)?audiochan\\.com/search/?\\?([^#]+)', ('audiochan.com/search',), 'https://audiochan.com/search?q=QUERY', None),
+    ('gallery_dl.extractor.batoto', 'BatotoChapterExtractor', 'batoto', 'chapter', '', False, '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/[^/?#]+|chapter)/(\\d+)', ('title/', 'chapter'), 'https://xbato.org/title/12345-MANGA/54321', 'Extractor for batoto manga chapters'),
+    ('gallery_dl.extractor.batoto', 'BatotoMangaExtractor', 'batoto', 'manga', '', False, '(?:https?://)?((?:ba|d|f|h|j|m|w)to\\.to|(?:(?:manga|read)toto|batocomic|[xz]bato)\\.(?:com|net|org)|comiko\\.(?:net|org)|bat(?:otoo|o?two)\\.com)/(?:title/(\\d+)[^/?#]*|series/(\\d+)(?:/[^/?#]*)?)/?$', ('title/', 'series/'), 'https://xbato.org/title/12345-MANGA/', 'Extractor for batoto manga'),
+    ('gallery_dl.extractor.bbc', 'BbcGalleryExtractor', 'bbc', 'gallery', '', False, '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+(?!/galleries)(?:/[^/?#]+)?)$', ('/programmes/',), 'https://www.bbc.co.uk/programmes/PATH', 'Extractor for a programme gallery on bbc.co.uk'),
+    ('gallery_dl.extractor.bbc', 'BbcProgrammeExtractor', 'bbc', 'programme', '', False, '(?:https?://)?(?:www\\.)?bbc\\.co\\.uk(/programmes/[^/?#]+/galleries)(?:/?\\?page=(\\d+))?', ('/programmes/',), 'https://www.bbc.co.uk/programmes/ID/galleries', 'Extractor for all galleries of a bbc programme'),
+    ('gallery_dl.extractor.behance', 'BehanceGalleryExtractor', 'behance', 'gallery', '', False, '(?:https?://)?(?:www\\.)?behance\\.net/gallery/(\\d+)', ('behance.net/gallery/',), 'https://www.behance.net/gallery/12345/TITLE', 'Extractor for image galleries from www.behance.net'),
+    ('gallery_dl.extractor.behance', 'BehanceUserExtractor', 'behance', 'user', '', False, '(?:https?://)?(?:www\\.)?behance\\.net/([^/?#]+)/?$', ('behance.net/',), 'https://www.behance.net/USER', "Extractor for a user's galleries from www.behance.net"),
+    ('gallery_dl.extractor.behance', 'BehanceCollectionExtractor', 'behance', 'collection', '', False, '(?:https?://)?(?:www\\.)?behance\\.net/collection/(\\d+)', ('behance.net/collection/',), 'https://www.behance.net/collection/12345/TITLE', "Extractor for a collection's galleries from www.behance.net"),
+    ('gallery_dl.extractor.bellazon', 'BellazonPostExtractor', 'bellazon', 'post', '', False, '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[\\w-]+(?:/page/\\d+)?)/?#(?:findC|c)omment-(\\d+)', ('bellazon.com/main',), 'https://www.bellazon.com/main/topic/123-SLUG/#findComment-12345', None),
+    ('gallery_dl.extractor.bellazon', 'BellazonThreadExtractor', 'bellazon', 'thread', '', False, '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/topic/\\d+-[\\w-]+)(?:/page/(\\d+))?', ('bellazon.com/main',), 'https://www.bellazon.com/main/topic/123-SLUG/', None),
+    ('gallery_dl.extractor.bellazon', 'BellazonForumExtractor', 'bellazon', 'forum', '', False, '(?:https?://)?(?:www\\.)?bellazon\\.com/main(/forum/\\d+-[\\w-]+)(?:/page/(\\d+))?', ('bellazon.com/main',), 'https://www.bellazon.com/main/forum/123-SLUG/', None),
+    ('gallery_dl.extractor.bilibili', 'BilibiliArticleExtractor', 'bilibili', 'article', '', False, '(?:https?://)?(?:t\\.bilibili\\.com|(?:www\\.)?bilibili.com/opus)/(\\d+)', ('t.bilibili.com', 'bilibili'), 'https://www.bilibili.com/opus/12345', 'Extractor for a bilibili article'),
+    ('gallery_dl.extractor.bilibili', 'BilibiliUserArticlesExtractor', 'bilibili', 'user-articles', '', False, '(?:https?://)?space\\.bilibili\\.com/(\\d+)/(?:article|upload/opus)', ('space.bilibili.com/',), 'https://space.bilibili.com/12345/article', "Extractor for a bilibili user's articles"),
+    ('gallery_dl.extractor.bilibili', 'BilibiliUserArticlesFavoriteExtractor', 'bilibili', 'user-articles-favorite', '', False, '(?:https?://)?space\\.bilibili\\.com/(\\d+)/favlist\\?fid=opus', ('space.bilibili.com/',), 'https://space.bilibili.com/12345/favlist?fid=opus', None),
+    ('gallery_dl.extractor.blogger', 'BloggerPostExtractor', '', 'post', 'blogger', True, '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))(/\\d\\d\\d\\d/\\d\\d/[^/?#]+\\.html)', ('blogger:', '.blogspot.com'), 'https://BLOG.blogspot.com/1970/01/TITLE.html', 'Extractor for a single blog post'),
+    ('gallery_dl.extractor.blogger', 'BloggerBlogExtractor', '', 'blog', 'blogger', True, '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/?$', ('blogger:', '.blogspot.com'), 'https://BLOG.blogspot.com/', 'Extractor for an entire Blogger blog'),
+    ('gallery_dl.extractor.blogger', 'BloggerSearchExtractor', '', 'search', 'blogger', True, '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/?\\?q=([^&#]+)', ('blogger:', '.blogspot.com'), 'https://BLOG.blogspot.com/search?q=QUERY', 'Extractor for Blogger search resuls'),
+    ('gallery_dl.extractor.blogger', 'BloggerLabelExtractor', '', 'label', 'blogger', True, '(?:blogger:(https?://[^/?#]+)|(?:https?://)?(?:[\\w-]+\\.blogspot\\.com()))/search/label/([^/?#]+)', ('/search/label/',), 'https://BLOG.blogspot.com/search/label/LABEL', 'Extractor for Blogger posts by label'),
+    ('gallery_dl.extractor.bluesky', 'BlueskyUserExtractor', 'bluesky', 'user', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)$', ('/profile/',), 'https://bsky.app/profile/HANDLE', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyPostsExtractor', 'bluesky', 'posts', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/posts', ('/profile/',), 'https://bsky.app/profile/HANDLE/posts', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyRepliesExtractor', 'bluesky', 'replies', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/replies', ('/profile/',), 'https://bsky.app/profile/HANDLE/replies', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyMediaExtractor', 'bluesky', 'media', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/media', ('/profile/',), 'https://bsky.app/profile/HANDLE/media', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyVideoExtractor', 'bluesky', 'video', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/video', ('/profile/',), 'https://bsky.app/profile/HANDLE/video', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyLikesExtractor', 'bluesky', 'likes', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/likes', ('/profile/',), 'https://bsky.app/profile/HANDLE/likes', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyFeedExtractor', 'bluesky', 'feed', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/feed/([^/?#]+)', ('/profile/',), 'https://bsky.app/profile/HANDLE/feed/NAME', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyListExtractor', 'bluesky', 'list', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/lists/([^/?#]+)', ('/profile/',), 'https://bsky.app/profile/HANDLE/lists/ID', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyFollowingExtractor', 'bluesky', 'following', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/follows', ('/profile/',), 'https://bsky.app/profile/HANDLE/follows', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyPostExtractor', 'bluesky', 'post', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/post/([^/?#]+)', ('/profile/',), 'https://bsky.app/profile/HANDLE/post/ID', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyInfoExtractor', 'bluesky', 'info', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/info', ('/profile/',), 'https://bsky.app/profile/HANDLE/info', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyAvatarExtractor', 'bluesky', 'avatar', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/avatar', ('/profile/',), 'https://bsky.app/profile/HANDLE/avatar', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyBackgroundExtractor', 'bluesky', 'background', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/profile/([^/?#]+)/ba(?:nner|ckground)', ('/profile/',), 'https://bsky.app/profile/HANDLE/banner', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskySearchExtractor', 'bluesky', 'search', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/search(?:/|\\?q=)(.+)', ('/search',), 'https://bsky.app/search?q=QUERY', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyHashtagExtractor', 'bluesky', 'hashtag', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/hashtag/([^/?#]+)(?:/(top|latest))?', ('/hashtag/',), 'https://bsky.app/hashtag/NAME', None),
+    ('gallery_dl.extractor.bluesky', 'BlueskyBookmarkExtractor', 'bluesky', 'bookmark', '', False, '(?:https?://)?(?:(?:www\\.)?(?:c|[fv]x)?bs[ky]y[ex]?\\.app|main\\.bsky\\.dev)/saved', ('/saved',), 'https://bsky.app/saved', None),
+    ('gallery_dl.extractor.boosty', 'BoostyUserExtractor', 'boosty', 'user', '', False, '(?:https?://)?boosty\\.to/([^/?#]+)(?:\\?([^#]+))?$', ('boosty.to/',), 'https://boosty.to/USER', 'Extractor for boosty.to user profiles'),
+    ('gallery_dl.extractor.boosty', 'BoostyMediaExtractor', 'boosty', 'media', '', False, '(?:https?://)?boosty\\.to/([^/?#]+)/media/([^/?#]+)(?:\\?([^#]+))?', ('boosty.to/',), 'https://boosty.to/USER/media/all', 'Extractor for boosty.to user media'),
+    ('gallery_dl.extractor.boosty', 'BoostyFeedExtractor', 'boosty', 'feed', '', False, '(?:https?://)?boosty\\.to/(?:\\?([^#]+))?(?:$|#)', ('boosty.to/',), 'https://boosty.to/', 'Extractor for your boosty.to subscription feed'),
+    ('gallery_dl.extractor.boosty', 'BoostyPostExtractor', 'boosty', 'post', '', False, '(?:https?://)?boosty\\.to/([^/?#]+)/posts/([0-9a-f-]+)', ('boosty.to/',), 'https://boosty.to/USER/posts/01234567-89ab-cdef-0123-456789abcd', 'Extractor for boosty.to posts'),
+    ('gallery_dl.extractor.boosty', 'BoostyFollowingExtractor', 'boosty', 'following', '', False, '(?:https?://)?boosty\\.to/app/settings/subscriptions', ('boosty.to/app/settings/subscriptions',), 'https://boosty.to/app/settings/subscriptions', 'Extractor for your boosty.to subscribed users'),
+    ('gallery_dl.extractor.boosty', 'BoostyDirectMessagesExtractor', 'boosty', 'direct-messages', '', False, '(?:https?://)?boosty\\.to/app/messages/?\\?dialogId=(\\d+)', ('boosty.to/app/messages',), 'https://boosty.to/app/messages?dialogId=12345', 'Extractor for boosty.to direct messages'),
+    ('gallery_dl.extractor.booth', 'BoothItemExtractor', 'booth', 'item', '', False, '(?:https?://)?(?:[\\w-]+\\.)?booth\\.pm/(?:\\w\\w/)?items/(\\d+)', ('booth.pm/',), 'https://booth.pm/items/12345', None),
+    ('gallery_dl.extractor.booth', 'BoothShopExtractor', 'booth', 'shop', '', False, '(?:https?://)?([\\w-]+\\.)booth\\.pm/(?:\\w\\w/)?(?:items)?', ('booth.pm/',), 'https://SHOP.booth.pm/', None),
+    ('gallery_dl.extractor.bunkr', 'BunkrAlbumExtractor', 'bunkr', 'album', 'lolisafe', True, '(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?:s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|org)))/a/([^/?#]+)', None, 'https://bunkr.si/a/ID', 'Extractor for bunkr.si albums'),
+    ('gallery_dl.extractor.bunkr', 'BunkrMediaExtractor', 'bunkr', 'media', 'lolisafe', True, '(?:bunkr:(?:https?://)?([^/?#]+)|(?:https?://)?(?:app\\.)?(bunkr+\\.(?:s[kiu]|c[ir]|fi|p[hks]|ru|la|is|to|a[cx]|black|cat|media|red|site|ws|org)))(/[fvid]/[^/?#]+)', None, 'https://bunkr.si/f/FILENAME', 'Extractor for bunkr.si media links'),
+    ('gallery_dl.extractor.catbox', 'CatboxAlbumExtractor', 'catbox', 'album', '', False, '(?:https?://)?(?:www\\.)?catbox\\.moe(/c/[^/?#]+)', ('catbox.moe',), 'https://catbox.moe/c/ID', 'Extractor for catbox albums'),
+    ('gallery_dl.extractor.catbox', 'CatboxFileExtractor', 'catbox', 'file', '', False, '(?:https?://)?(?:files|litter|de)\\.catbox\\.moe/([^/?#]+)', ('.catbox.moe/',), 'https://files.catbox.moe/NAME.EXT', 'Extractor for catbox files'),
+    ('gallery_dl.extractor.cfake', 'CfakeCelebrityExtractor', 'cfake', 'celebrity', '', False, '(?:https?://)?(?:www\\.)?cfake\\.com/images/(celebrity)/([^/?#]+)/(\\d+)()(?:/p(\\d+))?', ('cfake.com/images/',), 'https://cfake.com/images/celebrity/NAME/123', 'Extractor for celebrity image galleries from cfake.com'),
+    ('gallery_dl.extractor.cfake', 'CfakeCategoryExtractor', 'cfake', 'category', '', False, '(?:https?://)?(?:www\\.)?cfake\\.com/images/(categories)/([^/?#]+)/(\\d+)()(?:/p(\\d+))?', ('cfake.com/images/',), 'https://cfake.com/images/categories/NAME/123', 'Extractor for category image galleries from cfake.com'),
+    ('gallery_dl.extractor.cfake', 'CfakeCreatedExtractor', 'cfake', 'created', '', False, '(?:https?://)?(?:www\\.)?cfake\\.com/images/(created)/([^/?#]+)/(\\d+)/(\\d+)(?:/p(\\d+))?', ('cfake.com/images/',), 'https://cfake.com/images/created/NAME/12345/123', "Extractor for 'created' image galleries from cfake.com"),
+    ('gallery_dl.extractor.cfake', 'CfakeCountryExtractor', 'cfake', 'country', '', False, '(?:https?://)?(?:www\\.)?cfake\\.com/images/(country)/([^/?#]+)/(\\d+)/(\\d+)(?:/p(\\d+))?', ('cfake.com/images/',), 'https://cfake.com/images/country/NAME/12345/123', 'Extractor for country image galleries from cfake.com'),
+    ('gallery_dl.extractor.chevereto', 'CheveretoImageExtractor', '', 'image', 'chevereto', True, '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/im(?:g|age)/[^/?#]+)', None, 'https://jpg7.cr/img/TITLE.ID', 'Extractor for chevereto images'),
+    ('gallery_dl.extractor.chevereto', 'CheveretoVideoExtractor', '', 'video', 'chevereto', True, '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/video/[^/?#]+)', ('/video/',), 'https://imagepond.net/video/TITLE.ID', 'Extractor for chevereto videos'),
+    ('gallery_dl.extractor.chevereto', 'CheveretoAlbumExtractor', '', 'album', 'chevereto', True, '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/a(?:lbum)?/[^/?#]+(?:/sub)?)', None, 'https://jpg7.cr/album/TITLE.ID', 'Extractor for chevereto albums'),
+    ('gallery_dl.extractor.chevereto', 'CheveretoCategoryExtractor', '', 'category', 'chevereto', True, '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/category/[^/?#]+)', ('/category/',), 'https://imglike.com/category/TITLE', 'Extractor for chevereto galleries'),
+    ('gallery_dl.extractor.chevereto', 'CheveretoUserExtractor', '', 'user', 'chevereto', True, '(?:chevereto:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?jpe?g\\d?\\.(?:cr|su|pet|fish(?:ing)?|church)()|(?:www\\.)?imagepond\\.net()|(?:www\\.)?imglike\\.com()))(/[^/?#]+(?:/albums)?)', None, 'https://jpg7.cr/USER', 'Extractor for chevereto users'),
+    ('gallery_dl.extractor.cien', 'CienArticleExtractor', 'cien', 'article', '', False, '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)/article/(\\d+)', ('/creator/',), 'https://ci-en.net/creator/123/article/12345', None),
+    ('gallery_dl.extractor.cien', 'CienCreatorExtractor', 'cien', 'creator', '', False, '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/creator/(\\d+)(?:/article(?:\\?([^#]+))?)?/?$', ('/creator/',), 'https://ci-en.net/creator/123', None),
+    ('gallery_dl.extractor.cien', 'CienRecentExtractor', 'cien', 'recent', '', False, '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/recent(?:\\?([^#]+))?', ('/mypage/recent',), 'https://ci-en.net/mypage/recent', None),
+    ('gallery_dl.extractor.cien', 'CienFollowingExtractor', 'cien', 'following', '', False, '(?:https?://)?ci-en\\.(?:net|dlsite\\.com)/mypage/subscription(/following)?', ('/mypage/subscription',), 'https://ci-en.net/mypage/subscription', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiModelExtractor', 'civitai', 'model', '', False, '(?:https?://)?civitai\\.com/models/(\\d+)(?:/?\\?modelVersionId=(\\d+))?', ('civitai.com/models/',), 'https://civitai.com/models/12345/TITLE', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiImageExtractor', 'civitai', 'image', '', False, '(?:https?://)?civitai\\.com/images/(\\d+)', ('civitai.com/images/',), 'https://civitai.com/images/12345', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiCollectionExtractor', 'civitai', 'collection', '', False, '(?:https?://)?civitai\\.com/collections/(\\d+)', ('civitai.com/collections/',), 'https://civitai.com/collections/12345', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiPostExtractor', 'civitai', 'post', '', False, '(?:https?://)?civitai\\.com/posts/(\\d+)', ('civitai.com/posts/',), 'https://civitai.com/posts/12345', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiTagExtractor', 'civitai', 'tag', '', False, '(?:https?://)?civitai\\.com/tag/([^/?&#]+)', ('civitai.com/tag/',), 'https://civitai.com/tag/TAG', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiSearchModelsExtractor', 'civitai', 'search-models', '', False, '(?:https?://)?civitai\\.com/search/models\\?([^#]+)', ('civitai.com/search/models?',), 'https://civitai.com/search/models?query=QUERY', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiSearchImagesExtractor', 'civitai', 'search-images', '', False, '(?:https?://)?civitai\\.com/search/images\\?([^#]+)', ('civitai.com/search/images?',), 'https://civitai.com/search/images?query=QUERY', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiModelsExtractor', 'civitai', 'models', '', False, '(?:https?://)?civitai\\.com/models(?:/?\\?([^#]+))?(?:$|#)', ('civitai.com/models',), 'https://civitai.com/models', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiImagesExtractor', 'civitai', 'images', '', False, '(?:https?://)?civitai\\.com/images(?:/?\\?([^#]+))?(?:$|#)', ('civitai.com/images',), 'https://civitai.com/images', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiVideosExtractor', 'civitai', 'videos', '', False, '(?:https?://)?civitai\\.com/videos(?:/?\\?([^#]+))?(?:$|#)', ('civitai.com/videos',), 'https://civitai.com/videos', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiPostsExtractor', 'civitai', 'posts', '', False, '(?:https?://)?civitai\\.com/posts(?:/?\\?([^#]+))?(?:$|#)', ('civitai.com/posts',), 'https://civitai.com/posts', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserExtractor', 'civitai', 'user', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/?(?:$|\\?|#)', ('civitai.com/user/',), 'https://civitai.com/user/USER', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserModelsExtractor', 'civitai', 'user-models', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/models/?(?:\\?([^#]+))?', ('civitai.com/user/',), 'https://civitai.com/user/USER/models', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserPostsExtractor', 'civitai', 'user-posts', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/posts/?(?:\\?([^#]+))?', ('civitai.com/user/',), 'https://civitai.com/user/USER/posts', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserImagesExtractor', 'civitai', 'user-images', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/images/?(?:\\?([^#]+))?', ('civitai.com/user/',), 'https://civitai.com/user/USER/images', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserVideosExtractor', 'civitai', 'user-videos', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/videos/?(?:\\?([^#]+))?', ('civitai.com/user/',), 'https://civitai.com/user/USER/videos', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiUserCollectionsExtractor', 'civitai', 'user-collections', '', False, '(?:https?://)?civitai\\.com/user/([^/?#]+)/collections/?(?:\\?([^#]+))?', ('civitai.com/user/',), 'https://civitai.com/user/USER/collections', None),
+    ('gallery_dl.extractor.civitai', 'CivitaiGeneratedExtractor', 'civitai', 'generated', '', False, '(?:https?://)?civitai\\.com/generate', ('civitai.com/generate',), 'https://civitai.com/generate', 'Extractor for your generated files feed'),
+    ('gallery_dl.extractor.comedywildlifephoto', 'ComedywildlifephotoGalleryExtractor', 'comedywildlifephoto', 'gallery', '', False, '(?:https?://)?(?:www\\.)?comedywildlifephoto\\.com(/gallery/[^/?#]+/[^/?#]+\\.php)', ('comedywildlifephoto.com',), 'https://www.comedywildlifephoto.com/gallery/SECTION/TITLE.php', 'Extractor for comedywildlifephoto galleries'),
+    ('gallery_dl.extractor.comick', 'ComickCoversExtractor', 'comick', 'covers', '', False, '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/cover', ('comick.io/comic/',), 'https://comick.io/comic/MANGA/cover', 'Extractor for comick.io manga covers'),
+    ('gallery_dl.extractor.comick', 'ComickChapterExtractor', 'comick', 'chapter', '', False, '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/(\\w+(?:-(?:chapter|volume)-[^/?#]+)?)', ('comick.io/comic/',), 'https://comick.io/comic/MANGA/ID-chapter-123-en', 'Extractor for comick.io manga chapters'),
+    ('gallery_dl.extractor.comick', 'ComickMangaExtractor', 'comick', 'manga', '', False, '(?:https?://)?(?:www\\.)?comick\\.io/comic/([\\w-]+)/?(?:\\?([^#]+))?', ('comick.io/comic/',), 'https://comick.io/comic/MANGA', 'Extractor for comick.io manga'),
+    ('gallery_dl.extractor.comicvine', 'ComicvineTagExtractor', 'comicvine', 'tag', '', False, '(?:https?://)?comicvine\\.gamespot\\.com(/([^/?#]+)/(\\d+-\\d+)/images/.*)', ('comicvine.gamespot.com',), 'https://comicvine.gamespot.com/TAG/123-45/images/', 'Extractor for a gallery on comicvine.gamespot.com'),
+    ('gallery_dl.extractor.cyberdrop', 'CyberdropAlbumExtractor', 'cyberdrop', 'album', 'lolisafe', True, '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/a/([^/?#]+)', ('cyberdrop.',), 'https://cyberdrop.cr/a/ID', 'Extractor for cyberdrop albums'),
+    ('gallery_dl.extractor.cyberdrop', 'CyberdropMediaExtractor', 'cyberdrop', 'media', 'lolisafe', True, '(?:https?://)?(?:www\\.)?cyberdrop\\.(?:cr|me|to)/f/([^/?#]+)', ('cyberdrop.',), 'https://cyberdrop.cr/f/ID', 'Extractor for cyberdrop media links'),
+    ('gallery_dl.extractor.cyberfile', 'CyberfileFolderExtractor', 'cyberfile', 'folder', '', False, '(?:https?://)?(?:www\\.)?cyberfile\\.me/folder/([0-9a-f]+)', ('cyberfile.me/folder/',), 'https://cyberfile.me/folder/0123456789abcdef/NAME', None),
+    ('gallery_dl.extractor.cyberfile', 'CyberfileSharedExtractor', 'cyberfile', 'shared', '', False, '(?:https?://)?(?:www\\.)?cyberfile\\.me/shared/([a-zA-Z0-9]+)', ('cyberfile.me/shared/',), 'https://cyberfile.me/shared/AbCdEfGhIjK', None),
+    ('gallery_dl.extractor.cyberfile', 'CyberfileFileExtractor', 'cyberfile', 'file', '', False, '(?:https?://)?(?:www\\.)?cyberfile\\.me/([a-zA-Z0-9]+)', ('cyberfile.me/',), 'https://cyberfile.me/AbCdE', None),
+    ('gallery_dl.extractor.danbooru', 'DanbooruTagExtractor', '', 'tag', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/posts\\?(?:[^&#]*&)*tags=([^&#]*)', ('danbooru:', '.donmai.us', 'donmai.moe', 'booru.allthefallen.moe', 'aibooru.', 'booru.borvar.art'), 'https://danbooru.donmai.us/posts?tags=TAG', 'Extractor for danbooru posts from tag searches'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruRandomExtractor', '', 'random', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/posts/random(?:\\?(?:[^&#]*&)*tags=([^&#]*))?', ('/posts/random',), 'https://danbooru.donmai.us/posts/random?tags=TAG', 'Extractor for a random danbooru post'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruPoolExtractor', '', 'pool', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/pool(?:s|/show)/(\\d+)', ('danbooru:', '.donmai.us', 'donmai.moe', 'booru.allthefallen.moe', 'aibooru.', 'booru.borvar.art'), 'https://danbooru.donmai.us/pools/12345', 'Extractor for Danbooru pools'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruFavgroupExtractor', '', 'favgroup', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/favorite_group(?:s|/show)/(\\d+)', ('/favorite_group',), 'https://danbooru.donmai.us/favorite_groups/12345', 'Extractor for Danbooru favorite groups'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruPostExtractor', '', 'post', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/post(?:s|/show)/(\\d+)', ('danbooru:', '.donmai.us', 'donmai.moe', 'booru.allthefallen.moe', 'aibooru.', 'booru.borvar.art'), 'https://danbooru.donmai.us/posts/12345', 'Extractor for single danbooru posts'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruMediaassetExtractor', '', 'media-asset', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/media_assets/(\\d+)', ('/media_assets/',), 'https://danbooru.donmai.us/media_assets/12345', 'Extractor for a danbooru media asset'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruPopularExtractor', '', 'popular', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/(?:explore/posts/)?popular(?:\\?([^#]*))?', ('danbooru:', '.donmai.us', 'donmai.moe', 'booru.allthefallen.moe', 'aibooru.', 'booru.borvar.art'), 'https://danbooru.donmai.us/explore/posts/popular', 'Extractor for popular images from danbooru'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruArtistExtractor', '', 'artist', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/(\\d+)', ('/artists/',), 'https://danbooru.donmai.us/artists/12345', 'Extractor for danbooru artists'),
+    ('gallery_dl.extractor.danbooru', 'DanbooruArtistSearchExtractor', '', 'artist-search', 'Danbooru', True, '(?:Danbooru:(https?://[^/?#]+)|(?:https?://)?(?:(?:(?:danbooru|hijiribe|sonohara|safebooru)\\.donmai\\.us|donmai\\.moe)()|booru\\.allthefallen\\.moe()|(?:safe\\.|general\\.)?aibooru\\.(?:online|download)()|booru\\.borvar\\.art()))/artists/?\\?([^#]+)', ('danbooru:', '.donmai.us', 'donmai.moe', 'booru.allthefallen.moe', 'aibooru.', 'booru.borvar.art'), 'https://danbooru.donmai.us/artists?QUERY', 'Extractor for danbooru artist searches'),
+    ('gallery_dl.extractor.dandadan', 'DandadanChapterExtractor', 'dandadan', 'chapter', '', False, '(?:https?://)?(?:www\\.)?dandadan\\.net(/manga/dandadan-chapter-([^/?#]+)/?)', ('/manga/dandadan-chapter-',), 'https://dandadan.net/manga/dandadan-chapter-123/', 'Extractor for dandadan manga chapters'),
+    ('gallery_dl.extractor.dandadan', 'DandadanMangaExtractor', 'dandadan', 'manga', '', False, '(?:https?://)?(?:www\\.)?dandadan\\.net(/)', ('dandadan.net',), 'https://dandadan.net/', 'Extractor for dandadan manga'),
+    ('gallery_dl.extractor.dankefuerslesen', 'DankefuerslesenChapterExtractor', 'dankefuerslesen', 'chapter', '', False, '(?:https?://)?(?:www\\.)?danke\\.moe/read/manga/([\\w-]+)/([\\w-]+)', ('danke.moe/read/manga/',), 'https://danke.moe/read/manga/TITLE/123/1/', 'Extractor for Danke fürs Lesen manga chapters'),
+    ('gallery_dl.extractor.dankefuerslesen', 'DankefuerslesenMangaExtractor', 'dankefuerslesen', 'manga', '', False, '(?:https?://)?(?:www\\.)?danke\\.moe/read/manga/([^/?#]+)', ('danke.moe/read/manga/',), 'https://danke.moe/read/manga/TITLE/', 'Extractor for Danke fürs Lesen manga'),
+    ('gallery_dl.extractor.desktopography', 'DesktopographySiteExtractor', 'desktopography', 'site', '', False, '(?:https?://)?desktopography\\.net/$', ('desktopography.net/',), 'https://desktopography.net/', 'Extractor for all desktopography exhibitions '),
+    ('gallery_dl.extractor.desktopography', 'DesktopographyExhibitionExtractor', 'desktopography', 'exhibition', '', False, '(?:https?://)?desktopography\\.net/exhibition-([^/?#]+)/', ('desktopography.net/exhibition-',), 'https://desktopography.net/exhibition-2020/', 'Extractor for a yearly desktopography exhibition'),
+    ('gallery_dl.extractor.desktopography', 'DesktopographyEntryExtractor', 'desktopography', 'entry', '', False, '(?:https?://)?desktopography\\.net/portfolios/([\\w-]+)', ('desktopography.net/portfolios/',), 'https://desktopography.net/portfolios/NAME/', 'Extractor for all resolutions of a desktopography wallpaper'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartUserExtractor', 'deviantart', 'user', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/?$', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER', "Extractor for an artist's user profile"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartGalleryExtractor', 'deviantart', 'gallery', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery(?:/all|/recommended-for-you)?/?(\\?(?!q=).*)?$', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/gallery/', "Extractor for all deviations from an artist's gallery"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartAvatarExtractor', 'deviantart', 'avatar', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/avatar', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/avatar/', "Extractor for an artist's avatar"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartBackgroundExtractor', 'deviantart', 'background', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/ba(?:nner|ckground)', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/banner/', "Extractor for an artist's banner"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartFolderExtractor', 'deviantart', 'folder', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/([^/?#]+)/([^/?#]+)', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/gallery/12345/TITLE', "Extractor for deviations inside an artist's gallery folder"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartStashExtractor', 'deviantart', 'stash', '', False, '(?:https?://)?(?:(?:www\\.)?deviantart\\.com/stash|sta\\.s(h))/([a-z0-9]+)', ('deviantart.com/stash', 'sta.s'), 'https://www.deviantart.com/stash/abcde', 'Extractor for sta.sh-ed deviations'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartFavoriteExtractor', 'deviantart', 'favorite', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites(?:/all|/?\\?catpath=)?/?$', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/favourites/', "Extractor for an artist's favorites"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartCollectionExtractor', 'deviantart', 'collection', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/favourites/([^/?#]+)/([^/?#]+)', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/favourites/12345/TITLE', 'Extractor for a single favorite collection'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartJournalExtractor', 'deviantart', 'journal', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:posts(?:/journals)?|journal)/?(?:\\?.*)?$', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/posts/journals/', "Extractor for an artist's journals"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartStatusExtractor', 'deviantart', 'status', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/posts/statuses', ('/posts/statuses',), 'https://www.deviantart.com/USER/posts/statuses/', "Extractor for an artist's status updates"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartTagExtractor', 'deviantart', 'tag', '', False, '(?:https?://)?www\\.deviantart\\.com/tag/([^/?#]+)', ('www.deviantart.com/tag/',), 'https://www.deviantart.com/tag/TAG', 'Extractor for deviations from tag searches'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartWatchExtractor', 'deviantart', 'watch', '', False, '(?:https?://)?(?:www\\.)?deviantart\\.com/(?:watch/deviations|notifications/watch)()()', ('watch/deviations', 'notifications/watch'), 'https://www.deviantart.com/watch/deviations', 'Extractor for Deviations from watched users'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartWatchPostsExtractor', 'deviantart', 'watch-posts', '', False, '(?:https?://)?(?:www\\.)?deviantart\\.com/watch/posts()()', ('deviantart.com/watch/posts',), 'https://www.deviantart.com/watch/posts', 'Extractor for Posts from watched users'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartDeviationExtractor', 'deviantart', 'deviation', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(art|journal)/(?:[^/?#]+-)?(\\d+)|(?:https?://)?(?:www\\.)?(?:fx)?deviantart\\.com/(?:view/|deviation/|view(?:-full)?\\.php/*\\?(?:[^#]+&)?id=)(\\d+)|(?:https?://)?fav\\.me/d([0-9a-z]+)', ('deviantart.com/', 'deviantart.com', 'deviantart.com/', 'fav.me/d'), 'https://www.deviantart.com/UsER/art/TITLE-12345', 'Extractor for single deviations'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartScrapsExtractor', 'deviantart', 'scraps', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/(?:\\?catpath=)?scraps\\b', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/gallery/scraps', "Extractor for an artist's scraps"),
+    ('gallery_dl.extractor.deviantart', 'DeviantartSearchExtractor', 'deviantart', 'search', '', False, '(?:https?://)?www\\.deviantart\\.com/search(?:/deviations)?/?\\?([^#]+)', ('www.deviantart.com/search',), 'https://www.deviantart.com/search?q=QUERY', 'Extractor for deviantart search results'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartGallerySearchExtractor', 'deviantart', 'gallery-search', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/gallery/?\\?(q=[^#]+)', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/gallery?q=QUERY', 'Extractor for deviantart gallery searches'),
+    ('gallery_dl.extractor.deviantart', 'DeviantartFollowingExtractor', 'deviantart', 'following', '', False, '(?:https?://)?(?:(?:www\\.)?(?:fx)?deviantart\\.com/(?!watch/)([\\w-]+)|(?!www\\.)([\\w-]+)\\.(?:fx)?deviantart\\.com)/(?:about#)?watching', ('deviantart.com/', 'deviantart.com'), 'https://www.deviantart.com/USER/about#watching', "Extractor for user's watched users"),
+    ('gallery_dl.extractor.discord', 'DiscordChannelExtractor', 'discord', 'channel', '', False, '(?:https?://)?discord\\.com/channels/(\\d+)/(?:\\d+/threads/)?(\\d+)/?$', ('discord.com/channels/',), 'https://discord.com/channels/1234567890/9876543210', None),
+    ('gallery_dl.extractor.discord', 'DiscordMessageExtractor', 'discord', 'message', '', False, '(?:https?://)?discord\\.com/channels/(\\d+)/(\\d+)/(\\d+)/?$', ('discord.com/channels/',), 'https://discord.com/channels/1234567890/9876543210/2468013579', None),
+    ('gallery_dl.extractor.discord', 'DiscordServerExtractor', 'discord', 'server', '', False, '(?:https?://)?discord\\.com/channels/(\\d+)/?$', ('discord.com/channels/',), 'https://discord.com/channels/1234567890', None),
+    ('gallery_dl.extractor.discord', 'DiscordDirectMessagesExtractor', 'discord', 'direct-messages', '', False, '(?:https?://)?discord\\.com/channels/@me/(\\d+)/?$', ('discord.com/channels/@me/',), 'https://discord.com/channels/@me/1234567890', None),
+    ('gallery_dl.extractor.discord', 'DiscordDirectMessageExtractor', 'discord', 'direct-message', '', False, '(?:https?://)?discord\\.com/channels/@me/(\\d+)/(\\d+)/?$', ('discord.com/channels/@me/',), 'https://discord.com/channels/@me/1234567890/9876543210', None),
+    ('gallery_dl.extractor.dynastyscans', 'DynastyscansChapterExtractor', 'dynastyscans', 'chapter', '', False, '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/chapters/[^/?#]+)', ('dynasty-scans.com',), 'https://dynasty-scans.com/chapters/NAME', 'Extractor for manga-chapters from dynasty-scans.com'),
+    ('gallery_dl.extractor.dynastyscans', 'DynastyscansMangaExtractor', 'dynastyscans', 'manga', '', False, '(?:https?://)?(?:www\\.)?dynasty-scans\\.com(/series/[^/?#]+)', ('dynasty-scans.com',), 'https://dynasty-scans.com/series/NAME', None),
+    ('gallery_dl.extractor.dynastyscans', 'DynastyscansSearchExtractor', 'dynastyscans', 'search', '', False, '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/?(?:\\?([^#]+))?$', ('dynasty-scans.com/images',), 'https://dynasty-scans.com/images?QUERY', 'Extrator for image search results on dynasty-scans.com'),
+    ('gallery_dl.extractor.dynastyscans', 'DynastyscansImageExtractor', 'dynastyscans', 'image', '', False, '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/images/(\\d+)', ('dynasty-scans.com/images/',), 'https://dynasty-scans.com/images/12345', 'Extractor for individual images on dynasty-scans.com'),
+    ('gallery_dl.extractor.dynastyscans', 'DynastyscansAnthologyExtractor', 'dynastyscans', 'anthology', '', False, '(?:https?://)?(?:www\\.)?dynasty-scans\\.com/anthologies/([^/?#]+)', ('dynasty-scans.com/anthologies/',), 'https://dynasty-scans.com/anthologies/TITLE', 'Extractor for dynasty-scans anthologies'),
+    ('gallery_dl.extractor.e621', 'E621TagExtractor', '', 'tag', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/posts?(?:\\?[^#]*?tags=|/index/\\d+/)([^&#]*)', ('/post',), 'https://e621.net/posts?tags=TAG', 'Extractor for e621 posts from tag searches'),
+    ('gallery_dl.extractor.e621', 'E621PoolExtractor', '', 'pool', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/pool(?:s|/show)/(\\d+)', ('/pool',), 'https://e621.net/pools/12345', 'Extractor for e621 pools'),
+    ('gallery_dl.extractor.e621', 'E621PostExtractor', '', 'post', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/post(?:s|/show)/(\\d+)', ('/post',), 'https://e621.net/posts/12345', 'Extractor for single e621 posts'),
+    ('gallery_dl.extractor.e621', 'E621PopularExtractor', '', 'popular', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/explore/posts/popular(?:\\?([^#]*))?', ('/explore/posts/popular',), 'https://e621.net/explore/posts/popular', 'Extractor for popular images from e621'),
+    ('gallery_dl.extractor.e621', 'E621ArtistExtractor', '', 'artist', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/artists/(\\d+)', ('/artists/',), 'https://e621.net/artists/12345', 'Extractor for e621 artists'),
+    ('gallery_dl.extractor.e621', 'E621ArtistSearchExtractor', '', 'artist-search', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/artists/?\\?([^#]+)', ('/artists',), 'https://e621.net/artists?QUERY', 'Extractor for e621 artist searches'),
+    ('gallery_dl.extractor.e621', 'E621FavoriteExtractor', '', 'favorite', 'E621', True, '(?:E621:(https?://[^/?#]+)|(?:https?://)?(?:e621\\.(?:net|cc)()|e926\\.net()|e6ai\\.net()))/favorites(?:\\?([^#]*))?', ('/favorites',), 'https://e621.net/favorites', 'Extractor for e621 favorites'),
+    ('gallery_dl.extractor.e621', 'E621FrontendExtractor', 'e621', 'frontend', 'E621', False, '(?:https?://)?e621\\.(?:cc/\\?tags|anthro\\.fr/\\?q)=([^&#]*)', ('cc/?tags', 'anthro.fr/?q'), 'https://e621.cc/?tags=TAG', 'Extractor for alternative e621 frontends'),
+    ('gallery_dl.extractor.eporner', 'EpornerGalleryExtractor', 'eporner', 'gallery', '', False, '(?:https?://)?(?:www\\.)?eporner\\.com/gallery/(\\w+)(?:/([\\w-]+))?', ('eporner.com/gallery/',), 'https://www.eporner.com/gallery/GID/SLUG/', 'Extractor for image galleries from eporner.com'),
+    ('gallery_dl.extractor.erome', 'EromeAlbumExtractor', 'erome', 'album', '', False, '(?:https?://)?(?:www\\.)?erome\\.com/a/(\\w+)', ('erome.com/a/',), 'https://www.erome.com/a/ID', 'Extractor for albums on erome.com'),
+    ('gallery_dl.extractor.erome', 'EromeUserExtractor', 'erome', 'user', '', False, '(?:https?://)?(?:www\\.)?erome\\.com/(?!a/|search\\?)([^/?#]+)(?:/?\\?([^#]+))?', ('erome.com/',), 'https://www.erome.com/USER', None),
+    ('gallery_dl.extractor.erome', 'EromeSearchExtractor', 'erome', 'search', '', False, '(?:https?://)?(?:www\\.)?erome\\.com/search/?\\?(q=[^#]+)', ('erome.com/search',), 'https://www.erome.com/search?q=QUERY', None),
+    ('gallery_dl.extractor.everia', 'EveriaPostExtractor', 'everia', 'post', '', False, '(?:https?://)?everia\\.club(/\\d{4}/\\d{2}/\\d{2}/[^/?#]+)', ('everia.club',), 'https://everia.club/0000/00/00/TITLE', None),
+    ('gallery_dl.extractor.everia', 'EveriaTagExtractor', 'everia', 'tag', '', False, '(?:https?://)?everia\\.club(/tag/[^/?#]+)', ('everia.club',), 'https://everia.club/tag/TAG', None),
+    ('gallery_dl.extractor.everia', 'EveriaCategoryExtractor', 'everia', 'category', '', False, '(?:https?://)?everia\\.club(/category/[^/?#]+)', ('everia.club',), 'https://everia.club/category/CATEGORY', None),
+    ('gallery_dl.extractor.everia', 'EveriaDateExtractor', 'everia', 'date', '', False, '(?:https?://)?everia\\.club(/\\d{4}(?:/\\d{2})?(?:/\\d{2})?)(?:/page/\\d+)?/?$', ('everia.club',), 'https://everia.club/0000/00/00', None),
+    ('gallery_dl.extractor.everia', 'EveriaSearchExtractor', 'everia', 'search', '', False, '(?:https?://)?everia\\.club/(?:page/\\d+/)?\\?s=([^&#]+)', ('everia.club/',), 'https://everia.club/?s=SEARCH', None),
+    ('gallery_dl.extractor.exhentai', 'ExhentaiGalleryExtractor', 'exhentai', 'gallery', '', False, '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/(?:g/(\\d+)/([\\da-f]{10})|s/([\\da-f]{10})/(\\d+)-(\\d+))', ('hentai.org/',), 'https://e-hentai.org/g/12345/67890abcde/', 'Extractor for image galleries from exhentai.org'),
+    ('gallery_dl.extractor.exhentai', 'ExhentaiSearchExtractor', 'exhentai', 'search', '', False, '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/(?:\\?([^#]*)|tag/([^/?#]+))', ('hentai.org/',), 'https://e-hentai.org/?f_search=QUERY', 'Extractor for exhentai search results'),
+    ('gallery_dl.extractor.exhentai', 'ExhentaiFavoriteExtractor', 'exhentai', 'favorite', '', False, '(?:https?://)?(e[x-]|g\\.e-)hentai\\.org/favorites\\.php(?:\\?([^#]*)())?', ('hentai.org/favorites.php',), 'https://e-hentai.org/favorites.php', 'Extractor for favorited exhentai galleries'),
+    ('gallery_dl.extractor.facebook', 'FacebookPhotoExtractor', 'facebook', 'photo', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/photos/[^/?#]+/|photo(?:.php)?/?\\?(?:[^&#]+&)*fbid=)([^/?&#]+)[^/?#]*(?<!&setextract)$', ('facebook.com/',), 'https://www.facebook.com/photo/?fbid=PHOTO_ID', 'Base class for Facebook Photo extractors'),
+    ('gallery_dl.extractor.facebook', 'FacebookSetExtractor', 'facebook', 'set', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:(?:media/set|photo)/?\\?(?:[^&#]+&)*set=([^&#]+)[^/?#]*(?<!&setextract)$|([^/?#]+/posts/[^/?#]+)|photo/\\?(?:[^&#]+&)*fbid=([^/?&#]+)&set=([^/?&#]+)&setextract)', ('facebook.com/',), 'https://www.facebook.com/media/set/?set=SET_ID', 'Base class for Facebook Set extractors'),
+    ('gallery_dl.extractor.facebook', 'FacebookVideoExtractor', 'facebook', 'video', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?:[^/?#]+/videos/|watch/?\\?v=)([^/?&#]+)', ('facebook.com/',), 'https://www.facebook.com/watch/?v=VIDEO_ID', 'Base class for Facebook Video extractors'),
+    ('gallery_dl.extractor.facebook', 'FacebookInfoExtractor', 'facebook', 'info', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/info', ('facebook.com/',), 'https://www.facebook.com/USERNAME/info', 'Extractor for Facebook Profile data'),
+    ('gallery_dl.extractor.facebook', 'FacebookAlbumsExtractor', 'facebook', 'albums', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos_albums(?:/([^/?#]+))?', ('/photos_albums',), 'https://www.facebook.com/USERNAME/photos_albums', 'Extractor for Facebook Profile albums'),
+    ('gallery_dl.extractor.facebook', 'FacebookPhotosExtractor', 'facebook', 'photos', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/photos(?:_by)?', ('facebook.com/',), 'https://www.facebook.com/USERNAME/photos', 'Extractor for Facebook Profile Photos'),
+    ('gallery_dl.extractor.facebook', 'FacebookAvatarExtractor', 'facebook', 'avatar', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/avatar', ('facebook.com/',), 'https://www.facebook.com/USERNAME/avatar', 'Extractor for Facebook Profile Avatars'),
+    ('gallery_dl.extractor.facebook', 'FacebookUserExtractor', 'facebook', 'user', '', False, '(?:https?://)?(?:[\\w-]+\\.)?facebook\\.com/(?!media/|photo/|photo.php|watch/|permalink.php)(?:profile\\.php\\?id=|people/[^/?#]+/)?([^/?&#]+)/?(?:$|\\?|#)', ('facebook.com/',), 'https://www.facebook.com/USERNAME', 'Extractor for Facebook Profiles'),
+    ('gallery_dl.extractor.fanbox', 'FanboxCreatorExtractor', 'fanbox', 'creator', '', False, '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))(?:/posts)?/?$', ('.fanbox.cc', 'fanbox.cc/@'), 'https://USER.fanbox.cc/', "Extractor for a Fanbox creator's works"),
+    ('gallery_dl.extractor.fanbox', 'FanboxPostExtractor', 'fanbox', 'post', '', False, '(?:https?://)?(?:(?!www\\.)([\\w-]+)\\.fanbox\\.cc|(?:www\\.)?fanbox\\.cc/@([\\w-]+))/posts/(\\d+)', ('.fanbox.cc', 'fanbox.cc/@'), 'https://USER.fanbox.cc/posts/12345', 'Extractor for media from a single Fanbox post'),
+    ('gallery_dl.extractor.fanbox', 'FanboxHomeExtractor', 'fanbox', 'home', '', False, '(?:https?://)?(?:www\\.)?fanbox\\.cc/?$', ('fanbox.cc',), 'https://fanbox.cc/', 'Extractor for your Fanbox home feed'),
+    ('gallery_dl.extractor.fanbox', 'FanboxSupportingExtractor', 'fanbox', 'supporting', '', False, '(?:https?://)?(?:www\\.)?fanbox\\.cc/home/supporting', ('fanbox.cc/home/supporting',), 'https://fanbox.cc/home/supporting', 'Extractor for your supported Fanbox users feed'),
+    ('gallery_dl.extractor.fanbox', 'FanboxRedirectExtractor', 'fanbox', 'redirect', '', False, '(?:https?://)?(?:www\\.)?pixiv\\.net/fanbox/creator/(\\d+)', ('pixiv.net/fanbox/creator/',), 'https://www.pixiv.net/fanbox/creator/12345', 'Extractor for pixiv redirects to fanbox.cc'),
+    ('gallery_dl.extractor.fansly', 'FanslyPostExtractor', 'fansly', 'post', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/post/(\\d+)', ('fansly.com/post/',), 'https://fansly.com/post/1234567890', None),
+    ('gallery_dl.extractor.fansly', 'FanslyHomeExtractor', 'fansly', 'home', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/home(?:/(?:subscribed()|list/(\\d+)))?', ('fansly.com/home',), 'https://fansly.com/home', None),
+    ('gallery_dl.extractor.fansly', 'FanslyListExtractor', 'fansly', 'list', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/lists/(\\d+)', ('fansly.com/lists/',), 'https://fansly.com/lists/1234567890', None),
+    ('gallery_dl.extractor.fansly', 'FanslyListsExtractor', 'fansly', 'lists', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/lists', ('fansly.com/lists',), 'https://fansly.com/lists', None),
+    ('gallery_dl.extractor.fansly', 'FanslyCreatorPostsExtractor', 'fansly', 'creator-posts', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/posts(?:/wall/(\\d+))?', ('fansly.com/',), 'https://fansly.com/CREATOR/posts', None),
+    ('gallery_dl.extractor.fansly', 'FanslyCreatorMediaExtractor', 'fansly', 'creator-media', '', False, '(?:https?://)?(?:www\\.)?fansly\\.com/([^/?#]+)/media(?:/wall/(\\d+))?', ('fansly.com/',), 'https://fansly.com/CREATOR/media', None),
+    ('gallery_dl.extractor.fantia', 'FantiaCreatorExtractor', 'fantia', 'creator', '', False, '(?:https?://)?(?:www\\.)?fantia\\.jp/fanclubs/(\\d+)', ('fantia.jp/fanclubs/',), 'https://fantia.jp/fanclubs/12345', "Extractor for a Fantia creator's works"),
+    ('gallery_dl.extractor.fantia', 'FantiaPostExtractor', 'fantia', 'post', '', False, '(?:https?://)?(?:www\\.)?fantia\\.jp/posts/(\\d+)', ('fantia.jp/posts/',), 'https://fantia.jp/posts/12345', 'Extractor for media from a single Fantia post'),
+    ('gallery_dl.extractor.fapello', 'FapelloPostExtractor', 'fapello', 'post', '', False, '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/|popular_videos/)([^/?#]+)/(\\d+)', ('fapello.',), 'https://fapello.com/MODEL/12345/', 'Extractor for individual posts on fapello.com'),
+    ('gallery_dl.extractor.fapello', 'FapelloModelExtractor', 'fapello', 'model', '', False, '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!top-(?:likes|followers)|popular_videos|videos|trending|search/?$)([^/?#]+)/?$', ('fapello.',), 'https://fapello.com/model/', 'Extractor for all posts from a fapello model'),
+    ('gallery_dl.extractor.fapello', 'FapelloPathExtractor', 'fapello', 'path', '', False, '(?:https?://)?(?:www\\.)?fapello\\.(?:com|su)/(?!search/?$)(top-(?:likes|followers)|videos|trending|popular_videos/[^/?#]+)/?$', ('fapello.',), 'https://fapello.com/trending/', 'Extractor for models and posts from fapello.com paths'),
+    ('gallery_dl.extractor.fapachi', 'FapachiPostExtractor', 'fapachi', 'post', '', False, '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search/)([^/?#]+)/media/(\\d+)', ('fapachi.com/',), 'https://fapachi.com/MODEL/media/12345', 'Extractor for individual posts on fapachi.com'),
+    ('gallery_dl.extractor.fapachi', 'FapachiUserExtractor', 'fapachi', 'user', '', False, '(?:https?://)?(?:www\\.)?fapachi\\.com/(?!search(?:/|$))([^/?#]+)(?:/page/(\\d+))?$', ('fapachi.com/',), 'https://fapachi.com/MODEL', 'Extractor for all posts from a fapachi user'),
+    ('gallery_dl.extractor.fikfap', 'FikfapPostExtractor', 'fikfap', 'post', '', False, '(?:https?://)?(?:www\\.)?fikfap\\.com/user/(\\w+)/post/(\\d+)', ('fikfap.com/user/',), 'https://fikfap.com/user/USER/post/12345', None),
+    ('gallery_dl.extractor.fikfap', 'FikfapUserExtractor', 'fikfap', 'user', '', False, '(?:https?://)?(?:www\\.)?fikfap\\.com/user/(\\w+)', ('fikfap.com/user/',), 'https://fikfap.com/user/USER', None),
+    ('gallery_dl.extractor.fitnakedgirls', 'FitnakedgirlsGalleryExtractor', 'fitnakedgirls', 'gallery', '', False, '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/([\\w-]+)/?$', ('fitnakedgirls.com/photos/gallery/',), 'https://fitnakedgirls.com/photos/gallery/MODEL-nude/', 'Extractor for fitnakedgirls galleries'),
+    ('gallery_dl.extractor.fitnakedgirls', 'FitnakedgirlsCategoryExtractor', 'fitnakedgirls', 'category', '', False, '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/category/([\\w-]+)', ('fitnakedgirls.com/photos/gallery/category/',), 'https://fitnakedgirls.com/photos/gallery/category/CATEGORY/', 'Extractor for fitnakedgirls category pages'),
+    ('gallery_dl.extractor.fitnakedgirls', 'FitnakedgirlsTagExtractor', 'fitnakedgirls', 'tag', '', False, '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/photos/gallery/tag/([\\w-]+)', ('fitnakedgirls.com/photos/gallery/tag/',), 'https://fitnakedgirls.com/photos/gallery/tag/TAG/', 'Extractor for fitnakedgirls tag pages'),
+    ('gallery_dl.extractor.fitnakedgirls', 'FitnakedgirlsVideoExtractor', 'fitnakedgirls', 'video', '', False, '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/videos/(\\d+)/(\\d+)/([\\w-]+)', ('fitnakedgirls.com/videos/',), 'https://fitnakedgirls.com/videos/2025/08/VIDEO-TITLE/', 'Extractor for fitnakedgirls video posts'),
+    ('gallery_dl.extractor.fitnakedgirls', 'FitnakedgirlsBlogExtractor', 'fitnakedgirls', 'blog', '', False, '(?:https?://)?(?:www\\.)?fitnakedgirls\\.com/fitblog/([\\w-]+)', ('fitnakedgirls.com/fitblog/',), 'https://fitnakedgirls.com/fitblog/MODEL-NAME/', 'Extractor for fitnakedgirls blog posts'),
+    ('gallery_dl.extractor.flickr', 'FlickrImageExtractor', 'flickr', 'image', '', False, '(?:https?://)?(?:(?:(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/[^/?#]+/|[\\w-]+\\.static\\.?flickr\\.com/(?:\\d+/)+)(\\d+)|flic\\.kr/p/([A-Za-z1-9]+))', ('flickr.com/photos/', 'flickr.com/', 'flic.kr/p/'), 'https://www.flickr.com/photos/USER/12345', 'Extractor for individual images from flickr.com'),
+    ('gallery_dl.extractor.flickr', 'FlickrAlbumExtractor', 'flickr', 'album', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/(?:album|set)s(?:/(\\d+))?', ('flickr.com/photos/',), 'https://www.flickr.com/photos/USER/albums/12345', 'Extractor for photo albums from flickr.com'),
+    ('gallery_dl.extractor.flickr', 'FlickrGalleryExtractor', 'flickr', 'gallery', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/galleries/(\\d+)', ('flickr.com/photos/',), 'https://www.flickr.com/photos/USER/galleries/12345/', 'Extractor for photo galleries from flickr.com'),
+    ('gallery_dl.extractor.flickr', 'FlickrGroupExtractor', 'flickr', 'group', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/groups/([^/?#]+)', ('flickr.com/groups/',), 'https://www.flickr.com/groups/NAME/', 'Extractor for group pools from flickr.com'),
+    ('gallery_dl.extractor.flickr', 'FlickrUserExtractor', 'flickr', 'user', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/?$', ('flickr.com/photos/',), 'https://www.flickr.com/photos/USER/', 'Extractor for the photostream of a flickr user'),
+    ('gallery_dl.extractor.flickr', 'FlickrFavoriteExtractor', 'flickr', 'favorite', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/photos/([^/?#]+)/favorites', ('flickr.com/photos/',), 'https://www.flickr.com/photos/USER/favorites', 'Extractor for favorite photos of a flickr user'),
+    ('gallery_dl.extractor.flickr', 'FlickrSearchExtractor', 'flickr', 'search', '', False, '(?:https?://)?(?:www\\.|secure\\.|m\\.)?flickr\\.com/search/?\\?([^#]+)', ('flickr.com/search',), 'https://flickr.com/search/?text=QUERY', 'Extractor for flickr photos based on search results'),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityGalleryExtractor', 'furaffinity', 'gallery', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)(?:$|/(?!folder/))', ('raffinity.net/gallery/',), 'https://www.furaffinity.net/gallery/USER/', "Extractor for a furaffinity user's gallery"),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityFolderExtractor', 'furaffinity', 'folder', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/gallery/([^/?#]+)/folder/(\\d+)(?:/([^/?#]+))?', ('raffinity.net/gallery/',), 'https://www.furaffinity.net/gallery/USER/folder/12345/FOLDER', 'Extractor for a FurAffinity folder'),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityScrapsExtractor', 'furaffinity', 'scraps', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/scraps/([^/?#]+)', ('raffinity.net/scraps/',), 'https://www.furaffinity.net/scraps/USER/', "Extractor for a furaffinity user's scraps"),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityFavoriteExtractor', 'furaffinity', 'favorite', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/favorites/([^/?#]+)', ('raffinity.net/favorites/',), 'https://www.furaffinity.net/favorites/USER/', "Extractor for a furaffinity user's favorites"),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinitySearchExtractor', 'furaffinity', 'search', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/search(?:/([^/?#]+))?/?[?&]([^#]+)', ('raffinity.net/search',), 'https://www.furaffinity.net/search/?q=QUERY', 'Extractor for furaffinity search results'),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityPostExtractor', 'furaffinity', 'post', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/(?:view|full)/(\\d+)', ('raffinity.net/',), 'https://www.furaffinity.net/view/12345/', 'Extractor for individual posts on furaffinity'),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityUserExtractor', 'furaffinity', 'user', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/user/([^/?#]+)', ('raffinity.net/user/',), 'https://www.furaffinity.net/user/USER/', 'Extractor for furaffinity user profiles'),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinityFollowingExtractor', 'furaffinity', 'following', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net/watchlist/by/([^/?#]+)', ('raffinity.net/watchlist/by/',), 'https://www.furaffinity.net/watchlist/by/USER/', "Extractor for a furaffinity user's watched users"),
+    ('gallery_dl.extractor.furaffinity', 'FuraffinitySubmissionsExtractor', 'furaffinity', 'submissions', '', False, '(?:https?://)?(?:www\\.|sfw\\.)?(?:f[ux]|f?xfu)raffinity\\.net(/msg/submissions(?:/[^/?#]+)?)', ('/msg/submissions',), 'https://www.furaffinity.net/msg/submissions', 'Extractor for new furaffinity submissions'),
+    ('gallery_dl.extractor.furry34', 'Furry34PostExtractor', 'furry34', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?furry34\\.com/post/(\\d+)', ('furry34.com/post/',), 'https://furry34.com/post/12345', None),
+    ('gallery_dl.extractor.furry34', 'Furry34PlaylistExtractor', 'furry34', 'playlist', 'booru', True, '(?:https?://)?(?:www\\.)?furry34\\.com/playlists/view/(\\d+)', ('furry34.com/playlists/view/',), 'https://furry34.com/playlists/view/12345', None),
+    ('gallery_dl.extractor.furry34', 'Furry34TagExtractor', 'furry34', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?furry34\\.com/(?:([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)', ('furry34.com/',), 'https://furry34.com/TAG', None),
+    ('gallery_dl.extractor.fuskator', 'FuskatorGalleryExtractor', 'fuskator', 'gallery', '', False, '(?:https?://)?fuskator\\.com/(?:thumbs|expanded)/([^/?#]+)', ('fuskator.com/',), 'https://fuskator.com/thumbs/ID/', 'Extractor for image galleries on fuskator.com'),
+    ('gallery_dl.extractor.fuskator', 'FuskatorSearchExtractor', 'fuskator', 'search', '', False, '(?:https?://)?fuskator\\.com(/(?:search|page)/.+)', ('fuskator.com',), 'https://fuskator.com/search/TAG/', 'Extractor for search results on fuskator.com'),
+    ('gallery_dl.extractor.gelbooru', 'GelbooruTagExtractor', 'gelbooru', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=post&s=list&tags=([^&#]*)', ('?page=post&s=list&tags=',), 'https://gelbooru.com/index.php?page=post&s=list&tags=TAG', 'Extractor for images from gelbooru.com based on search-tags'),
+    ('gallery_dl.extractor.gelbooru', 'GelbooruPoolExtractor', 'gelbooru', 'pool', 'booru', True, '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=pool&s=show&id=(\\d+)', ('?page=pool&s=show&id=',), 'https://gelbooru.com/index.php?page=pool&s=show&id=12345', 'Extractor for gelbooru pools'),
+    ('gallery_dl.extractor.gelbooru', 'GelbooruFavoriteExtractor', 'gelbooru', 'favorite', 'booru', True, '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?page=favorites&s=view&id=(\\d+)', ('?page=favorites&s=view&id=',), 'https://gelbooru.com/index.php?page=favorites&s=view&id=12345', 'Extractor for gelbooru favorites'),
+    ('gallery_dl.extractor.gelbooru', 'GelbooruPostExtractor', 'gelbooru', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?gelbooru\\.com/(?:index\\.php)?\\?(?=(?:[^#]+&)?page=post(?:&|#|$))(?=(?:[^#]+&)?s=view(?:&|#|$))(?:[^#]+&)?id=(\\d+)', ('gelbooru.com/',), 'https://gelbooru.com/index.php?page=post&s=view&id=12345', 'Extractor for single images from gelbooru.com'),
+    ('gallery_dl.extractor.gelbooru', 'GelbooruRedirectExtractor', 'gelbooru', 'redirect', 'booru', False, '(?:https?://)?(?:www\\.)?gelbooru\\.com/redirect\\.php\\?s=([^&#]+)', ('gelbooru.com/redirect.php?s=',), 'https://gelbooru.com/redirect.php?s=BASE64', None),
+    ('gallery_dl.extractor.gelbooru_v01', 'GelbooruV01TagExtractor', '', 'tag', 'gelbooru_v01', True, '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=list&tags=([^&#]+)', ('/index.php?page=post&s=list&tags=',), 'https://allgirl.booru.org/index.php?page=post&s=list&tags=TAG', None),
+    ('gallery_dl.extractor.gelbooru_v01', 'GelbooruV01FavoriteExtractor', '', 'favorite', 'gelbooru_v01', True, '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=favorites&s=view&id=(\\d+)', ('/index.php?page=favorites&s=view&id=',), 'https://allgirl.booru.org/index.php?page=favorites&s=view&id=1', None),
+    ('gallery_dl.extractor.gelbooru_v01', 'GelbooruV01PostExtractor', '', 'post', 'gelbooru_v01', True, '(?:gelbooru_v01:(https?://[^/?#]+)|(?:https?://)?(?:the-collection\\.booru\\.org()|illusioncards\\.booru\\.org()|allgirl\\.booru\\.org()|drawfriends\\.booru\\.org()|vidyart2\\.booru\\.org()))/index\\.php\\?page=post&s=view&id=(\\d+)', ('/index.php?page=post&s=view&id=',), 'https://allgirl.booru.org/index.php?page=post&s=view&id=12345', None),
+    ('gallery_dl.extractor.gelbooru_v02', 'GelbooruV02TagExtractor', '', 'tag', 'gelbooru_v02', True, '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=list&tags=([^&#]*)', ('/index.php?page=post&s=list&tags=',), 'https://safebooru.org/index.php?page=post&s=list&tags=TAG', None),
+    ('gallery_dl.extractor.gelbooru_v02', 'GelbooruV02PoolExtractor', '', 'pool', 'gelbooru_v02', True, '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=pool&s=show&id=(\\d+)', ('/index.php?page=pool&s=show&id=',), 'https://safebooru.org/index.php?page=pool&s=show&id=12345', None),
+    ('gallery_dl.extractor.gelbooru_v02', 'GelbooruV02FavoriteExtractor', '', 'favorite', 'gelbooru_v02', True, '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=favorites&s=view&id=(\\d+)', ('/index.php?page=favorites&s=view&id=',), 'https://safebooru.org/index.php?page=favorites&s=view&id=12345', None),
+    ('gallery_dl.extractor.gelbooru_v02', 'GelbooruV02PostExtractor', '', 'post', 'gelbooru_v02', True, '(?:gelbooru_v02:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?rule34\\.xxx()|safebooru\\.org()|tbib\\.org()|hypnohub\\.net()|xbooru\\.com()))/index\\.php\\?page=post&s=view&id=(\\d+)', ('/index.php?page=post&s=view&id=',), 'https://safebooru.org/index.php?page=post&s=view&id=12345', None),
+    ('gallery_dl.extractor.girlsreleased', 'GirlsreleasedSetExtractor', 'girlsreleased', 'set', '', False, '(?:https?://)?(?:www\\.)?girlsreleased\\.com/set/(\\d+)', ('girlsreleased.com/set/',), 'https://girlsreleased.com/set/12345', 'Extractor for girlsreleased galleries'),
+    ('gallery_dl.extractor.girlsreleased', 'GirlsreleasedModelExtractor', 'girlsreleased', 'model', '', False, '(?:https?://)?(?:www\\.)?girlsreleased\\.com/model/(\\d+(?:/.+)?)', ('girlsreleased.com/model/',), 'https://girlsreleased.com/model/12345/MODEL', 'Extractor for girlsreleased models'),
+    ('gallery_dl.extractor.girlsreleased', 'GirlsreleasedSiteExtractor', 'girlsreleased', 'site', '', False, '(?:https?://)?(?:www\\.)?girlsreleased\\.com/site/([^/?#]+(?:/model/\\d+/?.*)?)', ('girlsreleased.com/site/',), 'https://girlsreleased.com/site/SITE', 'Extractor for girlsreleased sites'),
+    ('gallery_dl.extractor.girlswithmuscle', 'GirlswithmusclePostExtractor', 'girlswithmuscle', 'post', '', False, '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/(\\d+)', ('girlswithmuscle.com/',), 'https://www.girlswithmuscle.com/12345/', 'Extractor for individual posts on girlswithmuscle.com'),
+    ('gallery_dl.extractor.girlswithmuscle', 'GirlswithmuscleSearchExtractor', 'girlswithmuscle', 'search', '', False, '(?:https?://)?(?:www\\.)?girlswithmuscle\\.com/images/(.*)', ('girlswithmuscle.com/images/',), 'https://www.girlswithmuscle.com/images/?name=MODEL', 'Extractor for search results on girlswithmuscle.com'),
+    ('gallery_dl.extractor.gofile', 'GofileFolderExtractor', 'gofile', 'folder', '', False, '(?:https?://)?(?:www\\.)?gofile\\.io/d/([^/?#]+)', ('gofile.io/d/',), 'https://gofile.io/d/ID', None),
+    ('gallery_dl.extractor.hatenablog', 'HatenablogEntryExtractor', 'hatenablog', 'entry', '', False, '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))/entry/([^?#]+)(?:\\?([^#]*))?(?:#.*)?$', ('/entry/',), 'https://BLOG.hatenablog.com/entry/PATH', 'Extractor for a single entry URL'),
+    ('gallery_dl.extractor.hatenablog', 'HatenablogHomeExtractor', 'hatenablog', 'home', '', False, '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/?)(?:\\?([^#]*))?(?:#.*)?$', ('hatenablog:http', 'nablog.', 'nadiary.com', 'blo.jp'), 'https://BLOG.hatenablog.com', "Extractor for a blog's home page"),
+    ('gallery_dl.extractor.hatenablog', 'HatenablogArchiveExtractor', 'hatenablog', 'archive', '', False, '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/archive(?:/\\d+(?:/\\d+(?:/\\d+)?)?|/category/[^?#]+)?)(?:\\?([^#]*))?(?:#.*)?$', ('/archive',), 'https://BLOG.hatenablog.com/archive/2024', "Extractor for a blog's archive page"),
+    ('gallery_dl.extractor.hatenablog', 'HatenablogSearchExtractor', 'hatenablog', 'search', '', False, '(?:hatenablog:https?://([^/?#]+)|(?:https?://)?([\\w-]+\\.(?:hatenablog\\.(?:com|jp)|hatenadiary\\.com|hateblo\\.jp)))(/search)(?:\\?([^#]*))?(?:#.*)?$', ('/search',), 'https://BLOG.hatenablog.com/search?q=QUERY', "Extractor for a blog's search results"),
+    ('gallery_dl.extractor.hdoujin', 'HdoujinGalleryExtractor', 'hdoujin', 'gallery', '', False, '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:g|reader)/(\\d+)/(\\w+)', ('hdoujin.',), 'https://hdoujin.org/g/12345/67890abcdef/', None),
+    ('gallery_dl.extractor.hdoujin', 'HdoujinSearchExtractor', 'hdoujin', 'search', '', False, '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$', ('hdoujin.',), 'https://hdoujin.org/browse?s=QUERY', None),
+    ('gallery_dl.extractor.hdoujin', 'HdoujinFavoriteExtractor', 'hdoujin', 'favorite', '', False, '(?:https?://)?(?:www\\.)?(hdoujin\\.(?:org|net))/favorites(?:\\?([^#]*))?', ('/favorites',), 'https://hdoujin.org/favorites', None),
+    ('gallery_dl.extractor.hentai2read', 'Hentai2readChapterExtractor', 'hentai2read', 'chapter', '', False, '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+/([^/?#]+))', ('hentai2read.com',), 'https://hentai2read.com/TITLE/1/', 'Extractor for a single manga chapter from hentai2read.com'),
+    ('gallery_dl.extractor.hentai2read', 'Hentai2readMangaExtractor', 'hentai2read', 'manga', '', False, '(?:https?://)?(?:www\\.)?hentai2read\\.com(/[^/?#]+)/?$', ('hentai2read.com',), 'https://hentai2read.com/TITLE/', 'Extractor for hmanga from hentai2read.com'),
+    ('gallery_dl.extractor.hentaicosplays', 'HentaicosplaysGalleryExtractor', '', 'gallery', 'hentaicosplays', True, '(?:hentaicosplays:(https?://[^/?#]+)|(?:https?://)?(?:(?:\\w\\w\\.)?hentai-cosplays?(?:-xxx)?\\.com()|(?:\\w\\w\\.)?hentai-img(?:-xxx)?\\.com()|(?:\\w\\w\\.)?porn-images?(?:-xxx)?\\.com()))/(?:image|story)/([\\w-]+)', ('hentaicosplays:', 'hentai-cosplay', 'hentai-img', 'porn-image'), 'https://hentai-cosplay-xxx.com/image/TITLE/', 'Extractor for image galleries from\n    hentai-cosplay-xxx.com, hentai-img-xxx.com, and porn-image.com'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryUserExtractor', 'hentaifoundry', 'user', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/profile', ('hentai-foundry.com/user/',), 'https://www.hentai-foundry.com/user/USER/profile', 'Extractor for a hentaifoundry user profile'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryPicturesExtractor', 'hentaifoundry', 'pictures', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)(?:/page/(\\d+))?/?$', ('hentai-foundry.com/pictures/user/',), 'https://www.hentai-foundry.com/pictures/user/USER', 'Extractor for all pictures of a hentaifoundry user'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryScrapsExtractor', 'hentaifoundry', 'scraps', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/user/([^/?#]+)/scraps', ('hentai-foundry.com/pictures/user/',), 'https://www.hentai-foundry.com/pictures/user/USER/scraps', 'Extractor for scraps of a hentaifoundry user'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryFavoriteExtractor', 'hentaifoundry', 'favorite', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/user/([^/?#]+)/faves/pictures', ('hentai-foundry.com/user/',), 'https://www.hentai-foundry.com/user/USER/faves/pictures', 'Extractor for favorite images of a hentaifoundry user'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryTagExtractor', 'hentaifoundry', 'tag', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/tagged/([^/?#]+)', ('hentai-foundry.com/pictures/tagged/',), 'https://www.hentai-foundry.com/pictures/tagged/TAG', 'Extractor for tag searches on hentaifoundry.com'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryRecentExtractor', 'hentaifoundry', 'recent', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/recent/(\\d\\d\\d\\d-\\d\\d-\\d\\d)', ('hentai-foundry.com/pictures/recent/',), 'https://www.hentai-foundry.com/pictures/recent/1970-01-01', "Extractor for 'Recent Pictures' on hentaifoundry.com"),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryPopularExtractor', 'hentaifoundry', 'popular', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/pictures/popular()', ('hentai-foundry.com/pictures/popular',), 'https://www.hentai-foundry.com/pictures/popular', 'Extractor for popular images on hentaifoundry.com'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryImageExtractor', 'hentaifoundry', 'image', '', False, '(https?://)?(?:www\\.|pictures\\.)?hentai-foundry\\.com/(?:pictures/user|[^/?#])/([^/?#]+)/(\\d+)', ('hentai-foundry.com/',), 'https://www.hentai-foundry.com/pictures/user/USER/12345/TITLE', 'Extractor for a single image from hentaifoundry.com'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryStoriesExtractor', 'hentaifoundry', 'stories', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)(?:/page/(\\d+))?/?$', ('hentai-foundry.com/stories/user/',), 'https://www.hentai-foundry.com/stories/user/USER', 'Extractor for stories of a hentaifoundry user'),
+    ('gallery_dl.extractor.hentaifoundry', 'HentaifoundryStoryExtractor', 'hentaifoundry', 'story', '', False, '(https?://)?(?:www\\.)?hentai-foundry\\.com/stories/user/([^/?#]+)/(\\d+)', ('hentai-foundry.com/stories/user/',), 'https://www.hentai-foundry.com/stories/user/USER/12345/TITLE', 'Extractor for a hentaifoundry story'),
+    ('gallery_dl.extractor.hentaihand', 'HentaihandGalleryExtractor', 'hentaihand', 'gallery', '', False, '(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/comic/([\\w-]+)', ('hentaihand.com/',), 'https://hentaihand.com/en/comic/TITLE', 'Extractor for image galleries on hentaihand.com'),
+    ('gallery_dl.extractor.hentaihand', 'HentaihandTagExtractor', 'hentaihand', 'tag', '', False, '(?i)(?:https?://)?(?:www\\.)?hentaihand\\.com/\\w+/(parody|character|tag|artist|group|language|category|relationship)/([^/?#]+)', ('hentaihand.com/',), 'https://hentaihand.com/en/tag/TAG', 'Extractor for tag searches on hentaihand.com'),
+    ('gallery_dl.extractor.hentaihere', 'HentaihereChapterExtractor', 'hentaihere', 'chapter', '', False, '(?:https?://)?(?:www\\.)?hentaihere\\.com/m/S(\\d+)/([^/?#]+)', ('hentaihere.com/m/s',), 'https://hentaihere.com/m/S12345/1/1/', 'Extractor for a single manga chapter from hentaihere.com'),
+    ('gallery_dl.extractor.hentaihere', 'HentaihereMangaExtractor', 'hentaihere', 'manga', '', False, '(?:https?://)?(?:www\\.)?hentaihere\\.com(/m/S\\d+)/?$', ('hentaihere.com',), 'https://hentaihere.com/m/S12345', 'Extractor for hmanga from hentaihere.com'),
+    ('gallery_dl.extractor.hentainexus', 'HentainexusGalleryExtractor', 'hentainexus', 'gallery', '', False, '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com/(?:view|read)/(\\d+)', ('hentainexus.com/',), 'https://hentainexus.com/view/12345', 'Extractor for hentainexus galleries'),
+    ('gallery_dl.extractor.hentainexus', 'HentainexusSearchExtractor', 'hentainexus', 'search', '', False, '(?i)(?:https?://)?(?:www\\.)?hentainexus\\.com(?:/page/\\d+)?/?(?:\\?(q=[^/?#]+))?$', ('hentainexus.com',), 'https://hentainexus.com/?q=QUERY', 'Extractor for hentainexus search results'),
+    ('gallery_dl.extractor.hiperdex', 'HiperdexChapterExtractor', 'hiperdex', 'chapter', '', False, '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+)/([^/?#]+))', ('/manga',), 'https://hiperdex.com/manga/MANGA/CHAPTER/', 'Extractor for hiperdex manga chapters'),
+    ('gallery_dl.extractor.hiperdex', 'HiperdexMangaExtractor', 'hiperdex', 'manga', '', False, '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/mangas?/([^/?#]+))/?$', ('/manga',), 'https://hiperdex.com/manga/MANGA/', 'Extractor for hiperdex manga'),
+    ('gallery_dl.extractor.hiperdex', 'HiperdexArtistExtractor', 'hiperdex', 'artist', '', False, '((?:https?://)?(?:www\\.)?(?:1st)?hiper(?:dex|toon)\\d?\\.(?:com|net|info|top))(/manga-a(?:rtist|uthor)/(?:[^/?#]+))', ('/manga-a',), 'https://hiperdex.com/manga-artist/NAME/', "Extractor for an artists's manga on hiperdex"),
+    ('gallery_dl.extractor.hitomi', 'HitomiGalleryExtractor', 'hitomi', 'gallery', '', False, '(?:https?://)?hitomi\\.la/(?:manga|doujinshi|cg|gamecg|imageset|galleries|reader)/(?:[^/?#]+-)?(\\d+)', ('hitomi.la/',), 'https://hitomi.la/manga/TITLE-867789.html', 'Extractor for hitomi.la galleries'),
+    ('gallery_dl.extractor.hitomi', 'HitomiTagExtractor', 'hitomi', 'tag', '', False, '(?:https?://)?hitomi\\.la/(tag|artist|group|series|type|character)/([^/?#]+)\\.html', ('hitomi.la/',), 'https://hitomi.la/tag/TAG-LANG.html', 'Extractor for galleries from tag searches on hitomi.la'),
+    ('gallery_dl.extractor.hitomi', 'HitomiIndexExtractor', 'hitomi', 'index', '', False, '(?:https?://)?hitomi\\.la/(\\w+)-(\\w+)\\.html', ('hitomi.la/',), 'https://hitomi.la/index-LANG.html', 'Extractor for galleries from index searches on hitomi.la'),
+    ('gallery_dl.extractor.hitomi', 'HitomiSearchExtractor', 'hitomi', 'search', '', False, '(?:https?://)?hitomi\\.la/search\\.html\\?([^#]+)', ('hitomi.la/search.html?',), 'https://hitomi.la/search.html?QUERY', 'Extractor for galleries from multiple tag searches on hitomi.la'),
+    ('gallery_dl.extractor.hotleak', 'HotleakPostExtractor', 'hotleak', 'post', '', False, '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/]+)/(photo|video)/(\\d+)', ('hotleak.vip/',), 'https://hotleak.vip/MODEL/photo/12345', 'Extractor for individual posts on hotleak'),
+    ('gallery_dl.extractor.hotleak', 'HotleakCreatorExtractor', 'hotleak', 'creator', '', False, '(?:https?://)?(?:www\\.)?hotleak\\.vip/(?!(?:hot|creators|videos|photos)(?:$|/))([^/?#]+)/?$', ('hotleak.vip/',), 'https://hotleak.vip/MODEL', 'Extractor for all posts from a hotleak creator'),
+    ('gallery_dl.extractor.hotleak', 'HotleakCategoryExtractor', 'hotleak', 'category', '', False, '(?:https?://)?(?:www\\.)?hotleak\\.vip/(hot|creators|videos|photos)(?:/?\\?([^#]+))?', ('hotleak.vip/',), 'https://hotleak.vip/photos', 'Extractor for hotleak categories'),
+    ('gallery_dl.extractor.hotleak', 'HotleakSearchExtractor', 'hotleak', 'search', '', False, '(?:https?://)?(?:www\\.)?hotleak\\.vip/search(?:/?\\?([^#]+))', ('hotleak.vip/search',), 'https://hotleak.vip/search?search=QUERY', 'Extractor for hotleak search results'),
+    ('gallery_dl.extractor.idolcomplex', 'IdolcomplexTagExtractor', 'idolcomplex', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?(?:/posts)?/?\\?([^#]*)', ('complex.com',), 'https://www.idolcomplex.com/en/posts?tags=TAGS', 'Extractor for idolcomplex tag searches'),
+    ('gallery_dl.extractor.idolcomplex', 'IdolcomplexPoolExtractor', 'idolcomplex', 'pool', 'booru', True, '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/pools?/(?:show/)?(\\w+)', ('complex.com',), 'https://www.idolcomplex.com/en/pools/0123456789abcdef', 'Extractor for idolcomplex pools'),
+    ('gallery_dl.extractor.idolcomplex', 'IdolcomplexPostExtractor', 'idolcomplex', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?idol(?:\\.sankaku)?complex\\.com(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/posts?(?:/show)?/(\\w+)', ('complex.com',), 'https://www.idolcomplex.com/en/posts/0123456789abcdef', 'Extractor for individual idolcomplex posts'),
+    ('gallery_dl.extractor.imagebam', 'ImagebamGalleryExtractor', 'imagebam', 'gallery', '', False, '(?:https?://)?(?:www\\.)?imagebam\\.com(/(?:gallery/|view/G)[a-zA-Z0-9]+)', ('imagebam.com',), 'https://www.imagebam.com/view/GID', 'Extractor for imagebam galleries'),
+    ('gallery_dl.extractor.imagebam', 'ImagebamImageExtractor', 'imagebam', 'image', '', False, '(?:https?://)?(?:\\w+\\.)?imagebam\\.com(/(?:image/|view/M|(?:[0-9a-f]{2}/){3})[a-zA-Z0-9]+)', ('imagebam.com',), 'https://www.imagebam.com/view/MID', 'Extractor for single imagebam images'),
+    ('gallery_dl.extractor.imagechest', 'ImagechestGalleryExtractor', 'imagechest', 'gallery', '', False, '(?:https?://)?(?:www\\.)?imgchest\\.com/p/([A-Za-z0-9]{11})', ('imgchest.com/p/',), 'https://imgchest.com/p/abcdefghijk', 'Extractor for image galleries from imgchest.com'),
+    ('gallery_dl.extractor.imagechest', 'ImagechestUserExtractor', 'imagechest', 'user', '', False, '(?:https?://)?(?:www\\.)?imgchest\\.com/u/([^/?#]+)', ('imgchest.com/u/',), 'https://imgchest.com/u/USER', 'Extractor for imgchest.com user profiles'),
+    ('gallery_dl.extractor.imagefap', 'ImagefapGalleryExtractor', 'imagefap', 'gallery', '', False, '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:gallery\\.php\\?gid=|gallery/|pictures/)(\\d+)', ('imagefap.com/',), 'https://www.imagefap.com/gallery/12345', 'Extractor for image galleries from imagefap.com'),
+    ('gallery_dl.extractor.imagefap', 'ImagefapImageExtractor', 'imagefap', 'image', '', False, '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/photo/(\\d+)', ('imagefap.com/photo/',), 'https://www.imagefap.com/photo/12345', 'Extractor for single images from imagefap.com'),
+    ('gallery_dl.extractor.imagefap', 'ImagefapFolderExtractor', 'imagefap', 'folder', '', False, '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:organizer/|(?:usergallery\\.php\\?user(id)?=([^&#]+)&|profile/([^/?#]+)/galleries\\?)folderid=)(\\d+|-1)', ('imagefap.com/',), 'https://www.imagefap.com/organizer/12345', 'Extractor for imagefap user folders'),
+    ('gallery_dl.extractor.imagefap', 'ImagefapUserExtractor', 'imagefap', 'user', '', False, '(?:https?://)?(?:www\\.|beta\\.)?imagefap\\.com/(?:profile(?:\\.php\\?user=|/)([^/?#]+)(?:/galleries)?|usergallery\\.php\\?userid=(\\d+))(?:$|#)', ('imagefap.com/',), 'https://www.imagefap.com/profile/USER', 'Extractor for an imagefap user profile'),
+    ('gallery_dl.extractor.imgbb', 'ImgbbAlbumExtractor', 'imgbb', 'album', '', False, '(?:https?://)?ibb\\.co/album/([^/?#]+)/?(?:\\?([^#]+))?', ('ibb.co/album/',), 'https://ibb.co/album/ID', 'Extractor for imgbb albums'),
+    ('gallery_dl.extractor.imgbb', 'ImgbbImageExtractor', 'imgbb', 'image', '', False, '(?:https?://)?ibb\\.co/([^/?#]+)', ('ibb.co/',), 'https://ibb.co/ID', None),
+    ('gallery_dl.extractor.imgbb', 'ImgbbUserExtractor', 'imgbb', 'user', '', False, '(?:https?://)?([\\w-]+)\\.imgbb\\.com/?(?:\\?([^#]+))?', ('.imgbb.com',), 'https://USER.imgbb.com', 'Extractor for imgbb user profiles'),
+    ('gallery_dl.extractor.imgbox', 'ImgboxGalleryExtractor', 'imgbox', 'gallery', '', False, '(?:https?://)?(?:www\\.)?imgbox\\.com/g/([A-Za-z0-9]{10})', ('imgbox.com/g/',), 'https://imgbox.com/g/12345abcde', 'Extractor for image galleries from imgbox.com'),
+    ('gallery_dl.extractor.imgbox', 'ImgboxImageExtractor', 'imgbox', 'image', '', False, '(?:https?://)?(?:(?:www\\.|i\\.)?imgbox\\.com|images\\d+\\.imgbox\\.com/[0-9a-f]{2}/[0-9a-f]{2})/([A-Za-z0-9]{8})', ('imgbox.com', '.imgbox.com/'), 'https://imgbox.com/1234abcd', 'Extractor for single images from imgbox.com'),
+    ('gallery_dl.extractor.imgpile', 'ImgpilePostExtractor', 'imgpile', 'post', '', False, '(?:https?://)?(?:www\\.)?imgpile\\.com/p/(\\w+)', ('imgpile.com/p/',), 'https://imgpile.com/p/AbCdEfG', None),
+    ('gallery_dl.extractor.imgpile', 'ImgpileUserExtractor', 'imgpile', 'user', '', False, '(?:https?://)?(?:www\\.)?imgpile\\.com/u/([^/?#]+)', ('imgpile.com/u/',), 'https://imgpile.com/u/USER', None),
+    ('gallery_dl.extractor.imgth', 'ImgthGalleryExtractor', 'imgth', 'gallery', '', False, '(?:https?://)?(?:www\\.)?imgth\\.com/gallery/(\\d+)', ('imgth.com/gallery/',), 'https://imgth.com/gallery/123/TITLE', 'Extractor for image galleries from imgth.com'),
+    ('gallery_dl.extractor.imgur', 'ImgurImageExtractor', 'imgur', 'image', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?!gallery|search)(?:r/\\w+/)?(?:[^/?#]+-)?(\\w{7}|\\w{5})[sbtmlh]?', ('imgur.',), 'https://imgur.com/abcdefg', 'Extractor for individual images on imgur.com'),
+    ('gallery_dl.extractor.imgur', 'ImgurAlbumExtractor', 'imgur', 'album', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/a/(?:[^/?#]+-)?(\\w{7}|\\w{5})', ('imgur.',), 'https://imgur.com/a/abcde', 'Extractor for imgur albums'),
+    ('gallery_dl.extractor.imgur', 'ImgurGalleryExtractor', 'imgur', 'gallery', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/(?:gallery|t/\\w+)/(?:[^/?#]+-)?(\\w{7}|\\w{5})', ('imgur.',), 'https://imgur.com/gallery/abcde', 'Extractor for imgur galleries'),
+    ('gallery_dl.extractor.imgur', 'ImgurUserExtractor', 'imgur', 'user', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/(?!me(?:/|$|\\?|#))([^/?#]+)(?:/posts|/submitted)?/?$', ('imgur.',), 'https://imgur.com/user/USER', 'Extractor for all images posted by a user'),
+    ('gallery_dl.extractor.imgur', 'ImgurFavoriteExtractor', 'imgur', 'favorite', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/?$', ('/favorites',), 'https://imgur.com/user/USER/favorites', "Extractor for a user's favorites"),
+    ('gallery_dl.extractor.imgur', 'ImgurFavoriteFolderExtractor', 'imgur', 'favorite-folder', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/([^/?#]+)/favorites/folder/(\\d+)', ('/favorites/folder/',), 'https://imgur.com/user/USER/favorites/folder/12345/TITLE', "Extractor for a user's favorites folder"),
+    ('gallery_dl.extractor.imgur', 'ImgurMeExtractor', 'imgur', 'me', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/user/me(?:/posts)?(/hidden)?', ('/user/me',), 'https://imgur.com/user/me', 'Extractor for your personal uploads'),
+    ('gallery_dl.extractor.imgur', 'ImgurSubredditExtractor', 'imgur', 'subreddit', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/r/([^/?#]+)/?$', ('imgur.',), 'https://imgur.com/r/SUBREDDIT', "Extractor for a subreddits's imgur links"),
+    ('gallery_dl.extractor.imgur', 'ImgurTagExtractor', 'imgur', 'tag', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/t/([^/?#]+)$', ('imgur.',), 'https://imgur.com/t/TAG', 'Extractor for imgur tag searches'),
+    ('gallery_dl.extractor.imgur', 'ImgurSearchExtractor', 'imgur', 'search', '', False, '(?:https?://)?(?:www\\.|[im]\\.)?imgur\\.(?:com|io)/search(?:/[^?#]+)?/?\\?q=([^&#]+)', ('/search',), 'https://imgur.com/search?q=UERY', 'Extractor for imgur search results'),
+    ('gallery_dl.extractor.imhentai', 'ImhentaiGalleryExtractor', '', 'gallery', 'IMHentai', True, '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))/(?:gallery|view)/(\\d+)', ('imhentai:', 'imhentai.xxx', 'hentaiera.com', 'hentairox.com', 'hentaifox.com', 'hentaienvy.com', 'hentaizap.com'), 'https://imhentai.xxx/gallery/12345/', 'Extractor for imhentai galleries'),
+    ('gallery_dl.extractor.imhentai', 'ImhentaiTagExtractor', '', 'tag', 'IMHentai', True, '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))(/(?:artist|category|character|group|language|parody|tag)/([^/?#]+))', ('imhentai:', 'imhentai.xxx', 'hentaiera.com', 'hentairox.com', 'hentaifox.com', 'hentaienvy.com', 'hentaizap.com'), 'https://imhentai.xxx/tag/TAG/', 'Extractor for imhentai tag searches'),
+    ('gallery_dl.extractor.imhentai', 'ImhentaiSearchExtractor', '', 'search', 'IMHentai', True, '(?:IMHentai:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?imhentai\\.xxx()|(?:www\\.)?hentaiera\\.com()|(?:www\\.)?hentairox\\.com()|(?:www\\.)?hentaifox\\.com()|(?:www\\.)?hentaienvy\\.com()|(?:www\\.)?hentaizap\\.com()))(/(?:advanced-)?search/?\\?[^#]+|/[^/?#]+/?)', ('imhentai:', 'imhentai.xxx', 'hentaiera.com', 'hentairox.com', 'hentaifox.com', 'hentaienvy.com', 'hentaizap.com'), 'https://imhentai.xxx/search/?key=QUERY', 'Extractor for imhentai search results'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyUserExtractor', 'inkbunny', 'user', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?!s/)(gallery/|scraps/)?(\\w+)(?:$|[/?#])', ('inkbunny.net/',), 'https://inkbunny.net/USER', 'Extractor for inkbunny user profiles'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyPoolExtractor', 'inkbunny', 'pool', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:poolview_process\\.php\\?pool_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=pool(?:&[^#]+)?))', ('poolview_process.php?pool_id=', 'submissionsviewall.php?'), 'https://inkbunny.net/poolview_process.php?pool_id=12345', 'Extractor for inkbunny pools'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyFavoriteExtractor', 'inkbunny', 'favorite', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:userfavorites_process\\.php\\?favs_user_id=(\\d+)|submissionsviewall\\.php\\?((?:[^#]+&)?mode=userfavs(?:&[^#]+)?))', ('userfavorites_process.php?favs_user_id=', 'submissionsviewall.php?'), 'https://inkbunny.net/userfavorites_process.php?favs_user_id=12345', 'Extractor for inkbunny user favorites'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyUnreadExtractor', 'inkbunny', 'unread', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=unreadsubs(?:&[^#]+)?)', ('inkbunny.net/submissionsviewall.php?',), 'https://inkbunny.net/submissionsviewall.php?text=&mode=unreadsubs&type=', 'Extractor for unread inkbunny submissions'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnySearchExtractor', 'inkbunny', 'search', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/submissionsviewall\\.php\\?((?:[^#]+&)?mode=search(?:&[^#]+)?)', ('inkbunny.net/submissionsviewall.php?',), 'https://inkbunny.net/submissionsviewall.php?text=TAG&mode=search&type=', 'Extractor for inkbunny search results'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyFollowingExtractor', 'inkbunny', 'following', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/(?:watchlist_process\\.php\\?mode=watching&user_id=(\\d+)|usersviewall\\.php\\?((?:[^#]+&)?mode=watching(?:&[^#]+)?))', ('watchlist_process.php?mode=watching&user_id=', 'usersviewall.php?'), 'https://inkbunny.net/watchlist_process.php?mode=watching&user_id=12345', 'Extractor for inkbunny user watches'),
+    ('gallery_dl.extractor.inkbunny', 'InkbunnyPostExtractor', 'inkbunny', 'post', '', False, '(?:https?://)?(?:www\\.)?inkbunny\\.net/s/(\\d+)', ('inkbunny.net/s/',), 'https://inkbunny.net/s/12345', 'Extractor for individual Inkbunny posts'),
+    ('gallery_dl.extractor.instagram', 'InstagramPostExtractor', 'instagram', 'post', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?:share()(?:/(?:p|tv|reels?()))?|(?:[^/?#]+/)?(?:p|tv|reels?()))/([^/?#]+)', ('instagram.com/',), 'https://www.instagram.com/p/abcdefg/', 'Extractor for an Instagram post'),
+    ('gallery_dl.extractor.instagram', 'InstagramUserExtractor', 'instagram', 'user', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/?(?:$|[?#])', ('instagram.com/',), 'https://www.instagram.com/USER/', 'Extractor for an Instagram user profile'),
+    ('gallery_dl.extractor.instagram', 'InstagramPostsExtractor', 'instagram', 'posts', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/posts', ('instagram.com/',), 'https://www.instagram.com/USER/posts/', "Extractor for an Instagram user's posts"),
+    ('gallery_dl.extractor.instagram', 'InstagramReelsExtractor', 'instagram', 'reels', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/reels', ('instagram.com/',), 'https://www.instagram.com/USER/reels/', "Extractor for an Instagram user's reels"),
+    ('gallery_dl.extractor.instagram', 'InstagramTaggedExtractor', 'instagram', 'tagged', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/tagged', ('instagram.com/',), 'https://www.instagram.com/USER/tagged/', "Extractor for an Instagram user's tagged posts"),
+    ('gallery_dl.extractor.instagram', 'InstagramGuideExtractor', 'instagram', 'guide', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/guide/[^/?#]+/(\\d+)', ('instagram.com/',), 'https://www.instagram.com/USER/guide/NAME/12345', 'Extractor for an Instagram guide'),
+    ('gallery_dl.extractor.instagram', 'InstagramSavedExtractor', 'instagram', 'saved', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved(?:/all-posts)?/?$', ('instagram.com/',), 'https://www.instagram.com/USER/saved/', "Extractor for an Instagram user's saved media"),
+    ('gallery_dl.extractor.instagram', 'InstagramCollectionExtractor', 'instagram', 'collection', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/saved/([^/?#]+)/([^/?#]+)', ('instagram.com/',), 'https://www.instagram.com/USER/saved/COLLECTION/12345', 'Extractor for Instagram collection'),
+    ('gallery_dl.extractor.instagram', 'InstagramStoriesTrayExtractor', 'instagram', 'stories-tray', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/stories/me/?$()', ('instagram.com/stories/me',), 'https://www.instagram.com/stories/me/', "Extractor for your Instagram account's stories tray"),
+    ('gallery_dl.extractor.instagram', 'InstagramStoriesExtractor', 'instagram', 'stories', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/s(?:tories/(?:highlights/(\\d+)|([^/?#]+)(?:/(\\d+))?)|/(aGlnaGxpZ2h0[^?#]+)(?:\\?story_media_id=(\\d+))?)', ('instagram.com/s',), 'https://www.instagram.com/stories/USER/', 'Extractor for Instagram stories'),
+    ('gallery_dl.extractor.instagram', 'InstagramHighlightsExtractor', 'instagram', 'highlights', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/highlights', ('instagram.com/',), 'https://www.instagram.com/USER/highlights/', "Extractor for an Instagram user's story highlights"),
+    ('gallery_dl.extractor.instagram', 'InstagramFollowersExtractor', 'instagram', 'followers', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/followers', ('instagram.com/',), 'https://www.instagram.com/USER/followers/', "Extractor for an Instagram user's followers"),
+    ('gallery_dl.extractor.instagram', 'InstagramFollowingExtractor', 'instagram', 'following', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/following', ('instagram.com/',), 'https://www.instagram.com/USER/following/', "Extractor for an Instagram user's followed users"),
+    ('gallery_dl.extractor.instagram', 'InstagramTagExtractor', 'instagram', 'tag', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/explore/tags/([^/?#]+)', ('instagram.com/explore/tags/',), 'https://www.instagram.com/explore/tags/TAG/', 'Extractor for Instagram tags'),
+    ('gallery_dl.extractor.instagram', 'InstagramInfoExtractor', 'instagram', 'info', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/info', ('instagram.com/',), 'https://www.instagram.com/USER/info/', "Extractor for an Instagram user's profile data"),
+    ('gallery_dl.extractor.instagram', 'InstagramAvatarExtractor', 'instagram', 'avatar', '', False, '(?:https?://)?(?:www\\.)?instagram\\.com/(?!(?:p|tv|reel|explore|stories)/)([^/?#]+)/avatar', ('instagram.com/',), 'https://www.instagram.com/USER/avatar/', "Extractor for an Instagram user's avatar"),
+    ('gallery_dl.extractor.issuu', 'IssuuPublicationExtractor', 'issuu', 'publication', '', False, '(?:https?://)?issuu\\.com(/[^/?#]+/docs/[^/?#]+)', ('issuu.com',), 'https://issuu.com/issuu/docs/TITLE/', 'Extractor for a single publication'),
+    ('gallery_dl.extractor.issuu', 'IssuuUserExtractor', 'issuu', 'user', '', False, '(?:https?://)?issuu\\.com/([^/?#]+)(?:/(\\d*))?$', ('issuu.com/',), 'https://issuu.com/USER', 'Extractor for all publications of a user/publisher'),
+    ('gallery_dl.extractor.itaku', 'ItakuGalleryExtractor', 'itaku', 'gallery', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/gallery(?:/(\\d+))?', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/gallery', "Extractor for an itaku user's gallery"),
+    ('gallery_dl.extractor.itaku', 'ItakuPostsExtractor', 'itaku', 'posts', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/posts(?:/(\\d+))?', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/posts', "Extractor for an itaku user's posts"),
+    ('gallery_dl.extractor.itaku', 'ItakuStarsExtractor', 'itaku', 'stars', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/stars(?:/(\\d+))?', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/stars', "Extractor for an itaku user's starred images"),
+    ('gallery_dl.extractor.itaku', 'ItakuFollowingExtractor', 'itaku', 'following', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/following', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/following', None),
+    ('gallery_dl.extractor.itaku', 'ItakuFollowersExtractor', 'itaku', 'followers', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/followers', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/followers', None),
+    ('gallery_dl.extractor.itaku', 'ItakuBookmarksExtractor', 'itaku', 'bookmarks', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/bookmarks/(image|user)/(\\d+)', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER/bookmarks/image/12345', 'Extractor for an itaku bookmarks folder'),
+    ('gallery_dl.extractor.itaku', 'ItakuUserExtractor', 'itaku', 'user', '', False, '(?:https?://)?itaku\\.ee/profile/([^/?#]+)/?(?:$|\\?|#)', ('itaku.ee/profile/',), 'https://itaku.ee/profile/USER', 'Extractor for itaku user profiles'),
+    ('gallery_dl.extractor.itaku', 'ItakuImageExtractor', 'itaku', 'image', '', False, '(?:https?://)?itaku\\.ee/images/(\\d+)', ('itaku.ee/images/',), 'https://itaku.ee/images/12345', None),
+    ('gallery_dl.extractor.itaku', 'ItakuPostExtractor', 'itaku', 'post', '', False, '(?:https?://)?itaku\\.ee/posts/(\\d+)', ('itaku.ee/posts/',), 'https://itaku.ee/posts/12345', None),
+    ('gallery_dl.extractor.itaku', 'ItakuSearchExtractor', 'itaku', 'search', '', False, '(?:https?://)?itaku\\.ee/home/images/?\\?([^#]+)', ('itaku.ee/home/images',), 'https://itaku.ee/home/images?tags=SEARCH', None),
+    ('gallery_dl.extractor.itchio', 'ItchioGameExtractor', 'itchio', 'game', '', False, '(?:https?://)?(\\w+)\\.itch\\.io/([\\w-]+)', ('.itch.io/',), 'https://USER.itch.io/GAME', 'Extractor for itch.io games'),
+    ('gallery_dl.extractor.iwara', 'IwaraUserExtractor', 'iwara', 'user', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/?$', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME', 'Extractor for iwara.tv profile pages'),
+    ('gallery_dl.extractor.iwara', 'IwaraUserImagesExtractor', 'iwara', 'user-images', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/images(?:\\?([^#]+))?', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME/images', None),
+    ('gallery_dl.extractor.iwara', 'IwaraUserVideosExtractor', 'iwara', 'user-videos', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/videos(?:\\?([^#]+))?', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME/videos', None),
+    ('gallery_dl.extractor.iwara', 'IwaraUserPlaylistsExtractor', 'iwara', 'user-playlists', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/playlists(?:\\?([^#]+))?', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME/playlists', None),
+    ('gallery_dl.extractor.iwara', 'IwaraFollowingExtractor', 'iwara', 'following', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/following', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME/following', None),
+    ('gallery_dl.extractor.iwara', 'IwaraFollowersExtractor', 'iwara', 'followers', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/profile/([^/?#]+)/followers', ('iwara.tv/profile/',), 'https://www.iwara.tv/profile/USERNAME/followers', None),
+    ('gallery_dl.extractor.iwara', 'IwaraImageExtractor', 'iwara', 'image', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/image/([^/?#]+)', ('iwara.tv/image/',), 'https://www.iwara.tv/image/ID', 'Extractor for individual iwara.tv image pages'),
+    ('gallery_dl.extractor.iwara', 'IwaraVideoExtractor', 'iwara', 'video', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/video/([^/?#]+)', ('iwara.tv/video/',), 'https://www.iwara.tv/video/ID', 'Extractor for individual iwara.tv videos'),
+    ('gallery_dl.extractor.iwara', 'IwaraPlaylistExtractor', 'iwara', 'playlist', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/playlist/([^/?#]+)', ('iwara.tv/playlist/',), 'https://www.iwara.tv/playlist/ID', 'Extractor for individual iwara.tv playlist pages'),
+    ('gallery_dl.extractor.iwara', 'IwaraFavoriteExtractor', 'iwara', 'favorite', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/favorites(?:/(image|video)s)?', ('iwara.tv/favorites',), 'https://www.iwara.tv/favorites/videos', None),
+    ('gallery_dl.extractor.iwara', 'IwaraSearchExtractor', 'iwara', 'search', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/search\\?([^#]+)', ('iwara.tv/search?',), 'https://www.iwara.tv/search?query=QUERY&type=TYPE', 'Extractor for iwara.tv search pages'),
+    ('gallery_dl.extractor.iwara', 'IwaraTagExtractor', 'iwara', 'tag', '', False, '(?:https?://)?(?:www\\.)?iwara\\.tv/(image|video)s(?:\\?([^#]+))?', ('iwara.tv/',), 'https://www.iwara.tv/videos?tags=TAGS', 'Extractor for iwara.tv tag search'),
+    ('gallery_dl.extractor.jschan', 'JschanThreadExtractor', '', 'thread', 'jschan', True, '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)/thread/(\\d+)\\.html', ('/thread/',), 'https://94chan.org/a/thread/12345.html', 'Extractor for jschan threads'),
+    ('gallery_dl.extractor.jschan', 'JschanBoardExtractor', '', 'board', 'jschan', True, '(?:jschan:(https?://[^/?#]+)|(?:https?://)?(?:94chan\\.org()))/([^/?#]+)(?:/index\\.html|/catalog\\.html|/\\d+\\.html|/?$)', ('jschan:', '94chan.org'), 'https://94chan.org/a/', 'Extractor for jschan boards'),
+    ('gallery_dl.extractor.kabeuchi', 'KabeuchiUserExtractor', 'kabeuchi', 'user', '', False, '(?:https?://)?kabe-uchiroom\\.com/mypage/?\\?id=(\\d+)', ('kabe-uchiroom.com/mypage',), 'https://kabe-uchiroom.com/mypage/?id=12345', 'Extractor for all posts of a user on kabe-uchiroom.com'),
+    ('gallery_dl.extractor.keenspot', 'KeenspotComicExtractor', 'keenspot', 'comic', '', False, '(?:https?://)?(?!www\\.|forums\\.)([\\w-]+)\\.keenspot\\.com(/.+)?', ('.keenspot.com',), 'http://COMIC.keenspot.com/', 'Extractor for webcomics from keenspot.com'),
+    ('gallery_dl.extractor.kemono', 'KemonoUserExtractor', 'kemono', 'user', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)', ('kemono', 'coomer'), 'https://kemono.cr/SERVICE/user/12345', 'Extractor for all posts from a kemono.cr user listing'),
+    ('gallery_dl.extractor.kemono', 'KemonoPostsExtractor', 'kemono', 'posts', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/posts()()(?:/?\\?([^#]+))?', ('kemono', 'coomer'), 'https://kemono.cr/posts', 'Extractor for kemono.cr post listings'),
+    ('gallery_dl.extractor.kemono', 'KemonoPostExtractor', 'kemono', 'post', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)(/revisions?(?:/(\\d*))?)?', ('kemono', 'coomer'), 'https://kemono.cr/SERVICE/user/12345/post/12345', 'Extractor for a single kemono.cr post'),
+    ('gallery_dl.extractor.kemono', 'KemonoDiscordExtractor', 'kemono', 'discord', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)[/#](?:channel/)?(\\d+)', ('/discord/server/',), 'https://kemono.cr/discord/server/12345/12345', 'Extractor for kemono.cr discord servers'),
+    ('gallery_dl.extractor.kemono', 'KemonoDiscordServerExtractor', 'kemono', 'discord-server', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/discord/server/(\\d+)$', ('/discord/server/',), 'https://kemono.cr/discord/server/12345', None),
+    ('gallery_dl.extractor.kemono', 'KemonoFavoriteExtractor', 'kemono', 'favorite', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/(?:account/)?favorites()()(?:/?\\?([^#]+))?', ('favorites',), 'https://kemono.cr/account/favorites/artists', 'Extractor for kemono.cr favorites'),
+    ('gallery_dl.extractor.kemono', 'KemonoArtistsExtractor', 'kemono', 'artists', '', False, '(?:https?://)?(?:www\\.|beta\\.)?(kemono|coomer)\\.(cr|s[tu]|party)/artists(?:\\?([^#]+))?', ('/artists',), 'https://kemono.cr/artists', 'Extractor for kemono artists'),
+    ('gallery_dl.extractor.khinsider', 'KhinsiderSoundtrackExtractor', 'khinsider', 'soundtrack', '', False, '(?:https?://)?downloads\\.khinsider\\.com/game-soundtracks/album/([^/?#]+)', ('downloads.khinsider.com/game-soundtracks/album/',), 'https://downloads.khinsider.com/game-soundtracks/album/TITLE', 'Extractor for soundtracks from khinsider.com'),
+    ('gallery_dl.extractor.komikcast', 'KomikcastChapterExtractor', 'komikcast', 'chapter', '', False, '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/chapter/[^/?#]+/)', ('komikcast',), 'https://komikcast.li/chapter/TITLE/', 'Extractor for komikcast manga chapters'),
+    ('gallery_dl.extractor.komikcast', 'KomikcastMangaExtractor', 'komikcast', 'manga', '', False, '(?:https?://)?(?:www\\.)?komikcast\\d*\\.(?:l(?:i|a|ol)|com|cz|site|mo?e)(/(?:komik/)?[^/?#]+/?)$', ('komikcast',), 'https://komikcast.li/komik/TITLE', 'Extractor for komikcast manga'),
+    ('gallery_dl.extractor.koofr', 'KoofrSharedExtractor', 'koofr', 'shared', '', False, '(?:https?://)?(?:(?:app\\.)?koofr\\.(?:net|eu)/links/([\\w-]+)|k00\\.fr/(\\w+))', ('/links/', 'k00.fr/'), 'https://app.koofr.net/links/UUID', 'Base class for koofr extractors'),
+    ('gallery_dl.extractor.leakgallery', 'LeakgalleryUserExtractor', 'leakgallery', 'user', '', False, '(?:https?://)?(?:www\\.)?leakgallery\\.com/(?!trending-medias|most-liked|random/medias)([^/?#]+)(?:/(Photos|Videos|All))?(?:/(MostRecent|MostViewed|MostLiked))?/?$', ('leakgallery.com/',), 'https://leakgallery.com/creator', 'Extractor for profile posts on leakgallery.com'),
+    ('gallery_dl.extractor.leakgallery', 'LeakgalleryTrendingExtractor', 'leakgallery', 'trending', '', False, '(?:https?://)?(?:www\\.)?leakgallery\\.com/trending-medias(?:/([\\w-]+))?', ('leakgallery.com/trending-medias',), 'https://leakgallery.com/trending-medias/Week', 'Extractor for trending posts on leakgallery.com'),
+    ('gallery_dl.extractor.leakgallery', 'LeakgalleryMostlikedExtractor', 'leakgallery', 'mostliked', '', False, '(?:https?://)?(?:www\\.)?leakgallery\\.com/most-liked', ('leakgallery.com/most-liked',), 'https://leakgallery.com/most-liked', 'Extractor for most liked posts on leakgallery.com'),
+    ('gallery_dl.extractor.leakgallery', 'LeakgalleryPostExtractor', 'leakgallery', 'post', '', False, '(?:https?://)?(?:www\\.)?leakgallery\\.com/([^/?#]+)/(\\d+)', ('leakgallery.com/',), 'https://leakgallery.com/CREATOR/12345', 'Extractor for individual posts on leakgallery.com'),
+    ('gallery_dl.extractor.lensdump', 'LensdumpAlbumExtractor', 'lensdump', 'album', '', False, '(?:https?://)?lensdump\\.com/a/(\\w+)(?:/?\\?([^#]+))?', ('lensdump.com/a/',), 'https://lensdump.com/a/ID', None),
+    ('gallery_dl.extractor.lensdump', 'LensdumpAlbumsExtractor', 'lensdump', 'albums', '', False, '(?:https?://)?lensdump\\.com/(?![ai]/)([^/?#]+)(?:/?\\?([^#]+))?', ('lensdump.com/',), 'https://lensdump.com/USER', 'Extractor for album list from lensdump.com'),
+    ('gallery_dl.extractor.lensdump', 'LensdumpImageExtractor', 'lensdump', 'image', '', False, '(?:https?://)?(?:(?:i\\d?\\.)?lensdump\\.com|\\w\\.l3n\\.co)/(?:i/)?(\\w+)', ('lensdump.com', '.l3n.co'), 'https://lensdump.com/i/ID', 'Extractor for individual images on lensdump.com'),
+    ('gallery_dl.extractor.lexica', 'LexicaSearchExtractor', 'lexica', 'search', '', False, '(?:https?://)?lexica\\.art/?\\?q=([^&#]+)', ('lexica.art',), 'https://lexica.art/?q=QUERY', 'Extractor for lexica.art search results'),
+    ('gallery_dl.extractor.lightroom', 'LightroomGalleryExtractor', 'lightroom', 'gallery', '', False, '(?:https?://)?lightroom\\.adobe\\.com/shares/([0-9a-f]+)', ('lightroom.adobe.com/shares/',), 'https://lightroom.adobe.com/shares/0123456789abcdef', 'Extractor for an image gallery on lightroom.adobe.com'),
+    ('gallery_dl.extractor.livedoor', 'LivedoorBlogExtractor', 'livedoor', 'blog', '', False, '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/?(?:$|[?#])', ('blog.livedoor.jp/',), 'http://blog.livedoor.jp/USER/', "Extractor for a user's blog on blog.livedoor.jp"),
+    ('gallery_dl.extractor.livedoor', 'LivedoorPostExtractor', 'livedoor', 'post', '', False, '(?:https?://)?blog\\.livedoor\\.jp/(\\w+)/archives/(\\d+)', ('blog.livedoor.jp/',), 'http://blog.livedoor.jp/USER/archives/12345.html', 'Extractor for images from a blog post on blog.livedoor.jp'),
+    ('gallery_dl.extractor.lofter', 'LofterPostExtractor', 'lofter', 'post', '', False, '(?:https?://)?[\\w-]+\\.lofter\\.com/post/([0-9a-f]+)_([0-9a-f]+)', ('.lofter.com/post/',), 'https://BLOG.lofter.com/post/12345678_90abcdef', 'Extractor for a lofter post'),
+    ('gallery_dl.extractor.lofter', 'LofterBlogPostsExtractor', 'lofter', 'blog-posts', '', False, '(?:https?://)?(?:www\\.lofter\\.com/front/blog/home-page/([\\w-]+)|([\\w-]+)\\.lofter\\.com)/?(?:$|\\?|#)', ('www.lofter.com/front/blog/home-page/', '.lofter.com'), 'https://BLOG.lofter.com/', "Extractor for a lofter blog's posts"),
+    ('gallery_dl.extractor.luscious', 'LusciousAlbumExtractor', 'luscious', 'album', '', False, '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/(?:albums|pictures/c/[^/?#]+/album)/[^/?#]+_(\\d+)', ('luscious.net/',), 'https://luscious.net/albums/TITLE_12345/', 'Extractor for image albums from luscious.net'),
+    ('gallery_dl.extractor.luscious', 'LusciousSearchExtractor', 'luscious', 'search', '', False, '(?:https?://)?(?:www\\.|members\\.)?luscious\\.net/albums/list/?(?:\\?([^#]+))?', ('luscious.net/albums/list',), 'https://luscious.net/albums/list/?tagged=TAG', 'Extractor for album searches on luscious.net'),
+    ('gallery_dl.extractor.lynxchan', 'LynxchanThreadExtractor', '', 'thread', 'lynxchan', True, '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)/res/(\\d+)', ('lynxchan:', 'bbw-chan.', 'kohlchan.net', 'endchan.'), 'https://endchan.org/a/res/12345.html', 'Extractor for LynxChan threads'),
+    ('gallery_dl.extractor.lynxchan', 'LynxchanBoardExtractor', '', 'board', 'lynxchan', True, '(?:lynxchan:(https?://[^/?#]+)|(?:https?://)?(?:bbw-chan\\.(?:link|nl)()|kohlchan\\.net()|endchan\\.(?:org|net|gg)()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)', ('lynxchan:', 'bbw-chan.', 'kohlchan.net', 'endchan.'), 'https://endchan.org/a/', 'Extractor for LynxChan boards'),
+    ('gallery_dl.extractor.madokami', 'MadokamiMangaExtractor', 'madokami', 'manga', '', False, '(?:https?://)?manga\\.madokami\\.al/Manga/(\\w/\\w{2}/\\w{4}/.+)', ('manga.madokami.al/manga/',), 'https://manga.madokami.al/Manga/A/AB/ABCD/ABCDE_TITLE', 'Extractor for madokami manga'),
+    ('gallery_dl.extractor.mangadex', 'MangadexCoversExtractor', 'mangadex', 'covers', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)(?:/[^/?#]+)?\\?tab=art', ('mangadex.',), 'https://mangadex.org/title/01234567-89ab-cdef-0123-456789abcdef?tab=art', 'Extractor for mangadex manga covers'),
+    ('gallery_dl.extractor.mangadex', 'MangadexChapterExtractor', 'mangadex', 'chapter', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/chapter/([0-9a-f-]+)', ('mangadex.',), 'https://mangadex.org/chapter/01234567-89ab-cdef-0123-456789abcdef', 'Extractor for manga-chapters from mangadex.org'),
+    ('gallery_dl.extractor.mangadex', 'MangadexMangaExtractor', 'mangadex', 'manga', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/(?:title|manga)/(?!follows|feed$)([0-9a-f-]+)', ('mangadex.',), 'https://mangadex.org/title/01234567-89ab-cdef-0123-456789abcdef', 'Extractor for manga from mangadex.org'),
+    ('gallery_dl.extractor.mangadex', 'MangadexFeedExtractor', 'mangadex', 'feed', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/feed$()', ('mangadex.',), 'https://mangadex.org/title/feed', 'Extractor for chapters from your Updates Feed'),
+    ('gallery_dl.extractor.mangadex', 'MangadexFollowingExtractor', 'mangadex', 'following', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/titles?/follows(?:\\?([^#]+))?$', ('mangadex.',), 'https://mangadex.org/title/follows', 'Extractor for followed manga from your Library'),
+    ('gallery_dl.extractor.mangadex', 'MangadexListExtractor', 'mangadex', 'list', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/list/([0-9a-f-]+)(?:/[^/?#]*)?(?:\\?tab=(\\w+))?', ('mangadex.',), 'https://mangadex.org/list/01234567-89ab-cdef-0123-456789abcdef/NAME', 'Extractor for mangadex MDLists'),
+    ('gallery_dl.extractor.mangadex', 'MangadexAuthorExtractor', 'mangadex', 'author', '', False, '(?:https?://)?(?:www\\.)?mangadex\\.(?:org|cc)/author/([0-9a-f-]+)', ('mangadex.',), 'https://mangadex.org/author/01234567-89ab-cdef-0123-456789abcdef/NAME', 'Extractor for mangadex authors'),
+    ('gallery_dl.extractor.mangafire', 'MangafireChapterExtractor', 'mangafire', 'chapter', '', False, '(?:https?://)?(?:www\\.)?mangafire\\.to/read/([\\w-]+\\.(\\w+))/([\\w-]+)/((chapter|volume)-\\d+(?:\\D.*)?)', ('mangafire.to/read/',), 'https://mangafire.to/read/MANGA.ID/LANG/chapter-123', 'Extractor for mangafire manga chapters'),
+    ('gallery_dl.extractor.mangafire', 'MangafireMangaExtractor', 'mangafire', 'manga', '', False, '(?:https?://)?(?:www\\.)?mangafire\\.to/manga/([\\w-]+)\\.(\\w+)', ('mangafire.to/manga/',), 'https://mangafire.to/manga/MANGA.ID', 'Extractor for mangafire manga'),
+    ('gallery_dl.extractor.mangafox', 'MangafoxChapterExtractor', 'mangafox', 'chapter', '', False, '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+/((?:v([^/?#]+)/)?c(\\d+)([^/?#]*)))', ('fanfox.net', 'mangafox.me'), 'https://fanfox.net/manga/TITLE/v01/c001/1.html', 'Extractor for manga chapters from fanfox.net'),
+    ('gallery_dl.extractor.mangafox', 'MangafoxMangaExtractor', 'mangafox', 'manga', '', False, '(?:https?://)?(?:www\\.|m\\.)?(?:fanfox\\.net|mangafox\\.me)(/manga/[^/?#]+)/?$', ('fanfox.net', 'mangafox.me'), 'https://fanfox.net/manga/TITLE', 'Extractor for manga from fanfox.net'),
+    ('gallery_dl.extractor.mangahere', 'MangahereChapterExtractor', 'mangahere', 'chapter', '', False, '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co]/manga/([^/]+(?:/v0*(\\d+))?/c([^/?#]+))', ('mangahere.c',), 'https://www.mangahere.cc/manga/TITLE/c001/1.html', 'Extractor for manga-chapters from mangahere.cc'),
+    ('gallery_dl.extractor.mangahere', 'MangahereMangaExtractor', 'mangahere', 'manga', '', False, '(?:https?://)?(?:www\\.|m\\.)?mangahere\\.c[co](/manga/[^/?#]+/?)(?:#.*)?$', ('mangahere.c',), 'https://www.mangahere.cc/manga/TITLE', 'Extractor for manga from mangahere.cc'),
+    ('gallery_dl.extractor.manganelo', 'ManganeloChapterExtractor', '', 'chapter', 'manganelo', True, '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+/chapter-[^/?#]+)', ('manganelo:', 'nelomanga.net', 'natomanga.com', 'manganato.gg', 'mangakakalot.gg'), 'https://www.mangakakalot.gg/manga/MANGA_NAME/chapter-123', 'Extractor for manganelo manga chapters'),
+    ('gallery_dl.extractor.manganelo', 'ManganeloMangaExtractor', '', 'manga', 'manganelo', True, '(?:manganelo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nelomanga\\.net()|(?:www\\.)?natomanga\\.com()|(?:www\\.)?manganato\\.gg()|(?:www\\.)?mangakakalot\\.gg()))(/manga/[^/?#]+)$', ('manganelo:', 'nelomanga.net', 'natomanga.com', 'manganato.gg', 'mangakakalot.gg'), 'https://www.mangakakalot.gg/manga/MANGA_NAME', 'Extractor for manganelo manga'),
+    ('gallery_dl.extractor.mangapark', 'MangaparkChapterExtractor', 'mangapark', 'chapter', '', False, '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title/[^/?#]+/|comic/\\d+/[^/?#]+/[^/?#]+-i)(\\d+)', ('title/', 'comic/'), 'https://mangapark.net/title/MANGA/12345-en-ch.01', 'Extractor for manga-chapters from mangapark.net'),
+    ('gallery_dl.extractor.mangapark', 'MangaparkMangaExtractor', 'mangapark', 'manga', '', False, '(?:https?://)?(?:www\\.)?(?:(?:manga|comic|read)park\\.(?:com|net|org|me|io|to)|parkmanga\\.(?:com|net|org)|mpark\\.to)/(?:title|comic)/(\\d+)(?:[/-][^/?#]*)?/?$', ('park.', 'parkmanga.', 'mpark.to'), 'https://mangapark.net/title/12345-MANGA', 'Extractor for manga from mangapark.net'),
+    ('gallery_dl.extractor.mangaread', 'MangareadChapterExtractor', 'mangaread', 'chapter', '', False, '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+/[^/?#]+)', ('mangaread.org',), 'https://www.mangaread.org/manga/MANGA/chapter-01/', 'Extractor for manga-chapters from mangaread.org'),
+    ('gallery_dl.extractor.mangaread', 'MangareadMangaExtractor', 'mangaread', 'manga', '', False, '(?:https?://)?(?:www\\.)?mangaread\\.org(/manga/[^/?#]+)/?$', ('mangaread.org',), 'https://www.mangaread.org/manga/MANGA', 'Extractor for manga from mangaread.org'),
+    ('gallery_dl.extractor.mangareader', 'MangareaderChapterExtractor', 'mangareader', 'chapter', '', False, '(?:https?://)?(?:www\\.)?mangareader\\.to/read/([\\w-]+-\\d+)/([^/?#]+)/(chapter|volume)-(\\d+[^/?#]*)', ('mangareader.to/read/',), 'https://mangareader.to/read/MANGA-123/LANG/chapter-123', 'Extractor for mangareader manga chapters'),
+    ('gallery_dl.extractor.mangareader', 'MangareaderMangaExtractor', 'mangareader', 'manga', '', False, '(?:https?://)?(?:www\\.)?mangareader\\.to/([\\w-]+-\\d+)', ('mangareader.to/',), 'https://mangareader.to/MANGA-123', 'Extractor for mangareader manga'),
+    ('gallery_dl.extractor.mangataro', 'MangataroChapterExtractor', 'mangataro', 'chapter', '', False, '(?:https?://)?mangataro\\.org(/read/([^/?#]+)/(?:[^/?#]*-)?(\\d+))', ('mangataro.org',), 'https://mangataro.org/read/MANGA/ch123-12345', 'Extractor for mangataro manga chapters'),
+    ('gallery_dl.extractor.mangataro', 'MangataroMangaExtractor', 'mangataro', 'manga', '', False, '(?:https?://)?mangataro\\.org(/manga/([^/?#]+))', ('mangataro.org',), 'https://mangataro.org/manga/MANGA', 'Extractor for mangataro manga'),
+    ('gallery_dl.extractor.mangoxo', 'MangoxoAlbumExtractor', 'mangoxo', 'album', '', False, '(?:https?://)?(?:www\\.)?mangoxo\\.com/album/(\\w+)', ('mangoxo.com/album/',), 'https://www.mangoxo.com/album/ID', 'Extractor for albums on mangoxo.com'),
+    ('gallery_dl.extractor.mangoxo', 'MangoxoChannelExtractor', 'mangoxo', 'channel', '', False, '(?:https?://)?(?:www\\.)?mangoxo\\.com/(\\w+)/album', ('mangoxo.com/',), 'https://www.mangoxo.com/USER/album', 'Extractor for all albums on a mangoxo channel'),
+    ('gallery_dl.extractor.misskey', 'MisskeyUserExtractor', '', 'user', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/?$', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/@USER', 'Extractor for all images of a Misskey user'),
+    ('gallery_dl.extractor.misskey', 'MisskeyNotesExtractor', '', 'notes', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/notes', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/@USER/notes', "Extractor for a Misskey user's notes"),
+    ('gallery_dl.extractor.misskey', 'MisskeyInfoExtractor', '', 'info', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/info', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/@USER/info', "Extractor for a Misskey user's profile data"),
+    ('gallery_dl.extractor.misskey', 'MisskeyAvatarExtractor', '', 'avatar', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/avatar', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/@USER/avatar', "Extractor for a Misskey user's avatar"),
+    ('gallery_dl.extractor.misskey', 'MisskeyBackgroundExtractor', '', 'background', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/ba(?:nner|ckground)', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/@USER/banner', "Extractor for a Misskey user's banner image"),
+    ('gallery_dl.extractor.misskey', 'MisskeyFollowingExtractor', '', 'following', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/@([^/?#]+)/following', ('/following',), 'https://misskey.io/@USER/following', 'Extractor for followed Misskey users'),
+    ('gallery_dl.extractor.misskey', 'MisskeyNoteExtractor', '', 'note', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/notes/(\\w+)', ('misskey:', 'misskey.io', 'misskey.design', 'misskey.art', 'lesbian.energy', 'sushi.ski'), 'https://misskey.io/notes/98765', 'Extractor for images from a Note'),
+    ('gallery_dl.extractor.misskey', 'MisskeyFavoriteExtractor', '', 'favorite', 'misskey', True, '(?:misskey:(https?://[^/?#]+)|(?:https?://)?(?:misskey\\.io()|misskey\\.design()|misskey\\.art()|lesbian\\.energy()|sushi\\.ski()))/(?:my|api/i)/favorites', ('/favorites',), 'https://misskey.io/my/favorites', 'Extractor for favorited notes'),
+    ('gallery_dl.extractor.motherless', 'MotherlessMediaExtractor', 'motherless', 'media', '', False, '(?:https?://)?motherless\\.com/((?:g/[^/?#]+/|G[IV]?[A-Z0-9]+/)?(?!G)[A-Z0-9]+)', ('motherless.com/',), 'https://motherless.com/ABC123', 'Extractor for a single image/video from motherless.com'),
+    ('gallery_dl.extractor.motherless', 'MotherlessGalleryExtractor', 'motherless', 'gallery', '', False, '(?:https?://)?motherless\\.com/G([IVG])?([A-Z0-9]+)/?$', ('motherless.com/g',), 'https://motherless.com/GABC123', 'Extractor for a motherless.com gallery'),
+    ('gallery_dl.extractor.motherless', 'MotherlessGroupExtractor', 'motherless', 'group', '', False, '(?:https?://)?motherless\\.com/g([iv]?)/?([a-z0-9_]+)/?$', ('motherless.com/g',), 'https://motherless.com/g/abc123', None),
+    ('gallery_dl.extractor.myhentaigallery', 'MyhentaigalleryGalleryExtractor', 'myhentaigallery', 'gallery', '', False, '(?:https?://)?myhentaigallery\\.com/g(?:allery/(?:thumbnails|show))?/(\\d+)', ('myhentaigallery.com/g',), 'https://myhentaigallery.com/g/12345', 'Extractor for image galleries from myhentaigallery.com'),
+    ('gallery_dl.extractor.myhentaigallery', 'MyhentaigalleryTagExtractor', 'myhentaigallery', 'tag', '', False, '(?:https?://)?myhentaigallery\\.com(/g/(artist|category|group|parody)/(\\d+).*)', ('myhentaigallery.com',), 'https://myhentaigallery.com/g/category/123', 'Extractor for myhentaigallery tag searches'),
+    ('gallery_dl.extractor.myportfolio', 'MyportfolioGalleryExtractor', 'myportfolio', 'gallery', '', False, '(?:myportfolio:(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+\\.myportfolio\\.com))(/[^/?#]+)?', ('myportfolio:', '.myportfolio.com'), 'https://USER.myportfolio.com/TITLE', 'Extractor for an image gallery on www.myportfolio.com'),
+    ('gallery_dl.extractor.naverblog', 'NaverBlogPostExtractor', 'naver-blog', 'post', '', False, '(?:https?://)?blog\\.naver\\.com/(?:PostView\\.n(?:aver|hn)\\?blogId=(\\w+)&logNo=(\\d+)|(\\w+)/(\\d+)/?$)', ('blog.naver.com/',), 'https://blog.naver.com/BLOGID/12345', 'Extractor for blog posts on blog.naver.com'),
+    ('gallery_dl.extractor.naverblog', 'NaverBlogBlogExtractor', 'naver-blog', 'blog', '', False, '(?:https?://)?blog\\.naver\\.com/(?:PostList\\.n(?:aver|hn)\\?(?:[^&#]+&)*blogId=([^&#]+)|(\\w+)/?$)', ('blog.naver.com/',), 'https://blog.naver.com/BLOGID', "Extractor for a user's blog on blog.naver.com"),
+    ('gallery_dl.extractor.naverchzzk', 'NaverChzzkCommentExtractor', 'naver-chzzk', 'comment', '', False, '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community/detail/(\\d+)', ('/community/detail/',), 'https://chzzk.naver.com/0123456789abcdef/community/detail/12345', 'Extractor for individual comment from chzzk.naver.com'),
+    ('gallery_dl.extractor.naverchzzk', 'NaverChzzkCommunityExtractor', 'naver-chzzk', 'community', '', False, '(?:https?://)?chzzk\\.naver\\.com/(\\w+)/community', ('chzzk.naver.com/',), 'https://chzzk.naver.com/0123456789abcdef/community', 'Extractor for comments from chzzk.naver.com'),
+    ('gallery_dl.extractor.naverwebtoon', 'NaverWebtoonEpisodeExtractor', 'naver-webtoon', 'episode', '', False, '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/detail(?:\\.nhn)?\\?([^#]+)', ('comic.naver.com/',), 'https://comic.naver.com/webtoon/detail?titleId=12345&no=1', None),
+    ('gallery_dl.extractor.naverwebtoon', 'NaverWebtoonComicExtractor', 'naver-webtoon', 'comic', '', False, '(?:https?://)?comic\\.naver\\.com/(webtoon|challenge|bestChallenge)/list(?:\\.nhn)?\\?([^#]+)', ('comic.naver.com/',), 'https://comic.naver.com/webtoon/list?titleId=12345', None),
+    ('gallery_dl.extractor.nekohouse', 'NekohousePostExtractor', 'nekohouse', 'post', '', False, '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/post/([^/?#]+)', ('nekohouse.su/',), 'https://nekohouse.su/SERVICE/user/12345/post/12345', None),
+    ('gallery_dl.extractor.nekohouse', 'NekohouseUserExtractor', 'nekohouse', 'user', '', False, '(?:https?://)?nekohouse\\.su/([^/?#]+)/user/([^/?#]+)/?(?:\\?([^#]+))?(?:$|\\?|#)', ('nekohouse.su/',), 'https://nekohouse.su/SERVICE/user/12345', None),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsImageExtractor', 'newgrounds', 'image', '', False, '(?:https?://)?(?:(?:www\\.)?newgrounds\\.com/art/view/([^/?#]+)/[^/?#]+|art\\.ngfiles\\.com/images/\\d+/\\d+_([^_]+)_([^.]+))', ('newgrounds.com/art/view/', 'art.ngfiles.com/images/'), 'https://www.newgrounds.com/art/view/USER/TITLE', 'Extractor for a single image from newgrounds.com'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsMediaExtractor', 'newgrounds', 'media', '', False, '(?:https?://)?(?:www\\.)?newgrounds\\.com(/(?:portal/view|audio/listen)/\\d+)', ('newgrounds.com',), 'https://www.newgrounds.com/portal/view/12345', 'Extractor for a media file from newgrounds.com'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsArtExtractor', 'newgrounds', 'art', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/art(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ('.newgrounds.com/art',), 'https://USER.newgrounds.com/art', 'Extractor for all images of a newgrounds user'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsAudioExtractor', 'newgrounds', 'audio', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/audio(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ('.newgrounds.com/audio',), 'https://USER.newgrounds.com/audio', 'Extractor for all audio submissions of a newgrounds user'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsMoviesExtractor', 'newgrounds', 'movies', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/movies(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ('.newgrounds.com/movies',), 'https://USER.newgrounds.com/movies', 'Extractor for all movies of a newgrounds user'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsGamesExtractor', 'newgrounds', 'games', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/games(?:(?:/page/|/?\\?page=)(\\d+))?/?$', ('.newgrounds.com/games',), 'https://USER.newgrounds.com/games', "Extractor for a newgrounds user's games"),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsUserExtractor', 'newgrounds', 'user', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/?$', ('.newgrounds.com',), 'https://USER.newgrounds.com', 'Extractor for a newgrounds user profile'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsFavoriteExtractor', 'newgrounds', 'favorite', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites(?!/following)(?:/(art|audio|movies)(?:(?:/page/|/?\\?page=)(\\d+))?)?', ('.newgrounds.com/favorites',), 'https://USER.newgrounds.com/favorites', 'Extractor for posts favorited by a newgrounds user'),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsFollowingExtractor', 'newgrounds', 'following', '', False, '(?:https?://)?([\\w-]+)\\.newgrounds\\.com/favorites/(following)(?:(?:/page/|/?\\?page=)(\\d+))?', ('.newgrounds.com/favorites/',), 'https://USER.newgrounds.com/favorites/following', "Extractor for a newgrounds user's favorited users"),
+    ('gallery_dl.extractor.newgrounds', 'NewgroundsSearchExtractor', 'newgrounds', 'search', '', False, '(?:https?://)?(?:www\\.)?newgrounds\\.com/search/conduct/([^/?#]+)/?\\?([^#]+)', ('newgrounds.com/search/conduct/',), 'https://www.newgrounds.com/search/conduct/art?terms=QUERY', 'Extractor for newgrounds.com search reesults'),
+    ('gallery_dl.extractor.nhentai', 'NhentaiGalleryExtractor', 'nhentai', 'gallery', '', False, '(?:https?://)?nhentai\\.net/g/(\\d+)', ('nhentai.net/g/',), 'https://nhentai.net/g/12345/', 'Extractor for image galleries from nhentai.net'),
+    ('gallery_dl.extractor.nhentai', 'NhentaiTagExtractor', 'nhentai', 'tag', '', False, '(?:https?://)?nhentai\\.net(/(?:artist|category|character|group|language|parody|tag)/[^/?#]+(?:/popular[^/?#]*)?/?)(?:\\?([^#]+))?', ('nhentai.net',), 'https://nhentai.net/tag/TAG/', 'Extractor for nhentai tag searches'),
+    ('gallery_dl.extractor.nhentai', 'NhentaiSearchExtractor', 'nhentai', 'search', '', False, '(?:https?://)?nhentai\\.net(/search/?)\\?([^#]+)', ('nhentai.net',), 'https://nhentai.net/search/?q=QUERY', 'Extractor for nhentai search results'),
+    ('gallery_dl.extractor.nhentai', 'NhentaiFavoriteExtractor', 'nhentai', 'favorite', '', False, '(?:https?://)?nhentai\\.net(/favorites/?)(?:\\?([^#]+))?', ('nhentai.net',), 'https://nhentai.net/favorites/', 'Extractor for nhentai favorites'),
+    ('gallery_dl.extractor.nijie', 'NijieUserExtractor', '', 'user', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members\\.php\\?id=(\\d+)', ('/members.php?id=',), 'https://nijie.info/members.php?id=12345', 'Extractor for nijie user profiles'),
+    ('gallery_dl.extractor.nijie', 'NijieIllustrationExtractor', '', 'illustration', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_illust\\.php\\?id=(\\d+)', ('/members_illust.php?id=',), 'https://nijie.info/members_illust.php?id=12345', 'Extractor for all illustrations of a nijie-user'),
+    ('gallery_dl.extractor.nijie', 'NijieDoujinExtractor', '', 'doujin', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/members_dojin\\.php\\?id=(\\d+)', ('/members_dojin.php?id=',), 'https://nijie.info/members_dojin.php?id=12345', 'Extractor for doujin entries of a nijie user'),
+    ('gallery_dl.extractor.nijie', 'NijieFavoriteExtractor', '', 'favorite', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/user_like_illust_view\\.php\\?id=(\\d+)', ('/user_like_illust_view.php?id=',), 'https://nijie.info/user_like_illust_view.php?id=12345', 'Extractor for all favorites/bookmarks of a nijie user'),
+    ('gallery_dl.extractor.nijie', 'NijieNuitaExtractor', '', 'nuita', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/history_nuita\\.php\\?id=(\\d+)', ('/history_nuita.php?id=',), 'https://nijie.info/history_nuita.php?id=12345', "Extractor for a nijie user's 抜いた list"),
+    ('gallery_dl.extractor.nijie', 'NijieFeedExtractor', '', 'feed', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_user_view\\.php', ('/like_user_view.php',), 'https://nijie.info/like_user_view.php', 'Extractor for nijie liked user feed'),
+    ('gallery_dl.extractor.nijie', 'NijieFollowedExtractor', '', 'followed', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/like_my\\.php', ('/like_my.php',), 'https://nijie.info/like_my.php', 'Extractor for followed nijie users'),
+    ('gallery_dl.extractor.nijie', 'NijieImageExtractor', '', 'image', 'Nijie', True, '(?:Nijie:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?nijie\\.info()|(?:www\\.)?horne\\.red()))/view(?:_popup)?\\.php\\?id=(\\d+)', ('.php?id=',), 'https://nijie.info/view.php?id=12345', 'Extractor for a nijie work/image'),
+    ('gallery_dl.extractor.nitter', 'NitterTweetsExtractor', '', 'tweets', 'nitter', True, '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)(?:/tweets)?(?:$|\\?|#)', None, 'https://nitter.net/USER', None),
+    ('gallery_dl.extractor.nitter', 'NitterRepliesExtractor', '', 'replies', 'nitter', True, '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/with_replies', ('/with_replies',), 'https://nitter.net/USER/with_replies', None),
+    ('gallery_dl.extractor.nitter', 'NitterMediaExtractor', '', 'media', 'nitter', True, '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/media', ('/media',), 'https://nitter.net/USER/media', None),
+    ('gallery_dl.extractor.nitter', 'NitterSearchExtractor', '', 'search', 'nitter', True, '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i(?:/user/|d:)(\\d+)|[^/?#]+)/search', ('/search',), 'https://nitter.net/USER/search', None),
+    ('gallery_dl.extractor.nitter', 'NitterTweetExtractor', '', 'tweet', 'nitter', True, '(?:nitter:(https?://[^/?#]+)|(?:https?://)?(?:))/(i/web|[^/?#]+)/status/(\\d+())', ('/status/',), 'https://nitter.net/USER/status/12345', 'Extractor for nitter tweets'),
+    ('gallery_dl.extractor.nozomi', 'NozomiPostExtractor', 'nozomi', 'post', '', False, '(?:https?://)?nozomi\\.la/post/(\\d+)', ('nozomi.la/post/',), 'https://nozomi.la/post/12345.html', 'Extractor for individual posts on nozomi.la'),
+    ('gallery_dl.extractor.nozomi', 'NozomiIndexExtractor', 'nozomi', 'index', '', False, '(?:https?://)?nozomi\\.la/(?:(index(?:-Popular)?)-(\\d+)\\.html)?(?:$|#|\\?)', ('nozomi.la/',), 'https://nozomi.la/index-1.html', 'Extractor for the nozomi.la index'),
+    ('gallery_dl.extractor.nozomi', 'NozomiTagExtractor', 'nozomi', 'tag', '', False, '(?:https?://)?nozomi\\.la/tag/([^/?#]+)-(\\d+)\\.', ('nozomi.la/tag/',), 'https://nozomi.la/tag/TAG-1.html', 'Extractor for posts from tag searches on nozomi.la'),
+    ('gallery_dl.extractor.nozomi', 'NozomiSearchExtractor', 'nozomi', 'search', '', False, '(?:https?://)?nozomi\\.la/search\\.html\\?q=([^&#]+)', ('nozomi.la/search.html?q=',), 'https://nozomi.la/search.html?q=QUERY', 'Extractor for search results on nozomi.la'),
+    ('gallery_dl.extractor.nsfwalbum', 'NsfwalbumAlbumExtractor', 'nsfwalbum', 'album', '', False, '(?:https?://)?(?:www\\.)?nsfwalbum\\.com(/album/(\\d+))', ('nsfwalbum.com',), 'https://nsfwalbum.com/album/12345', 'Extractor for image albums on nsfwalbum.com'),
+    ('gallery_dl.extractor.nudostar', 'NudostarModelExtractor', 'nudostar', 'model', '', False, '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/?)$', ('nudostar.tv',), 'https://nudostar.tv/models/MODEL/', 'Extractor for NudoStar models'),
+    ('gallery_dl.extractor.nudostar', 'NudostarImageExtractor', 'nudostar', 'image', '', False, '(?:https?://)?(?:[a-z]{2}.)?nudostar\\.tv(/models/([^/?#]+)/(\\d+)/)', ('nudostar.tv',), 'https://nudostar.tv/models/MODEL/123/', 'Extractor for NudoStar images'),
+    ('gallery_dl.extractor.okporn', 'OkpornGalleryExtractor', 'okporn', 'gallery', '', False, '(?:https?://)?(?:www\\.)?ok\\.porn/albums/(\\d+)', ('ok.porn/albums/',), 'https://ok.porn/albums/12345/', 'Extractor for image galleries from ok.porn'),
+    ('gallery_dl.extractor.paheal', 'PahealTagExtractor', 'paheal', 'tag', 'shimmie2', False, '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/list/([^/?#]+)', ('.paheal.net/post/list/',), 'https://rule34.paheal.net/post/list/TAG/1', 'Extractor for images from rule34.paheal.net by search-tags'),
+    ('gallery_dl.extractor.paheal', 'PahealPostExtractor', 'paheal', 'post', 'shimmie2', False, '(?:https?://)?(?:rule34|rule63|cosplay)\\.paheal\\.net/post/view/(\\d+)', ('.paheal.net/post/view/',), 'https://rule34.paheal.net/post/view/12345', 'Extractor for single images from rule34.paheal.net'),
+    ('gallery_dl.extractor.patreon', 'PatreonCollectionExtractor', 'patreon', 'collection', '', False, '(?:https?://)?(?:www\\.)?patreon\\.com/collection/(\\d+)', ('patreon.com/collection/',), 'https://www.patreon.com/collection/12345', 'Extractor for a patreon collection'),
+    ('gallery_dl.extractor.patreon', 'PatreonCreatorExtractor', 'patreon', 'creator', '', False, '(?:https?://)?(?:www\\.)?patreon\\.com/(?!(?:home|create|login|signup|search|posts|messages)(?:$|[/?#]))(?:profile/creators|(?:cw?/)?([^/?#]+)(?:/posts)?)/?(?:\\?([^#]+))?', ('patreon.com/',), 'https://www.patreon.com/c/USER', "Extractor for a creator's works"),
+    ('gallery_dl.extractor.patreon', 'PatreonUserExtractor', 'patreon', 'user', '', False, '(?:https?://)?(?:www\\.)?patreon\\.com/home$', ('patreon.com/home',), 'https://www.patreon.com/home', 'Extractor for media from creators supported by you'),
+    ('gallery_dl.extractor.patreon', 'PatreonPostExtractor', 'patreon', 'post', '', False, '(?:https?://)?(?:www\\.)?patreon\\.com/posts/([^/?#]+)', ('patreon.com/posts/',), 'https://www.patreon.com/posts/TITLE-12345', 'Extractor for media from a single post'),
+    ('gallery_dl.extractor.pexels', 'PexelsCollectionExtractor', 'pexels', 'collection', '', False, '(?:https?://)?(?:www\\.)?pexels\\.com/collections/((?:[^/?#]*-)?(\\w+))', ('pexels.com/collections/',), 'https://www.pexels.com/collections/SLUG-a1b2c3/', 'Extractor for a pexels.com collection'),
+    ('gallery_dl.extractor.pexels', 'PexelsSearchExtractor', 'pexels', 'search', '', False, '(?:https?://)?(?:www\\.)?pexels\\.com/search/([^/?#]+)', ('pexels.com/search/',), 'https://www.pexels.com/search/QUERY/', 'Extractor for pexels.com search results'),
+    ('gallery_dl.extractor.pexels', 'PexelsUserExtractor', 'pexels', 'user', '', False, '(?:https?://)?(?:www\\.)?pexels\\.com/(@(?:(?:[^/?#]*-)?(\\d+)|[^/?#]+))', ('pexels.com/',), 'https://www.pexels.com/@USER-12345/', 'Extractor for pexels.com user galleries'),
+    ('gallery_dl.extractor.pexels', 'PexelsImageExtractor', 'pexels', 'image', '', False, '(?:https?://)?(?:www\\.)?pexels\\.com/photo/((?:[^/?#]*-)?\\d+)', ('pexels.com/photo/',), 'https://www.pexels.com/photo/SLUG-12345/', None),
+    ('gallery_dl.extractor.philomena', 'PhilomenaPostExtractor', '', 'post', 'philomena', True, '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:images/)?(\\d+)', ('philomena:', 'derpibooru.org', 'ponybooru.org', 'furbooru.org'), 'https://derpibooru.org/images/12345', 'Extractor for single posts on a Philomena booru'),
+    ('gallery_dl.extractor.philomena', 'PhilomenaSearchExtractor', '', 'search', 'philomena', True, '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/(?:search/?\\?([^#]+)|tags/([^/?#]+))', ('philomena:', 'derpibooru.org', 'ponybooru.org', 'furbooru.org'), 'https://derpibooru.org/search?q=QUERY', 'Extractor for Philomena search results'),
+    ('gallery_dl.extractor.philomena', 'PhilomenaGalleryExtractor', '', 'gallery', 'philomena', True, '(?:philomena:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?derpibooru\\.org()|(?:www\\.)?ponybooru\\.org()|furbooru\\.org()))/galleries/(\\d+)', ('/galleries/',), 'https://derpibooru.org/galleries/12345', 'Extractor for Philomena galleries'),
+    ('gallery_dl.extractor.photovogue', 'PhotovogueUserExtractor', 'photovogue', 'user', '', False, '(?:https?://)?(?:www\\.)?vogue\\.com/photovogue/photographers/(\\d+)', ('vogue.com/photovogue/photographers/',), 'https://www.vogue.com/photovogue/photographers/12345', None),
+    ('gallery_dl.extractor.picarto', 'PicartoGalleryExtractor', 'picarto', 'gallery', '', False, '(?:https?://)?picarto\\.tv/([^/?#]+)/gallery', ('picarto.tv/',), 'https://picarto.tv/USER/gallery/TITLE/', 'Extractor for picarto galleries'),
+    ('gallery_dl.extractor.pictoa', 'PictoaImageExtractor', 'pictoa', 'image', '', False, '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+)/(\\d+)', ('pictoa.com',), 'https://www.pictoa.com/albums/NAME-12345/12345.html', 'Extractor for single images from pictoa.com'),
+    ('gallery_dl.extractor.pictoa', 'PictoaAlbumExtractor', 'pictoa', 'album', '', False, '(?:https?://)?(?:[\\w]+\\.)?pictoa\\.com(?:\\.de)?/albums/(?:[\\w-]+-)?(\\d+).html', ('pictoa.com',), 'https://www.pictoa.com/albums/NAME-12345.html', 'Extractor for image albums from pictoa.com'),
+    ('gallery_dl.extractor.piczel', 'PiczelUserExtractor', 'piczel', 'user', '', False, '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/([^/?#]+)/?$', ('piczel.tv/gallery/',), 'https://piczel.tv/gallery/USER', "Extractor for all images from a user's gallery"),
+    ('gallery_dl.extractor.piczel', 'PiczelFolderExtractor', 'piczel', 'folder', '', False, '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/(?!image/)[^/?#]+/(\\d+)', ('piczel.tv/gallery/',), 'https://piczel.tv/gallery/USER/12345', "Extractor for images inside a user's folder"),
+    ('gallery_dl.extractor.piczel', 'PiczelImageExtractor', 'piczel', 'image', '', False, '(?:https?://)?(?:www\\.)?piczel\\.tv/gallery/image/(\\d+)', ('piczel.tv/gallery/image/',), 'https://piczel.tv/gallery/image/12345', 'Extractor for individual images'),
+    ('gallery_dl.extractor.pillowfort', 'PillowfortPostExtractor', 'pillowfort', 'post', '', False, '(?:https?://)?www\\.pillowfort\\.social/posts/(\\d+)', ('www.pillowfort.social/posts/',), 'https://www.pillowfort.social/posts/12345', 'Extractor for a single pillowfort post'),
+    ('gallery_dl.extractor.pillowfort', 'PillowfortUserExtractor', 'pillowfort', 'user', '', False, '(?:https?://)?www\\.pillowfort\\.social/(?!posts/)([^/?#]+(?:/tagged/[^/?#]+)?)', ('www.pillowfort.social/',), 'https://www.pillowfort.social/USER', 'Extractor for all posts of a pillowfort user'),
+    ('gallery_dl.extractor.pinterest', 'PinterestUserExtractor', 'pinterest', 'user', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)(?:/_saved)?/?$', ('pinterest.',), 'https://www.pinterest.com/USER/', "Extractor for a user's boards"),
+    ('gallery_dl.extractor.pinterest', 'PinterestAllpinsExtractor', 'pinterest', 'allpins', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/pins/?$', ('pinterest.',), 'https://www.pinterest.com/USER/pins/', "Extractor for a user's 'All Pins' feed"),
+    ('gallery_dl.extractor.pinterest', 'PinterestCreatedExtractor', 'pinterest', 'created', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/_created/?$', ('pinterest.',), 'https://www.pinterest.com/USER/_created/', "Extractor for a user's created pins"),
+    ('gallery_dl.extractor.pinterest', 'PinterestSectionExtractor', 'pinterest', 'section', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/([^/?#]+)', ('pinterest.',), 'https://www.pinterest.com/USER/BOARD/SECTION', 'Extractor for board sections on pinterest.com'),
+    ('gallery_dl.extractor.pinterest', 'PinterestSearchExtractor', 'pinterest', 'search', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/search/pins/?\\?q=([^&#]+)', ('/search/pins',), 'https://www.pinterest.com/search/pins/?q=QUERY', 'Extractor for Pinterest search results'),
+    ('gallery_dl.extractor.pinterest', 'PinterestPinExtractor', 'pinterest', 'pin', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+)(?!.*#related$)', ('pinterest.',), 'https://www.pinterest.com/pin/12345/', 'Extractor for images from a single pin from pinterest.com'),
+    ('gallery_dl.extractor.pinterest', 'PinterestBoardExtractor', 'pinterest', 'board', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?(?!.*#related$)', ('pinterest.',), 'https://www.pinterest.com/USER/BOARD/', 'Extractor for images from a board from pinterest.com'),
+    ('gallery_dl.extractor.pinterest', 'PinterestRelatedPinExtractor', 'pinterest', 'related-pin', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/pin/([^/?#]+).*#related$', ('pinterest.',), 'https://www.pinterest.com/pin/12345/#related', 'Extractor for related pins of another pin from pinterest.com'),
+    ('gallery_dl.extractor.pinterest', 'PinterestRelatedBoardExtractor', 'pinterest', 'related-board', '', False, '(?:https?://)?(?:\\w+\\.)?pinterest\\.[\\w.]+/(?!pin/)([^/?#]+)/([^/?#]+)/?#related$', ('pinterest.',), 'https://www.pinterest.com/USER/BOARD/#related', 'Extractor for related pins of a board from pinterest.com'),
+    ('gallery_dl.extractor.pinterest', 'PinterestPinitExtractor', 'pinterest', 'pinit', '', False, '(?:https?://)?pin\\.it/([^/?#]+)', ('pin.it/',), 'https://pin.it/abcde', 'Extractor for images from a pin.it URL'),
+    ('gallery_dl.extractor.pixeldrain', 'PixeldrainFileExtractor', 'pixeldrain', 'file', '', False, '(?:https?://)?pixeldrain\\.com/(?:u|api/file)/(\\w+)', ('pixeldrain.com/',), 'https://pixeldrain.com/u/abcdefgh', 'Extractor for pixeldrain files'),
+    ('gallery_dl.extractor.pixeldrain', 'PixeldrainAlbumExtractor', 'pixeldrain', 'album', '', False, '(?:https?://)?pixeldrain\\.com/(?:l|api/list)/(\\w+)(?:#item=(\\d+))?', ('pixeldrain.com/',), 'https://pixeldrain.com/l/abcdefgh', 'Extractor for pixeldrain albums'),
+    ('gallery_dl.extractor.pixeldrain', 'PixeldrainFolderExtractor', 'pixeldrain', 'folder', '', False, '(?:https?://)?pixeldrain\\.com/(?:d|api/filesystem)/([^?]+)', ('pixeldrain.com/',), 'https://pixeldrain.com/d/abcdefgh', 'Extractor for pixeldrain filesystem files and directories'),
+    ('gallery_dl.extractor.pixiv', 'PixivUserExtractor', 'pixiv', 'user', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?u(?:sers)?/|member\\.php\\?id=|(?:mypage\\.php)?#id=)(\\d+)(?:$|[?#])', ('ixiv.net/',), 'https://www.pixiv.net/en/users/12345', 'Extractor for a pixiv user profile'),
+    ('gallery_dl.extractor.pixiv', 'PixivArtworksExtractor', 'pixiv', 'artworks', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(?:artworks|illustrations|manga)(?:/([^/?#]+))?/?(?:$|[?#])|member_illust\\.php\\?id=(\\d+)(?:&([^#]+))?)', ('ixiv.net/',), 'https://www.pixiv.net/en/users/12345/artworks', 'Extractor for artworks of a pixiv user'),
+    ('gallery_dl.extractor.pixiv', 'PixivAvatarExtractor', 'pixiv', 'avatar', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/avatar', ('ixiv.net/',), 'https://www.pixiv.net/en/users/12345/avatar', 'Extractor for pixiv avatars'),
+    ('gallery_dl.extractor.pixiv', 'PixivBackgroundExtractor', 'pixiv', 'background', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/background', ('/background',), 'https://www.pixiv.net/en/users/12345/background', 'Extractor for pixiv background banners'),
+    ('gallery_dl.extractor.pixiv', 'PixivMeExtractor', 'pixiv', 'me', '', False, '(?:https?://)?pixiv\\.me/([^/?#]+)', ('pixiv.me/',), 'https://pixiv.me/USER', 'Extractor for pixiv.me URLs'),
+    ('gallery_dl.extractor.pixiv', 'PixivWorkExtractor', 'pixiv', 'work', '', False, '(?:https?://)?(?:(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?artworks/|member_illust\\.php\\?(?:[^&]+&)*illust_id=)(\\d+)|(?:i(?:\\d+\\.pixiv|\\.pximg)\\.net/(?:(?:.*/)?img-[^/]+/img/\\d{4}(?:/\\d\\d){5}|img\\d+/img/[^/]+)|img\\d*\\.pixiv\\.net/img/[^/]+|(?:www\\.)?pixiv\\.net/i)/(\\d+))', ('ixiv.net/', '.pixiv', '.pximg', '.pixiv.net/img/', 'pixiv.net/i'), 'https://www.pixiv.net/artworks/12345', 'Extractor for a single pixiv work/illustration'),
+    ('gallery_dl.extractor.pixiv', 'PixivUnlistedExtractor', 'pixiv', 'unlisted', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?artworks/unlisted/(\\w+)', ('artworks/unlisted/',), 'https://www.pixiv.net/en/artworks/unlisted/a1b2c3d4e5f6g7h8i9j0', 'Extractor for a unlisted pixiv illustrations'),
+    ('gallery_dl.extractor.pixiv', 'PixivFavoriteExtractor', 'pixiv', 'favorite', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?users/(\\d+)/(bookmarks/artworks|following)(?:/([^/?#]+))?|bookmark\\.php)(?:\\?([^#]*))?', ('ixiv.net/',), 'https://www.pixiv.net/en/users/12345/bookmarks/artworks', 'Extractor for all favorites/bookmarks of a pixiv user'),
+    ('gallery_dl.extractor.pixiv', 'PixivRankingExtractor', 'pixiv', 'ranking', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/ranking\\.php(?:\\?([^#]*))?', ('ixiv.net/ranking.php',), 'https://www.pixiv.net/ranking.php', 'Extractor for pixiv ranking pages'),
+    ('gallery_dl.extractor.pixiv', 'PixivSearchExtractor', 'pixiv', 'search', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:(?:en/)?tags/([^/?#]+)(?:/[^/?#]+)?/?|search\\.php)(?:\\?([^#]+))?', ('ixiv.net/',), 'https://www.pixiv.net/en/tags/TAG', 'Extractor for pixiv search results'),
+    ('gallery_dl.extractor.pixiv', 'PixivFollowExtractor', 'pixiv', 'follow', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/bookmark_new_illust\\.php', ('ixiv.net/bookmark_new_illust.php',), 'https://www.pixiv.net/bookmark_new_illust.php', 'Extractor for new illustrations from your followed artists'),
+    ('gallery_dl.extractor.pixiv', 'PixivPixivisionExtractor', 'pixiv', 'pixivision', '', False, '(?:https?://)?(?:www\\.)?pixivision\\.net/(?:en/)?a/(\\d+)', ('pixivision.net/',), 'https://www.pixivision.net/en/a/12345', 'Extractor for illustrations from a pixivision article'),
+    ('gallery_dl.extractor.pixiv', 'PixivSeriesExtractor', 'pixiv', 'series', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/user/(\\d+)/series/(\\d+)', ('ixiv.net/user/',), 'https://www.pixiv.net/user/12345/series/12345', 'Extractor for illustrations from a Pixiv series'),
+    ('gallery_dl.extractor.pixiv', 'PixivSketchExtractor', 'pixiv', 'sketch', '', False, '(?:https?://)?sketch\\.pixiv\\.net/@([^/?#]+)', ('sketch.pixiv.net/@',), 'https://sketch.pixiv.net/@USER', 'Extractor for user pages on sketch.pixiv.net'),
+    ('gallery_dl.extractor.pixiv', 'PixivNovelNovelExtractor', 'pixiv-novel', 'novel', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/n(?:ovel/show\\.php\\?id=|/)(\\d+)', ('ixiv.net/n',), 'https://www.pixiv.net/novel/show.php?id=12345', 'Extractor for pixiv novels'),
+    ('gallery_dl.extractor.pixiv', 'PixivNovelUserExtractor', 'pixiv-novel', 'user', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/novels', ('ixiv.net/',), 'https://www.pixiv.net/en/users/12345/novels', "Extractor for pixiv users' novels"),
+    ('gallery_dl.extractor.pixiv', 'PixivNovelSeriesExtractor', 'pixiv-novel', 'series', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/novel/series/(\\d+)', ('ixiv.net/novel/series/',), 'https://www.pixiv.net/novel/series/12345', 'Extractor for pixiv novel series'),
+    ('gallery_dl.extractor.pixiv', 'PixivNovelBookmarkExtractor', 'pixiv-novel', 'bookmark', '', False, '(?:https?://)?(?:www\\.|touch\\.)?ph?ixiv\\.net/(?:en/)?users/(\\d+)/bookmarks/novels(?:/([^/?#]+))?(?:/?\\?([^#]+))?', ('/bookmarks/novels',), 'https://www.pixiv.net/en/users/12345/bookmarks/novels', 'Extractor for bookmarked pixiv novels'),
+    ('gallery_dl.extractor.pixnet', 'PixnetImageExtractor', 'pixnet', 'image', '', False, '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/photo/(\\d+)', ('net/album/photo/',), 'https://USER.pixnet.net/album/photo/12345', 'Extractor for a single photo from pixnet.net'),
+    ('gallery_dl.extractor.pixnet', 'PixnetSetExtractor', 'pixnet', 'set', '', False, '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/set/(\\d+)', ('net/album/set/',), 'https://USER.pixnet.net/album/set/12345', 'Extractor for images from a pixnet set'),
+    ('gallery_dl.extractor.pixnet', 'PixnetFolderExtractor', 'pixnet', 'folder', '', False, '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net/album/folder/(\\d+)', ('net/album/folder/',), 'https://USER.pixnet.net/album/folder/12345', 'Extractor for all sets in a pixnet folder'),
+    ('gallery_dl.extractor.pixnet', 'PixnetUserExtractor', 'pixnet', 'user', '', False, '(?:https?://)?(?!www\\.)([\\w-]+)\\.pixnet.net()(?:/blog|/album(?:/list)?)?/?(?:$|[?#])', ('.pixnet',), 'https://USER.pixnet.net/', 'Extractor for all sets and folders of a pixnet user'),
+    ('gallery_dl.extractor.plurk', 'PlurkTimelineExtractor', 'plurk', 'timeline', '', False, '(?:https?://)?(?:www\\.)?plurk\\.com/(?!p/)(\\w+)/?(?:$|[?#])', ('plurk.com/',), 'https://www.plurk.com/USER', 'Extractor for URLs from all posts in a Plurk timeline'),
+    ('gallery_dl.extractor.plurk', 'PlurkPostExtractor', 'plurk', 'post', '', False, '(?:https?://)?(?:www\\.)?plurk\\.com/p/(\\w+)', ('plurk.com/p/',), 'https://www.plurk.com/p/12345', 'Extractor for URLs from a Plurk post'),
+    ('gallery_dl.extractor.poipiku', 'PoipikuUserExtractor', 'poipiku', 'user', '', False, '(?:https?://)?poipiku\\.com/(?:IllustListPcV\\.jsp\\?PG=(\\d+)&ID=)?(\\d+)/?(?:$|[?&#])', ('poipiku.com/',), 'https://poipiku.com/12345/', 'Extractor for posts from a poipiku user'),
+    ('gallery_dl.extractor.poipiku', 'PoipikuPostExtractor', 'poipiku', 'post', '', False, '(?:https?://)?poipiku\\.com/(\\d+)/(\\d+)', ('poipiku.com/',), 'https://poipiku.com/12345/12345.html', 'Extractor for a poipiku post'),
+    ('gallery_dl.extractor.poringa', 'PoringaPostExtractor', 'poringa', 'post', '', False, '(?:https?://)?(?:www\\.)?poringa\\.net/posts/imagenes/(\\d+)', ('poringa.net/posts/imagenes/',), 'http://www.poringa.net/posts/imagenes/12345/TITLE.html', 'Extractor for posts on poringa.net'),
+    ('gallery_dl.extractor.poringa', 'PoringaUserExtractor', 'poringa', 'user', '', False, '(?:https?://)?(?:www\\.)?poringa\\.net/(\\w+)$', ('poringa.net/',), 'http://www.poringa.net/USER', None),
+    ('gallery_dl.extractor.poringa', 'PoringaSearchExtractor', 'poringa', 'search', '', False, '(?:https?://)?(?:www\\.)?poringa\\.net/buscar/\\?&?q=([^&#]+)', ('poringa.net/buscar/?',), 'http://www.poringa.net/buscar/?q=QUERY', None),
+    ('gallery_dl.extractor.pornhub', 'PornhubGalleryExtractor', 'pornhub', 'gallery', '', False, '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/album/(\\d+)', ('pornhub.com/album/',), 'https://www.pornhub.com/album/12345', 'Extractor for image galleries on pornhub.com'),
+    ('gallery_dl.extractor.pornhub', 'PornhubGifExtractor', 'pornhub', 'gif', '', False, '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/gif/(\\d+)', ('pornhub.com/gif/',), 'https://www.pornhub.com/gif/12345', 'Extractor for pornhub.com gifs'),
+    ('gallery_dl.extractor.pornhub', 'PornhubUserExtractor', 'pornhub', 'user', '', False, '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/?$', ('pornhub.com/',), 'https://www.pornhub.com/model/USER', 'Extractor for a pornhub user'),
+    ('gallery_dl.extractor.pornhub', 'PornhubPhotosExtractor', 'pornhub', 'photos', '', False, '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(photos(?:/[^/?#]+)?)', ('pornhub.com/',), 'https://www.pornhub.com/model/USER/photos', 'Extractor for all galleries of a pornhub user'),
+    ('gallery_dl.extractor.pornhub', 'PornhubGifsExtractor', 'pornhub', 'gifs', '', False, '(?:https?://)?(?:[\\w-]+\\.)?pornhub\\.com/((?:users|model|pornstar)/[^/?#]+)/(gifs(?:/[^/?#]+)?)', ('pornhub.com/',), 'https://www.pornhub.com/model/USER/gifs', "Extractor for a pornhub user's gifs"),
+    ('gallery_dl.extractor.pornpics', 'PornpicsGalleryExtractor', 'pornpics', 'gallery', '', False, '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/galleries/((?:[^/?#]+-)?(\\d+))', ('pornpics.com',), 'https://www.pornpics.com/galleries/TITLE-12345/', 'Extractor for pornpics galleries'),
+    ('gallery_dl.extractor.pornpics', 'PornpicsTagExtractor', 'pornpics', 'tag', '', False, '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/tags/([^/?#]+)', ('pornpics.com',), 'https://www.pornpics.com/tags/TAGS/', 'Extractor for galleries from pornpics tag searches'),
+    ('gallery_dl.extractor.pornpics', 'PornpicsSearchExtractor', 'pornpics', 'search', '', False, '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(?:\\?q=|pornstars/|channels/)([^/&#]+)', ('pornpics.com',), 'https://www.pornpics.com/?q=QUERY', 'Extractor for galleries from pornpics search results'),
+    ('gallery_dl.extractor.pornpics', 'PornpicsListingExtractor', 'pornpics', 'listing', '', False, '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/(popular|recent|rating|likes|views|comments)/?$', ('pornpics.com',), 'https://www.pornpics.com/popular/', "Extractor for galleries from pornpics listing pages\n\n    These pages (popular, recent, etc.) don't support JSON pagination\n    and use single quotes in HTML, unlike category pages.\n    "),
+    ('gallery_dl.extractor.pornpics', 'PornpicsCategoryExtractor', 'pornpics', 'category', '', False, '(?:https?://)?(?:www\\.)?pornpics\\.com(?:/\\w\\w)?/([^/?#]+)/?$', ('pornpics.com',), 'https://www.pornpics.com/ass/', 'Extractor for galleries from pornpics categories'),
+    ('gallery_dl.extractor.pornstarstube', 'PornstarstubeGalleryExtractor', 'pornstarstube', 'gallery', '', False, '(?:https?://)?(?:www\\.)?pornstars\\.tube/albums/(\\d+)(?:/([\\w-]+))?', ('pornstars.tube/albums/',), 'https://pornstars.tube/albums/12345/SLUG/', 'Extractor for image galleries from pornstars.tube'),
+    ('gallery_dl.extractor.postmill', 'PostmillPostExtractor', '', 'post', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))/f/(\\w+)/(\\d+)', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/f/FORUM/123/TITLE', 'Extractor for a single submission URL'),
+    ('gallery_dl.extractor.postmill', 'PostmillShortURLExtractor', '', 'shorturl', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/\\d+)$', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/123', 'Extractor for short submission URLs'),
+    ('gallery_dl.extractor.postmill', 'PostmillHomeExtractor', '', 'home', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/(?:featured|subscribed|all)?)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/', 'Extractor for the home page'),
+    ('gallery_dl.extractor.postmill', 'PostmillForumExtractor', '', 'forum', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/f/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/f/FORUM', 'Extractor for submissions on a forum'),
+    ('gallery_dl.extractor.postmill', 'PostmillUserSubmissionsExtractor', '', 'usersubmissions', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/user/\\w+/submissions)()(?:\\?([^#]+))?$', ('/submissions',), 'https://raddle.me/user/USER/submissions', 'Extractor for submissions made by a user'),
+    ('gallery_dl.extractor.postmill', 'PostmillTagExtractor', '', 'tag', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/tag/\\w+)(/(?:hot|new|active|top|controversial|most_commented))?(?:\\?([^#]+))?$', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/tag/TAG', 'Extractor for submissions on a forum with a specific tag'),
+    ('gallery_dl.extractor.postmill', 'PostmillSearchExtractor', '', 'search', 'postmill', True, '(?:postmill:(https?://[^/?#]+)|(?:https?://)?(?:(?:raddle\\.me|c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid\\.onion)()))(/search)()\\?(q=[^#]+)$', ('postmill:', 'raddle.me', 'c32zjeghcp5tj3kb72pltz56piei66drc63vkhn5yixiyk4cmerrjtid.onion'), 'https://raddle.me/search?q=QUERY', 'Extractor for search results'),
+    ('gallery_dl.extractor.rawkuma', 'RawkumaChapterExtractor', 'rawkuma', 'chapter', '', False, '(?:https?://)?rawkuma\\.(?:net|com)(/manga/[^/?#]+/chapter-\\d+(?:.\\d+)?\\.(\\d+))', ('/chapter-',), 'https://rawkuma.net/manga/7TITLE/chapter-123.321', 'Extractor for manga chapters from rawkuma.net'),
+    ('gallery_dl.extractor.rawkuma', 'RawkumaMangaExtractor', 'rawkuma', 'manga', '', False, '(?:https?://)?rawkuma\\.(?:net|com)/manga/([^/?#]+)', ('rawkuma.',), 'https://rawkuma.net/manga/TITLE/', 'Extractor for manga from rawkuma.net'),
+    ('gallery_dl.extractor.reactor', 'ReactorTagExtractor', '', 'tag', 'reactor', True, '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/tag/([^/?#]+)(?:/[^/?#]+)?', ('reactor:', 'reactor.cc', 'joyreactor.c', 'pornreactor.cc', 'fapreactor', 'thatpervert.com'), 'http://reactor.cc/tag/TAG', 'Extractor for tag searches on *reactor.cc sites'),
+    ('gallery_dl.extractor.reactor', 'ReactorSearchExtractor', '', 'search', 'reactor', True, '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/search(?:/|\\?q=)([^/?#]+)', ('reactor:', 'reactor.cc', 'joyreactor.c', 'pornreactor.cc', 'fapreactor', 'thatpervert.com'), 'http://reactor.cc/search?q=QUERY', 'Extractor for search results on *reactor.cc sites'),
+    ('gallery_dl.extractor.reactor', 'ReactorUserExtractor', '', 'user', 'reactor', True, '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/user/([^/?#]+)', ('reactor:', 'reactor.cc', 'joyreactor.c', 'pornreactor.cc', 'fapreactor', 'thatpervert.com'), 'http://reactor.cc/user/USER', 'Extractor for all posts of a user on *reactor.cc sites'),
+    ('gallery_dl.extractor.reactor', 'ReactorPostExtractor', '', 'post', 'reactor', True, '(?:reactor:(https?://[^/?#]+)|(?:https?://)?(?:(?:[^/.]+\\.)?reactor\\.cc()|(?:www\\.)?joyreactor\\.c(?:c|om)()|(?:www\\.)?(?:pornreactor\\.cc|fapreactor.com)()|thatpervert\\.com()))/post/(\\d+)', ('reactor:', 'reactor.cc', 'joyreactor.c', 'pornreactor.cc', 'fapreactor', 'thatpervert.com'), 'http://reactor.cc/post/12345', 'Extractor for single posts on *reactor.cc sites'),
+    ('gallery_dl.extractor.readcomiconline', 'ReadcomiconlineIssueExtractor', 'readcomiconline', 'issue', '', False, '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/[^/?#]+\\?)([^#]+)', ('readcomiconline.',), 'https://readcomiconline.li/Comic/TITLE/Issue-123?id=12345', 'Extractor for comic-issues from readcomiconline.li'),
+    ('gallery_dl.extractor.readcomiconline', 'ReadcomiconlineComicExtractor', 'readcomiconline', 'comic', '', False, '(?i)(?:https?://)?(?:www\\.)?readcomiconline\\.(?:li|to)(/Comic/[^/?#]+/?)$', ('readcomiconline.',), 'https://readcomiconline.li/Comic/TITLE', 'Extractor for comics from readcomiconline.li'),
+    ('gallery_dl.extractor.realbooru', 'RealbooruTagExtractor', 'realbooru', 'tag', 'booru', True, '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=list&tags=([^&#]*)', ('realbooru.com/index.php?page=post&s=list&tags=',), 'https://realbooru.com/index.php?page=post&s=list&tags=TAG', None),
+    ('gallery_dl.extractor.realbooru', 'RealbooruFavoriteExtractor', 'realbooru', 'favorite', 'booru', True, '(?:https?://)?realbooru\\.com/index\\.php\\?page=favorites&s=view&id=(\\d+)', ('realbooru.com/index.php?page=favorites&s=view&id=',), 'https://realbooru.com/index.php?page=favorites&s=view&id=12345', None),
+    ('gallery_dl.extractor.realbooru', 'RealbooruPoolExtractor', 'realbooru', 'pool', 'booru', True, '(?:https?://)?realbooru\\.com/index\\.php\\?page=pool&s=show&id=(\\d+)', ('realbooru.com/index.php?page=pool&s=show&id=',), 'https://realbooru.com/index.php?page=pool&s=show&id=12345', None),
+    ('gallery_dl.extractor.realbooru', 'RealbooruPostExtractor', 'realbooru', 'post', 'booru', True, '(?:https?://)?realbooru\\.com/index\\.php\\?page=post&s=view&id=(\\d+)', ('realbooru.com/index.php?page=post&s=view&id=',), 'https://realbooru.com/index.php?page=post&s=view&id=12345', None),
+    ('gallery_dl.extractor.reddit', 'RedditSubredditExtractor', 'reddit', 'subreddit', '', False, '(?:https?://)?(?:\\w+\\.)?reddit\\.com(/r/[^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)', ('reddit.com',), 'https://www.reddit.com/r/SUBREDDIT/', 'Extractor for URLs from subreddits on reddit.com'),
+    ('gallery_dl.extractor.reddit', 'RedditHomeExtractor', 'reddit', 'home', '', False, '(?:https?://)?(?:\\w+\\.)?reddit\\.com((?:/([a-z]+))?)/?(?:\\?([^#]*))?(?:$|#)', ('reddit.com',), 'https://www.reddit.com/', 'Extractor for submissions from your home feed on reddit.com'),
+    ('gallery_dl.extractor.reddit', 'RedditUserExtractor', 'reddit', 'user', '', False, '(?:https?://)?(?:\\w+\\.)?reddit\\.com/u(?:ser)?/([^/?#]+(?:/([a-z]+))?)/?(?:\\?([^#]*))?$', ('reddit.com/u',), 'https://www.reddit.com/user/USER/', 'Extractor for URLs from posts by a reddit user'),
+    ('gallery_dl.extractor.reddit', 'RedditSubmissionExtractor', 'reddit', 'submission', '', False, '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(?:(?:r|u|user)/[^/?#]+/)?comments|gallery)|redd\\.it)/([a-z0-9]+)', ('reddit.com/', 'redd.it'), 'https://www.reddit.com/r/SUBREDDIT/comments/id/', 'Extractor for URLs from a submission on reddit.com'),
+    ('gallery_dl.extractor.reddit', 'RedditImageExtractor', 'reddit', 'image', '', False, '(?:https?://)?((?:i|preview)\\.redd\\.it|i\\.reddituploads\\.com)/([^/?#]+)(\\?[^#]*)?', ('.redd.it', 'i.reddituploads.com'), 'https://i.redd.it/NAME.EXT', 'Extractor for reddit-hosted images'),
+    ('gallery_dl.extractor.reddit', 'RedditRedirectExtractor', 'reddit', 'redirect', '', False, '(?:https?://)?(?:(?:\\w+\\.)?reddit\\.com/(?:(r|u|user)/([^/?#]+)))/s/([a-zA-Z0-9]{10})', ('reddit.com/',), 'https://www.reddit.com/r/SUBREDDIT/s/abc456GHIJ', 'Extractor for personalized share URLs produced by the mobile app'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsUserExtractor', 'redgifs', 'user', '', False, '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/users/([^/?#]+)/?(?:\\?([^#]+))?$', ('redgifs.com/users/',), 'https://www.redgifs.com/users/USER', 'Extractor for redgifs user profiles'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsCollectionExtractor', 'redgifs', 'collection', '', False, '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/([^/?#]+)', ('redgifs.com/users/',), 'https://www.redgifs.com/users/USER/collections/ID', 'Extractor for an individual user collection'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsCollectionsExtractor', 'redgifs', 'collections', '', False, '(?:https?://)?(?:www\\.)?redgifs\\.com/users/([^/?#]+)/collections/?$', ('redgifs.com/users/',), 'https://www.redgifs.com/users/USER/collections', 'Extractor for redgifs user collections'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsNichesExtractor', 'redgifs', 'niches', '', False, '(?:https?://)?(?:www\\.)?redgifs\\.com/niches/([^/?#]+)/?(?:\\?([^#]+))?$', ('redgifs.com/niches/',), 'https://www.redgifs.com/niches/NAME', 'Extractor for redgifs niches'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsSearchExtractor', 'redgifs', 'search', '', False, '(?:https?://)?(?:\\w+\\.)?redgifs\\.com/(?:gifs/([^/?#]+)|search(?:/gifs)?()|browse)(?:/?\\?([^#]+))?', ('redgifs.com/',), 'https://www.redgifs.com/gifs/TAG', 'Extractor for redgifs search results'),
+    ('gallery_dl.extractor.redgifs', 'RedgifsImageExtractor', 'redgifs', 'image', '', False, '(?:https?://)?(?:(?:\\w+\\.)?redgifs\\.com/(?:watch|ifr)|(?:\\w+\\.)?gfycat\\.com(?:/gifs/detail|/\\w+)?|(?:www\\.)?gifdeliverynetwork\\.com|i\\.redgifs\\.com/i)/([A-Za-z0-9]+)', ('redgifs.com/', 'gfycat.com', 'gifdeliverynetwork.com', 'i.redgifs.com/i'), 'https://redgifs.com/watch/ID', 'Extractor for individual gifs from redgifs.com'),
+    ('gallery_dl.extractor.rule34us', 'Rule34usTagExtractor', 'rule34us', 'tag', 'booru', True, '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/index&q=([^&#]*)', ('rule34.us/index.php?r=posts/index&q=',), 'https://rule34.us/index.php?r=posts/index&q=TAG', None),
+    ('gallery_dl.extractor.rule34us', 'Rule34usPostExtractor', 'rule34us', 'post', 'booru', True, '(?:https?://)?rule34\\.us/index\\.php\\?r=posts/view&id=(\\d+)', ('rule34.us/index.php?r=posts/view&id=',), 'https://rule34.us/index.php?r=posts/view&id=12345', None),
+    ('gallery_dl.extractor.rule34vault', 'Rule34vaultPostExtractor', 'rule34vault', 'post', 'booru', True, '(?:https?://)?rule34vault\\.com/post/(\\d+)', ('rule34vault.com/post/',), 'https://rule34vault.com/post/12345', None),
+    ('gallery_dl.extractor.rule34vault', 'Rule34vaultPlaylistExtractor', 'rule34vault', 'playlist', 'booru', True, '(?:https?://)?rule34vault\\.com/playlists/view/(\\d+)', ('rule34vault.com/playlists/view/',), 'https://rule34vault.com/playlists/view/12345', None),
+    ('gallery_dl.extractor.rule34vault', 'Rule34vaultTagExtractor', 'rule34vault', 'tag', 'booru', True, '(?:https?://)?rule34vault\\.com/(?!p(?:ost|laylists)/)([^/?#]+)', ('rule34vault.com/',), 'https://rule34vault.com/TAG', None),
+    ('gallery_dl.extractor.rule34xyz', 'Rule34xyzPostExtractor', 'rule34xyz', 'post', 'booru', True, '(?:https?://)?rule34\\.xyz/post/(\\d+)', ('rule34.xyz/post/',), 'https://rule34.xyz/post/12345', None),
+    ('gallery_dl.extractor.rule34xyz', 'Rule34xyzPlaylistExtractor', 'rule34xyz', 'playlist', 'booru', True, '(?:https?://)?rule34\\.xyz/playlists/view/(\\d+)', ('rule34.xyz/playlists/view/',), 'https://rule34.xyz/playlists/view/12345', None),
+    ('gallery_dl.extractor.rule34xyz', 'Rule34xyzTagExtractor', 'rule34xyz', 'tag', 'booru', True, '(?:https?://)?rule34\\.xyz/([^/?#]+)$', ('rule34.xyz/',), 'https://rule34.xyz/TAG', None),
+    ('gallery_dl.extractor.s3ndpics', 'S3ndpicsPostExtractor', 's3ndpics', 'post', '', False, '(?:https?://)?(?:www\\.)?s3nd\\.pics/post/([0-9a-f]+)', ('s3nd.pics/post/',), 'https://s3nd.pics/post/0123456789abcdef01234567', None),
+    ('gallery_dl.extractor.s3ndpics', 'S3ndpicsUserExtractor', 's3ndpics', 'user', '', False, '(?:https?://)?(?:www\\.)?s3nd\\.pics/user/(\\w+)', ('s3nd.pics/user/',), 'https://s3nd.pics/user/USER', None),
+    ('gallery_dl.extractor.s3ndpics', 'S3ndpicsSearchExtractor', 's3ndpics', 'search', '', False, '(?:https?://)?(?:www\\.)?s3nd\\.pics/search/?\\?([^#]+)', ('s3nd.pics/search',), 'https://s3nd.pics/search?QUERY', None),
+    ('gallery_dl.extractor.saint', 'SaintAlbumExtractor', 'saint', 'album', 'lolisafe', True, '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)/a/([^/?#]+)', ('saint',), 'https://saint2.su/a/ID', 'Extractor for saint albums'),
+    ('gallery_dl.extractor.saint', 'SaintMediaExtractor', 'saint', 'media', 'lolisafe', True, '(?:https?://)?saint\\d*\\.(?:su|pk|cr|to)(/(embe)?d/([^/?#]+))', ('saint',), 'https://saint2.su/embed/ID', 'Extractor for saint media links'),
+    ('gallery_dl.extractor.sankaku', 'SankakuTagExtractor', 'sankaku', 'tag', 'booru', True, '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?(?:/posts)?/?\\?([^#]*)', ('.sankakucomplex.com', 'sankaku.app'), 'https://sankaku.app/?tags=TAG', 'Extractor for images from sankaku.app by search-tags'),
+    ('gallery_dl.extractor.sankaku', 'SankakuPoolExtractor', 'sankaku', 'pool', 'booru', True, '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/(?:books|pools?/show)/(\\w+)', ('.sankakucomplex.com', 'sankaku.app'), 'https://sankaku.app/books/12345', 'Extractor for image pools or books from sankaku.app'),
+    ('gallery_dl.extractor.sankaku', 'SankakuPostExtractor', 'sankaku', 'post', 'booru', True, '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/posts?(?:/show)?/(\\w+)', ('.sankakucomplex.com', 'sankaku.app'), 'https://sankaku.app/post/show/12345', 'Extractor for single posts from sankaku.app'),
+    ('gallery_dl.extractor.sankaku', 'SankakuBooksExtractor', 'sankaku', 'books', 'booru', True, '(?:https?://)?(?:(?:chan|www|beta|black|white)\\.sankakucomplex\\.com|sankaku\\.app)(?:/[a-z]{2}(?:[-_][A-Z]{2})?)?/books/?\\?([^#]*)', ('.sankakucomplex.com', 'sankaku.app'), 'https://sankaku.app/books?tags=TAG', 'Extractor for books by tag search on sankaku.app'),
+    ('gallery_dl.extractor.sankakucomplex', 'SankakucomplexArticleExtractor', 'sankakucomplex', 'article', '', False, '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/(\\d\\d\\d\\d/\\d\\d/\\d\\d/[^/?#]+)', ('.sankakucomplex.com/',), 'https://news.sankakucomplex.com/1970/01/01/TITLE', 'Extractor for articles on news.sankakucomplex.com'),
+    ('gallery_dl.extractor.sankakucomplex', 'SankakucomplexTagExtractor', 'sankakucomplex', 'tag', '', False, '(?:https?://)?(?:news|www)\\.sankakucomplex\\.com/((?:tag|category|author)/[^/?#]+)', ('.sankakucomplex.com/',), 'https://news.sankakucomplex.com/tag/TAG/', 'Extractor for sankakucomplex blog articles by tag or author'),
+    ('gallery_dl.extractor.schalenetwork', 'SchalenetworkGalleryExtractor', 'schalenetwork', 'gallery', '', False, '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:g|reader)/(\\d+)/(\\w+)', ('niyaniya', 'shupogaki', 'koharu', 'anchira', 'seia', 'hoshino.one'), 'https://niyaniya.moe/g/12345/67890abcde/', 'Extractor for schale.network galleries'),
+    ('gallery_dl.extractor.schalenetwork', 'SchalenetworkSearchExtractor', 'schalenetwork', 'search', '', False, '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/(?:tag/([^/?#]+)|browse)?(?:/?\\?([^#]*))?$', ('niyaniya', 'shupogaki', 'koharu', 'anchira', 'seia', 'hoshino.one'), 'https://niyaniya.moe/browse?s=QUERY', 'Extractor for schale.network search results'),
+    ('gallery_dl.extractor.schalenetwork', 'SchalenetworkFavoriteExtractor', 'schalenetwork', 'favorite', '', False, '(?i)(?:https?://)?((?:niyaniya|shupogaki)\\.moe|(?:koharu|anchira|seia)\\.to|(?:hoshino)\\.one)/favorites(?:\\?([^#]*))?', ('/favorites',), 'https://niyaniya.moe/favorites', 'Extractor for schale.network favorites'),
+    ('gallery_dl.extractor.scrolller', 'ScrolllerSubredditExtractor', 'scrolller', 'subreddit', '', False, '(?:https?://)?(?:www\\.)?scrolller\\.com(/r/[^/?#]+)(?:/?\\?([^#]+))?', ('scrolller.com',), 'https://scrolller.com/r/SUBREDDIT', 'Extractor for media from a scrolller subreddit'),
+    ('gallery_dl.extractor.scrolller', 'ScrolllerFollowingExtractor', 'scrolller', 'following', '', False, '(?:https?://)?(?:www\\.)?scrolller\\.com/following', ('scrolller.com/following',), 'https://scrolller.com/following', 'Extractor for followed scrolller subreddits'),
+    ('gallery_dl.extractor.scrolller', 'ScrolllerPostExtractor', 'scrolller', 'post', '', False, '(?:https?://)?(?:www\\.)?scrolller\\.com/(?!r/|following$)([^/?#]+)', ('scrolller.com/',), 'https://scrolller.com/TITLE-SLUG-a1b2c3d4f5', 'Extractor for media from a single scrolller post'),
+    ('gallery_dl.extractor.seiga', 'SeigaUserExtractor', 'seiga', 'user', '', False, '(?:https?://)?(?:www\\.|(?:sp\\.)?seiga\\.)?nicovideo\\.jp/user/illust/(\\d+)(?:\\?(?:[^&]+&)*sort=([^&#]+))?', ('nicovideo.jp/user/illust/',), 'https://seiga.nicovideo.jp/user/illust/12345', 'Extractor for images of a user from seiga.nicovideo.jp'),
+    ('gallery_dl.extractor.seiga', 'SeigaImageExtractor', 'seiga', 'image', '', False, '(?:https?://)?(?:(?:seiga\\.|www\\.)?nicovideo\\.jp/(?:seiga/im|image/source/)|sp\\.seiga\\.nicovideo\\.jp/seiga/#!/im|lohas\\.nicoseiga\\.jp/(?:thumb|(?:priv|o)/[^/]+/\\d+)/)(\\d+)', ('nicovideo.jp/', 'sp.seiga.nicovideo.jp/seiga/#!/im', 'lohas.nicoseiga.jp/'), 'https://seiga.nicovideo.jp/seiga/im12345', 'Extractor for single images from seiga.nicovideo.jp'),
+    ('gallery_dl.extractor.senmanga', 'SenmangaChapterExtractor', 'senmanga', 'chapter', '', False, '(?:https?://)?raw\\.senmanga\\.com(/[^/?#]+/[^/?#]+)', ('raw.senmanga.com',), 'https://raw.senmanga.com/MANGA/CHAPTER', 'Extractor for manga chapters from raw.senmanga.com'),
+    ('gallery_dl.extractor.sexcom', 'SexcomPinExtractor', 'sexcom', 'pin', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/(?:\\w\\w/(?:pic|gif|video)s|pin)/\\d+/?)(?!.*#related$)', ('sex.com',), 'https://www.sex.com/pin/12345-TITLE/', 'Extractor for a pinned image or video on www.sex.com'),
+    ('gallery_dl.extractor.sexcom', 'SexcomRelatedPinExtractor', 'sexcom', 'related-pin', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?(/pin/(\\d+)/?).*#related$', ('#related',), 'https://www.sex.com/pin/12345#related', 'Extractor for related pins on www.sex.com'),
+    ('gallery_dl.extractor.sexcom', 'SexcomPinsExtractor', 'sexcom', 'pins', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/pins/', ('sex.com',), 'https://www.sex.com/user/USER/pins/', "Extractor for a user's pins on www.sex.com"),
+    ('gallery_dl.extractor.sexcom', 'SexcomLikesExtractor', 'sexcom', 'likes', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/likes/', ('sex.com',), 'https://www.sex.com/user/USER/likes/', "Extractor for a user's liked pins on www.sex.com"),
+    ('gallery_dl.extractor.sexcom', 'SexcomBoardExtractor', 'sexcom', 'board', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/user/([^/?#]+)/(?!(?:following|pins|repins|likes)/)([^/?#]+)', ('sex.com',), 'https://www.sex.com/user/USER/BOARD/', 'Extractor for pins from a board on www.sex.com'),
+    ('gallery_dl.extractor.sexcom', 'SexcomFeedExtractor', 'sexcom', 'feed', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/feed', ('sex.com',), 'https://www.sex.com/feed/', "Extractor for pins from your account's main feed on www.sex.com"),
+    ('gallery_dl.extractor.sexcom', 'SexcomSearchExtractor', 'sexcom', 'search', '', False, '(?:https?://)?(?:www\\.)?sex\\.com(?:/[a-z]{2})?/(?:(pic|gif|video)s(?:\\?(search=[^#]+)$|/([^/?#]*))|search/(pic|gif|video)s)/?(?:\\?([^#]+))?', ('sex.com',), 'https://www.sex.com/search/pics?query=QUERY', 'Extractor for search results on www.sex.com'),
+    ('gallery_dl.extractor.shimmie2', 'Shimmie2TagExtractor', '', 'tag', 'shimmie2', True, '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/list/([^/?#]+)(?:/(\\d+))?', ('post/list/',), 'https://vidya.pics/post/list/TAG/1', 'Extractor for shimmie2 posts by tag search'),
+    ('gallery_dl.extractor.shimmie2', 'Shimmie2PostExtractor', '', 'post', 'shimmie2', True, '(?:shimmie2:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.cavemanon\\.xyz()|rule34hentai\\.net()|vidya\\.pics()|noz\\.rip/booru()|co\\.llection\\.pics()|soybooru\\.com()))/(?:index\\.php\\?q=/?)?post/view/(\\d+)', ('post/view/',), 'https://vidya.pics/post/view/12345', 'Extractor for single shimmie2 posts'),
+    ('gallery_dl.extractor.simplyhentai', 'SimplyhentaiGalleryExtractor', 'simplyhentai', 'gallery', '', False, '(?:https?://)?(?!videos\\.)([\\w-]+\\.)?simply-hentai\\.com(?!/(?:album|gifs?|images?|series)(?:/|$))((?:/(?!(?:page|all-pages)(?:/|\\.|$))[^/?#]+)+)', ('simply-hentai.com',), 'https://www.simply-hentai.com/TITLE', 'Extractor for image galleries from simply-hentai.com'),
+    ('gallery_dl.extractor.simplyhentai', 'SimplyhentaiImageExtractor', 'simplyhentai', 'image', '', False, '(?:https?://)?(?:www\\.)?(simply-hentai\\.com/(image|gif)/[^/?#]+)', ('simply-hentai.com/',), 'https://www.simply-hentai.com/image/NAME', 'Extractor for individual images from simply-hentai.com'),
+    ('gallery_dl.extractor.simplyhentai', 'SimplyhentaiVideoExtractor', 'simplyhentai', 'video', '', False, '(?:https?://)?(videos\\.simply-hentai\\.com/[^/?#]+)', ('videos.simply-hentai.com/',), 'https://videos.simply-hentai.com/TITLE', 'Extractor for hentai videos from simply-hentai.com'),
+    ('gallery_dl.extractor.sizebooru', 'SizebooruPostExtractor', 'sizebooru', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?sizebooru\\.com/Details/(\\d+)', ('sizebooru.com/details/',), 'https://sizebooru.com/Details/12345', 'Extractor for sizebooru posts'),
+    ('gallery_dl.extractor.sizebooru', 'SizebooruTagExtractor', 'sizebooru', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?sizebooru\\.com/Search/([^/?#]+)', ('sizebooru.com/search/',), 'https://sizebooru.com/Search/TAG', 'Extractor for sizebooru tag searches'),
+    ('gallery_dl.extractor.sizebooru', 'SizebooruGalleryExtractor', 'sizebooru', 'gallery', 'booru', True, '(?:https?://)?(?:www\\.)?sizebooru\\.com/Galleries/List/(\\d+)', ('sizebooru.com/galleries/list/',), 'https://sizebooru.com/Galleries/List/123', 'Extractor for sizebooru galleries'),
+    ('gallery_dl.extractor.sizebooru', 'SizebooruUserExtractor', 'sizebooru', 'user', 'booru', True, '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Uploads/([^/?#]+)', ('sizebooru.com/profile/uploads/',), 'https://sizebooru.com/Profile/Uploads/USER', "Extractor for a sizebooru user's uploads"),
+    ('gallery_dl.extractor.sizebooru', 'SizebooruFavoriteExtractor', 'sizebooru', 'favorite', 'booru', True, '(?:https?://)?(?:www\\.)?sizebooru\\.com/Profile/Favorites/([^/?#]+)', ('sizebooru.com/profile/favorites/',), 'https://sizebooru.com/Profile/Favorites/USER', "Extractor for a sizebooru user's favorites"),
+    ('gallery_dl.extractor.skeb', 'SkebPostExtractor', 'skeb', 'post', '', False, '(?:https?://)?skeb\\.jp/@([^/?#]+)/works/(\\d+)', ('skeb.jp/@',), 'https://skeb.jp/@USER/works/123', 'Extractor for a single skeb post'),
+    ('gallery_dl.extractor.skeb', 'SkebWorksExtractor', 'skeb', 'works', '', False, '(?:https?://)?skeb\\.jp/@([^/?#]+)/works', ('skeb.jp/@',), 'https://skeb.jp/@USER/works', "Extractor for a skeb user's works"),
+    ('gallery_dl.extractor.skeb', 'SkebSentrequestsExtractor', 'skeb', 'sentrequests', '', False, '(?:https?://)?skeb\\.jp/@([^/?#]+)/sent[ _-]?requests', ('skeb.jp/@',), 'https://skeb.jp/@USER/sentrequests', "Extractor for a skeb user's sent requests"),
+    ('gallery_dl.extractor.skeb', 'SkebUserExtractor', 'skeb', 'user', '', False, '(?:https?://)?skeb\\.jp/@([^/?#]+)/?$', ('skeb.jp/@',), 'https://skeb.jp/@USER', 'Extractor for a skeb user profile'),
+    ('gallery_dl.extractor.skeb', 'SkebSearchExtractor', 'skeb', 'search', '', False, '(?:https?://)?skeb\\.jp/search\\?q=([^&#]+)', ('skeb.jp/search?q=',), 'https://skeb.jp/search?q=QUERY', 'Extractor for skeb search results'),
+    ('gallery_dl.extractor.skeb', 'SkebFollowingExtractor', 'skeb', 'following', '', False, '(?:https?://)?skeb\\.jp/@([^/?#]+)/following_creators', ('/following_creators',), 'https://skeb.jp/@USER/following_creators', 'Extractor for all creators followed by a skeb user'),
+    ('gallery_dl.extractor.skeb', 'SkebFollowingUsersExtractor', 'skeb', 'following-users', '', False, '(?:https?://)?skeb\\.jp/following_users', ('skeb.jp/following_users',), 'https://skeb.jp/following_users', 'Extractor for your followed users'),
+    ('gallery_dl.extractor.slickpic', 'SlickpicAlbumExtractor', 'slickpic', 'album', '', False, '(?:https?://)?([\\w-]+)\\.slickpic\\.com/albums/([^/?#]+)', ('.slickpic.com/albums/',), 'https://USER.slickpic.com/albums/TITLE/', 'Extractor for albums on slickpic.com'),
+    ('gallery_dl.extractor.slickpic', 'SlickpicUserExtractor', 'slickpic', 'user', '', False, '(?:https?://)?([\\w-]+)\\.slickpic\\.com(?:/gallery)?/?(?:$|[?#])', ('.slickpic.com',), 'https://USER.slickpic.com/', None),
+    ('gallery_dl.extractor.slideshare', 'SlidesharePresentationExtractor', 'slideshare', 'presentation', '', False, '(?:https?://)?(?:www\\.)?slideshare\\.net/(?:mobile/)?([^/?#]+)/([^/?#]+)', ('slideshare.net/',), 'https://www.slideshare.net/USER/PRESENTATION', 'Extractor for images from a presentation on slideshare.net'),
+    ('gallery_dl.extractor.smugmug', 'SmugmugAlbumExtractor', 'smugmug', 'album', '', False, 'smugmug:album:([^:]+)$', ('smugmug:album:',), 'smugmug:album:ID', 'Extractor for smugmug albums'),
+    ('gallery_dl.extractor.smugmug', 'SmugmugImageExtractor', 'smugmug', 'image', '', False, '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)(?:/[^/?#]+)+/i-([^/?#-]+)', ('smugmug:', '.smugmug.com'), 'https://USER.smugmug.com/PATH/i-ID', 'Extractor for individual smugmug images'),
+    ('gallery_dl.extractor.smugmug', 'SmugmugPathExtractor', 'smugmug', 'path', '', False, '(?:smugmug:(?!album:)(?:https?://)?([^/]+)|(?:https?://)?([\\w-]+)\\.smugmug\\.com)((?:/[^/?#a-fh-mo-z][^/?#]*)*)/?$', ('smugmug:', '.smugmug.com'), 'https://USER.smugmug.com/PATH', 'Extractor for smugmug albums from URL paths and users'),
+    ('gallery_dl.extractor.soundgasm', 'SoundgasmAudioExtractor', 'soundgasm', 'audio', '', False, '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/([^/?#]+)', ('soundgasm.net/u',), 'https://soundgasm.net/u/USER/TITLE', 'Extractor for audio clips from soundgasm.net'),
+    ('gallery_dl.extractor.soundgasm', 'SoundgasmUserExtractor', 'soundgasm', 'user', '', False, '(?:https?://)?(?:www\\.)?soundgasm\\.net/u(?:ser)?/([^/?#]+)/?$', ('soundgasm.net/u',), 'https://soundgasm.net/u/USER', 'Extractor for all sounds from a soundgasm user'),
+    ('gallery_dl.extractor.speakerdeck', 'SpeakerdeckPresentationExtractor', 'speakerdeck', 'presentation', '', False, '(?:https?://)?(?:www\\.)?speakerdeck\\.com/([^/?#]+)/([^/?#]+)', ('speakerdeck.com/',), 'https://speakerdeck.com/USER/PRESENTATION', 'Extractor for images from a presentation on speakerdeck.com'),
+    ('gallery_dl.extractor.steamgriddb', 'SteamgriddbAssetExtractor', 'steamgriddb', 'asset', '', False, '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(grid|hero|logo|icon)/(\\d+)', ('steamgriddb.com/',), 'https://www.steamgriddb.com/grid/1234', 'Extractor for a single asset'),
+    ('gallery_dl.extractor.steamgriddb', 'SteamgriddbGridsExtractor', 'steamgriddb', 'grids', '', False, '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/grids(?:/(\\d+))?', ('steamgriddb.com/',), 'https://www.steamgriddb.com/game/1234/grids', None),
+    ('gallery_dl.extractor.steamgriddb', 'SteamgriddbHeroesExtractor', 'steamgriddb', 'heroes', '', False, '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/heroes(?:/(\\d+))?', ('steamgriddb.com/',), 'https://www.steamgriddb.com/game/1234/heroes', None),
+    ('gallery_dl.extractor.steamgriddb', 'SteamgriddbLogosExtractor', 'steamgriddb', 'logos', '', False, '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/logos(?:/(\\d+))?', ('steamgriddb.com/',), 'https://www.steamgriddb.com/game/1234/logos', None),
+    ('gallery_dl.extractor.steamgriddb', 'SteamgriddbIconsExtractor', 'steamgriddb', 'icons', '', False, '(?:https?://)?(?:www\\.)?steamgriddb\\.com/(game|collection)/(\\d+)/icons(?:/(\\d+))?', ('steamgriddb.com/',), 'https://www.steamgriddb.com/game/1234/icons', None),
+    ('gallery_dl.extractor.subscribestar', 'SubscribestarUserExtractor', 'subscribestar', 'user', '', False, '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/(?!posts/)([^/?#]+)', ('subscribestar.',), 'https://www.subscribestar.com/USER', 'Extractor for media from a subscribestar user'),
+    ('gallery_dl.extractor.subscribestar', 'SubscribestarPostExtractor', 'subscribestar', 'post', '', False, '(?:https?://)?(?:www\\.)?subscribestar\\.(com|adult)/posts/(\\d+)', ('subscribestar.',), 'https://www.subscribestar.com/posts/12345', 'Extractor for media from a single subscribestar post'),
+    ('gallery_dl.extractor.sxypix', 'SxypixGalleryExtractor', 'sxypix', 'gallery', '', False, '(?:https?://)?(?:www\\.)?sxypix\\.com(/w/(\\w+))', ('sxypix.com',), 'https://sxypix.com/w/2bbaf1b24a5863d0e73436619bbaa7ee', 'Extractor for image galleries from sxypix.com'),
+    ('gallery_dl.extractor.szurubooru', 'SzurubooruTagExtractor', '', 'tag', 'szurubooru', True, '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/posts(?:/query=([^/?#]*))?', ('szurubooru:', 'booru.bcbnsfw.space', 'snootbooru.com', 'visuabusters.com/booru'), 'https://booru.bcbnsfw.space/posts/query=TAG', None),
+    ('gallery_dl.extractor.szurubooru', 'SzurubooruPostExtractor', '', 'post', 'szurubooru', True, '(?:szurubooru:(https?://[^/?#]+)|(?:https?://)?(?:booru\\.bcbnsfw\\.space()|snootbooru\\.com()|(?:www\\.)?visuabusters\\.com/booru()))/post/(\\d+)', ('szurubooru:', 'booru.bcbnsfw.space', 'snootbooru.com', 'visuabusters.com/booru'), 'https://booru.bcbnsfw.space/post/12345', None),
+    ('gallery_dl.extractor.tapas', 'TapasEpisodeExtractor', 'tapas', 'episode', '', False, '(?:https?://)?tapas\\.io/episode/(\\d+)', ('tapas.io/episode/',), 'https://tapas.io/episode/12345', None),
+    ('gallery_dl.extractor.tapas', 'TapasSeriesExtractor', 'tapas', 'series', '', False, '(?:https?://)?tapas\\.io/series/([^/?#]+)', ('tapas.io/series/',), 'https://tapas.io/series/TITLE', None),
+    ('gallery_dl.extractor.tapas', 'TapasCreatorExtractor', 'tapas', 'creator', '', False, '(?:https?://)?tapas\\.io/(?!series|episode)([^/?#]+)', ('tapas.io/',), 'https://tapas.io/CREATOR', None),
+    ('gallery_dl.extractor.tcbscans', 'TcbscansChapterExtractor', 'tcbscans', 'chapter', '', False, '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/chapters/\\d+/[^/?#]+)', ('/chapters/',), 'https://tcbscans.me/chapters/12345/MANGA-chapter-123', None),
+    ('gallery_dl.extractor.tcbscans', 'TcbscansMangaExtractor', 'tcbscans', 'manga', '', False, '(?:https?://)?(?:tcb(?:-backup\\.bihar-mirchi|scans)|onepiecechapters)\\.(?:com|me)(/mangas/\\d+/[^/?#]+)', ('/mangas/',), 'https://tcbscans.me/mangas/123/MANGA', None),
+    ('gallery_dl.extractor.telegraph', 'TelegraphGalleryExtractor', 'telegraph', 'gallery', '', False, '(?:https?://)(?:www\\.)??telegra\\.ph(/[^/?#]+)', ('telegra.ph',), 'https://telegra.ph/TITLE', 'Extractor for articles from telegra.ph'),
+    ('gallery_dl.extractor.tenor', 'TenorImageExtractor', 'tenor', 'image', '', False, '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?view/(?:[^/?#]*-)?(\\d+)', ('tenor.com/',), 'https://tenor.com/view/SLUG-1234567890', None),
+    ('gallery_dl.extractor.tenor', 'TenorSearchExtractor', 'tenor', 'search', '', False, '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?search/([^/?#]+)', ('tenor.com/',), 'https://tenor.com/search/QUERY', None),
+    ('gallery_dl.extractor.tenor', 'TenorUserExtractor', 'tenor', 'user', '', False, '(?:https?://)?tenor\\.com/(?:\\w\\w(?:-\\w\\w)?/)?(?:users|official)/([^/?#]+)', ('tenor.com/',), 'https://tenor.com/users/USER', None),
+    ('gallery_dl.extractor.thehentaiworld', 'ThehentaiworldTagExtractor', 'thehentaiworld', 'tag', '', False, '(?:https?://)?(?:www\\.)?thehentaiworld\\.com/tag/([^/?#]+)', ('thehentaiworld.com/tag/',), 'https://thehentaiworld.com/tag/TAG/', None),
+    ('gallery_dl.extractor.thehentaiworld', 'ThehentaiworldPostExtractor', 'thehentaiworld', 'post', '', False, '(?:https?://)?(?:www\\.)?thehentaiworld\\.com(/(?:video|(?:[\\w-]+-)?hentai-image)s/([^/?#]+))', ('thehentaiworld.com',), 'https://thehentaiworld.com/hentai-images/SLUG/', None),
+    ('gallery_dl.extractor.tiktok', 'TiktokPostExtractor', 'tiktok', 'post', '', False, '(?:https?://)?(?:www\\.)?tiktokv?\\.com/(?:@([\\w_.-]*)|share)/(?:phot|vide)o/(\\d+)', ('tiktok',), 'https://www.tiktok.com/@USER/photo/1234567890', 'Extract a single video or photo TikTok link'),
+    ('gallery_dl.extractor.tiktok', 'TiktokVmpostExtractor', 'tiktok', 'vmpost', '', False, '(?:https?://)?(?:(?:v[mt]\\.)?tiktok\\.com|(?:www\\.)?tiktok\\.com/t)/(?!@)([^/?#]+)', ('tiktok.com', 'tiktok.com/t'), 'https://vm.tiktok.com/1a2B3c4E5', 'Extract a single video or photo TikTok VM link'),
+    ('gallery_dl.extractor.tiktok', 'TiktokUserExtractor', 'tiktok', 'user', '', False, '(?:https?://)?(?:www\\.)?tiktokv?\\.com/@([\\w_.-]+)/?(?:$|\\?|#)', ('tiktok',), 'https://www.tiktok.com/@USER', "Extract a TikTok user's profile"),
+    ('gallery_dl.extractor.tmohentai', 'TmohentaiGalleryExtractor', 'tmohentai', 'gallery', '', False, '(?:https?://)?tmohentai\\.com/(?:contents|reader)/(\\w+)', ('tmohentai.com/',), 'https://tmohentai.com/contents/12345a67b89c0', None),
+    ('gallery_dl.extractor.toyhouse', 'ToyhouseArtExtractor', 'toyhouse', 'art', '', False, '(?:https?://)?(?:www\\.)?toyhou\\.se/([^/?#]+)/art', ('toyhou.se/',), 'https://www.toyhou.se/USER/art', 'Extractor for artworks of a toyhouse user'),
+    ('gallery_dl.extractor.toyhouse', 'ToyhouseImageExtractor', 'toyhouse', 'image', '', False, '(?:https?://)?(?:(?:www\\.)?toyhou\\.se/~images|f\\d+\\.toyhou\\.se/file/[^/?#]+/(?:image|watermark)s)/(\\d+)', ('toyhou.se/~images', '.toyhou.se/file/'), 'https://toyhou.se/~images/12345', 'Extractor for individual toyhouse images'),
+    ('gallery_dl.extractor.tsumino', 'TsuminoGalleryExtractor', 'tsumino', 'gallery', '', False, '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:entry|Book/Info|Read/(?:Index|View))/(\\d+)', ('tsumino.com/',), 'https://www.tsumino.com/entry/12345', 'Extractor for image galleries on tsumino.com'),
+    ('gallery_dl.extractor.tsumino', 'TsuminoSearchExtractor', 'tsumino', 'search', '', False, '(?i)(?:https?://)?(?:www\\.)?tsumino\\.com/(?:Books/?)?#(.+)', ('tsumino.com/',), 'https://www.tsumino.com/Books#QUERY', 'Extractor for search results on tsumino.com'),
+    ('gallery_dl.extractor.tumblr', 'TumblrUserExtractor', 'tumblr', 'user', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/page/\\d+|/archive)?/?$', ('tumblr:', 'tumblr.com/', '.tumblr.com'), 'https://www.tumblr.com/BLOG', "Extractor for a Tumblr user's posts"),
+    ('gallery_dl.extractor.tumblr', 'TumblrPostExtractor', 'tumblr', 'post', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/(?:post/|image/)?(\\d+)', ('tumblr:', 'tumblr.com/', '.tumblr.com'), 'https://www.tumblr.com/BLOG/12345', 'Extractor for a single Tumblr post'),
+    ('gallery_dl.extractor.tumblr', 'TumblrTagExtractor', 'tumblr', 'tag', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))(?:/archive)?/tagged/([^/?#]+)', ('/tagged/',), 'https://www.tumblr.com/BLOG/tagged/TAG', "Extractor for Tumblr user's posts by tag"),
+    ('gallery_dl.extractor.tumblr', 'TumblrDayExtractor', 'tumblr', 'day', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/day/(\\d\\d\\d\\d/\\d\\d/\\d\\d)', ('tumblr:', 'tumblr.com/', '.tumblr.com'), 'https://www.tumblr.com/BLOG/day/1970/01/01', "Extractor for Tumblr user's posts by day"),
+    ('gallery_dl.extractor.tumblr', 'TumblrLikesExtractor', 'tumblr', 'likes', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/likes', ('tumblr:', 'tumblr.com/', '.tumblr.com'), 'https://www.tumblr.com/BLOG/likes', "Extractor for a Tumblr user's liked posts"),
+    ('gallery_dl.extractor.tumblr', 'TumblrFollowingExtractor', 'tumblr', 'following', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/following', ('/following',), 'https://www.tumblr.com/BLOG/following', "Extractor for a Tumblr user's followed blogs"),
+    ('gallery_dl.extractor.tumblr', 'TumblrFollowersExtractor', 'tumblr', 'followers', '', False, '(?:tumblr:(?:https?://)?([^/]+)|(?:https?://)?(?:(?:www\\.)?tumblr\\.com/(?:blog/(?:view/)?)?([\\w-]+)|([\\w-]+\\.tumblr\\.com)))/followers', ('/followers',), 'https://www.tumblr.com/BLOG/followers', "Extractor for a Tumblr user's followers"),
+    ('gallery_dl.extractor.tumblr', 'TumblrSearchExtractor', 'tumblr', 'search', '', False, '(?:https?://)?(?:www\\.)?tumblr\\.com/search/([^/?#]+)(?:/([^/?#]+)(?:/([^/?#]+))?)?(?:/?\\?([^#]+))?', ('tumblr.com/search/',), 'https://www.tumblr.com/search/QUERY', 'Extractor for a Tumblr search'),
+    ('gallery_dl.extractor.tumblrgallery', 'TumblrgalleryTumblrblogExtractor', 'tumblrgallery', 'tumblrblog', '', False, '(?:https?://)?tumblrgallery\\.xyz(/tumblrblog/gallery/(\\d+)\\.html)', ('/tumblrblog/gallery/',), 'https://tumblrgallery.xyz/tumblrblog/gallery/12345.html', 'Extractor for Tumblrblog on tumblrgallery.xyz'),
+    ('gallery_dl.extractor.tumblrgallery', 'TumblrgalleryPostExtractor', 'tumblrgallery', 'post', '', False, '(?:https?://)?tumblrgallery\\.xyz(/post/(\\d+)\\.html)', ('tumblrgallery.xyz',), 'https://tumblrgallery.xyz/post/12345.html', 'Extractor for Posts on tumblrgallery.xyz'),
+    ('gallery_dl.extractor.tumblrgallery', 'TumblrgallerySearchExtractor', 'tumblrgallery', 'search', '', False, '(?:https?://)?tumblrgallery\\.xyz(/s\\.php\\?q=([^&#]+))', ('tumblrgallery.xyz',), 'https://tumblrgallery.xyz/s.php?q=QUERY', 'Extractor for Search result on tumblrgallery.xyz'),
+    ('gallery_dl.extractor.tungsten', 'TungstenPostExtractor', 'tungsten', 'post', '', False, '(?:https?://)?(?:www\\.)?tungsten\\.run/post/(\\w+)', ('tungsten.run/post/',), 'https://tungsten.run/post/AbCdEfGhIjKlMnOp', None),
+    ('gallery_dl.extractor.tungsten', 'TungstenModelExtractor', 'tungsten', 'model', '', False, '(?:https?://)?(?:www\\.)?tungsten\\.run/model/(\\w+)(?:/?\\?model_version=(\\w+))?', ('tungsten.run/model/',), 'https://tungsten.run/model/AbCdEfGhIjKlM', None),
+    ('gallery_dl.extractor.tungsten', 'TungstenUserExtractor', 'tungsten', 'user', '', False, '(?:https?://)?(?:www\\.)?tungsten\\.run/user/([^/?#]+)(?:/posts)?/?(?:\\?([^#]+))?', ('tungsten.run/user/',), 'https://tungsten.run/user/USER', None),
+    ('gallery_dl.extractor.twibooru', 'TwibooruPostExtractor', 'twibooru', 'post', 'philomena', True, '(?:https?://)?(?:www\\.)?twibooru\\.org/(\\d+)', ('twibooru.org/',), 'https://twibooru.org/12345', 'Extractor for single twibooru posts'),
+    ('gallery_dl.extractor.twibooru', 'TwibooruSearchExtractor', 'twibooru', 'search', 'philomena', True, '(?:https?://)?(?:www\\.)?twibooru\\.org/(?:search/?\\?([^#]+)|tags/([^/?#]+))', ('twibooru.org/',), 'https://twibooru.org/search?q=TAG', 'Extractor for twibooru search results'),
+    ('gallery_dl.extractor.twibooru', 'TwibooruGalleryExtractor', 'twibooru', 'gallery', 'philomena', True, '(?:https?://)?(?:www\\.)?twibooru\\.org/galleries/(\\d+)', ('twibooru.org/galleries/',), 'https://twibooru.org/galleries/12345', 'Extractor for twibooru galleries'),
+    ('gallery_dl.extractor.twitter', 'TwitterHomeExtractor', 'twitter', 'home', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:home(?:/fo(?:llowing|r[-_ ]?you()))?|i/timeline)/?$', ('.com/',), 'https://x.com/home', 'Extractor for Twitter home timelines'),
+    ('gallery_dl.extractor.twitter', 'TwitterSearchExtractor', 'twitter', 'search', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/search/?\\?(?:[^&#]+&)*q=([^&#]+)', ('.com/search',), 'https://x.com/search?q=QUERY', 'Extractor for Twitter search results'),
+    ('gallery_dl.extractor.twitter', 'TwitterHashtagExtractor', 'twitter', 'hashtag', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/hashtag/([^/?#]+)', ('.com/hashtag/',), 'https://x.com/hashtag/NAME', 'Extractor for Twitter hashtags'),
+    ('gallery_dl.extractor.twitter', 'TwitterUserExtractor', 'twitter', 'user', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:([^/?#]+)/?(?:$|\\?|#)|i(?:/user/|ntent/user\\?user_id=)(\\d+))', ('.com/',), 'https://x.com/USER', 'Extractor for a Twitter user'),
+    ('gallery_dl.extractor.twitter', 'TwitterTimelineExtractor', 'twitter', 'timeline', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/timeline(?!\\w)', ('/timeline',), 'https://x.com/USER/timeline', 'Extractor for a Twitter user timeline'),
+    ('gallery_dl.extractor.twitter', 'TwitterTweetsExtractor', 'twitter', 'tweets', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/tweets(?!\\w)', ('/tweets',), 'https://x.com/USER/tweets', "Extractor for Tweets from a user's Tweets timeline"),
+    ('gallery_dl.extractor.twitter', 'TwitterRepliesExtractor', 'twitter', 'replies', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/with_replies(?!\\w)', ('/with_replies',), 'https://x.com/USER/with_replies', "Extractor for Tweets from a user's timeline including replies"),
+    ('gallery_dl.extractor.twitter', 'TwitterHighlightsExtractor', 'twitter', 'highlights', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/highlights(?!\\w)', ('/highlights',), 'https://x.com/USER/highlights', "Extractor for Tweets from a user's highlights timeline"),
+    ('gallery_dl.extractor.twitter', 'TwitterMediaExtractor', 'twitter', 'media', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/media(?!\\w)', ('/media',), 'https://x.com/USER/media', "Extractor for Tweets from a user's Media timeline"),
+    ('gallery_dl.extractor.twitter', 'TwitterLikesExtractor', 'twitter', 'likes', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/likes(?!\\w)', ('/likes',), 'https://x.com/USER/likes', 'Extractor for liked tweets'),
+    ('gallery_dl.extractor.twitter', 'TwitterBookmarkExtractor', 'twitter', 'bookmark', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/bookmarks()', ('.com/i/bookmarks',), 'https://x.com/i/bookmarks', 'Extractor for bookmarked tweets'),
+    ('gallery_dl.extractor.twitter', 'TwitterListExtractor', 'twitter', 'list', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/?$', ('.com/i/lists/',), 'https://x.com/i/lists/12345', 'Extractor for Twitter lists'),
+    ('gallery_dl.extractor.twitter', 'TwitterListMembersExtractor', 'twitter', 'list-members', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/lists/(\\d+)/members', ('.com/i/lists/',), 'https://x.com/i/lists/12345/members', 'Extractor for members of a Twitter list'),
+    ('gallery_dl.extractor.twitter', 'TwitterFollowingExtractor', 'twitter', 'following', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/following(?!\\w)', ('/following',), 'https://x.com/USER/following', 'Extractor for followed users'),
+    ('gallery_dl.extractor.twitter', 'TwitterFollowersExtractor', 'twitter', 'followers', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/followers(?!\\w)', ('/followers',), 'https://x.com/USER/followers', "Extractor for a user's followers"),
+    ('gallery_dl.extractor.twitter', 'TwitterCommunityExtractor', 'twitter', 'community', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/communities/(\\d+)', ('.com/i/communities/',), 'https://x.com/i/communities/12345', 'Extractor for a Twitter community'),
+    ('gallery_dl.extractor.twitter', 'TwitterCommunitiesExtractor', 'twitter', 'communities', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/communities/?$', ('/communities',), 'https://x.com/i/communities', 'Extractor for followed Twitter communities'),
+    ('gallery_dl.extractor.twitter', 'TwitterEventExtractor', 'twitter', 'event', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/i/events/(\\d+)', ('.com/i/events/',), 'https://x.com/i/events/12345', 'Extractor for Tweets from a Twitter Event'),
+    ('gallery_dl.extractor.twitter', 'TwitterTweetExtractor', 'twitter', 'tweet', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+|i/web)/status/(\\d+)/?(?:$|\\?|#|photo/|video/)', ('/status/',), 'https://x.com/USER/status/12345', 'Extractor for individual tweets'),
+    ('gallery_dl.extractor.twitter', 'TwitterQuotesExtractor', 'twitter', 'quotes', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/(?:[^/?#]+|i/web)/status/(\\d+)/quotes', ('/status/',), 'https://x.com/USER/status/12345/quotes', 'Extractor for quotes of a Tweet'),
+    ('gallery_dl.extractor.twitter', 'TwitterInfoExtractor', 'twitter', 'info', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/info', ('.com/',), 'https://x.com/USER/info', "Extractor for a user's profile data"),
+    ('gallery_dl.extractor.twitter', 'TwitterAvatarExtractor', 'twitter', 'avatar', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/photo', ('/photo',), 'https://x.com/USER/photo', None),
+    ('gallery_dl.extractor.twitter', 'TwitterBackgroundExtractor', 'twitter', 'background', '', False, '(?:https?://)?(?:www\\.|mobile\\.)?(?:(?:[fv]x)?twitter|(?:fix(?:up|v))?x)\\.com/([^/?#]+)/header_photo', ('/header_photo',), 'https://x.com/USER/header_photo', None),
+    ('gallery_dl.extractor.twitter', 'TwitterImageExtractor', 'twitter', 'image', '', False, 'https?://pbs\\.twimg\\.com/media/([\\w-]+)(?:\\?format=|\\.)(\\w+)', ('://pbs.twimg.com/media/',), 'https://pbs.twimg.com/media/ABCDE?format=jpg&name=orig', None),
+    ('gallery_dl.extractor.urlgalleries', 'UrlgalleriesGalleryExtractor', 'urlgalleries', 'gallery', '', False, '(?:https?://)()(?:(\\w+)\\.)?urlgalleries\\.net/(?:b/([^/?#]+)/)?(?:[\\w-]+-)?(\\d+)', ('urlgalleries.net/',), 'https://urlgalleries.net/b/BLOG/gallery-12345/TITLE', 'Base class for Urlgalleries extractors'),
+    ('gallery_dl.extractor.unsplash', 'UnsplashImageExtractor', 'unsplash', 'image', '', False, '(?:https?://)?unsplash\\.com/photos/([^/?#]+)', ('unsplash.com/photos/',), 'https://unsplash.com/photos/ID', 'Extractor for a single unsplash photo'),
+    ('gallery_dl.extractor.unsplash', 'UnsplashUserExtractor', 'unsplash', 'user', '', False, '(?:https?://)?unsplash\\.com/@(\\w+)/?$', ('unsplash.com/@',), 'https://unsplash.com/@USER', 'Extractor for all photos of an unsplash user'),
+    ('gallery_dl.extractor.unsplash', 'UnsplashFavoriteExtractor', 'unsplash', 'favorite', '', False, '(?:https?://)?unsplash\\.com/@(\\w+)/likes', ('unsplash.com/@',), 'https://unsplash.com/@USER/likes', 'Extractor for all likes of an unsplash user'),
+    ('gallery_dl.extractor.unsplash', 'UnsplashCollectionExtractor', 'unsplash', 'collection', '', False, '(?:https?://)?unsplash\\.com/collections/([^/?#]+)(?:/([^/?#]+))?', ('unsplash.com/collections/',), 'https://unsplash.com/collections/12345/TITLE', 'Extractor for an unsplash collection'),
+    ('gallery_dl.extractor.unsplash', 'UnsplashSearchExtractor', 'unsplash', 'search', '', False, '(?:https?://)?unsplash\\.com/s/photos/([^/?#]+)(?:\\?([^#]+))?', ('unsplash.com/s/photos/',), 'https://unsplash.com/s/photos/QUERY', 'Extractor for unsplash search results'),
+    ('gallery_dl.extractor.uploadir', 'UploadirFileExtractor', 'uploadir', 'file', '', False, '(?:https?://)?uploadir\\.com/(?:user/)?u(?:ploads)?/([^/?#]+)', ('uploadir.com/',), 'https://uploadir.com/u/ID', 'Extractor for uploadir files'),
+    ('gallery_dl.extractor.urlshortener', 'UrlshortenerLinkExtractor', '', 'link', 'urlshortener', True, '(?:urlshortener:(https?://[^/?#]+)|(?:https?://)?(?:bit\\.ly()|t\\.co()))(/[^/?#]+)', ('urlshortener:', 'bit.ly', 't.co'), 'https://bit.ly/abcde', 'Extractor for general-purpose URL shorteners'),
+    ('gallery_dl.extractor.vanillarock', 'VanillarockPostExtractor', 'vanillarock', 'post', '', False, '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?!category/|tag/)[^/?#]+)/?$', ('vanilla-rock.com',), 'https://vanilla-rock.com/TITLE', 'Extractor for blogposts on vanilla-rock.com'),
+    ('gallery_dl.extractor.vanillarock', 'VanillarockTagExtractor', 'vanillarock', 'tag', '', False, '(?:https?://)?(?:www\\.)?vanilla-rock\\.com(/(?:tag|category)/[^?#]+)', ('vanilla-rock.com',), 'https://vanilla-rock.com/tag/TAG', 'Extractor for vanillarock blog posts by tag or category'),
+    ('gallery_dl.extractor.vichan', 'VichanThreadExtractor', '', 'thread', 'vichan', True, '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)/res/(\\d+)', ('vichan:', '8kun.top', 'smuglo', 'boards.guro.cx'), 'https://8kun.top/a/res/12345.html', 'Extractor for vichan threads'),
+    ('gallery_dl.extractor.vichan', 'VichanBoardExtractor', '', 'board', 'vichan', True, '(?:vichan:(https?://[^/?#]+)|(?:https?://)?(?:8kun\\.top()|smuglo(?:\\.li|li\\.net)()|boards\\.guro\\.cx()))/([^/?#]+)(?:/index|/catalog|/\\d+|/?$)', ('vichan:', '8kun.top', 'smuglo', 'boards.guro.cx'), 'https://8kun.top/a/', 'Extractor for vichan boards'),
+    ('gallery_dl.extractor.vipergirls', 'VipergirlsThreadExtractor', 'vipergirls', 'thread', '', False, '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?(/page\\d+)?(?:$|#|\\?(?!p=))', ('vipergirls.to/threads/',), 'https://vipergirls.to/threads/12345-TITLE', 'Extractor for vipergirls threads'),
+    ('gallery_dl.extractor.vipergirls', 'VipergirlsPostExtractor', 'vipergirls', 'post', '', False, '(?:https?://)?(?:www\\.)?vipergirls\\.to/threads/(\\d+)(?:-[^/?#]+)?\\?p=\\d+[^#]*#post(\\d+)', ('vipergirls.to/threads/',), 'https://vipergirls.to/threads/12345-TITLE?p=23456#post23456', 'Extractor for vipergirls posts'),
+    ('gallery_dl.extractor.vk', 'VkPhotosExtractor', 'vk', 'photos', '', False, '(?:https://)?(?:www\\.|m\\.)?vk\\.com/(?:(?:albums|photos|id)(-?\\d+)|(?!(?:album|tag|wall)-?\\d+_?)([^/?#]+))', ('vk.com/',), 'https://vk.com/id12345', 'Extractor for photos from a vk user'),
+    ('gallery_dl.extractor.vk', 'VkAlbumExtractor', 'vk', 'album', '', False, '(?:https://)?(?:www\\.|m\\.)?vk\\.com/album(-?\\d+)_(\\d+)$', ('vk.com/album',), 'https://vk.com/album12345_00', 'Extractor for a vk album'),
+    ('gallery_dl.extractor.vk', 'VkTaggedExtractor', 'vk', 'tagged', '', False, '(?:https://)?(?:www\\.|m\\.)?vk\\.com/tag(-?\\d+)$', ('vk.com/tag',), 'https://vk.com/tag12345', 'Extractor for a vk tagged photos'),
+    ('gallery_dl.extractor.vk', 'VkWallPostExtractor', 'vk', 'wall-post', '', False, '(?:https://)?(?:www\\.|m\\.)?vk\\.com/wall(-?\\d+)_(\\d+)', ('vk.com/wall',), 'https://vk.com/wall12345_123', 'Extractor for a vk wall post'),
+    ('gallery_dl.extractor.vsco', 'VscoUserExtractor', 'vsco', 'user', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/?$', ('vsco.co/',), 'https://vsco.co/USER', 'Extractor for a vsco user profile'),
+    ('gallery_dl.extractor.vsco', 'VscoGalleryExtractor', 'vsco', 'gallery', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/(?:gallery|images)', ('vsco.co/',), 'https://vsco.co/USER/gallery', "Extractor for a vsco user's gallery"),
+    ('gallery_dl.extractor.vsco', 'VscoCollectionExtractor', 'vsco', 'collection', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/collection', ('/collection',), 'https://vsco.co/USER/collection/1', 'Extractor for images from a collection on vsco.co'),
+    ('gallery_dl.extractor.vsco', 'VscoSpaceExtractor', 'vsco', 'space', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/spaces/([^/?#]+)', ('vsco.co/spaces/',), 'https://vsco.co/spaces/a1b2c3d4e5f', 'Extractor for a vsco.co space'),
+    ('gallery_dl.extractor.vsco', 'VscoSpacesExtractor', 'vsco', 'spaces', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/spaces', ('vsco.co/',), 'https://vsco.co/USER/spaces', "Extractor for a vsco.co user's spaces"),
+    ('gallery_dl.extractor.vsco', 'VscoAvatarExtractor', 'vsco', 'avatar', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/avatar', ('vsco.co/',), 'https://vsco.co/USER/avatar', 'Extractor for vsco.co user avatars'),
+    ('gallery_dl.extractor.vsco', 'VscoImageExtractor', 'vsco', 'image', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/media/([0-9a-fA-F]+)', ('vsco.co/',), 'https://vsco.co/USER/media/0123456789abcdef', 'Extractor for individual images on vsco.co'),
+    ('gallery_dl.extractor.vsco', 'VscoVideoExtractor', 'vsco', 'video', '', False, '(?:https?://)?(?:www\\.)?vsco\\.co/([^/?#]+)/video/([^/?#]+)', ('vsco.co/',), 'https://vsco.co/USER/video/012345678-9abc-def0', 'Extractor for vsco.co videos links'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenSearchExtractor', 'wallhaven', 'search', '', False, '(?:https?://)?wallhaven\\.cc/search(?:/?\\?([^#]+))?', ('wallhaven.cc/search',), 'https://wallhaven.cc/search?q=QUERY', 'Extractor for search results on wallhaven.cc'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenCollectionExtractor', 'wallhaven', 'collection', '', False, '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/(\\d+)', ('wallhaven.cc/user/',), 'https://wallhaven.cc/user/USER/favorites/12345', 'Extractor for a collection on wallhaven.cc'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenUserExtractor', 'wallhaven', 'user', '', False, '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/?$', ('wallhaven.cc/user/',), 'https://wallhaven.cc/user/USER', 'Extractor for a wallhaven user'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenCollectionsExtractor', 'wallhaven', 'collections', '', False, '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/favorites/?$', ('wallhaven.cc/user/',), 'https://wallhaven.cc/user/USER/favorites', 'Extractor for all collections of a wallhaven user'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenUploadsExtractor', 'wallhaven', 'uploads', '', False, '(?:https?://)?wallhaven\\.cc/user/([^/?#]+)/uploads', ('wallhaven.cc/user/',), 'https://wallhaven.cc/user/USER/uploads', 'Extractor for all uploads of a wallhaven user'),
+    ('gallery_dl.extractor.wallhaven', 'WallhavenImageExtractor', 'wallhaven', 'image', '', False, '(?:https?://)?(?:wallhaven\\.cc/w/|whvn\\.cc/|w\\.wallhaven\\.cc/[a-z]+/\\w\\w/wallhaven-)(\\w+)', ('allhaven.cc/w/', 'hvn.cc/', '.wallhaven.cc/'), 'https://wallhaven.cc/w/ID', 'Extractor for individual wallpaper on wallhaven.cc'),
+    ('gallery_dl.extractor.wallpapercave', 'WallpapercaveImageExtractor', 'wallpapercave', 'image', '', False, '(?:https?://)?(?:www\\.)?wallpapercave\\.com/', ('wallpapercave.com/',), 'https://wallpapercave.com/w/wp12345', 'Extractor for images on wallpapercave.com'),
+    ('gallery_dl.extractor.warosu', 'WarosuThreadExtractor', 'warosu', 'thread', '', False, '(?:https?://)?(?:www\\.)?warosu\\.org/([^/]+)/thread/(\\d+)', ('warosu.org/',), 'https://warosu.org/a/thread/12345', 'Extractor for threads on warosu.org'),
+    ('gallery_dl.extractor.weasyl', 'WeasylSubmissionExtractor', 'weasyl', 'submission', '', False, '(?:https://)?(?:www\\.)?weasyl.com/(?:~[\\w~-]+/submissions|submission|view)/(\\d+)', ('weasyl',), 'https://www.weasyl.com/~USER/submissions/12345/TITLE', None),
+    ('gallery_dl.extractor.weasyl', 'WeasylSubmissionsExtractor', 'weasyl', 'submissions', '', False, '(?:https://)?(?:www\\.)?weasyl.com/(?:~|submissions/)([\\w~-]+)/?$', ('weasyl',), 'https://www.weasyl.com/submissions/USER', None),
+    ('gallery_dl.extractor.weasyl', 'WeasylFolderExtractor', 'weasyl', 'folder', '', False, '(?:https://)?(?:www\\.)?weasyl.com/submissions/([\\w~-]+)\\?folderid=(\\d+)', ('com/submissions/',), 'https://www.weasyl.com/submissions/USER?folderid=12345', None),
+    ('gallery_dl.extractor.weasyl', 'WeasylJournalExtractor', 'weasyl', 'journal', '', False, '(?:https://)?(?:www\\.)?weasyl.com/journal/(\\d+)', ('com/journal/',), 'https://www.weasyl.com/journal/12345', None),
+    ('gallery_dl.extractor.weasyl', 'WeasylJournalsExtractor', 'weasyl', 'journals', '', False, '(?:https://)?(?:www\\.)?weasyl.com/journals/([\\w~-]+)', ('com/journals/',), 'https://www.weasyl.com/journals/USER', None),
+    ('gallery_dl.extractor.weasyl', 'WeasylFavoriteExtractor', 'weasyl', 'favorite', '', False, '(?:https://)?(?:www\\.)?weasyl.com/favorites(?:\\?userid=(\\d+)|/([^/?#]+))', ('com/favorites',), 'https://www.weasyl.com/favorites?userid=12345', None),
+    ('gallery_dl.extractor.webmshare', 'WebmshareVideoExtractor', 'webmshare', 'video', '', False, '(?:https?://)?(?:s\\d+\\.)?webmshare\\.com/(?:play/|download-webm/)?(\\w{3,})', ('webmshare.com/',), 'https://webmshare.com/_ID_', 'Extractor for webmshare videos'),
+    ('gallery_dl.extractor.webtoons', 'WebtoonsEpisodeExtractor', 'webtoons', 'episode', '', False, '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+)/[^/?#]+)/viewer\\?([^#\'\\"]+)', ('webtoons.com/',), 'https://www.webtoons.com/en/GENRE/TITLE/NAME/viewer?title_no=123&episode_no=12345', 'Extractor for an episode on webtoons.com'),
+    ('gallery_dl.extractor.webtoons', 'WebtoonsComicExtractor', 'webtoons', 'comic', '', False, '(?:https?://)?(?:www\\.)?webtoons\\.com/(([^/?#]+)/([^/?#]+)/([^/?#]+))/list\\?([^#]+)', ('webtoons.com/',), 'https://www.webtoons.com/en/GENRE/TITLE/list?title_no=123', 'Extractor for an entire comic on webtoons.com'),
+    ('gallery_dl.extractor.webtoons', 'WebtoonsArtistExtractor', 'webtoons', 'artist', '', False, '(?:https?://)?(?:www\\.)?webtoons\\.com/p/community/([^/?#]+)/u/([^/?#]+)', ('webtoons.com/p/community/',), 'https://www.webtoons.com/p/community/LANG/u/ARTIST', 'Extractor for webtoons.com artists'),
+    ('gallery_dl.extractor.weebcentral', 'WeebcentralChapterExtractor', 'weebcentral', 'chapter', '', False, '(?:https?://)?(?:www\\.)?weebcentral\\.com(/chapters/(\\w+))', ('weebcentral.com',), 'https://weebcentral.com/chapters/01JHABCDEFGHIJKLMNOPQRSTUV', 'Extractor for manga chapters from weebcentral.com'),
+    ('gallery_dl.extractor.weebcentral', 'WeebcentralMangaExtractor', 'weebcentral', 'manga', '', False, '(?:https?://)?(?:www\\.)?weebcentral\\.com/series/(\\w+)', ('weebcentral.com/series/',), 'https://weebcentral.com/series/01J7ABCDEFGHIJKLMNOPQRSTUV/TITLE', 'Extractor for manga from weebcentral.com'),
+    ('gallery_dl.extractor.weibo', 'WeiboUserExtractor', 'weibo', 'user', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?(?:$|#)', ('weibo.c',), 'https://weibo.com/USER', 'Extractor for weibo user profiles'),
+    ('gallery_dl.extractor.weibo', 'WeiboHomeExtractor', 'weibo', 'home', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=home', ('?tabtype=home',), 'https://weibo.com/USER?tabtype=home', "Extractor for weibo 'home' listings"),
+    ('gallery_dl.extractor.weibo', 'WeiboFeedExtractor', 'weibo', 'feed', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=feed', ('?tabtype=feed',), 'https://weibo.com/USER?tabtype=feed', 'Extractor for weibo user feeds'),
+    ('gallery_dl.extractor.weibo', 'WeiboVideosExtractor', 'weibo', 'videos', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=video', ('?tabtype=video',), 'https://weibo.com/USER?tabtype=video', "Extractor for weibo 'video' listings"),
+    ('gallery_dl.extractor.weibo', 'WeiboNewvideoExtractor', 'weibo', 'newvideo', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=newVideo', ('?tabtype=newvideo',), 'https://weibo.com/USER?tabtype=newVideo', "Extractor for weibo 'newVideo' listings"),
+    ('gallery_dl.extractor.weibo', 'WeiboArticleExtractor', 'weibo', 'article', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=article', ('?tabtype=article',), 'https://weibo.com/USER?tabtype=article', "Extractor for weibo 'article' listings"),
+    ('gallery_dl.extractor.weibo', 'WeiboAlbumExtractor', 'weibo', 'album', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(?:(u|n|p(?:rofile)?)/)?([^/?#]+)(?:/home)?\\?tabtype=album', ('?tabtype=album',), 'https://weibo.com/USER?tabtype=album', "Extractor for weibo 'album' listings"),
+    ('gallery_dl.extractor.weibo', 'WeiboStatusExtractor', 'weibo', 'status', '', False, '(?:https?://)?(?:www\\.|m\\.)?weibo\\.c(?:om|n)/(detail|status|\\d+)/(\\w+)', ('weibo.c',), 'https://weibo.com/detail/12345', 'Extractor for a weibo status'),
+    ('gallery_dl.extractor.wikiart', 'WikiartArtistExtractor', 'wikiart', 'artist', '', False, '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!\\w+-by-)([\\w-]+)/?$', ('wikiart.org/',), 'https://www.wikiart.org/en/ARTIST', "Extractor for an artist's paintings on wikiart.org"),
+    ('gallery_dl.extractor.wikiart', 'WikiartImageExtractor', 'wikiart', 'image', '', False, '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/(?!(?:paintings|artists)-by-)([\\w-]+)/([\\w-]+)', ('wikiart.org/',), 'https://www.wikiart.org/en/ARTIST/TITLE', 'Extractor for individual paintings on wikiart.org'),
+    ('gallery_dl.extractor.wikiart', 'WikiartArtworksExtractor', 'wikiart', 'artworks', '', False, '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/paintings-by-([\\w-]+)/([\\w-]+)', ('/paintings-by-',), 'https://www.wikiart.org/en/paintings-by-GROUP/TYPE', 'Extractor for artwork collections on wikiart.org'),
+    ('gallery_dl.extractor.wikiart', 'WikiartArtistsExtractor', 'wikiart', 'artists', '', False, '(?:https?://)?(?:www\\.)?wikiart\\.org/([a-z]+)/artists-by-([\\w-]+)/([\\w-]+)', ('wikiart.org/',), 'https://www.wikiart.org/en/artists-by-GROUP/TYPE', 'Extractor for artist collections on wikiart.org'),
+    ('gallery_dl.extractor.wikifeet', 'WikifeetGalleryExtractor', 'wikifeet', 'gallery', '', False, '(?:https?://)(?:(?:www\\.)?wikifeetx?|men\\.wikifeet)\\.com/([^/?#]+)', ('wikifeet', 'men.wikifeet'), 'https://www.wikifeet.com/CELEB', 'Extractor for image galleries from wikifeet.com'),
+    ('gallery_dl.extractor.wikimedia', 'WikimediaArticleExtractor', '', 'article', 'wikimedia', True, '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/(?!static/)([^?#]+)', ('wikimedia:', '.wik', 'species.wikimedia.org', 'commons.wikimedia.org', 'mediawiki.org', '.fandom.com', '.wiki.gg', 'mariowiki.com', '.bulbagarden.net', 'pidgi.net', 'azurlane.koumakan.jp'), 'https://en.wikipedia.org/wiki/TITLE', 'Extractor for wikimedia articles'),
+    ('gallery_dl.extractor.wikimedia', 'WikimediaWikiExtractor', '', 'wiki', 'wikimedia', True, '(?:wikimedia:(https?://[^/?#]+)|(?:https?://)?(?:[a-z]{2,}\\.wik(?:i(?:pedia|quote|books|source|news|versity|data|voyage)|tionary)\\.org()|species\\.wikimedia\\.org()|commons\\.wikimedia\\.org()|(?:www\\.)?mediawiki\\.org()|[\\w-]+\\.fandom\\.com()|\\w+\\.wiki\\.gg()|(?:www\\.)?mariowiki\\.com()|(?:bulbapedia|archives)\\.bulbagarden\\.net()|(?:www\\.)?pidgi\\.net()|azurlane\\.koumakan\\.jp()))/?$', ('wikimedia:', '.wik', 'species.wikimedia.org', 'commons.wikimedia.org', 'mediawiki.org', '.fandom.com', '.wiki.gg', 'mariowiki.com', '.bulbagarden.net', 'pidgi.net', 'azurlane.koumakan.jp'), 'https://en.wikipedia.org/', 'Extractor for all files on a MediaWiki instance'),
+    ('gallery_dl.extractor.xasiat', 'XasiatAlbumExtractor', 'xasiat', 'album', '', False, '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/(\\d+)/[^/?#]+)', ('xasiat.com',), 'https://www.xasiat.com/albums/12345/TITLE/', None),
+    ('gallery_dl.extractor.xasiat', 'XasiatTagExtractor', 'xasiat', 'tag', '', False, '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/tags/[^/?#]+)', ('/albums/tags/',), 'https://www.xasiat.com/albums/tags/TAG/', None),
+    ('gallery_dl.extractor.xasiat', 'XasiatCategoryExtractor', 'xasiat', 'category', '', False, '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/categories/[^/?#]+)', ('/albums/categories/',), 'https://www.xasiat.com/albums/categories/CATEGORY/', None),
+    ('gallery_dl.extractor.xasiat', 'XasiatModelExtractor', 'xasiat', 'model', '', False, '(?:https?://)?(?:www\\.)?xasiat\\.com((?:/fr|/ja)?/albums/models/[^/?#]+)', ('/albums/models/',), 'https://www.xasiat.com/albums/models/MODEL/', None),
+    ('gallery_dl.extractor.xenforo', 'XenforoPostExtractor', '', 'post', 'xenforo', True, '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()))/(?:threads/[^/?#]+/post-|posts/)(\\d+)', ('xenforo:', 'simpcity.', 'nudostar.com/forum'), 'https://simpcity.cr/threads/TITLE.12345/post-54321', None),
+    ('gallery_dl.extractor.xenforo', 'XenforoThreadExtractor', '', 'thread', 'xenforo', True, '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()))(/threads/(?:[^/?#]+\\.)?\\d+)(?:/page-(\\d+))?', ('/threads/',), 'https://simpcity.cr/threads/TITLE.12345/', None),
+    ('gallery_dl.extractor.xenforo', 'XenforoForumExtractor', '', 'forum', 'xenforo', True, '(?:xenforo:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?simpcity\\.(?:cr|su)()|(?:www\\.)?nudostar\\.com/forum()))(/forums/(?:[^/?#]+\\.)?[^/?#]+)(?:/page-(\\d+))?', ('xenforo:', 'simpcity.', 'nudostar.com/forum'), 'https://simpcity.cr/forums/TITLE.123/', None),
+    ('gallery_dl.extractor.xfolio', 'XfolioWorkExtractor', 'xfolio', 'work', '', False, '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/works/(\\d+)', ('/portfolio/',), 'https://xfolio.jp/portfolio/USER/works/12345', None),
+    ('gallery_dl.extractor.xfolio', 'XfolioUserExtractor', 'xfolio', 'user', '', False, '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)(?:/works)?/?(?:$|\\?|#)', ('/portfolio/',), 'https://xfolio.jp/portfolio/USER', None),
+    ('gallery_dl.extractor.xfolio', 'XfolioSeriesExtractor', 'xfolio', 'series', '', False, '(?:https?://)?xfolio\\.jp(?:/[^/?#]+)?/portfolio/([^/?#]+)/series/(\\d+)', ('/portfolio/',), 'https://xfolio.jp/portfolio/USER/series/12345', None),
+    ('gallery_dl.extractor.xhamster', 'XhamsterGalleryExtractor', 'xhamster', 'gallery', '', False, '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))(/photos/gallery/[^/?#]+)', ('/photos/gallery/',), 'https://xhamster.com/photos/gallery/12345', 'Extractor for image galleries on xhamster.com'),
+    ('gallery_dl.extractor.xhamster', 'XhamsterUserExtractor', 'xhamster', 'user', '', False, '(?:https?://)?((?:[\\w-]+\\.)?xhamster(?:\\d?\\.(?:com|one|desi)|\\.porncache\\.net))/users/([^/?#]+)(?:/photos)?/?(?:$|[?#])', ('xhamster',), 'https://xhamster.com/users/USER/photos', 'Extractor for all galleries of an xhamster user'),
+    ('gallery_dl.extractor.xvideos', 'XvideosGalleryExtractor', 'xvideos', 'gallery', '', False, '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/photos/(\\d+)', ('xvideos.com/',), 'https://www.xvideos.com/profiles/USER/photos/12345', 'Extractor for user profile galleries on xvideos.com'),
+    ('gallery_dl.extractor.xvideos', 'XvideosUserExtractor', 'xvideos', 'user', '', False, '(?:https?://)?(?:www\\.)?xvideos\\.com/(?:profiles|(?:amateur-|model-)?channels)/([^/?#]+)/?(?:#.*)?$', ('xvideos.com/',), 'https://www.xvideos.com/profiles/USER', 'Extractor for user profiles on xvideos.com'),
+    ('gallery_dl.extractor.yiffverse', 'YiffversePostExtractor', 'yiffverse', 'post', 'booru', True, '(?:https?://)?(?:www\\.)?yiffverse\\.com/post/(\\d+)', ('yiffverse.com/post/',), 'https://yiffverse.com/post/12345', None),
+    ('gallery_dl.extractor.yiffverse', 'YiffversePlaylistExtractor', 'yiffverse', 'playlist', 'booru', True, '(?:https?://)?(?:www\\.)?yiffverse\\.com/playlist/(\\d+)', ('yiffverse.com/playlist/',), 'https://yiffverse.com/playlist/12345', None),
+    ('gallery_dl.extractor.yiffverse', 'YiffverseTagExtractor', 'yiffverse', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?yiffverse\\.com/(?:tag/([^/?#]+))?(?:/?\\?([^#]+))?(?:$|#)', ('yiffverse.com/',), 'https://yiffverse.com/tag/TAG', None),
+    ('gallery_dl.extractor.zerochan', 'ZerochanTagExtractor', 'zerochan', 'tag', 'booru', True, '(?:https?://)?(?:www\\.)?zerochan\\.net/(?!\\d+$)([^/?#]+)/?(?:\\?([^#]+))?', ('zerochan.net/',), 'https://www.zerochan.net/TAG', None),
+    ('gallery_dl.extractor.zerochan', 'ZerochanImageExtractor', 'zerochan', 'image', 'booru', True, '(?:https?://)?(?:www\\.)?zerochan\\.net/(\\d+)', ('zerochan.net/',), 'https://www.zerochan.net/12345', None),
+    ('gallery_dl.extractor.moebooru', 'MoebooruTagExtractor', '', 'tag', 'moebooru', True, '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post\\?(?:[^&#]*&)*tags=([^&#]*)', ('moebooru:', 'yande.re', 'konachan.', 'sakugabooru.com', 'lolibooru.moe'), 'https://yande.re/post?tags=TAG', None),
+    ('gallery_dl.extractor.moebooru', 'MoebooruPoolExtractor', '', 'pool', 'moebooru', True, '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/pool/show/(\\d+)', ('/pool/show/',), 'https://yande.re/pool/show/12345', None),
+    ('gallery_dl.extractor.moebooru', 'MoebooruPostExtractor', '', 'post', 'moebooru', True, '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/show/(\\d+)', ('/post/show/',), 'https://yande.re/post/show/12345', None),
+    ('gallery_dl.extractor.moebooru', 'MoebooruPopularExtractor', '', 'popular', 'moebooru', True, '(?:moebooru:(https?://[^/?#]+)|(?:https?://)?(?:yande\\.re()|konachan\\.(?:com|net)()|(?:www\\.)?sakugabooru\\.com()|lolibooru\\.moe()))/post/popular_(by_(?:day|week|month)|recent)(?:\\?([^#]*))?', ('/post/popular_',), 'https://yande.re/post/popular_by_month?year=YYYY&month=MM', None),
+    ('gallery_dl.extractor.foolfuuka', 'FoolfuukaThreadExtractor', '', 'thread', 'foolfuuka', True, '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/thread/(\\d+)', ('foolfuuka:', '4plebs.org', 'archived.moe', 'archiveofsins.com', 'arch.b4k.', 'desuarchive.org', 'boards.fireden.net', 'archive.palanq.win', 'rbt.asia', 'rebeccablacktech.com', 'thebarchive.com'), 'https://archived.moe/a/thread/12345/', 'Base extractor for threads on FoolFuuka based boards/archives'),
+    ('gallery_dl.extractor.foolfuuka', 'FoolfuukaBoardExtractor', '', 'board', 'foolfuuka', True, '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)(?:/(?:page/)?(\\d*))?$', ('foolfuuka:', '4plebs.org', 'archived.moe', 'archiveofsins.com', 'arch.b4k.', 'desuarchive.org', 'boards.fireden.net', 'archive.palanq.win', 'rbt.asia', 'rebeccablacktech.com', 'thebarchive.com'), 'https://archived.moe/a/', 'Base extractor for FoolFuuka based boards/archives'),
+    ('gallery_dl.extractor.foolfuuka', 'FoolfuukaSearchExtractor', '', 'search', 'foolfuuka', True, '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/search((?:/[^/?#]+/[^/?#]+)+)', ('foolfuuka:', '4plebs.org', 'archived.moe', 'archiveofsins.com', 'arch.b4k.', 'desuarchive.org', 'boards.fireden.net', 'archive.palanq.win', 'rbt.asia', 'rebeccablacktech.com', 'thebarchive.com'), 'https://archived.moe/_/search/text/QUERY/', 'Base extractor for search results on FoolFuuka based boards/archives'),
+    ('gallery_dl.extractor.foolfuuka', 'FoolfuukaGalleryExtractor', '', 'gallery', 'foolfuuka', True, '(?:foolfuuka:(https?://[^/?#]+)|(?:https?://)?(?:(?:archive\\.)?4plebs\\.org()|archived\\.moe()|(?:www\\.)?archiveofsins\\.com()|arch\\.b4k\\.(?:dev|co)()|desuarchive\\.org()|boards\\.fireden\\.net()|archive\\.palanq\\.win()|(?:rbt\\.asia|(?:archive\\.)?rebeccablacktech\\.com)()|thebarchive\\.com()))/([^/?#]+)/gallery(?:/(\\d+))?', ('foolfuuka:', '4plebs.org', 'archived.moe', 'archiveofsins.com', 'arch.b4k.', 'desuarchive.org', 'boards.fireden.net', 'archive.palanq.win', 'rbt.asia', 'rebeccablacktech.com', 'thebarchive.com'), 'https://archived.moe/a/gallery', 'Base extractor for FoolFuuka galleries'),
+    ('gallery_dl.extractor.foolslide', 'FoolslideChapterExtractor', '', 'chapter', 'foolslide', True, '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/read/[^/?#]+/[a-z-]+/\\d+/\\d+(?:/\\d+)?)', ('/read/',), 'https://read.powermanga.org/read/MANGA/en/0/123/', 'Base class for chapter extractors for FoOlSlide based sites'),
+    ('gallery_dl.extractor.foolslide', 'FoolslideMangaExtractor', '', 'manga', 'foolslide', True, '(?:foolslide:(https?://[^/?#]+)|(?:https?://)?(?:))(/series/[^/?#]+)', ('/series/',), 'https://read.powermanga.org/series/MANGA/', 'Base class for manga extractors for FoOlSlide based sites'),
+    ('gallery_dl.extractor.mastodon', 'MastodonUserExtractor', '', 'user', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)(?:/media)?/?$', ('mastodon:', 'mastodon.social', 'pawoo.net', 'baraag.net'), 'https://mastodon.social/@USER', 'Extractor for all images of an account/user'),
+    ('gallery_dl.extractor.mastodon', 'MastodonBookmarkExtractor', '', 'bookmark', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/bookmarks', ('/bookmarks',), 'https://mastodon.social/bookmarks', 'Extractor for mastodon bookmarks'),
+    ('gallery_dl.extractor.mastodon', 'MastodonFavoriteExtractor', '', 'favorite', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/favourites', ('/favourites',), 'https://mastodon.social/favourites', 'Extractor for mastodon favorites'),
+    ('gallery_dl.extractor.mastodon', 'MastodonListExtractor', '', 'list', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/lists/(\\w+)', ('mastodon:', 'mastodon.social', 'pawoo.net', 'baraag.net'), 'https://mastodon.social/lists/12345', 'Extractor for mastodon lists'),
+    ('gallery_dl.extractor.mastodon', 'MastodonHashtagExtractor', '', 'hashtag', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/tags/(\\w+)', ('mastodon:', 'mastodon.social', 'pawoo.net', 'baraag.net'), 'https://mastodon.social/tags/NAME', 'Extractor for mastodon hashtags'),
+    ('gallery_dl.extractor.mastodon', 'MastodonFollowingExtractor', '', 'following', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@|users/)([^/?#]+)/following', ('/following',), 'https://mastodon.social/@USER/following', 'Extractor for followed mastodon users'),
+    ('gallery_dl.extractor.mastodon', 'MastodonStatusExtractor', '', 'status', 'mastodon', True, '(?:mastodon:(https?://[^/?#]+)|(?:https?://)?(?:mastodon\\.social()|pawoo\\.net()|baraag\\.net()))(?:/web)?/(?:@[^/?#]+|(?:users/[^/?#]+/)?(?:statuses|notice|objects()))/(?!following)([^/?#]+)', ('mastodon:', 'mastodon.social', 'pawoo.net', 'baraag.net'), 'https://mastodon.social/@USER/12345', 'Extractor for images from a status'),
+    ('gallery_dl.extractor.shopify', 'ShopifyCollectionExtractor', '', 'collection', 'shopify', True, '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))(/collections/[\\w-]+)/?(?:$|[?#])', ('/collections/',), 'https://www.fashionnova.com/collections/TITLE', 'Base class for collection extractors for Shopify based sites'),
+    ('gallery_dl.extractor.shopify', 'ShopifyProductExtractor', '', 'product', 'shopify', True, '(?:shopify:(https?://[^/?#]+)|(?:https?://)?(?:(?:www\\.)?chelseacrew\\.com()|(?:www\\.)?fashionnova\\.com()|(?:[a-z]+\\.)?loungeunderwear\\.com()|michaels\\.com\\.au()|modcloth\\.com()|(?:www\\.)?ohpolly\\.com()|(?:www\\.)?omgmiamiswimwear\\.com()|pinupgirlclothing\\.com()|(?:www\\.)?raidlondon\\.com()|(?:www\\.)?unique\\-vintage\\.com()|(?:www\\.)?windsorstore\\.com()))((?:/collections/[\\w-]+)?/products/[\\w-]+)', ('/products/',), 'https://www.fashionnova.com/collections/TITLE/products/NAME', 'Base class for product extractors for Shopify based sites'),
+    ('gallery_dl.extractor.lolisafe', 'LolisafeAlbumExtractor', '', 'album', 'lolisafe', True, '(?:lolisafe:(https?://[^/?#]+)|(?:https?://)?(?:))/a/([^/?#]+)', None, 'https://xbunkr.com/a/ID', None),
+    ('gallery_dl.extractor.imagehosts', 'ImxtoImageExtractor', 'imxto', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.)?((?:imx\\.to|img\\.yt)/(?:i/|img-)(\\w+)(\\.html)?)', ('x.to', 'g.yt'), 'https://imx.to/i/ID', 'Extractor for single images from imx.to'),
+    ('gallery_dl.extractor.imagehosts', 'ImxtoGalleryExtractor', 'imxto', 'gallery', 'imagehost', False, '(?:https?://)?(?:www\\.)?(imx\\.to/g/([^/?#]+))', ('imx.to/g/',), 'https://imx.to/g/ID', 'Extractor for image galleries from imx.to'),
+    ('gallery_dl.extractor.imagehosts', 'AcidimgImageExtractor', 'acidimg', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?acidimg\\.cc/img-([a-z0-9]+)\\.html)', ('acidimg.cc/img-',), 'https://acidimg.cc/img-abc123.html', 'Extractor for single images from acidimg.cc'),
+    ('gallery_dl.extractor.imagehosts', 'ImagevenueImageExtractor', 'imagevenue', 'image', 'imagehost', False, '(?:https?://)?((?:www|img\\d+)\\.imagevenue\\.com/([A-Z0-9]{8,10}|view/.*|img\\.php\\?.*))', ('.imagevenue.com/',), 'https://www.imagevenue.com/ME123456789', 'Extractor for single images from imagevenue.com'),
+    ('gallery_dl.extractor.imagehosts', 'ImagetwistImageExtractor', 'imagetwist', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/([a-z0-9]{12}))', ('image',), 'https://imagetwist.com/123456abcdef/NAME.EXT', 'Extractor for single images from imagetwist.com'),
+    ('gallery_dl.extractor.imagehosts', 'ImagetwistGalleryExtractor', 'imagetwist', 'gallery', 'imagehost', False, '(?:https?://)?((?:www\\.|phun\\.)?image(?:twist|haha)\\.com/(p/[^/?#]+/\\d+))', ('image',), 'https://imagetwist.com/p/USER/12345/NAME', 'Extractor for galleries from imagetwist.com'),
+    ('gallery_dl.extractor.imagehosts', 'ImgadultImageExtractor', 'imgadult', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?imgadult\\.com/img-([0-9a-f]+)\\.html)', ('imgadult.com/img-',), 'https://imgadult.com/img-0123456789abc.html', 'Extractor for single images from imgadult.com'),
+    ('gallery_dl.extractor.imagehosts', 'ImgspiceImageExtractor', 'imgspice', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?imgspice\\.com/([^/?#]+))', ('imgspice.com/',), 'https://imgspice.com/ID/NAME.EXT.html', 'Extractor for single images from imgspice.com'),
+    ('gallery_dl.extractor.imagehosts', 'PixhostImageExtractor', 'pixhost', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/show/\\d+/(\\d+)_[^/?#]+)', ('pixhost.',), 'https://pixhost.to/show/123/12345_NAME.EXT', 'Extractor for single images from pixhost.to'),
+    ('gallery_dl.extractor.imagehosts', 'PixhostGalleryExtractor', 'pixhost', 'gallery', 'imagehost', False, '(?:https?://)?(?:www\\.)?pixhost\\.(?:to|org)(/gallery/([^/?#]+))', ('/gallery/',), 'https://pixhost.to/gallery/ID', 'Extractor for image galleries from pixhost.to'),
+    ('gallery_dl.extractor.imagehosts', 'PostimgImageExtractor', 'postimg', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/(?!gallery/)(?:image/)?([^/?#]+)/?)', ('ostim', 'ixxxels'), 'https://postimg.cc/ID', 'Extractor for single images from postimages.org'),
+    ('gallery_dl.extractor.imagehosts', 'PostimgGalleryExtractor', 'postimg', 'gallery', 'imagehost', False, '(?:https?://)?(?:www\\.)?(?:postim(?:ages|g)|pixxxels)\\.(?:cc|org)(/gallery/([^/?#]+))', ('/gallery/',), 'https://postimg.cc/gallery/ID', 'Extractor for images galleries from postimages.org'),
+    ('gallery_dl.extractor.imagehosts', 'TurboimagehostImageExtractor', 'turboimagehost', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?turboimagehost\\.com/p/(\\d+)/[^/?#]+\\.html)', ('turboimagehost.com/p/',), 'https://www.turboimagehost.com/p/12345/NAME.EXT.html', 'Extractor for single images from www.turboimagehost.com'),
+    ('gallery_dl.extractor.imagehosts', 'TurboimagehostGalleryExtractor', 'turboimagehost', 'gallery', 'imagehost', False, '(?:https?://)?((?:www\\.)?turboimagehost\\.com/album/(\\d+)/([^/?#]*))', ('turboimagehost.com/album/',), 'https://www.turboimagehost.com/album/12345/GALLERY_NAME', 'Extractor for image galleries from turboimagehost.com'),
+    ('gallery_dl.extractor.imagehosts', 'ViprImageExtractor', 'vipr', 'image', 'imagehost', False, '(?:https?://)?(vipr\\.im/(\\w+))', ('vipr.im/',), 'https://vipr.im/abc123.html', 'Extractor for single images from vipr.im'),
+    ('gallery_dl.extractor.imagehosts', 'ImgclickImageExtractor', 'imgclick', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?imgclick\\.net/([^/?#]+))', ('imgclick.net/',), 'http://imgclick.net/abc123/NAME.EXT.html', 'Extractor for single images from imgclick.net'),
+    ('gallery_dl.extractor.imagehosts', 'FappicImageExtractor', 'fappic', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.|img\\d+\\.)?fappic\\.com/(?:i/\\d+/())?(\\w{10,})(?:/|\\.)\\w+', ('fappic.com/',), 'https://fappic.com/abcde12345/NAME.EXT', 'Extractor for single images from fappic.com'),
+    ('gallery_dl.extractor.imagehosts', 'PicstateImageExtractor', 'picstate', 'image', 'imagehost', False, '(?:https?://)?((?:www\\.)?picstate\\.com/view/full/([^/?#]+))', ('picstate.com/view/full/',), 'https://picstate.com/view/full/123', 'Extractor for single images from picstate.com'),
+    ('gallery_dl.extractor.imagehosts', 'ImgdriveImageExtractor', 'imgdrive', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.)?(img(drive|taxi|wallet)\\.(?:com|net)/img-(\\w+)\\.html)', ('/img-',), 'https://imgdrive.net/img-0123456789abc.html', 'Extractor for single images from imgdrive.net'),
+    ('gallery_dl.extractor.imagehosts', 'SilverpicImageExtractor', 'silverpic', 'image', 'imagehost', False, '(?:https?://)?(?:www\\.)?silverpic\\.(?:net|com)(/([a-z0-9]{10,})/[\\S]+\\.html)', ('silverpic.',), 'https://silverpic.net/a1b2c3d4f5g6/NAME.EXT.html', 'Extractor for single images from silverpic.com'),
+    ('gallery_dl.extractor.directlink', 'DirectlinkExtractor', 'directlink', '', '', False, '(?i)https?://(?P<domain>[^/?#]+)/(?P<path>[^?#]+\\.(?:jpe?g|jpe|png|gif|bmp|svg|web[mp]|avif|heic|psd|mp4|m4v|mov|mkv|og[gmv]|wav|mp3|opus|zip|rar|7z|pdf|swf))(?:\\?(?P<query>[^#]*))?(?:#(?P<fragment>.*))?$', ('http',), 'https://en.wikipedia.org/static/images/project-logos/enwiki.png', 'Extractor for direct links to images and other media files'),
+    ('gallery_dl.extractor.recursive', 'RecursiveExtractor', 'recursive', '', '', False, 'r(?:ecursive)?:', None, 'recursive:https://pastebin.com/raw/FLwrCYsT', 'Extractor that fetches URLs from a remote or local source'),
+    ('gallery_dl.extractor.oauth', 'OAuthFlickr', 'oauth', 'flickr', '', False, 'oauth:flickr$', ('oauth:flickr',), 'oauth:flickr', None),
+    ('gallery_dl.extractor.oauth', 'OAuthSmugmug', 'oauth', 'smugmug', '', False, 'oauth:smugmug$', ('oauth:smugmug',), 'oauth:smugmug', None),
+    ('gallery_dl.extractor.oauth', 'OAuthTumblr', 'oauth', 'tumblr', '', False, 'oauth:tumblr$', ('oauth:tumblr',), 'oauth:tumblr', None),
+    ('gallery_dl.extractor.oauth', 'OAuthDeviantart', 'oauth', 'deviantart', '', False, 'oauth:deviantart$', ('oauth:deviantart',), 'oauth:deviantart', None),
+    ('gallery_dl.extractor.oauth', 'OAuthReddit', 'oauth', 'reddit', '', False, 'oauth:reddit$', ('oauth:reddit',), 'oauth:reddit', None),
+    ('gallery_dl.extractor.oauth', 'OAuthMastodon', 'oauth', 'mastodon', '', False, 'oauth:mastodon:(?:https?://)?([^/?#]+)', ('oauth:mastodon:',), 'oauth:mastodon:mastodon.social', None),
+    ('gallery_dl.extractor.oauth', 'OAuthPixiv', 'oauth', 'pixiv', '', False, 'oauth:pixiv$', ('oauth:pixiv',), 'oauth:pixiv', None),
+    ('gallery_dl.extractor.noop', 'NoopExtractor', 'noop', '', '', False, '(?i)noo?p$', None, 'noop', None),
+    ('gallery_dl.extractor.ytdl', 'YoutubeDLExtractor', 'ytdl', '', '', False, 'ytdl:(.*)', None, 'ytdl:https://www.youtube.com/watch?v=abcdefghijk', 'Generic extractor for youtube-dl supported URLs'),
+    ('gallery_dl.extractor.generic', 'GenericExtractor', 'generic', '', '', False, '(?i)(?P<generic>g(?:eneric)?:)(?P<scheme>https?://)?(?P<domain>[-\\w\\.]+)(?P<path>/[^?#]*)?(?:\\?(?P<query>[^#]*))?(?:\\#(?P<fragment>.*))?', None, 'generic:https://www.nongnu.org/lzip/', 'Extractor for images in a generic web page.'),
+)
@@ -9,7 +9,7 @@
 """Extractors for *booru sites"""
 
 from .common import BaseExtractor, Message
-from .. import text
+from .. import text, cache
 import operator
 
 
@@ -23,9 +23,8 @@ class BooruExtractor(BaseExtractor):
     def items(self):
         self.login()
         data = self.metadata()
-        tags = self.config("tags", False)
-        notes = self.config("notes", False)
-        fetch_html = tags or notes
+        self._fetch_tags = self.config("tags", False)
+        self._fetch_notes = self.config("notes", False)
 
         if url_key := self.config("url"):
             if isinstance(url_key, (list, tuple)):
@@ -34,23 +33,17 @@ class BooruExtractor(BaseExtractor):
             else:
                 self._file_url = operator.itemgetter(url_key)
 
-        for post in self.posts():
-            try:
-                url = self._file_url(post)
-                if url[0] == "/":
-                    url = self.root + url
-            except Exception as exc:
-                self.log.debug("%s: %s", exc.__class__.__name__, exc)
-                self.log.warning("Unable to fetch download URL for post %s "
-                                 "(md5: %s)", post.get("id"), post.get("md5"))
-                continue
+        posts = self.posts()
+        if self._fetch_tags or self._fetch_notes:
+            self._metadata_cache = self.config("metadata-cache", False)
+            posts = self._map_threaded(
+                self._process, posts, self.config("metadata-workers", 4))
+        else:
+            posts = map(self._process, posts)
 
-            if fetch_html:
-                html = self._html(post)
-                if tags:
-                    self._tags(post, html)
-                if notes:
-                    self._notes(post, html)
+        for post, url in posts:
+            if url is None:
+                continue
 
             if "extension" not in post:
                 text.nameext_from_url(url, post)
@@ -83,6 +76,43 @@ class BooruExtractor(BaseExtractor):
         post["_fallback"] = it = iter(urls)
         return next(it)
 
+    def _process(self, post):
+        """Return a post's download URL and fetch its HTML metadata"""
+        try:
+            url = self._file_url(post)
+            if url[0] == "/":
+                url = self.root + url
+        except Exception as exc:
+            self.log.debug("%s: %s", exc.__class__.__name__, exc)
+            self.log.warning("Unable to fetch download URL for post %s "
+                             "(md5: %s)", post.get("id"), post.get("md5"))
+            return post, None
+
+        if self._fetch_tags or self._fetch_notes:
+            if self._metadata_cache and (
+                    change := post.get("change") or post.get("updated_at")):
+                key = (f"{__name__}.metadata-{self.category}_{post['id']}_"
+                       f"{change}_{self._fetch_tags:d}{self._fetch_notes:d}")
+                if (metadata := cache.entry_load(key)) is None:
+                    cache.entry_store(
+                        key, self._html_metadata(post), 30*86400)
+                else:
+                    post.update(metadata)
+            else:
+                self._html_metadata(post)
+        return post, url
+
+    def _html_metadata(self, post):
+        """Add and return metadata extracted from a post's HTML page"""
+        before = post.copy()
+        html = self._html(post)
+        if self._fetch_tags:
+            self._tags(post, html)
+        if self._fetch_notes:
+            self._notes(post, html)
+        return {key: value for key, value in post.items()
+                if key not in before or before[key] is not value}
+
     def _prepare(self, post):
         """Prepare a 'post's metadata"""
 
@@ -8,15 +8,20 @@
 
 """Common classes and constants used by extractor modules."""
 
+import io
 import os
 import re
 import ssl
+import zlib
 import time
+import http.client
 import netrc
 import queue
 import random
 import getpass
 import logging
+import collections
+import sqlite3
 import requests
 import threading
 from xml.etree import ElementTree
@@ -49,7 +54,10 @@ class Extractor():
     request_interval = 0.0
     request_interval_min = 0.0
     request_interval_429 = 60.0
-    request_timestamp = 0.0
+    _checkpoint = None
+    _checkpoint_sync = None
+    _watermark = None
+    _watermark_new = None
 
     def __init__(self, match):
         self.log = logging.getLogger(self.category)
@@ -173,16 +181,34 @@ class Extractor():
                 else:
                     kwargs["headers"] = {"Content-Type": "application/json"}
 
+        if self._http_cache and method == "GET" and \
+                "data" not in kwargs and not kwargs.get("stream"):
+            cached = self._http_cache_prepare(url, kwargs)
+        else:
+            cached = None
+
         response = challenge = None
         tries = 1
 
-        if self._interval and interval:
-            seconds = (self._interval() -
-                       (time.time() - Extractor.request_timestamp))
-            if seconds > 0.0:
-                self.sleep(seconds, "request")
+        # the start of requests with a delay between them is serialized
+        # per category, including ones from background threads
+        # like '_prefetch()' or other concurrent jobs
+        if interval:
+            slot = _request_slot(self.category)
+            lock = slot.lock if self._interval else None
+        else:
+            slot = lock = None
 
         while True:
+            if lock is not None:
+                with lock:
+                    seconds = (self._interval() -
+                               (time.time() - slot.timestamp))
+                    if seconds > 0.0:
+                        self.sleep(seconds, "request")
+                    # reserve this time slot
+                    slot.timestamp = time.time()
+
             try:
                 response = session.request(method, url, **kwargs)
             except requests.exceptions.ConnectionError as exc:
@@ -213,6 +239,8 @@ class Extractor():
                         not fatal and code != 429 or fatal is None) or
                     fatal is ...
                 ):
+                    if cached is not None:
+                        self._http_cache_update(response, *cached)
                     if encoding:
                         response.encoding = encoding
                     return response
@@ -234,8 +262,9 @@ class Extractor():
                     break
 
             finally:
-                if interval:
-                    Extractor.request_timestamp = time.time()
+                if slot is not None and \
+                        (now := time.time()) > slot.timestamp:
+                    slot.timestamp = now
 
             self.log.debug("%s (%s/%s)", msg, tries, retries+1)
             if tries > retries:
@@ -266,6 +295,129 @@ class Extractor():
         self.status |= exc.code
         raise exc
 
+    def _http_cache_prepare(self, url, kwargs):
+        """Add validators of a stored response to a request's headers"""
+        prep = requests.models.PreparedRequest()
+        prep.prepare_url(url, kwargs.get("params"))
+        key = prep.url
+
+        if entry := cache.http_load(key):
+            etag, modified, _, _ = entry
+            headers = kwargs.get("headers")
+            kwargs["headers"] = headers = dict(headers) if headers else {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+        return key, entry
+
+    def _http_cache_update(self, response, key, entry):
+        """Restore a stored response body or store a new one"""
+        code = response.status_code
+        headers = response.headers
+
+        if code == 304 and entry:
+            self.log.debug("Using stored response for %s", key)
+            response.status_code = 200
+            response.reason = "OK"
+            headers.update(entry[2])
+            response._content = entry[3]
+            response._content_consumed = True
+            response.encoding = requests.utils.get_encoding_from_headers(
+                headers)
+
+        elif code == 200:
+            etag = headers.get("etag")
+            modified = headers.get("last-modified")
+            if (etag or modified) and \
+                    "no-store" not in headers.get("cache-control", ""):
+                cache.http_store(
+                    key, self.category, etag, modified,
+                    {name: value for name, value in headers.items()
+                     if name.lower() not in HTTP_CACHE_EXCLUDE},
+                    response.content, self._http_cache)
+
+    def _prefetch(self, pages, depth=None):
+        """Iterate over 'pages' while producing the next ones in a thread
+
+        Runs the 'pages' generator up to 'depth' items ahead
+        of the consumer in a background thread.
+        State that must only change after an item got consumed,
+        like cursors for resuming, needs to be updated by the consumer.
+        """
+        if depth is None:
+            depth = self.config("prefetch", 1)
+        if not depth or depth < 1:
+            yield from pages
+            return
+
+        results = queue.Queue()
+        slots = threading.Semaphore(depth)
+        stop = threading.Event()
+
+        def produce():
+            iterator = iter(pages)
+            try:
+                while True:
+                    while not slots.acquire(timeout=1.0):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    try:
+                        page = next(iterator)
+                    except StopIteration:
+                        break
+                    results.put((True, page))
+                results.put((False, None))
+            except BaseException as exc:
+                results.put((False, exc))
+            finally:
+                if close := getattr(iterator, "close", None):
+                    close()
+
+        thread = threading.Thread(
+            target=produce, name=f"{self.category}-prefetch", daemon=True)
+        thread.start()
+        try:
+            while True:
+                ok, page = results.get()
+                if ok:
+                    slots.release()
+                    yield page
+                elif page is None:
+                    return
+                else:
+                    raise page
+        finally:
+            stop.set()
+
+    def _map_threaded(self, func, iterable, workers):
+        """Yield 'func(item)' for each item of 'iterable' in order
+
+        Calls 'func' in up to 'workers' threads
+        for items ahead of the one currently being consumed.
+        """
+        if not workers or workers <= 1:
+            for item in iterable:
+                yield func(item)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(workers, f"{self.category}-worker")
+        pending = collections.deque()
+        try:
+            for item in iterable:
+                pending.append(executor.submit(func, item))
+                if len(pending) > workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
+
     def request_location(self, url, **kwargs):
         kwargs.setdefault("method", "HEAD")
         kwargs.setdefault("allow_redirects", False)
@@ -401,6 +553,13 @@ class Extractor():
             self.config("sleep-429", self.request_interval_429),
         )
 
+        if http_cache := self.config("http-cache", False):
+            self._http_cache = (
+                HTTP_CACHE_SIZE if http_cache is True else
+                text.parse_bytes(http_cache, HTTP_CACHE_SIZE))
+        else:
+            self._http_cache = 0
+
         if self._retries < 0:
             self._retries = float("inf")
         if not self._retry_codes:
@@ -519,8 +678,16 @@ class Extractor():
         else:
             ssl_ctx = None
 
+        pool_size = self.config("pool-size") or 10
+        pool_block = self.config("pool-block", False)
+
         adapter = _build_requests_adapter(
-            ssl_options, ssl_ciphers, ssl_ctx, source_address)
+            ssl_options, ssl_ciphers, ssl_ctx, source_address,
+            pool_size, pool_block)
+        if path := self.config("http-replay"):
+            adapter = ReplayAdapter(_recording(path))
+        elif path := self.config("http-record"):
+            adapter = RecordAdapter(adapter, _recording(path))
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
@@ -691,8 +858,61 @@ class Extractor():
         #  return cache.DatabaseCacheDecorator(func, maxage, keyarg)
         return cache.DatabaseCacheDecorator(func, keyarg, maxage)
 
-    def _cache_memory(self, func, maxage=None, keyarg=None):
-        return cache.Memcache()
+    def _cache_memory(self, func, maxage=None, keyarg=None, maxsize=None):
+        return cache.memcache(maxage, keyarg, maxsize)(func)
+
+    def _checkpoint_load(self):
+        """Return the cursor of an interrupted previous run for this URL"""
+        if self._checkpoint_sync is None or \
+                not self.config("cursor-checkpoint", True):
+            return None
+        self._checkpoint = self.url
+        if (cursor := cache.checkpoint_load(self.url)) is not None:
+            self.log.info("Resuming from cursor checkpoint '%s' "
+                          "(use '-o cursor-checkpoint=false' to start "
+                          "from the beginning)", cursor)
+        return cursor
+
+    def _checkpoint_store(self, cursor):
+        """Store 'cursor' as resumption point for this URL
+
+        Waits until everything before it has been processed.
+        """
+        if self._checkpoint is not None:
+            self._checkpoint_sync()
+            cache.checkpoint_store(self._checkpoint, cursor)
+
+    def _checkpoint_clear(self):
+        """Delete this URL's checkpoint after a completed run"""
+        if self._checkpoint is not None:
+            cache.checkpoint_store(self._checkpoint, None)
+            self._checkpoint = None
+
+    def _watermark_load(self):
+        """Return the high-water mark of the last complete run for this URL
+
+        Everything at or below this value has already been processed
+        and is part of the download archive.
+        """
+        if self._watermark is None or \
+                (archive := self._watermark()) is None:
+            self._watermark = None
+            return None
+        if (mark := archive.watermark(self.url)) is not None:
+            self.log.debug("High-water mark: %s", mark)
+        return mark
+
+    def _watermark_update(self, value):
+        """Record 'value' as candidate for the next high-water mark"""
+        if self._watermark is not None and (
+                self._watermark_new is None or value > self._watermark_new):
+            self._watermark_new = value
+
+    def _watermark_store(self):
+        """Store the highest recorded value after a complete run"""
+        if self._watermark_new is not None and \
+                (archive := self._watermark()) is not None:
+            archive.watermark_update(self.url, self._watermark_new)
 
     def _get_date_min_max(self, dmin=None, dmax=None):
         """Retrieve and parse 'date-min' and 'date-max' config values"""
@@ -1014,26 +1234,156 @@ class BaseExtractor(Extractor):
 
 class RequestsAdapter(HTTPAdapter):
 
-    def __init__(self, ssl_context=None, source_address=None):
+    def __init__(self, ssl_context=None, source_address=None,
+                 pool_size=None, pool_block=False):
         self.ssl_context = ssl_context
         self.source_address = source_address
-        HTTPAdapter.__init__(self)
+        HTTPAdapter.__init__(
+            self,
+            # adapters are shared by all extractors with the same settings;
+            # keep connections to more than the default 10 hosts
+            pool_connections=64,
+            pool_maxsize=pool_size or 10,
+            pool_block=pool_block,
+        )
 
     def init_poolmanager(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = POOL_CLASSES
 
     def proxy_manager_for(self, *args, **kwargs):
         kwargs["ssl_context"] = self.ssl_context
         kwargs["source_address"] = self.source_address
-        return HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
+        manager = HTTPAdapter.proxy_manager_for(self, *args, **kwargs)
+        if isinstance(manager, urllib3.ProxyManager):
+            manager.pool_classes_by_scheme = POOL_CLASSES
+        return manager
+
+
+class RecordAdapter(requests.adapters.BaseAdapter):
+    """Store responses of non-streamed requests in a Recording"""
+
+    def __init__(self, adapter, recording):
+        requests.adapters.BaseAdapter.__init__(self)
+        self.adapter = adapter
+        self.recording = recording
+
+    def send(self, request, stream=False, **kwargs):
+        response = self.adapter.send(request, stream=stream, **kwargs)
+        if not stream:
+            self.recording.add(request, response)
+        return response
 
+    def close(self):
+        self.adapter.close()
 
-def _build_requests_adapter(
-        ssl_options, ssl_ciphers, ssl_ctx, source_address):
 
-    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address)
+class ReplayAdapter(HTTPAdapter):
+    """Serve responses from a Recording instead of the network"""
+
+    def __init__(self, recording):
+        HTTPAdapter.__init__(self)
+        self.recording = recording
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        if (entry := self.recording.get(request)) is None:
+            raise requests.exceptions.RequestException(
+                f"No recorded response for '{request.method} {request.url}'",
+                request=request)
+
+        status, reason, headers, body = entry
+        response = urllib3.HTTPResponse(
+            body=io.BytesIO(body), headers=headers, status=status,
+            reason=reason, preload_content=False, decode_content=False,
+            original_response=RecordedMessage(headers))
+        return self.build_response(request, response)
+
+
+class RecordedMessage():
+    """Stand-in for the http.client response of a replayed response
+
+    Provides the 'Set-Cookie' headers for requests' cookie handling.
+    """
+
+    def __init__(self, headers):
+        self.msg = msg = http.client.HTTPMessage()
+        for name, value in headers:
+            msg[name] = value
+
+    def isclosed(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class Recording():
+    """Recorded request->response pairs in an SQLite database
+
+    Responses for the same request
+    get served in the order they were recorded,
+    repeating the last one when there are no more.
+    """
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.served = {}
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT, status INTEGER, reason TEXT, headers TEXT, body BLOB)")
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_key ON responses (key)")
+
+    def key(self, request):
+        key = f"{request.method} {request.url}"
+        if request.body:
+            key = f"{key} {util.sha1(request.body)}"
+        return key
+
+    def add(self, request, response):
+        headers = getattr(response.raw, "headers", None) or response.headers
+        headers = [(name, value) for name, value in headers.items()
+                   if name.lower() not in RECORD_EXCLUDE]
+        headers.append(("Content-Length", str(len(response.content))))
+        entry = (self.key(request), response.status_code, response.reason,
+                 util.json_dumps(headers), zlib.compress(response.content))
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT INTO responses VALUES (?,?,?,?,?)", entry)
+
+    def get(self, request):
+        key = self.key(request)
+        with self.lock:
+            index = self.served.get(key, 0)
+            rows = self.db.execute(
+                "SELECT status, reason, headers, body FROM responses "
+                "WHERE key=? ORDER BY rowid", (key,)).fetchall()
+            if not rows:
+                return None
+            self.served[key] = index + 1
+
+        status, reason, headers, body = rows[min(index, len(rows)-1)]
+        return status, reason, util.json_loads(headers), zlib.decompress(body)
+
+
+def _recording(path):
+    path = util.expand_path(path)
+    try:
+        return CACHE_RECORDINGS[path]
+    except KeyError:
+        recording = CACHE_RECORDINGS[path] = Recording(path)
+        return recording
+
+
+def _build_requests_adapter(ssl_options, ssl_ciphers, ssl_ctx,
+                            source_address, pool_size=None, pool_block=False):
+
+    key = (ssl_options, ssl_ciphers, ssl_ctx, source_address,
+           pool_size, pool_block)
     try:
         return CACHE_ADAPTERS[key]
     except KeyError:
@@ -1059,10 +1409,100 @@ def _build_requests_adapter(
         ssl_context = None
 
     adapter = CACHE_ADAPTERS[key] = RequestsAdapter(
-        ssl_context, source_address)
+        ssl_context, source_address, pool_size, pool_block)
     return adapter
 
 
+class RequestSlot():
+    """Time of the last request to a site and the lock guarding it"""
+    __slots__ = ("lock", "timestamp")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timestamp = 0.0
+
+
+def _request_slot(category):
+    try:
+        return _request_slots[category]
+    except KeyError:
+        return _request_slots.setdefault(category, RequestSlot())
+
+
+_request_slots = {}
+
+
+# --------------------------------------------------------------------
+# connection statistics
+
+def _stats_connect(host, duration):
+    with _stats_lock:
+        try:
+            stats = CONNECTION_STATS[host]
+        except KeyError:
+            stats = CONNECTION_STATS[host] = [0, 0, 0.0]
+        stats[1] += 1
+        stats[2] += duration
+
+
+def _stats_request(host):
+    with _stats_lock:
+        try:
+            CONNECTION_STATS[host][0] += 1
+        except KeyError:
+            CONNECTION_STATS[host] = [1, 0, 0.0]
+
+
+def log_connection_stats():
+    """Log number of requests and new connections per host"""
+    log = logging.getLogger("connection")
+    for host, (num, connections, duration) in sorted(
+            CONNECTION_STATS.items()):
+        log.debug("%s: %s requests, %s connections (%.1f ms per connect)",
+                  host, num, connections,
+                  duration * 1000.0 / connections if connections else 0.0)
+
+
+class HTTPConnection(urllib3.connection.HTTPConnection):
+
+    def connect(self):
+        start = time.monotonic()
+        urllib3.connection.HTTPConnection.connect(self)
+        _stats_connect(self.host, time.monotonic() - start)
+
+
+class HTTPSConnection(urllib3.connection.HTTPSConnection):
+
+    def connect(self):
+        start = time.monotonic()
+        urllib3.connection.HTTPSConnection.connect(self)
+        _stats_connect(self.host, time.monotonic() - start)
+
+
+class HTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = HTTPConnection
+
+    def urlopen(self, *args, **kwargs):
+        _stats_request(self.host)
+        return urllib3.HTTPConnectionPool.urlopen(self, *args, **kwargs)
+
+
+class HTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = HTTPSConnection
+
+    def urlopen(self, *args, **kwargs):
+        _stats_request(self.host)
+        return urllib3.HTTPSConnectionPool.urlopen(self, *args, **kwargs)
+
+
+POOL_CLASSES = {
+    "http" : HTTPConnectionPool,
+    "https": HTTPSConnectionPool,
+}
+CONNECTION_STATS = {}  # host -> [requests, connections, connect time]
+_stats_lock = threading.Lock()
+
+
 @cache.cache(maxage=86400, keyarg=0)
 def _browser_useragent(browser):
     """Get User-Agent header from default browser"""
@@ -1108,8 +1548,19 @@ def _browser_useragent(browser):
 
 CACHE_ADAPTERS = {}
 CACHE_COOKIES = {}
+CACHE_RECORDINGS = {}
 CATEGORY_MAP = ()
 
+RECORD_EXCLUDE = {
+    "content-encoding", "content-length", "transfer-encoding",
+}
+
+HTTP_CACHE_SIZE = 64 * 1024 * 1024
+HTTP_CACHE_EXCLUDE = {
+    "content-encoding", "content-length", "transfer-encoding",
+    "connection", "keep-alive", "set-cookie", "date",
+}
+
 
 HEADERS_FIREFOX_140 = (
     ("User-Agent", "Mozilla/5.0 ({}; rv:140.0) Gecko/20100101 Firefox/140.0"),
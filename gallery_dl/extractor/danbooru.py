@@ -121,17 +121,43 @@ class DanbooruExtractor(BaseExtractor):
     def posts(self):
         return ()
 
-    def _pagination(self, endpoint, params, prefix=None):
+    def _pagination(self, endpoint, params, prefix=None, checkpoint=True):
         url = self.root + endpoint
         params["limit"] = self.per_page
-        params["page"] = self.page_start
 
-        first = True
+        if checkpoint and (page := self._checkpoint_load()) is not None:
+            params["page"] = page
+            first = False
+        else:
+            params["page"] = self.page_start
+            first = True
+
+        # posts at or below the high-water mark are already archived
+        if prefix == "b" and checkpoint:
+            mark = self._watermark_load()
+        else:
+            mark = None
+
+        pages = self._pagination_pages(url, params, prefix, first, mark)
+        for posts, page in self._prefetch(pages):
+            yield from posts
+            if checkpoint and page is not None:
+                self._checkpoint_store(page)
+
+    def _pagination_pages(self, url, params, prefix, first, mark):
+        """Yield lists of posts and the 'page' value of the next one"""
         while True:
+            done = False
             posts = self.request_json(url, params=params)
             if isinstance(posts, dict):
                 posts = posts["posts"]
 
+            if prefix == "b" and posts:
+                self._watermark_update(posts[0]["id"])
+                if mark is not None and posts[-1]["id"] <= mark:
+                    posts = [post for post in posts if post["id"] > mark]
+                    done = True
+
             if posts:
                 if self.includes:
                     params_meta = {
@@ -149,9 +175,8 @@ class DanbooruExtractor(BaseExtractor):
                 if prefix == "a" and not first:
                     posts.reverse()
 
-                yield from posts
-
-            if len(posts) < self.threshold:
+            if done or len(posts) < self.threshold:
+                yield posts, None
                 return
 
             if prefix:
@@ -162,6 +187,8 @@ class DanbooruExtractor(BaseExtractor):
                 params["page"] = 2
             first = False
 
+            yield posts, params["page"]
+
     def _ugoira_frames(self, post):
         data = self.request_json(
             f"{self.root}/posts/{post['id']}.json?only=media_metadata"
@@ -195,7 +222,9 @@ class DanbooruExtractor(BaseExtractor):
             params = {"tags": f"{ctype}:{cid}"}
             reverse = True
 
-        posts = self._pagination("/posts.json", params, prefix)
+        # no checkpoints when collecting all posts before returning them
+        posts = self._pagination(
+            "/posts.json", params, prefix, checkpoint=not reverse)
         if reverse:
             self.log.info("Collecting posts of %s %s", ctype, cid)
             return self._collection_enumerate_reverse(posts)
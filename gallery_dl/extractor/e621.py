@@ -109,7 +109,8 @@ class E621PoolExtractor(E621Extractor, danbooru.DanbooruPoolExtractor):
         id_to_post = {
             post["id"]: post
             for post in self._pagination(
-                "/posts.json", {"tags": "pool:" + self.pool_id})
+                "/posts.json", {"tags": "pool:" + self.pool_id},
+                checkpoint=False)
         }
 
         posts = []
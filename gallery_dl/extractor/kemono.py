@@ -39,6 +39,7 @@ class KemonoExtractor(Extractor):
     def _init(self):
         self.api = KemonoAPI(self)
         self.revisions = self.config("revisions")
+        self.comments = True if self.config("comments") else False
         if self.revisions:
             self.revisions_unique = (self.revisions == "unique")
         order = self.config("order-revisions")
@@ -56,7 +57,6 @@ class KemonoExtractor(Extractor):
         generators = self._build_file_generators(self.config("files"))
         announcements = True if self.config("announcements") else None
         archives = True if self.config("archives") else False
-        comments = True if self.config("comments") else False
         dms = True if self.config("dms") else None
         max_posts = self.config("max-posts")
         creator_info = {} if self.config("metadata", True) else None
@@ -78,8 +78,9 @@ class KemonoExtractor(Extractor):
         posts = self.posts()
         if max_posts:
             posts = itertools.islice(posts, max_posts)
-        if self.revisions:
-            posts = self._revisions(posts)
+        if self.revisions or self.comments:
+            posts = itertools.chain.from_iterable(self._map_threaded(
+                self._enrich, posts, self.config("metadata-workers", 4)))
 
         for post in posts:
             headers["Referer"] = (f"{self.root}/{post['service']}/user/"
@@ -106,12 +107,6 @@ class KemonoExtractor(Extractor):
                 post["user_profile"] = creator
                 post["username"] = creator["name"]
 
-            if comments:
-                post["comments"] = cmts = self.api.creator_post_comments(
-                    service, creator_id, post["id"])
-                if not isinstance(cmts, list):
-                    self.log.debug("%s/%s: %s", creator_id, post["id"], cmts)
-                    post["comments"] = ()
             if dms is not None:
                 if dms is True:
                     dms = self.api.creator_dms(
@@ -246,9 +241,20 @@ class KemonoExtractor(Extractor):
             date_string = date_string[:19]
         return self.parse_datetime_iso(date_string)
 
-    def _revisions(self, posts):
-        return itertools.chain.from_iterable(
-            self._revisions_post(post) for post in posts)
+    def _enrich(self, post):
+        """Return a post's revisions with their comments"""
+        posts = self._revisions_post(post) if self.revisions else (post,)
+
+        if self.comments:
+            comments = self.api.creator_post_comments(
+                post["service"], post["user"], post["id"])
+            if not isinstance(comments, list):
+                self.log.debug("%s/%s: %s", post["user"], post["id"], comments)
+                comments = ()
+            for rev in posts:
+                rev["comments"] = comments
+
+        return posts
 
     def _revisions_post(self, post):
         post["revision_id"] = 0
@@ -673,6 +679,11 @@ class KemonoAPI():
             encoding="utf-8", fatal=fatal)
 
     def _pagination(self, endpoint, params, batch=50, key=None):
+        for data in self.extractor._prefetch(
+                self._pagination_pages(endpoint, params, batch, key)):
+            yield from data
+
+    def _pagination_pages(self, endpoint, params, batch, key):
         offset = text.parse_int(params.get("o"))
         params["o"] = offset - offset % batch
 
@@ -683,7 +694,7 @@ class KemonoAPI():
                 data = data.get(key)
             if not data:
                 return
-            yield from data
+            yield data
 
             if len(data) < batch:
                 return
@@ -637,10 +637,13 @@ class TwitterExtractor(Extractor):
             self._update_cursor = util.identity
         elif isinstance(cursor, str):
             return cursor
+        else:
+            return self._checkpoint_load()
 
     def _update_cursor(self, cursor):
         self.log.debug("Cursor: %s", cursor)
         self._cursor = cursor
+        self._checkpoint_store(cursor)
         return cursor
 
     def metadata(self):
@@ -763,6 +766,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
             self.log.debug("Cursor: %s", self._cursor)
         else:
             self._cursor = None
+        self._checkpoint_store(self._cursor)
         return cursor
 
     def tweets(self):
@@ -773,6 +777,8 @@ class TwitterTimelineExtractor(TwitterExtractor):
             self._update_cursor = util.identity
         elif isinstance(cursor, str):
             self._cursor = cursor
+        elif cursor := self._checkpoint_load():
+            self._cursor = cursor
         else:
             cursor = None
 
@@ -807,6 +813,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
             self._cursor_prefix = f"2_{tweet_id}/"
             if reset:
                 self._cursor = self._cursor_prefix
+                self._checkpoint_store(self._cursor)
 
             if not self.textonly:
                 # try to search for media-only tweets
@@ -823,6 +830,7 @@ class TwitterTimelineExtractor(TwitterExtractor):
             self._cursor_prefix = f"3_{tweet_id}/"
             if reset:
                 self._cursor = self._cursor_prefix
+                self._checkpoint_store(self._cursor)
 
             yield from self.api.search_timeline(query)
             return self._update_cursor(None)
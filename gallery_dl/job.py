@@ -7,9 +7,11 @@
 # published by the Free Software Foundation.
 
 import sys
+import copy
 import errno
 import logging
 import functools
+import threading
 import collections
 
 from . import (
@@ -157,6 +159,7 @@ class Job():
         try:
             msg = self.dispatch(extractor)
         except exception.StopExtraction as exc:
+            self.handle_complete(exc)
             if exc.depth > 1 and exc.target != extractor.__class__.subcategory:
                 exc.depth -= 1
                 raise
@@ -191,6 +194,7 @@ class Job():
             self.status |= 1
             raise
         else:
+            self.handle_complete()
             if msg is None:
                 log.info("No results for %s", extractor.url)
         finally:
@@ -255,6 +259,13 @@ class Job():
     def handle_finalize(self):
         """Handle job finalization"""
 
+    def handle_complete(self, stop=None):
+        """Handle successful completion of an extractor run
+
+        'stop' is the StopExtraction exception that ended it early, if any
+        """
+        self.extractor._checkpoint_clear()
+
     def update_kwdict(self, kwdict):
         """Update 'kwdict' with additional metadata"""
         extr = self.extractor
@@ -329,6 +340,17 @@ class DownloadJob(Job):
         self.visited = parent.visited if parent else set()
         self._extractor_filter = None
         self._skipcnt = 0
+        self._skipexc = None
+        self._pending = None
+        self._executor = None
+        self._pp_pending = None
+        self._pp_executor = None
+        self._archive_init = True
+
+        extr = self.extractor
+        extr._checkpoint_sync = self._drain
+        if extr.config("archive-watermark"):
+            extr._watermark = self._watermark_archive
 
     def handle_url(self, url, kwdict):
         """Download the resource specified in 'url'"""
@@ -370,6 +392,26 @@ class DownloadJob(Job):
         if self.sleep is not None:
             self.extractor.sleep(self.sleep(), "download")
 
+        if self._pending is not None:
+            if archive is not None and \
+                    kwdict.get(archive._cache_key) in self._download_keys:
+                # same archive entry as a pending download
+                self._download_drain()
+                if archive.check(kwdict):
+                    self.handle_skip()
+                    return
+            if self._download_submit(url, kwdict):
+                return
+            # keep file order for anything that
+            # can not be downloaded in the background
+            self._download_drain()
+
+            if pathfmt.temppath and pathfmt.exists():
+                if archive is not None and self._archive_write_skip:
+                    archive.add(kwdict)
+                self.handle_skip()
+                return
+
         # download from URL
         if not self.download(url):
 
@@ -390,12 +432,25 @@ class DownloadJob(Job):
                         callback(pathfmt)
                 return
 
+        self._handle_download(kwdict)
+
+    def _handle_download(self, kwdict):
+        """Process a successfully downloaded file"""
+        hooks = self.hooks
+        pathfmt = self.pathfmt
+        archive = self.archive
+
         if not pathfmt.temppath:
             if archive is not None and self._archive_write_skip:
                 archive.add(kwdict)
             self.handle_skip()
             return
 
+        if self._pp_pending is not None:
+            self._skipcnt = 0
+            self._postprocess_submit(pathfmt)
+            return
+
         # run post processors
         if "file" in hooks:
             for callback in hooks["file"]:
@@ -419,6 +474,7 @@ class DownloadJob(Job):
             self.initialize(kwdict)
         else:
             if "post-after" in self.hooks:
+                self._drain()
                 for callback in self.hooks["post-after"]:
                     callback(self.pathfmt)
             if FLAGS.POST is not None:
@@ -433,6 +489,11 @@ class DownloadJob(Job):
             return
         self.visited.add(url)
 
+        if self._pending:
+            self._download_drain()
+        if self._pp_pending:
+            self._postprocess_drain()
+
         if cls := kwdict.get("_extractor"):
             extr = cls.from_url(url)
         else:
@@ -501,6 +562,22 @@ class DownloadJob(Job):
             self._write_unsupported(url)
 
     def handle_finalize(self):
+        if self._executor is not None:
+            try:
+                self._download_drain()
+            except exception.ControlException:
+                pass
+            finally:
+                self._executor.shutdown()
+                self._executor = self._pending = None
+
+        if self._pp_executor is not None:
+            try:
+                self._postprocess_drain()
+            finally:
+                self._pp_executor.shutdown()
+                self._pp_executor = self._pp_pending = None
+
         if self.archive:
             if not self.status:
                 self.archive.finalize()
@@ -527,6 +604,13 @@ class DownloadJob(Job):
                     callback(pathfmt)
 
     def handle_skip(self):
+        if self._pending:
+            # delay until all previous downloads are done
+            pathfmt = copy.copy(self.pathfmt)
+            pathfmt.kwdict = pathfmt.kwdict.copy()
+            self._pending.append((None, pathfmt, None))
+            return
+
         pathfmt = self.pathfmt
         if "skip" in self.hooks:
             for callback in self.hooks["skip"]:
@@ -552,6 +636,200 @@ class DownloadJob(Job):
         self._write_unsupported(url)
         return False
 
+    def _download_submit(self, url, kwdict):
+        """Start downloading 'url' in a background thread"""
+        pathfmt = self.pathfmt
+        if not pathfmt.temppath or \
+                not url.startswith(("https:", "http:")) or \
+                pathfmt.temppath in self._download_paths:
+            return False
+
+        urls = [url]
+        if self.fallback and (fallback := kwdict.get("_fallback")):
+            if not isinstance(fallback, (list, tuple)):
+                return False
+            for url in fallback:
+                if not isinstance(url, str) or \
+                        not url.startswith(("https:", "http:")):
+                    return False
+                urls.append(url)
+
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(
+                self._concurrency, "download")
+            self._local = threading.local()
+
+        # use independent copies, since extractors
+        # might modify or reuse their 'kwdict' objects
+        path = pathfmt.temppath
+        pathfmt = copy.copy(pathfmt)
+        pathfmt.kwdict = kwdict.copy()
+        self._download_paths.add(path)
+        if self.archive is not None:
+            self._download_keys.add(kwdict.get(self.archive._cache_key))
+        self._pending.append((self._executor.submit(
+            self._download_worker, urls, pathfmt), pathfmt, path))
+
+        self._download_collect(len(self._pending) > self._concurrency * 2)
+        return True
+
+    def _download_worker(self, urls, pathfmt):
+        """Download one of 'urls' to 'pathfmt'"""
+        try:
+            dl = self._local.downloader
+        except AttributeError:
+            dl = self._local.downloader = downloader.find("http")(self)
+            # progress indicators would get mixed up
+            dl.out = output.NullOutput()
+
+        for num, url in enumerate(urls):
+            if num:
+                util.remove_file(pathfmt.temppath)
+                self.log.info("Trying fallback URL #%d", num)
+            try:
+                if dl.download(url, pathfmt):
+                    return url
+            except OSError as exc:
+                if exc.errno == errno.ENOSPC:
+                    raise
+                self.log.warning("%s: %s", exc.__class__.__name__, exc)
+        return None
+
+    def _download_collect(self, block=False):
+        """Process finished background downloads in submission order"""
+        pending = self._pending
+        pathfmt_orig = self.pathfmt
+        stop = None
+
+        # handle results like regular downloads;
+        # don't delay skips while processing them
+        self._pending = None
+        try:
+            while pending:
+                future, pathfmt, path = pending[0]
+                if future is not None and not block and not future.done():
+                    break
+                pending.popleft()
+                block = stop is not None
+                self.pathfmt = pathfmt
+
+                if future is None:
+                    try:
+                        self.handle_skip()
+                    except (exception.ControlException, SystemExit) as exc:
+                        if stop is None:
+                            # finish downloads that have already started
+                            # before stopping, cancel all others
+                            stop = exc
+                            block = True
+                            for future, _, _ in pending:
+                                if future is not None:
+                                    future.cancel()
+                    continue
+
+                self._download_paths.discard(path)
+                if self.archive is not None:
+                    self._download_keys.discard(
+                        pathfmt.kwdict.get(self.archive._cache_key))
+                if future.cancelled():
+                    continue
+                if future.result():
+                    self._handle_download(pathfmt.kwdict)
+                else:
+                    self.status |= 4
+                    self.log.error("Failed to download %s", pathfmt.filename)
+                    if "error" in self.hooks:
+                        for callback in self.hooks["error"]:
+                            callback(pathfmt)
+        finally:
+            self._pending = pending
+            self.pathfmt = pathfmt_orig
+
+        if stop is not None:
+            raise stop
+
+    def _download_drain(self):
+        """Wait for and process all pending background downloads"""
+        while self._pending:
+            self._download_collect(True)
+
+    def _drain(self):
+        """Finish processing all files handed to background threads"""
+        if self._pending:
+            self._download_drain()
+        if self._pp_pending:
+            self._postprocess_drain()
+
+    def _postprocess_submit(self, pathfmt):
+        """Run 'file' and 'after' hooks in a background thread"""
+        if self._pp_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pp_executor = ThreadPoolExecutor(
+                self._pp_workers, "postprocessor")
+
+        # hand the current 'pathfmt' object itself to the background thread,
+        # since post processors might use it to associate data with a file,
+        # and continue with an independent copy
+        pathfmt.kwdict = pathfmt.kwdict.copy()
+        self.pathfmt = copy.copy(pathfmt)
+        self._pp_pending.append((self._pp_executor.submit(
+            self._postprocess_worker, pathfmt), pathfmt))
+
+        self._postprocess_collect(
+            len(self._pp_pending) > self._pp_workers * 2)
+
+    def _postprocess_worker(self, pathfmt):
+        """Run 'file' hooks, move the file into place, run 'after' hooks
+
+        Returns the exception raised by an 'after' hook instead of raising it,
+        since the file itself has been stored at that point.
+        """
+        hooks = self.hooks
+        if "file" in hooks:
+            for callback in hooks["file"]:
+                callback(pathfmt)
+
+        pathfmt.finalize()
+
+        if "after" in hooks:
+            try:
+                for callback in hooks["after"]:
+                    callback(pathfmt)
+            except Exception as exc:
+                return exc
+
+    def _postprocess_collect(self, block=False):
+        """Process finished background post processing in submission order"""
+        pending = self._pp_pending
+        archive = self.archive
+
+        while pending:
+            future, pathfmt = pending[0]
+            if not block and not future.done():
+                break
+            pending.popleft()
+            block = False
+
+            exc = future.result()
+            self.out.success(pathfmt.path)
+            if archive is not None and self._archive_write_file:
+                archive.add(pathfmt.kwdict)
+            if exc is not None:
+                raise exc
+            if archive is not None and self._archive_write_after:
+                archive.add(pathfmt.kwdict)
+
+    def _postprocess_drain(self):
+        """Wait for and process all pending background post processing"""
+        while self._pp_pending:
+            try:
+                self._postprocess_collect(True)
+            except Exception as exc:
+                self.log.error("%s: %s", exc.__class__.__name__, exc)
+                self.log.traceback(exc)
+                self.status |= 1
+
     def get_downloader(self, scheme):
         """Return a downloader suitable for 'scheme'"""
         try:
@@ -586,45 +864,17 @@ class DownloadJob(Job):
         if not cfg("download", True):
             # monkey-patch method to do nothing and always return True
             self.download = pathfmt.fix_extension
-
-        if archive_path := cfg("archive"):
-            archive_table = cfg("archive-table")
-            archive_prefix = cfg("archive-prefix")
-            if archive_prefix is None:
-                archive_prefix = extr.category if archive_table is None else ""
-
-            archive_format = cfg("archive-format")
-            if archive_format is None:
-                archive_format = extr.archive_fmt
-
-            try:
-                self.archive = archive.connect(
-                    archive_path,
-                    archive_prefix,
-                    archive_format,
-                    archive_table,
-                    cfg("archive-mode"),
-                    cfg("archive-pragma"),
-                    kwdict,
-                )
-            except Exception as exc:
-                extr.log.warning(
-                    "Failed to open download archive at '%s' (%s: %s)",
-                    archive_path, exc.__class__.__name__, exc)
-            else:
-                extr.log.debug("Using download archive '%s'", archive_path)
-
-                events = cfg("archive-event")
-                if events is None:
-                    self._archive_write_file = True
-                    self._archive_write_skip = False
-                    self._archive_write_after = False
-                else:
-                    if isinstance(events, str):
-                        events = events.split(",")
-                    self._archive_write_file = ("file" in events)
-                    self._archive_write_skip = ("skip" in events)
-                    self._archive_write_after = ("after" in events)
+        elif config.get(("downloader", "http"), "enabled", True) and \
+                (dl := self.get_downloader("http")):
+            concurrency = dl.config("concurrency", 1)
+            if concurrency and concurrency > 1:
+                self._concurrency = concurrency
+                self._download_paths = set()
+                self._download_keys = set()
+                self._pending = collections.deque()
+
+        if self._archive_init:
+            self._init_archive(kwdict)
 
         if skip := cfg("skip", True):
             self._skipexc = None
@@ -719,13 +969,120 @@ class DownloadJob(Job):
                                  name, exc.__class__.__name__, exc)
                 else:
                     pp_list.append(pp_obj)
+                    if pp_obj.sequential and self._pending is not None:
+                        pp_log.debug("Disabling concurrent downloads for "
+                                     "'%s'", name)
+                        self._pending = None
 
             if pp_list:
                 extr.log.debug("Active postprocessor modules: %s", pp_list)
+
+                if workers := cfg("postprocessor-workers"):
+                    if blocking := [pp for pp in pp_list
+                                    if not pp.deferrable]:
+                        pp_log.debug("Disabling background post processing "
+                                     "for %s", blocking)
+                    else:
+                        self._pp_workers = workers
+                        self._pp_pending = collections.deque()
+
                 if "init" in self.hooks:
                     for callback in self.hooks["init"]:
                         callback(pathfmt)
 
+    def _init_archive(self, kwdict=None):
+        """Open the download archive"""
+        self._archive_init = False
+        extr = self.extractor
+        cfg = extr.config
+
+        if archive_path := cfg("archive"):
+            archive_table = cfg("archive-table")
+            archive_prefix = cfg("archive-prefix")
+            if archive_prefix is None:
+                archive_prefix = extr.category if archive_table is None else ""
+
+            archive_format = cfg("archive-format")
+            if archive_format is None:
+                archive_format = extr.archive_fmt
+
+            try:
+                self.archive = archive.connect(
+                    archive_path,
+                    archive_prefix,
+                    archive_format,
+                    archive_table,
+                    cfg("archive-mode"),
+                    cfg("archive-pragma"),
+                    kwdict,
+                    filter=cfg("archive-filter"),
+                )
+            except Exception as exc:
+                extr.log.warning(
+                    "Failed to open download archive at '%s' (%s: %s)",
+                    archive_path, exc.__class__.__name__, exc)
+            else:
+                extr.log.debug("Using download archive '%s'", archive_path)
+
+                events = cfg("archive-event")
+                if events is None:
+                    self._archive_write_file = True
+                    self._archive_write_skip = False
+                    self._archive_write_after = False
+                else:
+                    if isinstance(events, str):
+                        events = events.split(",")
+                    self._archive_write_file = ("file" in events)
+                    self._archive_write_skip = ("skip" in events)
+                    self._archive_write_after = ("after" in events)
+
+    def _watermark_archive(self):
+        """Return the download archive for high-water mark lookups"""
+        cfg = self.extractor.config
+        if not cfg("skip", True):
+            return None
+        for target in ("image", "post", "chapter"):
+            if cfg(target + "-range") or cfg(target + "-filter"):
+                # not every item up to the mark gets processed
+                return None
+
+        if self._archive_init:
+            if "{" in (cfg("archive") or "") or \
+                    "{" in (cfg("archive-table") or ""):
+                self.extractor.log.debug(
+                    "'archive-watermark' is not supported for "
+                    "archive paths or tables with replacement fields")
+                return None
+            self._init_archive()
+
+        if (archive := self.archive) is None:
+            return None
+        if not hasattr(archive, "watermark"):
+            self.extractor.log.debug(
+                "'archive-watermark' is not supported by %s",
+                archive.__class__.__name__)
+            return None
+        return archive
+
+    def handle_complete(self, stop=None):
+        Job.handle_complete(self, stop)
+        if self.extractor._watermark_new is None:
+            return
+        if stop is not None and stop is not self._skipexc:
+            # stopped before reaching the previous mark
+            return
+        if self._pending:
+            try:
+                self._download_drain()
+            except exception.ControlException:
+                return
+        if self._pp_pending:
+            self._postprocess_drain()
+        # only record a new high-water mark if nothing failed,
+        # since items below it are not going to be checked again
+        if not self.status:
+            self.extractor._watermark_store()
+
     def register_hooks(self, hooks, options=None):
         expr = options.get("filter") if options else None
 
@@ -755,7 +1112,7 @@ class DownloadJob(Job):
 
 def _call_hook_condition(callback, condition, pathfmt):
     if condition(pathfmt.kwdict):
-        callback(pathfmt)
+        return callback(pathfmt)
 
 
 class SimulationJob(DownloadJob):
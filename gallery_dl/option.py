@@ -282,6 +282,13 @@ def build_parser():
         help="Delete cached login sessions, cookies, etc. for MODULE "
              "(ALL to delete everything)",
     )
+    general.add_argument(
+        "--archive-daemon",
+        dest="archive_daemon", metavar="SOCKET FILE", nargs=2,
+        help=("Run a daemon serving the download archive FILE on Unix "
+              "socket SOCKET. Other processes can use it with "
+              "'--download-archive unix:SOCKET'"),
+    )
     general.add_argument(
         "--compat",
         dest="category-map", nargs=0, action=ConfigConstAction, const="compat",
@@ -338,6 +345,11 @@ def build_parser():
         help=("Download URLs found in FILE. "
               "Delete them after they were downloaded successfully."),
     )
+    input.add_argument(
+        "--jobs",
+        dest="jobs", metavar="N", type=int, default=1,
+        help="Process up to N input URLs concurrently (default: 1)",
+    )
     input.add_argument(
         "--no-input",
         dest="input", nargs=0, action=ConfigConstAction, const=False,
@@ -9,6 +9,7 @@
 """Filesystem path handling"""
 
 import os
+import time
 import shutil
 import functools
 from . import util, formatter, exception
@@ -24,6 +25,7 @@ EXTENSION_MAP = {
 
 
 class PathFormat():
+    _listing_names = None
 
     def __init__(self, extractor):
         config = extractor.config
@@ -118,6 +120,12 @@ class PathFormat():
         if WINDOWS:
             self.extended = config("path-extended", True)
 
+        if scandir := config("skip-scandir"):
+            self.file_exists = self._file_exists_listing
+            self._listing_interval = \
+                60.0 if scandir is True else float(scandir)
+            self._listing_names = self._listing_directory = None
+
         self.basedirectory_conditions = None
         basedir = extractor._parentdir
         if not basedir:
@@ -160,28 +168,70 @@ class PathFormat():
 
     def exists(self):
         """Return True if the file exists on disk"""
-        if self.extension:
-            try:
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
-                return self.check_file()
-            except OSError:
-                pass
+        if self.extension and self.file_exists():
+            return self.check_file()
         return False
 
+    def file_exists(self):
+        """Return True if a file at 'realpath' exists"""
+        try:
+            os.lstat(self.realpath)  # raises OSError if file doesn't exist
+            return True
+        except OSError:
+            return False
+
+    def _file_exists_listing(self):
+        name = self.realpath[len(self.realdirectory):]
+        if os.sep not in name and os.path.normcase(name) in self._listing():
+            return True
+        # not in a possibly outdated listing or differently cased
+        return PathFormat.file_exists(self)
+
+    def _listing(self):
+        """Return the case-normalized names of all entries in 'realdirectory'
+
+        Listings get reused until 'realdirectory' changes
+        or its modification time differs after '_listing_interval' seconds
+        """
+        directory = self.realdirectory
+        now = time.monotonic()
+        if directory == self._listing_directory and \
+                now < self._listing_check:
+            return self._listing_names
+
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            mtime = None
+        if directory != self._listing_directory or \
+                mtime != self._listing_mtime:
+            names = set()
+            if mtime is not None:
+                try:
+                    with os.scandir(directory) as entries:
+                        names.update(
+                            os.path.normcase(entry.name) for entry in entries)
+                except OSError:
+                    pass
+            self._listing_names = names
+            self._listing_directory = directory
+            self._listing_mtime = mtime
+
+        self._listing_check = now + self._listing_interval
+        return self._listing_names
+
     def check_file(self):
         return True
 
     def _enum_file(self):
         num = 1
-        try:
-            while True:
-                prefix = format(num) + "."
-                self.kwdict["extension"] = prefix + self.extension
-                self.build_path()
-                os.lstat(self.realpath)  # raises OSError if file doesn't exist
-                num += 1
-        except OSError:
-            pass
+        while True:
+            prefix = format(num) + "."
+            self.kwdict["extension"] = prefix + self.extension
+            self.build_path()
+            if not self.file_exists():
+                break
+            num += 1
         self.prefix = prefix
         return False
 
@@ -385,6 +435,11 @@ class PathFormat():
                     os.unlink(self.temppath)
                 break
 
+        if self._listing_names is not None and \
+                self._listing_directory == self.realdirectory:
+            self._listing_names.add(os.path.normcase(
+                self.realpath[len(self.realdirectory):]))
+
         self.set_mtime()
 
 
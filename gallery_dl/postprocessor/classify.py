@@ -13,6 +13,7 @@ import os
 
 
 class ClassifyPP(PostProcessor):
+    deferrable = True
 
     DEFAULT_MAPPING = {
         "Pictures" : ("jpg", "jpeg", "png", "gif", "bmp", "svg", "webp",
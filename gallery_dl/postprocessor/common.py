@@ -13,6 +13,10 @@ from .. import archive
 
 class PostProcessor():
     """Base class for postprocessors"""
+    # True if hooks keep state from one file to the next
+    sequential = False
+    # True if 'file' and 'after' hooks can run in a background thread
+    deferrable = False
 
     def __init__(self, job):
         self.name = self.__class__.__name__[:-2].lower()
@@ -54,6 +58,8 @@ class PostProcessor():
             else:
                 self.log.debug(
                     "Using %s archive '%s'", self.name, archive_path)
+                # archive objects are not thread-safe
+                self.deferrable = False
                 return True
 
         self.archive = None
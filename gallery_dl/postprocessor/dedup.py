@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Replace files with identical content by links to a single copy"""
+
+from .common import PostProcessor
+from .. import util
+import threading
+import hashlib
+import atexit
+import weakref
+import sqlite3
+import os
+
+
+class DedupPP(PostProcessor):
+
+    def __init__(self, job, options):
+        PostProcessor.__init__(self, job)
+
+        path = options.get("index")
+        path = util.expand_path(path) if path else ":memory:"
+        self.index = _open(path)
+        self.log.debug("Using index '%s'", path)
+
+        action = options.get("action") or "hardlink"
+        if action == "skip":
+            self._action = self._skip
+        elif action == "reflink":
+            self._action = self._reflink
+        elif action == "symlink":
+            self._action = self._symlink
+        else:
+            self._action = self._hardlink
+
+        self.streams = weakref.WeakKeyDictionary()
+        job.register_hooks({
+            "stream": self.stream,
+            "file"  : self.run,
+        }, options)
+
+    def stream(self, pathfmt):
+        digest = hashlib.new(DIGEST)
+        self.streams[pathfmt] = stream = [0, digest]
+
+        def update(data):
+            stream[0] += len(data)
+            digest.update(data)
+        return update
+
+    def run(self, pathfmt):
+        path = pathfmt.temppath
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+
+        stream = self.streams.pop(pathfmt, None)
+        digest = stream[1].digest() if stream and stream[0] == size else None
+        partial = None
+        realpath = os.path.abspath(pathfmt.realpath)
+
+        # check files with known digests first
+        candidates = self.index.candidates(size)
+        candidates.sort(key=lambda entry: entry[2] is None)
+
+        for other, other_partial, other_digest in candidates:
+            if other == realpath:
+                continue
+
+            try:
+                if other_digest is None:
+                    if other_partial is None:
+                        other_partial = _hash(other, PARTIAL)
+                        self.index.update(other, other_partial, None)
+                    if partial is None:
+                        partial = _hash(path, PARTIAL)
+                    if partial != other_partial:
+                        continue
+                    other_digest = _hash(other)
+                    self.index.update(other, other_partial, other_digest)
+
+                if digest is None:
+                    digest = _hash(path)
+                if digest != other_digest or os.stat(other).st_size != size:
+                    continue
+            except OSError:
+                # file got moved or deleted
+                self.index.remove(other)
+                continue
+
+            self.log.debug("Duplicate of '%s'", other)
+            if self._action(pathfmt, other):
+                return
+
+        self.index.add(realpath, size, partial, digest)
+
+    def _skip(self, pathfmt, other):
+        pathfmt.delete = True
+        return True
+
+    def _hardlink(self, pathfmt, other):
+        return self._link(pathfmt, other, os.link)
+
+    def _symlink(self, pathfmt, other):
+        return self._link(pathfmt, other, os.symlink)
+
+    def _reflink(self, pathfmt, other):
+        return self._link(pathfmt, other, _reflink)
+
+    def _link(self, pathfmt, other, func):
+        # create the link next to the final file
+        # and let PathFormat.finalize() move it into place
+        path = pathfmt.realpath + ".dedup"
+        try:
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            util.remove_file(path)
+            func(other, path)
+        except (OSError, NotImplementedError) as exc:
+            self.log.debug("Unable to link '%s' (%s: %s)",
+                           other, exc.__class__.__name__, exc)
+            util.remove_file(path)
+            return False
+
+        if pathfmt.temppath != pathfmt.realpath:
+            util.remove_file(pathfmt.temppath)
+        pathfmt.temppath = path
+        return True
+
+
+class DedupIndex():
+    """Persistent map of file sizes and content digests to paths"""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(
+            path, timeout=60, check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS files "
+                "(path TEXT PRIMARY KEY, size INTEGER, "
+                "partial BLOB, digest BLOB)")
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS files_size ON files (size)")
+
+    def candidates(self, size):
+        """Return (path, partial, digest) of all files with 'size'"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT path, partial, digest FROM files WHERE size=?",
+                (size,)).fetchall()
+
+    def add(self, path, size, partial, digest):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?,?,?,?)",
+                (path, size, partial, digest))
+
+    def update(self, path, partial, digest):
+        with self.lock, self.db:
+            self.db.execute(
+                "UPDATE files SET partial=?, digest=? WHERE path=?",
+                (partial, digest, path))
+
+    def remove(self, path):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM files WHERE path=?", (path,))
+
+    def close(self):
+        self.db.close()
+
+
+def _open(path):
+    """Return the index at 'path' shared by all jobs of this process"""
+    with _indexes_lock:
+        if (index := _indexes.get(path)) is None:
+            index = _indexes[path] = DedupIndex(path)
+    return index
+
+
+def _close():
+    """Close all open indexes"""
+    with _indexes_lock:
+        for index in _indexes.values():
+            index.close()
+        _indexes.clear()
+
+
+def _hash(path, limit=None):
+    """Return the digest of a file's first 'limit' bytes or all of it"""
+    digest = hashlib.new(DIGEST)
+    with open(path, "rb") as fp:
+        if limit:
+            digest.update(fp.read(limit))
+        else:
+            while data := fp.read(CHUNK_SIZE):
+                digest.update(data)
+    return digest.digest()
+
+
+def _reflink(src, dst):
+    """Create a copy-on-write clone of 'src' at 'dst'"""
+    try:
+        import fcntl
+        FICLONE = 0x40049409
+    except ImportError:
+        raise NotImplementedError("reflinks are not supported")
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+DIGEST = "sha256"
+PARTIAL = 65536
+CHUNK_SIZE = 1048576
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+atexit.register(_close)
+
+__postprocessor__ = DedupPP
@@ -11,6 +11,9 @@
 from .common import PostProcessor
 from .. import util, formatter
 import subprocess
+import collections
+import functools
+import threading
 import os
 
 
@@ -27,6 +30,8 @@ def trim(args):
 
 
 class ExecPP(PostProcessor):
+    deferrable = True
+    procs = None
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -36,8 +41,17 @@ class ExecPP(PostProcessor):
             execute = self.exec_many
         else:
             execute, self.args = self._prepare_cmd(options["command"])
-            if options.get("async", False):
-                self._exec = self._popen
+
+        if options.get("async", False):
+            if cmds:
+                execute = self.exec_many_async
+            else:
+                self._run = self._run_async
+            self.procs = collections.deque()
+            self.procs_lock = threading.Lock()
+            self.procs_max = options.get("max-processes")
+            if self.procs_max is None:
+                self.procs_max = os.cpu_count() or 1
 
         self.verbose = options.get("verbose", True)
         self.session = False
@@ -55,6 +69,10 @@ class ExecPP(PostProcessor):
             events = events.split(",")
         job.register_hooks({event: execute for event in events}, options)
 
+        # wait for asynchronous processes before closing the archive
+        if self.procs is not None:
+            job.register_hooks({"finalize": self._finalize_async})
+
         if self._archive_init(job, options):
             self._archive_register(job)
 
@@ -66,38 +84,21 @@ class ExecPP(PostProcessor):
         else:
             return self.exec_list, [formatter.parse(arg) for arg in cmd]
 
-    def exec_list(self, pathfmt):
+    def exec_list(self, pathfmt, args=None):
         archive = self.archive
-        kwdict = pathfmt.kwdict
-
-        if archive and archive.check(kwdict):
+        if archive and archive.check(pathfmt.kwdict):
             return
 
-        kwdict["_directory"] = pathfmt.realdirectory
-        kwdict["_filename"] = pathfmt.filename
-        kwdict["_temppath"] = pathfmt.temppath
-        kwdict["_path"] = pathfmt.realpath
-
-        args = [arg.format_map(kwdict) for arg in self.args]
-        args[0] = os.path.expanduser(args[0])
-        retcode = self._exec(args, False)
+        args = self._args_list(pathfmt, args or self.args)
+        return self._run(args, False, pathfmt.kwdict)
 
-        if archive:
-            archive.add(kwdict)
-        return retcode
-
-    def exec_string(self, pathfmt):
+    def exec_string(self, pathfmt, args=None):
         archive = self.archive
         if archive and archive.check(pathfmt.kwdict):
             return
 
-        self.pathfmt = pathfmt
-        args = self._sub(self._replace, self.args)
-        retcode = self._exec(args, True)
-
-        if archive:
-            archive.add(pathfmt.kwdict)
-        return retcode
+        args = self._args_string(pathfmt, args or self.args)
+        return self._run(args, True, pathfmt.kwdict)
 
     def exec_many(self, pathfmt):
         if archive := self.archive:
@@ -107,8 +108,7 @@ class ExecPP(PostProcessor):
 
         retcode = 0
         for execute, args in self.cmds:
-            self.args = args
-            if retcode := execute(pathfmt):
+            if retcode := execute(pathfmt, args):
                 # non-zero exit status
                 break
 
@@ -117,8 +117,103 @@ class ExecPP(PostProcessor):
             archive.add(pathfmt.kwdict)
         return retcode
 
+    def exec_many_async(self, pathfmt):
+        archive = self.archive
+        if archive and archive.check(pathfmt.kwdict):
+            return
+
+        cmds = collections.deque(
+            (self._args_string(pathfmt, args), True)
+            if isinstance(args, str) else
+            (self._args_list(pathfmt, args), False)
+            for _, args in self.cmds
+        )
+        self._submit(cmds, pathfmt.kwdict)
+
+    def _args_list(self, pathfmt, args):
+        kwdict = pathfmt.kwdict
+        kwdict["_directory"] = pathfmt.realdirectory
+        kwdict["_filename"] = pathfmt.filename
+        kwdict["_temppath"] = pathfmt.temppath
+        kwdict["_path"] = pathfmt.realpath
+
+        args = [arg.format_map(kwdict) for arg in args]
+        args[0] = os.path.expanduser(args[0])
+        return args
+
+    def _args_string(self, pathfmt, args):
+        return self._sub(functools.partial(self._replace, pathfmt), args)
+
+    def _run(self, args, shell, kwdict):
+        retcode = self._exec(args, shell)
+        if self.archive:
+            self.archive.add(kwdict)
+        return retcode
+
+    def _run_async(self, args, shell, kwdict):
+        self._submit(collections.deque(((args, shell),)), kwdict)
+
+    def _submit(self, cmds, kwdict):
+        """Run 'cmds' one after another in the background"""
+        with self.procs_lock:
+            if self.procs_max:
+                self._reap(self.procs_max - 1)
+            else:
+                self._reap()
+            args, shell = cmds.popleft()
+            self.procs.append(Chain(
+                self._popen(args, shell), args, cmds,
+                kwdict.copy() if self.archive else None))
+
+    def _finalize_async(self, _):
+        with self.procs_lock:
+            self._reap(0)
+
+    def _reap(self, limit=None):
+        """Collect all finished command chains
+
+        Wait for the oldest ones while more than 'limit' are still running.
+        """
+        running = collections.deque()
+        for chain in self.procs:
+            if self._advance(chain):
+                self._collect(chain)
+            else:
+                running.append(chain)
+
+        if limit is not None:
+            while len(running) > limit:
+                chain = running.popleft()
+                self._advance(chain, True)
+                self._collect(chain)
+        self.procs = running
+
+    def _collect(self, chain):
+        if not chain.retcode and chain.kwdict is not None:
+            self.archive.add(chain.kwdict)
+
+    def _advance(self, chain, block=False):
+        """Start the next command of 'chain' after its current one succeeded
+
+        Return True when all of its commands are done
+        or one of them returned a non-zero exit status.
+        """
+        while chain.retcode is None:
+            if not block and chain.proc.poll() is None:
+                return False
+            retcode = self._check(chain.args, chain.proc.wait())
+            if retcode or not chain.cmds:
+                chain.retcode = retcode
+                break
+            chain.args, shell = chain.cmds.popleft()
+            chain.proc = self._popen(chain.args, shell)
+        return True
+
     def _exec(self, args, shell):
-        if retcode := self._popen(args, shell).wait():
+        return self._check(args, self._popen(args, shell).wait())
+
+    def _check(self, args, retcode):
+        if retcode:
             self.log.warning("'%s' returned with non-zero exit status (%d)",
                              args if self.verbose else trim(args), retcode)
         return retcode
@@ -132,15 +227,27 @@ class ExecPP(PostProcessor):
             start_new_session=self.session,
         )
 
-    def _replace(self, match):
+    def _replace(self, pathfmt, match):
         name = match[1]
         if name == "_directory":
-            return quote(self.pathfmt.realdirectory)
+            return quote(pathfmt.realdirectory)
         if name == "_filename":
-            return quote(self.pathfmt.filename)
+            return quote(pathfmt.filename)
         if name == "_temppath":
-            return quote(self.pathfmt.temppath)
-        return quote(self.pathfmt.realpath)
+            return quote(pathfmt.temppath)
+        return quote(pathfmt.realpath)
+
+
+class Chain():
+    """Command chain for one file, running in the background"""
+    __slots__ = ("proc", "args", "cmds", "kwdict", "retcode")
+
+    def __init__(self, proc, args, cmds, kwdict):
+        self.proc = proc
+        self.args = args
+        self.cmds = cmds
+        self.kwdict = kwdict
+        self.retcode = None
 
 
 __postprocessor__ = ExecPP
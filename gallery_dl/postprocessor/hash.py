@@ -10,9 +10,12 @@
 
 from .common import PostProcessor
 import hashlib
+import weakref
+import os
 
 
 class HashPP(PostProcessor):
+    deferrable = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -40,12 +43,48 @@ class HashPP(PostProcessor):
             events = events.split(",")
         job.register_hooks({event: self.run for event in events}, options)
 
+        # compute digests while downloading
+        if options.get("stream", True) and \
+                ("file" in events or "after" in events):
+            self.streams = weakref.WeakKeyDictionary()
+            job.register_hooks({"stream": self.stream}, options)
+        else:
+            self.streams = None
+
     def run(self, pathfmt):
-        hashes = [
+        if self.streams is not None and \
+                (stream := self.streams.pop(pathfmt, None)) and \
+                stream[0] == self._size(pathfmt):
+            # digests computed while downloading
+            hashes = stream[1]
+        else:
+            hashes = self._hash_file(pathfmt)
+
+        for key, h in hashes:
+            pathfmt.kwdict[key] = h.hexdigest()
+
+        if self.filename:
+            pathfmt.build_path()
+
+    def stream(self, pathfmt):
+        hashes = self._hashes()
+        self.streams[pathfmt] = stream = [0, hashes]
+
+        def update(data):
+            stream[0] += len(data)
+            for _, h in hashes:
+                h.update(data)
+        return update
+
+    def _hashes(self):
+        return [
             (key, hashlib.new(name))
             for key, name in self.hashes
         ]
 
+    def _hash_file(self, pathfmt):
+        hashes = self._hashes()
+
         size = self.chunk_size
         with self._open(pathfmt) as fp:
             while True:
@@ -55,11 +94,16 @@ class HashPP(PostProcessor):
                 for _, h in hashes:
                     h.update(data)
 
-        for key, h in hashes:
-            pathfmt.kwdict[key] = h.hexdigest()
+        return hashes
 
-        if self.filename:
-            pathfmt.build_path()
+    def _size(self, pathfmt):
+        try:
+            return os.stat(pathfmt.temppath).st_size
+        except OSError:
+            try:
+                return os.stat(pathfmt.realpath).st_size
+            except OSError:
+                return -1
 
     def _open(self, pathfmt):
         try:
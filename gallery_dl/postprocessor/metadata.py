@@ -10,12 +10,16 @@
 
 from .common import PostProcessor
 from .. import util, formatter
+import threading
+import sqlite3
 import json
+import time
 import sys
 import os
 
 
 class MetadataPP(PostProcessor):
+    deferrable = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -24,6 +28,7 @@ class MetadataPP(PostProcessor):
         cfmt = options.get("content-format") or options.get("format")
         omode = "w"
         filename = None
+        persistent = False
 
         if mode == "tags":
             self.write = self._write_tags
@@ -59,6 +64,23 @@ class MetadataPP(PostProcessor):
             self._json_encode = self._make_encoder(options).encode
             omode = "a"
             filename = "data.jsonl"
+            persistent = True
+        elif mode == "sqlite":
+            self.write = self._write_json
+            self._write_persistent = self._write_sqlite
+            self._json_encode = self._make_encoder(options).encode
+            self._open = self._open_sqlite
+            self._flush = self._flush_sqlite
+            extr = job.extractor
+            if extr.archive_fmt:
+                self._keygen = formatter.parse(
+                    extr.category + extr.archive_fmt).format_map
+            else:
+                # without an archive format, neither '_archive_key'
+                # nor 'category' + format are unique per file
+                self._keygen = None
+            filename = "metadata.sqlite3"
+            persistent = True
         else:
             self.write = self._write_json
             self._json_encode = self._make_encoder(options, 4).encode
@@ -93,6 +115,9 @@ class MetadataPP(PostProcessor):
         extfmt = options.get("extension-format")
         if filename:
             if filename == "-":
+                if mode == "sqlite":
+                    self.log.warning("Unable to write SQLite data to stdout. "
+                                     "Using 'jsonl' output instead.")
                 self.run = self._run_stdout
             else:
                 self._filename = self._filename_custom
@@ -108,7 +133,17 @@ class MetadataPP(PostProcessor):
             events = ("file",)
         elif isinstance(events, str):
             events = events.split(",")
+        if persistent := (persistent and filename != "-"):
+            # keep files open instead of reopening them for each write
+            self.run = self._run_persistent
+            self._handles = {}
+            self._paths = {}
+            self._lock = threading.Lock()
+            self._flush_interval = options.get("flush-interval", 10.0)
+            self._flush_time = time.monotonic() + self._flush_interval
         job.register_hooks({event: self.run for event in events}, options)
+        if persistent:
+            job.register_hooks({"finalize": self._close})
 
         if self._archive_init(job, options, "_MD_"):
             self._archive_register(job)
@@ -121,20 +156,19 @@ class MetadataPP(PostProcessor):
         self.skip = options.get("skip", False)
         self.meta_path = options.get("metadata-path")
 
-    def open(self, path):
-        return open(path, self.omode,
+    def open(self, path, omode=None):
+        return open(path, omode or self.omode,
                     encoding=self.encoding,
                     newline=self.newline)
 
+    _open = open
+
     def run(self, pathfmt):
         archive = self.archive
         if archive and archive.check(pathfmt.kwdict):
             return
 
-        if util.WINDOWS and pathfmt.extended:
-            directory = pathfmt._extended_path(self._directory(pathfmt))
-        else:
-            directory = self._directory(pathfmt)
+        directory = self._directory_real(pathfmt)
         path = directory + self._filename(pathfmt)
 
         if self.meta_path is not None:
@@ -157,6 +191,64 @@ class MetadataPP(PostProcessor):
         if self.mtime:
             pathfmt.set_mtime(path)
 
+    def _run_persistent(self, pathfmt):
+        archive = self.archive
+        if archive and archive.check(pathfmt.kwdict):
+            return
+
+        directory = self._directory_real(pathfmt)
+        path = directory + self._filename(pathfmt)
+
+        if self.meta_path is not None:
+            pathfmt.kwdict[self.meta_path] = path
+
+        with self._lock:
+            handles = self._handles
+            if (fp := handles.get(path)) is None:
+                if (omode := self._paths.get(path)) is None:
+                    if self.skip and os.path.exists(path):
+                        omode = self._paths[path] = False
+                    else:
+                        omode = self.omode
+                        self._paths[path] = "a"
+                if not omode:
+                    return
+                if len(handles) >= HANDLES_MAX:
+                    # close the least recently opened file
+                    self._flush(handles.pop(next(iter(handles)))).close()
+                os.makedirs(directory, exist_ok=True)
+                fp = handles[path] = self._open(path, omode)
+
+            self._write_persistent(fp, pathfmt)
+
+            if (now := time.monotonic()) >= self._flush_time:
+                self._flush_time = now + self._flush_interval
+                for fp in handles.values():
+                    self._flush(fp)
+
+        if archive:
+            archive.add(pathfmt.kwdict)
+
+    def _close(self, _):
+        with self._lock:
+            for fp in self._handles.values():
+                self._flush(fp).close()
+            self._handles.clear()
+
+    def _open_sqlite(self, path, omode):
+        db = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        db.execute("CREATE TABLE IF NOT EXISTS metadata "
+                   "(key TEXT PRIMARY KEY, data TEXT)")
+        return db
+
+    def _flush(self, fp):
+        fp.flush()
+        return fp
+
+    def _flush_sqlite(self, db):
+        db.commit()
+        return db
+
     def _run_stdout(self, pathfmt):
         self.write(sys.stdout, pathfmt.kwdict)
 
@@ -188,6 +280,11 @@ class MetadataPP(PostProcessor):
     def _directory(self, pathfmt):
         return self._base(pathfmt)
 
+    def _directory_real(self, pathfmt):
+        if util.WINDOWS and pathfmt.extended:
+            return pathfmt._extended_path(self._directory(pathfmt))
+        return self._directory(pathfmt)
+
     def _directory_custom(self, pathfmt):
         return os.path.join(self._base(pathfmt), self._metadir)
 
@@ -258,6 +355,20 @@ class MetadataPP(PostProcessor):
             kwdict = self.filter(kwdict)
         fp.write(self._json_encode(kwdict) + "\n")
 
+    def _write_persistent(self, fp, pathfmt):
+        self.write(fp, pathfmt.kwdict)
+
+    def _write_sqlite(self, db, pathfmt):
+        kwdict = pathfmt.kwdict
+        if self._keygen is None:
+            key = pathfmt.realpath
+        else:
+            key = kwdict.get("_archive_key") or self._keygen(kwdict)
+        if self.filter:
+            kwdict = self.filter(kwdict)
+        db.execute("INSERT OR REPLACE INTO metadata VALUES (?,?)",
+                   (key, self._json_encode(kwdict)))
+
     def _make_filter(self, options):
         if include := options.get("include"):
             if isinstance(include, str):
@@ -302,4 +413,6 @@ def _traverse(obj, key):
     return obj, key.strip("\"']")
 
 
+HANDLES_MAX = 16
+
 __postprocessor__ = MetadataPP
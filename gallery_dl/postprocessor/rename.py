@@ -14,6 +14,7 @@ import os
 
 
 class RenamePP(PostProcessor):
+    deferrable = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -11,8 +11,10 @@
 from .common import PostProcessor
 from .. import util, output
 import subprocess
+import threading
 import tempfile
 import zipfile
+import weakref
 import shutil
 import os
 
@@ -26,6 +28,8 @@ except ImportError:
 
 
 class UgoiraPP(PostProcessor):
+    sequential = True
+    deferrable = True
 
     def __init__(self, job, options):
         PostProcessor.__init__(self, job)
@@ -37,7 +41,10 @@ class UgoiraPP(PostProcessor):
         self.metadata = options.get("metadata", True)
         self.mtime = options.get("mtime", True)
         self.skip = options.get("skip", True)
-        self.uniform = self._convert_zip = self._convert_files = False
+        self.uniform = False
+        self._convert_zip = weakref.WeakKeyDictionary()
+        self._convert_files = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
 
         ffmpeg = options.get("ffmpeg-location")
         self.ffmpeg = util.expand_path(ffmpeg) if ffmpeg else "ffmpeg"
@@ -105,38 +112,37 @@ class UgoiraPP(PostProcessor):
         }, options)
 
     def prepare(self, pathfmt):
-        self._convert_zip = self._convert_files = False
+        self._convert_zip.pop(pathfmt, None)
+        self._convert_files.pop(pathfmt, None)
         if "_ugoira_frame_data" not in pathfmt.kwdict:
-            self._frames = None
             return
 
-        self._frames = pathfmt.kwdict["_ugoira_frame_data"]
+        frames = pathfmt.kwdict["_ugoira_frame_data"]
         index = pathfmt.kwdict.get("_ugoira_frame_index")
         if index is None:
-            self._convert_zip = True
+            self._convert_zip[pathfmt] = frames
             if self.delete:
                 pathfmt.set_extension(self.extension)
                 pathfmt.build_path()
         else:
             pathfmt.build_path()
-            frame = self._frames[index].copy()
+            frame = frames[index].copy()
             frame["index"] = index
             frame["path"] = pathfmt.realpath
             frame["ext"] = pathfmt.extension
 
-            if not index:
-                self._files = [frame]
-            else:
+            with self._lock:
+                if not index:
+                    self._files = []
                 self._files.append(frame)
-                if len(self._files) >= len(self._frames):
-                    self._convert_files = True
+            self._convert_files[pathfmt] = self._files
 
     def convert_from_zip(self, pathfmt):
-        if not self._convert_zip:
+        frames = self._convert_zip.pop(pathfmt, None)
+        if frames is None:
             return
-        self._zip_source = True
-        self._zip_ext = ext = pathfmt.extension
 
+        ext = pathfmt.extension
         with self._tempdir() as tempdir:
             if tempdir:
                 try:
@@ -153,7 +159,7 @@ class UgoiraPP(PostProcessor):
                         exc.__class__.__name__, exc)
                     return self.log.traceback(exc)
 
-            if self.convert(pathfmt, tempdir):
+            if self.convert(pathfmt, tempdir, frames, ext):
                 if self.delete:
                     pathfmt.delete = True
                 elif pathfmt.extension != ext:
@@ -162,12 +168,23 @@ class UgoiraPP(PostProcessor):
                     pathfmt.build_path()
 
     def convert_from_files(self, pathfmt):
-        if not self._convert_files:
+        files = self._convert_files.pop(pathfmt, None)
+        if files is None:
             return
-        self._zip_source = False
+
+        # only the frame list itself is shared with other threads
+        with self._lock:
+            # convert once all frames are known and their files are in place,
+            # including skipped ones, which never get here
+            if len(files) < len(pathfmt.kwdict["_ugoira_frame_data"]) or \
+                    not all(os.path.exists(f["path"]) for f in files):
+                return
+            pending = files
+            files = sorted(pending, key=lambda f: f["index"])
+            pending.clear()  # only convert once
 
         with tempfile.TemporaryDirectory() as tempdir:
-            for frame in self._files:
+            for frame in files:
 
                 # update frame filename extension
                 frame["file"] = name = \
@@ -178,30 +195,36 @@ class UgoiraPP(PostProcessor):
                     try:
                         self._copy_file(frame["path"], tempdir + "/" + name)
                     except OSError as exc:
-                        self.log.debug("Unable to copy frame %s (%s: %s)",
-                                       name, exc.__class__.__name__, exc)
+                        self.log.debug(
+                            "Unable to copy frame %s (%s: %s)",
+                            name, exc.__class__.__name__, exc)
                         return
 
             pathfmt.kwdict["num"] = 0
-            self._frames = self._files
-            if self.convert(pathfmt, tempdir):
+            if self.convert(pathfmt, tempdir, files):
                 self.log.info(pathfmt.filename)
                 if self.delete:
                     self.log.debug("Deleting frames")
-                    for frame in self._files:
+                    for frame in files:
                         util.remove_file(frame["path"])
 
-    def convert(self, pathfmt, tempdir):
+    def convert(self, pathfmt, tempdir, frames, zip_ext=None):
+        """Convert 'frames' in 'tempdir' and write the result to 'pathfmt'
+
+        'zip_ext' is the extension of the source ZIP archive, if any.
+        """
         pathfmt.set_extension(self.extension)
         pathfmt.build_path()
         if self.skip and pathfmt.exists():
             return True
 
-        return self._convert_impl(pathfmt, tempdir)
+        return self._convert_impl(pathfmt, tempdir, frames, zip_ext)
+
+    def convert_to_animation(self, pathfmt, tempdir, frames, zip_ext=None):
+        realpath = pathfmt.realpath
 
-    def convert_to_animation(self, pathfmt, tempdir):
         # process frames and collect command-line arguments
-        args = self._process(pathfmt, tempdir)
+        args = self._process(pathfmt, tempdir, frames)
         if self.args_pp:
             args += self.args_pp
         if self.args:
@@ -222,7 +245,7 @@ class UgoiraPP(PostProcessor):
                 args.append(pathfmt.realpath)
                 self._exec(args)
             if self._finalize:
-                self._finalize(pathfmt, tempdir)
+                self._finalize(pathfmt, tempdir, frames, realpath)
         except OSError as exc:
             output.stderr_write("\n")
             self.log.error("Unable to invoke FFmpeg (%s: %s)",
@@ -239,9 +262,7 @@ class UgoiraPP(PostProcessor):
                 pathfmt.set_mtime()
             return True
 
-    def convert_to_archive(self, pathfmt, tempdir):
-        frames = self._frames
-
+    def convert_to_archive(self, pathfmt, tempdir, frames, zip_ext=None):
         if self.metadata:
             if isinstance(self.metadata, str):
                 metaname = self.metadata
@@ -252,11 +273,11 @@ class UgoiraPP(PostProcessor):
                 for frame in frames
             ]).encode()
 
-        if self._zip_source:
+        if zip_ext is not None:
             zpath = pathfmt.temppath
             if self.delete:
                 self.delete = False
-            elif self._zip_ext != self.extension:
+            elif zip_ext != self.extension:
                 self._copy_file(zpath, pathfmt.realpath)
                 zpath = pathfmt.realpath
 
@@ -306,19 +327,18 @@ class UgoiraPP(PostProcessor):
     def _copy_file(self, src, dst):
         shutil.copyfile(src, dst)
 
-    def _process_concat(self, pathfmt, tempdir):
-        rate_in, rate_out = self.calculate_framerate(self._frames)
+    def _process_concat(self, pathfmt, tempdir, frames):
+        rate_in, rate_out = self.calculate_framerate(frames)
         args = [self.ffmpeg, "-f", "concat"]
         if rate_in:
             args += ("-r", str(rate_in))
-        args += ("-i", self._write_ffmpeg_concat(tempdir))
+        args += ("-i", self._write_ffmpeg_concat(tempdir, frames))
         if rate_out:
             args += ("-r", str(rate_out))
         return args
 
-    def _process_image2(self, pathfmt, tempdir):
+    def _process_image2(self, pathfmt, tempdir, frames):
         tempdir += "/"
-        frames = self._frames
 
         # add extra frame if necessary
         if self.repeat and not self._delay_is_uniform(frames):
@@ -350,8 +370,7 @@ class UgoiraPP(PostProcessor):
                    f"{frame['file'].rpartition('.')[2]}"),
         ]
 
-    def _process_mkvmerge(self, pathfmt, tempdir):
-        self._realpath = pathfmt.realpath
+    def _process_mkvmerge(self, pathfmt, tempdir, frames):
         pathfmt.realpath = tempdir + "/temp." + self.extension
 
         return [
@@ -359,26 +378,27 @@ class UgoiraPP(PostProcessor):
             "-f", "image2",
             "-pattern_type", "sequence",
             "-i", (f"{tempdir.replace('%', '%%')}/%06d."
-                   f"{self._frames[0]['file'].rpartition('.')[2]}"),
+                   f"{frames[0]['file'].rpartition('.')[2]}"),
         ]
 
-    def _finalize_mkvmerge(self, pathfmt, tempdir):
+    def _finalize_mkvmerge(self, pathfmt, tempdir, frames, realpath):
         args = [
             self.mkvmerge,
             "-o", pathfmt.path,  # mkvmerge does not support "raw" paths
-            "--timecodes", "0:" + self._write_mkvmerge_timecodes(tempdir),
+            "--timecodes",
+            "0:" + self._write_mkvmerge_timecodes(tempdir, frames),
         ]
         if self.extension == "webm":
             args.append("--webm")
         args += ("=", pathfmt.realpath)
 
-        pathfmt.realpath = self._realpath
+        pathfmt.realpath = realpath
         self._exec(args)
 
-    def _write_ffmpeg_concat(self, tempdir):
+    def _write_ffmpeg_concat(self, tempdir, frames):
         content = ["ffconcat version 1.0"]
 
-        for frame in self._frames:
+        for frame in frames:
             content.append(f"file '{frame['file']}'\n"
                            f"duration {frame['delay'] / 1000}")
         if self.repeat:
@@ -390,11 +410,11 @@ class UgoiraPP(PostProcessor):
             fp.write("\n".join(content))
         return ffconcat
 
-    def _write_mkvmerge_timecodes(self, tempdir):
+    def _write_mkvmerge_timecodes(self, tempdir, frames):
         content = ["# timecode format v2"]
 
         delay_sum = 0
-        for frame in self._frames:
+        for frame in frames:
             content.append(str(delay_sum))
             delay_sum += frame["delay"]
         content.append(str(delay_sum))
@@ -675,10 +675,17 @@ class Flags():
 
     def __init__(self):
         self.FILE = self.POST = self.CHILD = self.DOWNLOAD = None
+        self._terminate = False
+
+    def terminate(self):
+        """Make all running jobs stop at their next flag check"""
+        self._terminate = True
+        self.FILE = self.POST = self.CHILD = self.DOWNLOAD = "terminate"
 
     def process(self, flag):
         value = self.__dict__[flag]
-        self.__dict__[flag] = None
+        if not self._terminate:
+            self.__dict__[flag] = None
 
         if value == "abort":
             raise exception.AbortExtraction()
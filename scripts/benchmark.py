@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Run performance benchmarks"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+import http.server
+
+import util
+from gallery_dl import extractor
+
+
+def run_command(command, runs):
+    """Return the fastest and median runtime of 'command'"""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = util.ROOTDIR
+
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command, env=env, cwd=util.ROOTDIR,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        results.append(time.perf_counter() - start)
+
+    results.sort()
+    return results[0], results[len(results) // 2]
+
+
+def report(name, results):
+    fastest, median = results
+    print(f"{name:<32} {fastest*1000:>9.1f} ms {median*1000:>9.1f} ms")
+
+
+def bench_startup(args):
+    """Startup time of a single-URL run and '--list-extractors'
+
+    'linear' sets 'extractor.modules' to the default list,
+    which disables the extractor registry and URL index.
+    """
+    base = (sys.executable, "-m", "gallery_dl", "--config-ignore")
+    linear = ("-o", "extractor.modules=" + ",".join(extractor.modules))
+
+    for name, command in (
+        ("directlink"       , ("-g", "https://example.org/image.jpg")),
+        ("unsupported"      , ("-g", "https://example.org/")),
+        ("--list-extractors", ("--list-extractors",)),
+    ):
+        report(name, run_command(base + command, args.runs))
+        report(name + " (linear)", run_command(
+            base + linear + command, args.runs))
+
+
+def bench_download(args):
+    """CPU time of downloading a local file for different 'chunk-size's"""
+    from gallery_dl import config, job
+
+    data = os.urandom(args.size << 20)
+
+    class RequestHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "video/mp4")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), RequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/file.mp4"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for chunk_size in (32768, 1048576, "auto"):
+            config.clear()
+            config.set((), "base-directory", tmpdir)
+            config.set((), "skip", False)
+            config.set(("output",), "mode", "null")
+            config.set(("downloader", "http"), "chunk-size", chunk_size)
+
+            results = []
+            for _ in range(args.runs):
+                # downloads happen in the main thread,
+                # the server's CPU time is not included
+                start = time.thread_time()
+                job.DownloadJob(url).run()
+                results.append(time.thread_time() - start)
+            results.sort()
+            report(f"chunk-size={chunk_size}",
+                   (results[0], results[len(results) // 2]))
+
+    server.shutdown()
+
+
+def bench_replay(args):
+    """CPU time of processing recorded responses of '--url' URLs
+
+    'extract' only iterates over an extractor's results,
+    'simulate' also builds paths, formats filenames,
+    and checks a download archive, without downloading anything.
+    Responses get recorded with '-o http-record=PATH'.
+    """
+    from gallery_dl import config, job
+
+    if not args.recording or not args.urls:
+        print("requires '--recording' and '--url'")
+        return
+
+    def setup():
+        config.clear()
+        config.set(("extractor",), "http-replay", args.recording)
+        config.set(("output",), "mode", "null")
+
+    def extract(url):
+        for _ in extractor.find(url):
+            pass
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        def simulate(url):
+            config.set((), "base-directory", tmpdir)
+            config.set((), "download", False)
+            config.set((), "archive", os.path.join(tmpdir, "archive.db"))
+            job.DownloadJob(url).run()
+
+        for url in args.urls:
+            for name, func in (("extract", extract), ("simulate", simulate)):
+                results = []
+                for _ in range(args.runs):
+                    setup()
+                    start = time.process_time()
+                    func(url)
+                    results.append(time.process_time() - start)
+                results.sort()
+                report(f"{name} {url[:22]}",
+                       (results[0], results[len(results) // 2]))
+
+
+BENCHMARKS = {
+    "startup" : bench_startup,
+    "download": bench_download,
+    "replay"  : bench_replay,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--runs", metavar="N", type=int, default=10,
+        help="Number of runs per case (default: 10)",
+    )
+    parser.add_argument(
+        "-s", "--size", metavar="MB", type=int, default=256,
+        help="File size in MiB for 'download' (default: 256)",
+    )
+    parser.add_argument(
+        "-r", "--recording", metavar="PATH",
+        help="Recorded responses for 'replay'",
+    )
+    parser.add_argument(
+        "-u", "--url", metavar="URL", dest="urls", action="append",
+        help="Input URL for 'replay' (can be used multiple times)",
+    )
+    parser.add_argument(
+        "benchmarks", metavar="BENCHMARK", nargs="*",
+        help=f"Benchmarks to run ({', '.join(BENCHMARKS)})",
+    )
+    args = parser.parse_args()
+
+    for name in args.benchmarks or BENCHMARKS:
+        bench = BENCHMARKS[name]
+        print(f"{name}: {bench.__doc__.partition(chr(10))[0]}")
+        bench(args)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+"""Generate the extractor registry at gallery_dl/extractor/_registry.py"""
+
+import os
+import sys
+
+import util
+from gallery_dl import extractor
+
+
+SELF = "/".join(os.path.normpath(__file__).split(os.sep)[-2:])
+PATH = (sys.argv[1] if len(sys.argv) > 1 else
+        util.path("gallery_dl", "extractor", "_registry.py"))
+
+entries = [
+    extractor._class_info(cls)
+    for cls in extractor._list_classes()
+]
+base, checksums = extractor._registry_checksums()
+
+with util.lazy(PATH) as fp:
+    fp.write(f"""\
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+# auto-generated by {SELF}
+# (module, name, category, subcategory, basecategory,
+#  instances, pattern, factors, example, doc)
+
+# checksums of shared source files and of each module;
+# entries of modules with a different checksum get generated at runtime
+BASE = {base!r}
+
+MODULES = (
+""")
+    for module in extractor.modules:
+        fp.write(f"    {(module, checksums[module])!r},\n")
+    fp.write(""")
+
+EXTRACTORS = (
+""")
+    for info in entries:
+        fp.write(f"    {tuple(info)!r},\n")
+    fp.write(")\n")
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 2 as
+# published by the Free Software Foundation.
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import socket
+import sqlite3
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from gallery_dl import archive  # noqa E402
+
+
+class ArchiveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "archive.sqlite3")
+        archive._filters.clear()
+
+    def tearDown(self):
+        archive._filters.clear()
+        self.tmpdir.cleanup()
+
+    def _connect(self, mode=None, **kwargs):
+        return archive.connect(
+            self.path, "test", "{id}", mode=mode, **kwargs)
+
+    def _entries(self):
+        with sqlite3.connect(self.path) as con:
+            return sorted(
+                entry for entry, in con.execute("SELECT entry FROM archive"))
+
+
+class TestArchive(ArchiveTestCase):
+
+    def test_file(self):
+        arch = self._connect()
+        self.assertIsInstance(arch, archive.DownloadArchive)
+
+        kwdict = {"id": 1}
+        self.assertFalse(arch.check(kwdict))
+        self.assertEqual(kwdict["_archive_key"], "test1")
+        arch.add(kwdict)
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertEqual(self._entries(), ["test1"])
+        arch.close()
+
+    def test_memory(self):
+        arch = self._connect("memory")
+        self.assertIsInstance(arch, archive.DownloadArchiveMemory)
+
+        arch.add({"id": 1})
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertEqual(self._entries(), [])
+
+        arch.finalize()
+        arch.close()
+        self.assertEqual(self._entries(), ["test1"])
+
+    def test_batch(self):
+        arch = self._connect("batch:3")
+        self.assertIsInstance(arch, archive.DownloadArchiveBatch)
+        self.assertEqual(arch._batch_size, 3)
+        self.assertEqual(arch._batch_interval, 10.0)
+
+        arch.add({"id": 1})
+        arch.add({"id": 2})
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 3}))
+        self.assertEqual(self._entries(), [])
+
+        arch.add({"id": 3})
+        self.assertEqual(self._entries(), ["test1", "test2", "test3"])
+        self.assertEqual(arch.keys, set())
+        self.assertTrue(arch.check({"id": 1}))
+
+        arch.add({"id": 4})
+        self.assertEqual(len(self._entries()), 3)
+
+        # write pending entries on close()
+        arch.close()
+        self.assertEqual(len(self._entries()), 4)
+
+    def test_batch_interval(self):
+        arch = self._connect("batch::5")
+        self.assertEqual(arch._batch_size, 1000)
+        self.assertEqual(arch._batch_interval, 5.0)
+
+        with patch("time.monotonic") as tmock:
+            tmock.return_value = arch._batch_time - 1.0
+            arch.add({"id": 1})
+            self.assertEqual(self._entries(), [])
+
+            tmock.return_value += 1.0
+            arch.add({"id": 2})
+            self.assertEqual(self._entries(), ["test1", "test2"])
+        arch.close()
+
+    def test_watermark(self):
+        arch = self._connect()
+        self.assertIsNone(arch.watermark("https://example.org/"))
+
+        arch.watermark_update("https://example.org/", 123)
+        arch.watermark_update("https://example.org/b", "2024-01-01")
+        self.assertEqual(arch.watermark("https://example.org/"), 123)
+        self.assertEqual(arch.watermark("https://example.org/b"),
+                         "2024-01-01")
+
+        arch.watermark_update("https://example.org/", 456)
+        arch.close()
+
+        arch = self._connect("memory")
+        self.assertEqual(arch.watermark("https://example.org/"), 456)
+        arch.close()
+
+    def test_batch_signal(self):
+        arch = self._connect("batch")
+        arch.add({"id": 1})
+
+        with patch("os.kill") as kill, \
+                patch("signal.signal") as signal, \
+                patch.object(archive, "_batch_handlers", {}), \
+                patch.object(arch, "_write_keys",
+                             wraps=arch._write_keys) as write:
+            # interrupted while holding the archive lock
+            with arch._batch_lock:
+                archive._batch_signal(15, None)
+                signal.assert_called_once_with(15, 0)
+                write.assert_not_called()
+
+            for _ in range(100):
+                if kill.called:
+                    break
+                threading.Event().wait(0.01)
+
+        write.assert_called_once()
+        self.assertEqual(self._entries(), ["test1"])
+        kill.assert_called_once_with(os.getpid(), 15)
+        arch.close()
+
+    def test_batch_signal_install(self):
+        with patch.object(archive, "_batch_handlers", None), \
+                patch("signal.signal") as signal:
+            # handlers get installed once from the main thread
+            thread = threading.Thread(
+                target=lambda: self._connect("batch").close())
+            thread.start()
+            thread.join()
+            signal.assert_not_called()
+
+            archive.signals_install()
+            count = signal.call_count
+            self.assertGreater(count, 0)
+
+            self._connect("batch").close()
+            archive.signals_install()
+            self.assertEqual(signal.call_count, count)
+
+
+class TestArchiveFilter(ArchiveTestCase):
+
+    def _populate(self, count):
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+            con.executemany("INSERT INTO archive VALUES (?)", (
+                (f"test{i}",) for i in range(count)))
+
+    def test_bloom(self):
+        bloom = archive.BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(str(i))
+
+        for i in range(1000):
+            self.assertIn(str(i), bloom)
+        false_positives = sum(str(i) in bloom for i in range(1000, 11000))
+        self.assertLess(false_positives, 50)
+
+    def test_filter(self):
+        self._populate(100)
+        arch = self._connect(filter=True)
+        self.assertIsInstance(arch.filter, archive.BloomFilter)
+
+        with patch.object(arch, "cursor") as cursor:
+            cursor.fetchone.return_value = (1,)
+            kwdict = {"id": 1000}
+            self.assertFalse(arch.check(kwdict))
+            self.assertEqual(kwdict["_archive_key"], "test1000")
+            cursor.execute.assert_not_called()
+
+            self.assertTrue(arch.check({"id": 10}))
+            cursor.execute.assert_called_once()
+
+        arch.add({"id": 1000})
+        self.assertTrue(arch.check({"id": 1000}))
+        arch.close()
+
+    def test_filter_file(self):
+        self._populate(100)
+        path = os.path.join(self.tmpdir.name, "archive.bloom")
+
+        arch = self._connect(filter=path)
+        self.assertTrue(os.path.exists(path))
+        arch.add({"id": 100})
+        arch.close()
+
+        count, bloom = archive.BloomFilter.load(path)
+        self.assertEqual(count, 101)
+        self.assertIn("test100", bloom)
+
+        # new process
+        archive._filters.clear()
+        with patch.object(archive.BloomFilter, "add") as add:
+            arch = self._connect(filter=path)
+            add.assert_not_called()
+            self.assertFalse(arch.check({"id": 200}))
+            self.assertTrue(arch.check({"id": 100}))
+            arch.close()
+
+        # rebuild outdated filter
+        archive._filters.clear()
+        with sqlite3.connect(self.path) as con:
+            con.execute("INSERT INTO archive VALUES ('test500')")
+        arch = self._connect(filter=path)
+        self.assertTrue(arch.check({"id": 500}))
+        arch.close()
+        self.assertEqual(archive.BloomFilter.load(path)[0], 102)
+
+    def test_filter_file_concurrent(self):
+        self._populate(100)
+        path = os.path.join(self.tmpdir.name, "archive.bloom")
+
+        # two processes
+        arch1 = self._connect(filter=path)
+        filters = archive._filters.copy()
+        archive._filters.clear()
+        arch2 = self._connect(filter=path)
+        arch2.add({"id": 200})
+        arch2.close()
+        archive._filters.update(filters)
+        arch1.add({"id": 100})
+        arch1.close()
+
+        # count only includes entries added by 'arch1'
+        count, bloom = archive.BloomFilter.load(path)
+        self.assertEqual(count, 101)
+        self.assertNotIn("test200", bloom)
+
+        archive._filters.clear()
+        arch = self._connect(filter=path)
+        self.assertTrue(arch.check({"id": 200}))
+        self.assertTrue(arch.check({"id": 100}))
+        arch.close()
+
+    def test_filter_shared(self):
+        self._populate(100)
+        path = os.path.join(self.tmpdir.name, "archive.bloom")
+
+        parent = self._connect(filter=path)
+        mtime = os.stat(path).st_mtime_ns
+
+        # child jobs reuse the filter of their parent
+        with patch.object(archive.DownloadArchive, "entries") as entries, \
+                patch.object(archive.DownloadArchive, "count") as count:
+            child = self._connect(filter=path)
+            entries.assert_not_called()
+            count.assert_not_called()
+        self.assertIs(child.filter, parent.filter)
+
+        child.add({"id": 100})
+        self.assertTrue(parent.check({"id": 100}))
+
+        # only written after its last user is done
+        with patch.object(archive.BloomFilter, "save") as save:
+            child.close()
+            save.assert_not_called()
+            parent.close()
+            save.assert_called_once_with(path, 101)
+
+        # unchanged filters are not written again
+        with patch.object(archive.BloomFilter, "save") as save:
+            arch = self._connect(filter=path)
+            arch.check({"id": 5})
+            arch.close()
+            save.assert_not_called()
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+
+
+@unittest.skipIf(not hasattr(socket, "AF_UNIX"), "no Unix sockets")
+class TestArchiveDaemon(ArchiveTestCase):
+
+    def setUp(self):
+        ArchiveTestCase.setUp(self)
+        self.address = os.path.join(self.tmpdir.name, "archive.sock")
+        self.daemon = archive.ArchiveDaemon(self.path, interval=0.1)
+        self.thread = threading.Thread(
+            target=self.daemon.serve, args=(self.address,), daemon=True)
+        self.thread.start()
+        for _ in range(100):
+            if os.path.exists(self.address):
+                break
+            threading.Event().wait(0.01)
+
+    def tearDown(self):
+        self.daemon.close()
+        ArchiveTestCase.tearDown(self)
+
+    def _connect(self, **kwargs):
+        return archive.connect(
+            "unix:" + self.address, "test", "{id}", **kwargs)
+
+    def test_daemon(self):
+        arch = self._connect()
+        self.assertIsInstance(arch, archive.DownloadArchiveDaemon)
+        self.assertEqual(arch._table, "archive")
+
+        kwdict = {"id": 1}
+        self.assertFalse(arch.check(kwdict))
+        self.assertEqual(kwdict["_archive_key"], "test1")
+        arch.add(kwdict)
+        self.assertEqual(arch.keys, ["test1"])
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertEqual(arch.keys, [])
+
+        # entries are visible to other clients immediately
+        other = self._connect()
+        self.assertTrue(other.check({"id": 1}))
+        self.assertFalse(other.check({"id": 2}))
+
+        arch.add({"id": 2})
+        arch.close()
+        self.assertTrue(other.check({"id": 2}))
+        self.assertEqual(self._entries(), ["test1", "test2"])
+        self.assertEqual(other.count(), 2)
+        other.close()
+
+    def test_daemon_table(self):
+        arch = self._connect(table="foo")
+        self.assertEqual(arch._table, '"foo"')
+        arch.add({"id": 1})
+        arch.finalize()
+        arch.close()
+
+        arch = self._connect()
+        self.assertFalse(arch.check({"id": 1}))
+        arch.close()
+
+        with sqlite3.connect(self.path) as con:
+            self.assertEqual(
+                con.execute("SELECT entry FROM foo").fetchall(),
+                [("test1",)])
+
+    def test_daemon_batch(self):
+        arch = self._connect()
+        arch.BUFFER = 3
+        for i in range(5):
+            arch.add({"id": i})
+        self.assertEqual(arch.keys, ["test3", "test4"])
+
+        # pending entries get written after 'interval' seconds
+        for _ in range(100):
+            if self.daemon.written:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(self._entries(), ["test0", "test1", "test2"])
+
+        arch.finalize()
+        self.assertEqual(len(self._entries()), 5)
+        arch.close()
+
+    def test_daemon_load(self):
+        with sqlite3.connect(self.path) as con:
+            con.execute("CREATE TABLE archive (entry TEXT PRIMARY KEY)")
+            con.execute("INSERT INTO archive VALUES ('test1')")
+
+        arch = self._connect(mode="memory", filter=True)
+        self.assertFalse(hasattr(arch, "filter"))
+        self.assertTrue(arch.check({"id": 1}))
+        self.assertFalse(arch.check({"id": 2}))
+        arch.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,10 @@ import sys
 import unittest
 from unittest.mock import patch
 
+import time
+import sqlite3
 import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import config, util  # noqa E402
@@ -39,12 +42,17 @@ class TestCache(unittest.TestCase):
         def mc2():
             pass
 
+        @cache.memcache(maxsize=10)
+        def mc3():
+            pass
+
         @cache.cache()
         def dbc():
             pass
 
         self.assertIsInstance(mc1, cache.CacheDecorator)
         self.assertIsInstance(mc2, cache.MemoryCacheDecorator)
+        self.assertIsInstance(mc3, cache.LRUCacheDecorator)
         self.assertIsInstance(dbc, cache.DatabaseCacheDecorator)
 
     def test_keyarg_mem_simple(self):
@@ -132,6 +140,77 @@ class TestCache(unittest.TestCase):
             self.assertEqual(ex(2, 2, 2), 9)
             self.assertEqual(ex(1, 1, 1), 9)
 
+    def test_lru(self):
+        @cache.memcache(keyarg=0, maxsize=2)
+        def lru(a, b):
+            return a+b
+
+        self.assertEqual(lru(1, 1), 2)
+        self.assertEqual(lru(2, 2), 4)
+        self.assertEqual(lru(1, 0), 2)
+
+        # evicts the least recently used entry '2'
+        self.assertEqual(lru(3, 3), 6)
+        self.assertEqual(list(lru.cache), [1, 3])
+        self.assertEqual(lru(2, 0), 2)
+        self.assertEqual(list(lru.cache), [3, 2])
+
+        self.assertEqual(
+            (lru.hits, lru.misses, lru.evictions), (1, 4, 2))
+        self.assertIn((cache._name(lru.func), 2, 1, 4, 2), cache.stats())
+
+    def test_lru_threads(self):
+        @cache.memcache(keyarg=0, maxsize=8)
+        def lru(a):
+            return a
+
+        def run(offset):
+            for i in range(2000):
+                key = (i * 7 + offset) % 32
+                self.assertEqual(lru(key), key)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(lru.cache), 8)
+        self.assertEqual(lru.hits + lru.misses, 16000)
+
+    def test_lru_expires(self):
+        @cache.memcache(maxage=2, maxsize=10)
+        def ex(a):
+            return a
+
+        with patch("time.time") as tmock:
+            tmock.return_value = 0.001
+            self.assertEqual(ex(1), 1)
+            tmock.return_value += 1.0
+            self.assertEqual(ex(2), 1)
+            tmock.return_value += 1.0
+            self.assertEqual(ex(3), 3)
+
+    def test_maxsize_config(self):
+        def func():
+            pass
+        name = cache._name(func)
+
+        with patch.object(cache.config, "get") as get:
+            get.return_value = 5
+            self.assertEqual(cache.memcache()(func).maxsize, 5)
+
+            get.return_value = {name: 3, "*": 4}
+            self.assertEqual(cache.memcache(maxsize=9)(func).maxsize, 3)
+
+            get.return_value = {"*": 4}
+            self.assertEqual(cache.memcache(maxsize=9)(func).maxsize, 4)
+
+            get.return_value = {"other": 4}
+            self.assertEqual(cache.memcache(maxsize=9)(func).maxsize, 9)
+            self.assertNotIsInstance(
+                cache.memcache()(func), cache.LRUCacheDecorator)
+
     def test_update_mem_simple(self):
         @cache.memcache(keyarg=0)
         def up(a, b, c):
@@ -221,6 +300,206 @@ class TestCache(unittest.TestCase):
         self.assertEqual(db.cache[1][0], 3)
         self.assertEqual(db.cache[2][0], 6)
 
+    def test_database_nonblocking(self):
+        @cache.cache(keyarg=0, maxage=10)
+        def nb(a):
+            # other connections can write while computing a value
+            with sqlite3.connect(dbpath, timeout=0) as con:
+                con.execute("BEGIN IMMEDIATE")
+                con.execute("INSERT OR REPLACE INTO data VALUES (?,?,?)",
+                            ("test-nonblocking", b"", 0))
+            return a * 2
+
+        self.assertEqual(nb(2), 4)
+
+        # written to database by a background thread
+        key = f"{nb.key}-2"
+        self.assertTrue(cache._write_pending())
+        with sqlite3.connect(dbpath) as con:
+            value, = con.execute(
+                "SELECT value FROM data WHERE key=?", (key,)).fetchone()
+            self.assertEqual(cache.pickle.loads(value), 4)
+            self.assertIsNone(con.execute(
+                "SELECT 1 FROM lease WHERE key=?", (key,)).fetchone())
+
+    def test_database_lease(self):
+        @cache.cache(keyarg=0, maxage=10)
+        def ls(a):
+            raise AssertionError("computed despite foreign lease")
+
+        key = f"{ls.key}-1"
+        ls.database()
+        with sqlite3.connect(dbpath) as con:
+            con.execute("INSERT INTO lease VALUES (?,?,?)",
+                        (key, -1, int(cache.time.time()) + 60))
+
+        def provide():
+            with sqlite3.connect(dbpath) as con:
+                con.execute("INSERT OR REPLACE INTO data VALUES (?,?,?)",
+                            (key, cache.pickle.dumps("value"),
+                             int(cache.time.time()) + 60))
+                con.execute("DELETE FROM lease WHERE key=?", (key,))
+
+        timer = threading.Timer(0.2, provide)
+        timer.start()
+        self.assertEqual(ls(1), "value")
+        timer.join()
+
+    def test_database_compact(self):
+        @cache.cache(maxage=10)
+        def cp():
+            return 1
+
+        cp.update("", 2)
+        cache._write_pending()
+
+        with sqlite3.connect(dbpath) as con:
+            con.execute("INSERT OR REPLACE INTO data VALUES (?,?,?)",
+                        ("test-expired", b"", 1))
+
+        with patch.object(cache, "_compact_next", 0):
+            cache._compact()
+
+        with sqlite3.connect(dbpath) as con:
+            keys = {key for key, in con.execute("SELECT key FROM data")}
+        self.assertNotIn("test-expired", keys)
+        self.assertIn(f"{cp.key}-", keys)
+
+    def test_entry(self):
+        key = "gallery_dl.extractor.test.entry"
+        self.assertIsNone(cache.entry_load(key))
+
+        with patch.object(cache, "_lease_acquire") as lease:
+            cache.entry_store(key, {"a": 1}, 60)
+            self.assertEqual(cache.entry_load(key), {"a": 1})
+            cache._write_pending()
+            self.assertEqual(cache.entry_load(key), {"a": 1})
+        lease.assert_not_called()
+
+        with patch("time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.entry_load(key))
+
+    def test_checkpoint(self):
+        key = "https://example.org/checkpoint"
+        self.assertIsNone(cache.checkpoint_load(key))
+
+        cache.checkpoint_store(key, "b123")
+        self.assertEqual(cache.checkpoint_load(key), "b123")
+        cache._write_pending()
+        with sqlite3.connect(dbpath) as con:
+            value, expires = con.execute(
+                "SELECT value, expires FROM data WHERE key=?",
+                ("checkpoint:" + key,)).fetchone()
+        self.assertGreater(expires, time.time() + 86400)
+
+        cache.checkpoint_store(key, None)
+        self.assertIsNone(cache.checkpoint_load(key))
+        cache._write_pending()
+        self.assertIsNone(cache.checkpoint_load(key))
+
+    def test_http(self):
+        self.assertIsNone(cache.http_load("https://example.org/1"))
+
+        headers = {"Content-Type": "application/json"}
+        cache.http_store("https://example.org/1", "test", '"abc"', None,
+                         headers, b"1" * 40, 100)
+        self.assertEqual(cache.http_load("https://example.org/1"),
+                         ('"abc"', None, headers, b"1" * 40))
+
+        cache._write_pending()
+        self.assertEqual(cache.http_load("https://example.org/1"),
+                         ('"abc"', None, headers, b"1" * 40))
+
+        # evict least recently used entries
+        cache.http_store("https://example.org/2", "test", None, "Mon",
+                         {}, b"2" * 40, 100)
+        cache._write_pending()
+        cache.http_load("https://example.org/1")
+        cache.http_store("https://example.org/3", "test", '"def"', None,
+                         {}, b"3" * 40, 100)
+        cache._write_pending()
+        self.assertIsNone(cache.http_load("https://example.org/2"))
+        self.assertTrue(cache.http_load("https://example.org/1"))
+        self.assertTrue(cache.http_load("https://example.org/3"))
+
+        # too large
+        cache.http_store("https://example.org/4", "test", '"ghi"', None,
+                         {}, b"4" * 200, 100)
+        self.assertIsNone(cache.http_load("https://example.org/4"))
+
+        cache.clear("test")
+        self.assertIsNone(cache.http_load("https://example.org/1"))
+
+    def test_http_queue(self):
+        cache.http_store("https://example.org/q1", "test", '"abc"', None,
+                         {}, b"1" * 40, 100)
+        cache._write_pending()
+
+        # lookups and stores only queue writes
+        with patch.object(cache, "_lock_db") as lock:
+            self.assertTrue(cache.http_load("https://example.org/q1"))
+            cache.http_store("https://example.org/q2", "test", None, "Mon",
+                             {}, b"2" * 40, 100)
+            self.assertTrue(cache.http_load("https://example.org/q2"))
+        self.assertEqual(len(lock.__enter__.call_args_list), 1)
+        self.assertIn("https://example.org/q1", cache._http_atime)
+
+        # sizes are counted once and then kept track of in memory
+        with patch.object(cache, "_http_size", None):
+            cache._write_pending()
+            self.assertEqual(cache._http_size, 80)
+        self.assertFalse(cache._http_atime)
+
+        with sqlite3.connect(dbpath) as con:
+            atime, = con.execute(
+                "SELECT atime FROM http WHERE key=?",
+                ("https://example.org/q1",)).fetchone()
+        self.assertGreater(atime, time.time() - 10)
+
+        cache.clear("test")
+
+    def test_http_request(self):
+        from gallery_dl import extractor
+        import requests
+
+        config.set(("extractor",), "http-cache", "1M")
+        try:
+            extr = extractor.find("generic:https://example.org/")
+            extr.initialize()
+        finally:
+            config.clear()
+            config.set(("cache",), "file", dbpath)
+        sent = []
+
+        def request(method, url, **kwargs):
+            sent.append(kwargs.get("headers"))
+            response = requests.Response()
+            response.url = url
+            if kwargs.get("headers", {}).get("If-None-Match") == '"v1"':
+                response.status_code = 304
+            else:
+                response.status_code = 200
+                response.headers["ETag"] = '"v1"'
+                response.headers["Content-Type"] = \
+                    "application/json; charset=utf-8"
+                response._content = b'{"a": "\xc3\xa4"}'
+            return response
+
+        url = "https://example.org/api"
+        with patch.object(extr.session, "request", request):
+            self.assertEqual(extr.request_json(url, params={"q": 1}),
+                             {"a": "ä"})
+            response = extr.request(url, params={"q": 1})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json(), {"a": "ä"})
+            self.assertEqual(response.encoding, "utf-8")
+            extr.request(url, params={"q": 2})
+
+        self.assertNotIn("If-None-Match", sent[0] or {})
+        self.assertEqual(sent[1]["If-None-Match"], '"v1"')
+        self.assertNotIn("If-None-Match", sent[2] or {})
+        cache.clear("generic")
+
 
 if __name__ == "__main__":
     unittest.main()
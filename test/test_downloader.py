@@ -13,12 +13,15 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 
 import re
+import json
 import logging
 import os.path
 import binascii
 import tempfile
 import threading
+import http.client
 import http.server
+import requests
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import downloader, extractor, output, config, path  # noqa E402
@@ -134,6 +137,8 @@ class TestDownloaderConfig(unittest.TestCase):
         self.assertEqual(dl.rate, None)
         self.assertEqual(dl.part, True)
         self.assertEqual(dl.partdir, None)
+        self.assertEqual(dl.consume_max, 65536)
+        self.assertIsNone(dl.segments)
 
         self.assertIs(dl.interval_429, extr._interval_429)
         self.assertIs(dl.retry_codes, extr._retry_codes)
@@ -166,6 +171,41 @@ class TestDownloaderConfig(unittest.TestCase):
         self.assertEqual(dl.rate(), 42)
         self.assertEqual(dl.part, False)
 
+    def test_release_conn(self):
+        config.set(("downloader", "http"), "consume-content", "1k")
+        dl = downloader.find("http")(FakeJob())
+        self.assertEqual(dl.consume_max, 1024)
+
+        for length, consumed in (("100", True), ("1024", True),
+                                 ("1025", False), (None, False)):
+            response = Mock()
+            response.headers = {} if length is None else {
+                "Content-Length": length}
+            response.iter_content.return_value = ()
+            dl.release_conn(response)
+            self.assertEqual(response.iter_content.called, consumed)
+            self.assertEqual(response.close.called, not consumed)
+
+        config.set(("downloader", "http"), "consume-content", False)
+        dl = downloader.find("http")(FakeJob())
+        response = Mock()
+        response.headers = {"Content-Length": "10"}
+        dl.release_conn(response)
+        response.close.assert_called_once_with()
+        response.iter_content.assert_not_called()
+
+    def test_chunk_size_auto(self):
+        config.set(("downloader", "http"), "chunk-size", "auto")
+        dl = downloader.find("http")(FakeJob())
+        self.assertEqual(dl.chunk_size, 65536)
+        self.assertEqual(dl.iter_content, dl._iter_content_auto)
+
+        # fixed chunk size with rate limits
+        config.set(("downloader", "http"), "rate", "10k")
+        dl = downloader.find("http")(FakeJob())
+        self.assertEqual(dl.chunk_size, 10240)
+        self.assertNotEqual(dl.iter_content, dl._iter_content_auto)
+
 
 class TestDownloaderBase(unittest.TestCase):
 
@@ -242,7 +282,8 @@ class TestHTTPDownloader(TestDownloaderBase):
         port = 0  # select random not-in-use port
 
         try:
-            server = http.server.HTTPServer((host, port), HttpRequestHandler)
+            server = http.server.ThreadingHTTPServer(
+                (host, port), HttpRequestHandler)
         except OSError as exc:
             raise unittest.SkipTest(
                 f"cannot spawn local HTTP server ({exc})")
@@ -280,6 +321,31 @@ class TestHTTPDownloader(TestDownloaderBase):
         self._run_test("png", None, DATA["png"], "gif", "png")
         self._run_test("gif", None, DATA["gif"], "jpg", "gif")
 
+    def test_http_stream(self):
+        streamed = []
+
+        def stream(pathfmt):
+            streamed.append(b"")
+            return lambda data: streamed.append(data)
+
+        self.downloader.hooks = {"stream": [stream, lambda pathfmt: None]}
+        try:
+            self._run_test("jpg", None, DATA["jpg"], "png", "jpg")
+            self.assertEqual(b"".join(streamed), DATA["jpg"])
+
+            # no streaming for resumed downloads
+            del streamed[:]
+            pathfmt = self._prepare_destination(extension="png")
+            with open(pathfmt.temppath + ".part", "wb") as fp:
+                fp.write(DATA["png"][:12])
+            self.assertTrue(self.downloader.download(
+                f"{self.address}/png", pathfmt))
+            with pathfmt.open("rb") as fp:
+                self.assertEqual(fp.read(), DATA["png"])
+            self.assertEqual(streamed, [])
+        finally:
+            self.downloader.hooks = ()
+
     def test_http_filesize_min(self):
         url = f"{self.address}/gif"
         pathfmt = self._prepare_destination(None, extension=None)
@@ -298,6 +364,134 @@ class TestHTTPDownloader(TestDownloaderBase):
         self.assertTrue(success)
         self.assertEqual(pathfmt.temppath, "")
 
+    def test_http_chunk_size_auto(self):
+        dl = self.downloader
+        dl.iter_content = dl._iter_content_auto
+        readinto = http.client.HTTPResponse.readinto
+        try:
+            with patch.object(http.client.HTTPResponse, "readinto",
+                              autospec=True, side_effect=readinto) as mock:
+                self._run_test("jpg", None, DATA["jpg"], "png", "jpg")
+                self._run_test("gif", DATA["gif"][:5], DATA["gif"],
+                               "gif", "gif")
+            self.assertTrue(mock.called)
+        finally:
+            del dl.iter_content
+
+        # response body ends early
+        response = Mock()
+        response.raw.chunked = False
+        response.raw.length_remaining = 20
+        response.raw._fp.readinto.side_effect = (10, 0)
+        response.headers = {}
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            for _ in dl._iter_content_auto(response):
+                pass
+        response.raw.release_conn.assert_not_called()
+
+    def test_http_segmented(self):
+        dl = self.downloader
+        dl.segments = 4
+        dl.segments_min = 1
+        try:
+            with patch.object(dl, "_segment_fetch",
+                              wraps=dl._segment_fetch) as fetch:
+                self._run_test("jpg", None, DATA["jpg"], "png", "jpg")
+                self._run_test("gif", DATA["gif"][:5], DATA["gif"],
+                               "gif", "gif")
+            self.assertEqual(fetch.call_count, 8)
+        finally:
+            dl.segments = None
+
+    def test_http_segmented_resume(self):
+        dl = self.downloader
+        dl.segments = 4
+        dl.segments_min = 1
+        data = DATA["jpg"]
+        size = len(data)
+
+        # first and third segment partially downloaded
+        content = bytearray(size)
+        content[:50] = data[:50]
+        content[150:180] = data[150:180]
+        segments = [[50, 70], [70, 150], [180, 220], [220, size]]
+
+        pathfmt = self._prepare_destination(extension="jpg")
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath + ".part", "wb") as fp:
+            fp.write(content)
+        with open(pathfmt.realpath + ".part.segments", "w") as fp:
+            json.dump({"size": size, "segments": segments}, fp)
+
+        try:
+            with patch.object(dl, "_segment_fetch",
+                              wraps=dl._segment_fetch) as fetch:
+                self.assertTrue(dl.download(
+                    f"{self.address}/jpg", pathfmt))
+            self.assertEqual(fetch.call_count, 4)
+        finally:
+            dl.segments = None
+
+        self.assertFalse(os.path.exists(pathfmt.temppath + ".segments"))
+        pathfmt.finalize()
+        with open(pathfmt.realpath, "rb") as fp:
+            self.assertEqual(fp.read(), data)
+
+    def test_http_segmented_disabled(self):
+        dl = self.downloader
+        data = DATA["jpg"]
+        size = len(data)
+
+        # interrupted segmented download with a preallocated '.part' file
+        content = bytearray(size)
+        content[:50] = data[:50]
+        content[150:180] = data[150:180]
+        segments = [[50, 70], [70, 150], [180, 220], [220, size]]
+
+        pathfmt = self._prepare_destination(extension="jpg")
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath + ".part", "wb") as fp:
+            fp.write(content)
+        with open(pathfmt.realpath + ".part.segments", "w") as fp:
+            json.dump({"size": size, "segments": segments}, fp)
+
+        self.assertIsNone(dl.segments)
+        self.assertTrue(dl.download(f"{self.address}/jpg", pathfmt))
+        self.assertFalse(os.path.exists(pathfmt.temppath + ".segments"))
+        pathfmt.finalize()
+        with open(pathfmt.realpath, "rb") as fp:
+            self.assertEqual(fp.read(), data)
+
+    def test_http_segmented_invalid(self):
+        dl = self.downloader
+        data = DATA["jpg"]
+
+        # preallocated '.part' file with unusable progress data
+        pathfmt = self._prepare_destination(extension="jpg")
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath + ".part", "wb") as fp:
+            fp.write(bytes(len(data)))
+        with open(pathfmt.realpath + ".part.segments", "w") as fp:
+            fp.write("{}")
+
+        self.assertTrue(dl.download(f"{self.address}/jpg", pathfmt))
+        self.assertFalse(os.path.exists(pathfmt.temppath + ".segments"))
+        pathfmt.finalize()
+        with open(pathfmt.realpath, "rb") as fp:
+            self.assertEqual(fp.read(), data)
+
+    def test_http_connection_stats(self):
+        from gallery_dl.extractor import common
+        host = self.address.split("/")[2].partition(":")[0]
+        num, connections, _ = common.CONNECTION_STATS.get(host, (0, 0, 0))
+
+        self._run_test("jpg", None, DATA["jpg"], "jpg", "jpg")
+        self._run_test("png", None, DATA["png"], "png", "png")
+
+        stats = common.CONNECTION_STATS[host]
+        self.assertEqual(stats[0], num + 2)
+        self.assertGreater(stats[1], connections)
+
     def test_http_empty(self):
         url = f"{self.address}/~NUL"
         pathfmt = self._prepare_destination(None, extension=None)
@@ -335,17 +529,24 @@ class HttpRequestHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(self.path.encode())
             return
 
-        headers = {"Content-Length": len(output)}
+        headers = {"Content-Length": len(output), "Accept-Ranges": "bytes"}
 
         if "Range" in self.headers:
             status = 206
 
-            match = re.match(r"bytes=(\d+)-", self.headers["Range"])
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers["Range"])
             start = int(match[1])
+            if start >= len(output):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(output)}")
+                self.end_headers()
+                return
+            end = int(match[2]) if match[2] else len(output) - 1
 
             headers["Content-Range"] = \
-                f"bytes {start}-{len(output) - 1}/{len(output)}"
-            output = output[start:]
+                f"bytes {start}-{end}/{len(output)}"
+            output = output[start:end+1]
+            headers["Content-Length"] = len(output)
         else:
             status = 200
 
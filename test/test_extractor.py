@@ -10,14 +10,17 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import time
 import string
+import tempfile
+import threading
+import http.server
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import extractor, util, dt, config  # noqa E402
-from gallery_dl.extractor import mastodon  # noqa E402
+from gallery_dl import extractor, util, dt, config, exception  # noqa E402
+from gallery_dl.extractor import mastodon, common  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 from gallery_dl.extractor.directlink import DirectlinkExtractor  # noqa E402
 
@@ -54,6 +57,7 @@ class TestExtractorModule(unittest.TestCase):
 
     def setUp(self):
         extractor._cache.clear()
+        extractor._added.clear()
         extractor._module_iter = extractor._modules_internal()
         extractor._list_classes = _list_classes
 
@@ -86,6 +90,133 @@ class TestExtractorModule(unittest.TestCase):
         self.assertEqual(classes[0], FakeExtractor)
         self.assertIsInstance(extractor.find(uri), FakeExtractor)
 
+    def test_index(self):
+        classes = list(extractor._list_classes())
+        index = extractor._index_build(None)
+        self.assertEqual(len(index["classes"]), len(classes))
+
+        urls = ["", "/tmp/file.ext", "fake:foobar"]
+        urls.extend(cls.example for cls in classes if cls.category != "ytdl")
+        if results:
+            urls.extend(result["#url"] for result in results.all())
+
+        with patch.object(extractor, "_index", index):
+            for url in urls:
+                expected = None
+                for cls in classes:
+                    if cls.pattern.match(url):
+                        expected = cls
+                        break
+
+                for cls in extractor._find_classes(url):
+                    if cls.pattern.match(url):
+                        self.assertIs(cls, expected, url)
+                        break
+                else:
+                    self.assertIsNone(expected, url)
+
+            # classes added at runtime
+            extractor.add(FakeExtractor)
+            self.assertIsInstance(extractor.find("fake:foobar"), FakeExtractor)
+
+    def test_registry(self):
+        """Ensure the generated registry is up to date"""
+        from gallery_dl.extractor import _registry
+
+        base, checksums = extractor._registry_checksums()
+        self.assertEqual(_registry.BASE, base,
+                         "run 'scripts/registry.py'")
+        self.assertEqual(_registry.MODULES, tuple(
+            (name, checksums[name]) for name in extractor.modules),
+            "run 'scripts/registry.py'")
+        entries = [
+            tuple(extractor._class_info(cls))
+            for cls in extractor._list_classes()
+        ]
+        self.assertEqual(_registry.EXTRACTORS, tuple(entries),
+                         "run 'scripts/registry.py'")
+
+        info = extractor.ExtractorInfo._make(_registry.EXTRACTORS[0])
+        self.assertIs(info.load(), extractor._list_classes()[0])
+
+    def test_registry_fallback(self):
+        extractor._index = {"classes": [("gallery_dl.extractor.foo", "Foo")]}
+        extractor._index_classes = [None]
+
+        classes = list(extractor._index_iter([], [0]))
+        self.assertEqual(classes, list(extractor._list_classes()))
+        self.assertIsNone(extractor._index)
+        self.assertIsNone(extractor._index_classes)
+        self.assertFalse(extractor._registry_checked)
+
+        extractor._registry_checked = None
+
+    @patch.object(extractor, "_module_iter", extractor._module_iter_default)
+    def test_registry_stale(self):
+        from gallery_dl.extractor import _registry
+
+        with patch.object(extractor, "_registry_checked", None):
+            self.assertEqual(extractor._registry_stale(), set())
+
+        # out-of-date modules
+        modules = dict(_registry.MODULES)
+        modules["imgur"] = "00000000"
+        with patch.object(_registry, "MODULES", tuple(modules.items())), \
+                patch.object(extractor, "_registry_checked", None), \
+                patch.object(extractor, "_class_info",
+                             wraps=extractor._class_info) as class_info:
+            self.assertEqual(extractor._registry_stale(), {"imgur"})
+            entries = extractor._registry_entries()
+
+        modules = {args[0].__module__ for args, _ in class_info.call_args_list}
+        self.assertEqual(modules, {"gallery_dl.extractor.imgur"})
+        self.assertEqual(
+            [tuple(info) for info in entries], list(_registry.EXTRACTORS))
+
+        # changed shared files
+        with patch.object(_registry, "BASE", "00000000"), \
+                patch.object(extractor, "_registry_checked", None):
+            self.assertIsNone(extractor._registry_stale())
+
+    def test_pattern_factors(self):
+        factors = extractor._pattern_factors
+
+        self.assertEqual(factors(r"(?:https?://)?(?:www\.)?example\.org/a"),
+                         ("example.org/a",))
+        self.assertEqual(factors(r"(?i)https?://EXAMPLE\.(?:org|com)/"),
+                         ("://example.",))
+        self.assertEqual(factors(r"https?://(?:fooba|bar\.baz)/a"),
+                         ["fooba", "bar.baz"])
+        self.assertEqual(factors(r"(?:foo|)bar"), ("bar",))
+        self.assertIsNone(factors(r"(?:ytdl:)?(.*)"))
+
+    def test_session_pool(self):
+        extr1 = extractor.find("generic:https://example.org/")
+        extr2 = extractor.find("generic:https://example.com/")
+        extr1.initialize()
+        extr2.initialize()
+
+        # connection pools are shared between extractors
+        adapter = extr1.session.get_adapter("https://example.org/")
+        self.assertIs(adapter, extr2.session.get_adapter("https://"))
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertFalse(adapter._pool_block)
+
+        pool = adapter.poolmanager.connection_from_url("https://example.org/")
+        self.assertIsInstance(pool, common.HTTPSConnectionPool)
+        self.assertIs(pool.ConnectionCls, common.HTTPSConnection)
+
+        config.set(("extractor",), "pool-size", 4)
+        config.set(("extractor",), "pool-block", True)
+        try:
+            extr = extractor.find("generic:https://example.org/")
+            extr.initialize()
+        finally:
+            config.clear()
+        adapter = extr.session.get_adapter("https://")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertTrue(adapter._pool_block)
+
     def test_from_url(self):
         for uri in self.VALID_URIS:
             cls = extractor.find(uri).__class__
@@ -261,6 +392,358 @@ class TestExtractorWait(unittest.TestCase):
         return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
 
 
+class TestExtractorPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        self.extr = extractor.find("generic:https://example.org/")
+        self.produced = []
+
+    def _pages(self, num, exc=None):
+        for i in range(num):
+            self.produced.append(i)
+            yield [i, i]
+        if exc is not None:
+            raise exc
+
+    def _wait(self, length):
+        for _ in range(100):
+            if len(self.produced) >= length:
+                break
+            time.sleep(0.01)
+        time.sleep(0.02)
+
+    def test_prefetch(self):
+        pages = self.extr._prefetch(self._pages(5), 2)
+        self.assertEqual(next(pages), [0, 0])
+
+        # at most 'depth' pages ahead of the current one
+        self._wait(3)
+        self.assertEqual(self.produced, [0, 1, 2])
+
+        self.assertEqual(list(pages), [[1, 1], [2, 2], [3, 3], [4, 4]])
+
+    def test_prefetch_disabled(self):
+        config.set((), "prefetch", 0)
+        try:
+            pages = self.extr._prefetch(self._pages(3))
+            self.assertEqual(next(pages), [0, 0])
+            self.assertEqual(self.produced, [0])
+            self.assertEqual(list(pages), [[1, 1], [2, 2]])
+        finally:
+            config.clear()
+
+    def test_prefetch_exception(self):
+        pages = self.extr._prefetch(self._pages(2, ValueError("foo")))
+        self.assertEqual(next(pages), [0, 0])
+        self.assertEqual(next(pages), [1, 1])
+        with self.assertRaises(ValueError):
+            next(pages)
+
+    def test_prefetch_close(self):
+        closed = []
+
+        def gen():
+            try:
+                yield from self._pages(100)
+            finally:
+                closed.append(True)
+
+        pages = self.extr._prefetch(gen(), 1)
+        self.assertEqual(next(pages), [0, 0])
+        pages.close()
+
+        for _ in range(200):
+            if closed:
+                break
+            time.sleep(0.01)
+        self.assertEqual(closed, [True])
+        self.assertLessEqual(len(self.produced), 3)
+
+    def test_request_interval(self):
+        extr = self.extr
+        extr.initialize()
+        extr._interval = util.build_duration_func(0.05)
+        starts = []
+        active = []
+        overlap = []
+
+        def request(*args, **kwargs):
+            starts.append(time.time())
+            active.append(1)
+            overlap.append(len(active))
+            time.sleep(0.08)
+            active.pop()
+            return Mock(status_code=200)
+
+        def run():
+            for _ in range(3):
+                extr.request("https://example.org/")
+
+        with patch.object(extr.session, "request", request), \
+                patch.dict(common._request_slots, clear=True):
+            threads = [threading.Thread(target=run) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # requests start at least 'interval' seconds apart,
+        # but do not block each other while in progress
+        self.assertEqual(len(starts), 6)
+        starts.sort()
+        for prev, start in zip(starts, starts[1:]):
+            self.assertGreaterEqual(start - prev, 0.049)
+        self.assertIn(2, overlap)
+
+    def test_request_interval_category(self):
+        extr = self.extr
+        extr.initialize()
+        extr._interval = util.build_duration_func(10.0)
+
+        with patch.object(extr.session, "request") as request, \
+                patch.object(extr, "sleep") as sleep, \
+                patch.dict(common._request_slots, clear=True):
+            request.return_value = Mock(status_code=200)
+            common._request_slot("other").timestamp = time.time()
+
+            # requests to other sites do not delay this one
+            extr.request("https://example.org/")
+            sleep.assert_not_called()
+
+            extr.request("https://example.org/")
+            sleep.assert_called_once()
+
+        self.assertEqual(request.call_count, 2)
+
+    def test_map_threaded(self):
+        threads = set()
+
+        def func(i):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01 * (i % 3))
+            return i * 2
+
+        results = self.extr._map_threaded(func, range(10), 3)
+        self.assertEqual(list(results), [i * 2 for i in range(10)])
+        self.assertLessEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("generic-worker")
+                            for name in threads))
+
+        results = self.extr._map_threaded(func, range(3), 1)
+        self.assertEqual(list(results), [0, 2, 4])
+
+    def test_map_threaded_exception(self):
+        def func(i):
+            if i == 2:
+                raise ValueError(i)
+            return i
+
+        results = self.extr._map_threaded(func, range(5), 2)
+        self.assertEqual(next(results), 0)
+        self.assertEqual(next(results), 1)
+        with self.assertRaises(ValueError):
+            next(results)
+
+
+class TestExtractorBooru(unittest.TestCase):
+
+    def setUp(self):
+        self.extr = extractor.find(
+            "https://safebooru.org/index.php?page=post&s=list&tags=foo")
+        self.extr.initialize()
+        self.posts = [
+            {"id": i, "md5": str(i), "change": 100 + i, "tags": "",
+             "created_at": "Sat Jan 01 00:00:00 +0000 2000",
+             "file_url": f"https://example.org/{i}.jpg"}
+            for i in range(6)
+        ]
+        self.posts[4]["file_url"] = ""
+        del self.posts[5]["change"]
+
+    def tearDown(self):
+        config.clear()
+
+    def _run(self, html):
+        def _tags(post, page):
+            post["tags_artist"] = page
+
+        with patch.object(self.extr, "posts", return_value=self.posts), \
+                patch.object(self.extr, "_html", html), \
+                patch.object(self.extr, "_tags", _tags):
+            return [post for msg, _, post in self.extr
+                    if msg == Message.Url]
+
+    def test_tags(self):
+        config.set((), "tags", True)
+        config.set((), "metadata-cache", False)
+        threads = set()
+
+        def html(post):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01 * (3 - post["id"] % 3))
+            return f"artist{post['id']}"
+
+        posts = self._run(html)
+        self.assertEqual([p["id"] for p in posts], [0, 1, 2, 3, 5])
+        self.assertEqual([p["tags_artist"] for p in posts],
+                         ["artist0", "artist1", "artist2", "artist3",
+                          "artist5"])
+        self.assertTrue(all(name.startswith("safebooru-worker")
+                            for name in threads))
+
+    def test_tags_cache(self):
+        config.set((), "tags", True)
+        config.set((), "metadata-cache", True)
+        config.set((), "metadata-workers", 1)
+        html = Mock(side_effect=lambda post: f"artist{post['id']}")
+        prefix = "gallery_dl.extractor.booru.metadata-safebooru_"
+
+        def load(key):
+            if key != prefix + "1_101_10":
+                return {"tags_artist": "cached"}
+
+        with patch("gallery_dl.cache.entry_load", side_effect=load) as ld, \
+                patch("gallery_dl.cache.entry_store") as store:
+            posts = self._run(html)
+
+        self.assertEqual([p["tags_artist"] for p in posts],
+                         ["cached", "artist1", "cached", "cached", "artist5"])
+        self.assertEqual(ld.call_args_list[0][0][0], prefix + "0_100_10")
+        store.assert_called_once_with(
+            prefix + "1_101_10", {"tags_artist": "artist1"}, 30*86400)
+        self.assertEqual(html.call_count, 2)
+
+    def test_tags_cache_disabled(self):
+        config.set((), "tags", True)
+        html = Mock(side_effect=lambda post: f"artist{post['id']}")
+
+        with patch("gallery_dl.cache.entry_load") as load:
+            posts = self._run(html)
+
+        self.assertEqual(len(posts), 5)
+        self.assertEqual(html.call_count, 5)
+        load.assert_not_called()
+
+
+class TestExtractorKemono(unittest.TestCase):
+
+    def tearDown(self):
+        config.clear()
+
+    def test_comments(self):
+        config.set((), "comments", True)
+        config.set((), "metadata", False)
+        extr = extractor.find("https://kemono.cr/fanbox/user/12345")
+        extr.initialize()
+
+        posts = [
+            {"id": str(i), "service": "fanbox", "user": "12345",
+             "published": "2020-01-01T00:00:00", "title": "",
+             "file": {}, "attachments": []}
+            for i in range(8)
+        ]
+        threads = set()
+
+        def comments(service, creator_id, post_id):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01 * (int(post_id) % 3))
+            return [{"content": post_id}] if post_id != "5" else "error"
+
+        with patch.object(extr, "posts", return_value=posts), \
+                patch.object(extr.api, "creator_post_comments", comments):
+            results = [post for msg, _, post in extr
+                       if msg == Message.Directory]
+
+        self.assertEqual([post["id"] for post in results],
+                         [str(i) for i in range(8)])
+        self.assertEqual(results[1]["comments"], [{"content": "1"}])
+        self.assertEqual(results[5]["comments"], ())
+        self.assertTrue(all(name.startswith("kemono-worker")
+                            for name in threads))
+
+
+class TestExtractorRecording(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "recording.sqlite3")
+        self.requests = requests = []
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                requests.append(self.path)
+                if self.path == "/redirect":
+                    self.send_response(302)
+                    self.send_header("Location", "/page")
+                    self.send_header("Content-Length", "0")
+                    self.send_header("Set-Cookie", "a=1; Path=/")
+                    self.send_header("Set-Cookie", "b=2; Path=/")
+                    self.end_headers()
+                    return
+                body = f"{self.path} {len(requests)}".encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), RequestHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.root = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        for recording in common.CACHE_RECORDINGS.values():
+            recording.db.close()
+        common.CACHE_RECORDINGS.clear()
+        self.tmpdir.cleanup()
+        config.clear()
+
+    def _extractor(self):
+        extr = extractor.find("generic:" + self.root)
+        extr.initialize()
+        return extr
+
+    def test_record_replay(self):
+        config.set(("extractor",), "http-record", self.path)
+        extr = self._extractor()
+        self.assertIsInstance(
+            extr.session.get_adapter(self.root), common.RecordAdapter)
+        self.assertEqual(extr.request(self.root + "/redirect").text,
+                         "/page 2")
+        self.assertEqual(extr.request(self.root + "/page").text, "/page 3")
+        self.assertEqual(extr.cookies.get("b"), "2")
+
+        config.clear()
+        config.set(("extractor",), "http-replay", self.path)
+        extr = self._extractor()
+        self.assertIsInstance(
+            extr.session.get_adapter(self.root), common.ReplayAdapter)
+
+        response = extr.request(self.root + "/redirect")
+        self.assertEqual(response.text, "/page 2")
+        self.assertEqual(response.headers["Content-Type"], "text/plain")
+        self.assertEqual(len(response.history), 1)
+        self.assertEqual(extr.cookies.get("a"), "1")
+        self.assertEqual(extr.cookies.get("b"), "2")
+
+        # last response gets repeated
+        self.assertEqual(extr.request(self.root + "/page").text, "/page 3")
+        self.assertEqual(extr.request(self.root + "/page").text, "/page 3")
+        self.assertEqual(len(self.requests), 3)
+
+        with self.assertRaises(exception.HttpError):
+            extr.request(self.root + "/other")
+        self.assertEqual(len(self.requests), 3)
+
+
 class TextExtractorCommonDateminmax(unittest.TestCase):
 
     def setUp(self):
@@ -10,12 +10,17 @@
 import os
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import io
+import time
+import sqlite3
+import tempfile
+import threading
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from gallery_dl import job, config, text  # noqa E402
+import gallery_dl  # noqa E402
+from gallery_dl import job, config, text, util, exception  # noqa E402
 from gallery_dl.extractor.common import Extractor, Message  # noqa E402
 
 
@@ -65,6 +70,355 @@ class TestDownloadJob(TestJob):
         self.assertEqual(func(TestExtractorParent), False)
         self.assertEqual(func(TestExtractorAlt)   , False)
 
+    def _run_concurrent(self, delays, exists=()):
+        active = []
+        results = []
+
+        def download(_, url, pathfmt):
+            active.append(url)
+            results.append(len(active))
+            time.sleep(delays[url[-5]])
+            with pathfmt.open() as fp:
+                fp.write(b"")
+            active.remove(url)
+            return True
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set(("downloader", "http"), "concurrency", 3)
+            os.makedirs(tmpdir + "/test_category")
+            for name in exists:
+                open(tmpdir + "/test_category/test_" + name, "w").close()
+
+            tjob = self.jobclass(TestExtractor.from_url("test:"))
+            tjob.out = out = Mock()
+            with patch("gallery_dl.downloader.http.HttpDownloader.download",
+                       download):
+                tjob.run()
+
+            files = sorted(os.listdir(tmpdir + "/test_category"))
+
+        calls = [(name, os.path.basename(args[0]))
+                 for name, args, _ in out.mock_calls]
+        return calls, files, max(results)
+
+    def test_concurrency(self):
+        calls, files, active = self._run_concurrent(
+            {"1": 0.3, "2": 0.2, "3": 0.1})
+
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("success", "test_2.jpg"),
+            ("success", "test_3.jpg"),
+        ])
+        self.assertEqual(files, ["test_1.jpg", "test_2.jpg", "test_3.jpg"])
+        self.assertGreater(active, 1)
+
+    def test_concurrency_skip(self):
+        config.set((), "skip", "abort:2")
+        calls, files, active = self._run_concurrent(
+            {"1": 0.2, "2": 0.0, "3": 0.0}, ("2.jpg", "3.jpg"))
+
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("skip"   , "test_2.jpg"),
+            ("skip"   , "test_3.jpg"),
+        ])
+
+    def test_concurrency_skip_pending(self):
+        config.set((), "skip", "abort:1")
+        calls, files, active = self._run_concurrent(
+            {"1": 0.2, "2": 0.0, "3": 0.0}, ("2.jpg",))
+
+        # finish downloads started before the queued skip
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("skip"   , "test_2.jpg"),
+            ("success", "test_3.jpg"),
+        ])
+        self.assertEqual(files, ["test_1.jpg", "test_2.jpg", "test_3.jpg"])
+
+    def test_concurrency_archive(self):
+        config.set((), "archive", ":memory:")
+        config.set((), "archive-format", "{user[id]}")
+        calls, files, active = self._run_concurrent(
+            {"1": 0.1, "2": 0.0, "3": 0.0})
+
+        # wait for pending downloads with the same archive entry
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("skip"   , "test_2.jpg"),
+            ("skip"   , "test_3.jpg"),
+        ])
+        self.assertEqual(files, ["test_1.jpg"])
+        self.assertEqual(active, 1)
+
+    def test_skip_scandir(self):
+        config.set((), "skip-scandir", True)
+        with patch("os.lstat", wraps=os.lstat) as lstat:
+            calls, files, _ = self._run_concurrent(
+                {"1": 0.0, "2": 0.0, "3": 0.0}, ("2.jpg",))
+        self._assert_lstat(lstat, ["test_1.jpg", "test_3.jpg"])
+
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("skip"   , "test_2.jpg"),
+            ("success", "test_3.jpg"),
+        ])
+
+    def test_skip_scandir_enumerate(self):
+        config.set((), "skip", "enumerate")
+        config.set((), "skip-scandir", True)
+        with patch("os.lstat", wraps=os.lstat) as lstat:
+            calls, files, _ = self._run_concurrent(
+                {"1": 0.0, "2": 0.0, "3": 0.0}, ("1.jpg", "1.1.jpg"))
+        self._assert_lstat(lstat, ["test_1.2.jpg", "test_2.jpg", "test_3.jpg"])
+
+        self.assertEqual(calls, [
+            ("success", "test_1.2.jpg"),
+            ("success", "test_2.jpg"),
+            ("success", "test_3.jpg"),
+        ])
+
+    def test_skip_scandir_outdated(self):
+        from gallery_dl import path
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "skip-scandir", True)
+            pathfmt = path.PathFormat(TestExtractor.from_url("test:"))
+            kwdict = {"category": "test_category",
+                      "filename": "file", "extension": "jpg"}
+            pathfmt.set_directory(kwdict)
+            pathfmt.set_filename(kwdict)
+            pathfmt.build_path()
+            os.makedirs(pathfmt.realdirectory)
+            self.assertFalse(pathfmt.exists())
+
+            # written by another process after reading the directory
+            open(pathfmt.realpath, "w").close()
+            self.assertTrue(pathfmt.exists())
+
+            # names differing only in case
+            with patch("os.path.normcase", str.lower):
+                pathfmt._listing_directory = None
+                kwdict["filename"] = "FILE"
+                pathfmt.set_filename(kwdict)
+                pathfmt.build_path()
+                with patch("os.lstat") as lstat:
+                    self.assertTrue(pathfmt.exists())
+                lstat.assert_not_called()
+
+    def test_archive_watermark(self):
+        success = True
+
+        def download(_, url, pathfmt):
+            if success:
+                with pathfmt.open() as fp:
+                    fp.write(b"")
+            return success
+
+        def run(top, stop=None):
+            extr = TestExtractorWatermark.from_url("test:watermark")
+            extr.top = top
+            extr.stop = stop
+            tjob = self.jobclass(extr)
+            tjob.out = out = Mock()
+            with patch("gallery_dl.downloader.http.HttpDownloader.download",
+                       download):
+                tjob.run()
+            return extr.ids, [name for name, _, _ in out.mock_calls]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", tmpdir + "/archive.sqlite3")
+            config.set((), "archive-watermark", True)
+
+            self.assertEqual(run(3), ([3, 2, 1], ["success"] * 3))
+            # stop at the first known post
+            self.assertEqual(run(5), ([5, 4], ["success"] * 2))
+            self.assertEqual(run(5), ([], []))
+
+            # no high-water mark updates after failed downloads
+            success = False
+            self.assertEqual(run(7), ([7, 6], []))
+            success = True
+            self.assertEqual(run(7), ([7, 6], ["success"] * 2))
+
+            # disabled with ranges and filters
+            config.set((), "image-range", "1-2")
+            self.assertEqual(run(7), ([7, 6, 5], ["skip"] * 2))
+            config.set((), "image-range", "1")
+            self.assertEqual(run(9), ([9, 8], ["success"]))
+            config.unset((), "image-range")
+            config.set((), "image-filter", "num != 8")
+            self.assertEqual(run(10), ([10, 9, 8, 7, 6, 5, 4, 3, 2, 1],
+                                       ["success"] + ["skip"] * 8))
+            config.unset((), "image-filter")
+            self.assertEqual(run(10), ([10, 9, 8], ["skip", "skip",
+                                                    "success"]))
+            self.assertEqual(run(10), ([], []))
+
+            # not updated after other early stops
+            self.assertEqual(run(12, 11), ([12], ["success"]))
+            self.assertEqual(run(12), ([12, 11], ["skip", "success"]))
+
+            # updated after aborting because of archived files
+            config.set((), "image-range", "1-2")
+            self.assertEqual(run(14), ([14, 13, 12], ["success"] * 2))
+            config.unset((), "image-range")
+            config.set((), "skip", "abort:1")
+            self.assertEqual(run(15), ([15, 14], ["success", "skip"]))
+            self.assertEqual(run(15), ([], []))
+
+    def test_checkpoint(self):
+        stored = []
+
+        def download(_, url, pathfmt):
+            time.sleep(0.01)
+            with pathfmt.open() as fp:
+                fp.write(b"")
+            return True
+
+        def run(url):
+            extr = TestExtractorCheckpoint.from_url(url)
+            tjob = self.jobclass(extr)
+            tjob.out = out = Mock()
+
+            def checkpoint_store(key, value):
+                done = [args[0] for name, args, _ in out.mock_calls
+                        if name in ("success", "skip")]
+                stored.append((value, len(done)))
+
+            with patch("gallery_dl.downloader.http.HttpDownloader.download",
+                       download), \
+                    patch("gallery_dl.cache.checkpoint_load") as load, \
+                    patch("gallery_dl.cache.checkpoint_store",
+                          checkpoint_store):
+                load.return_value = None
+                tjob.run()
+            load.assert_called_once_with(url)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set(("downloader", "http"), "concurrency", 4)
+
+            # store checkpoints after finishing all previous downloads
+            run("test:checkpoint")
+            self.assertEqual(stored, [(2, 1), (3, 2), (4, 3), (None, 3)])
+
+            # keep checkpoint of interrupted runs
+            stored.clear()
+            run("test:checkpoint_fail")
+            self.assertEqual(stored, [(2, 1), (3, 2)])
+
+            # disabled
+            stored.clear()
+            config.set((), "cursor-checkpoint", False)
+            with patch("gallery_dl.cache.checkpoint_load") as load:
+                extr = TestExtractorCheckpoint.from_url("test:checkpoint")
+                tjob = self.jobclass(extr)
+                tjob.out = Mock()
+                with patch("gallery_dl.downloader.http.HttpDownloader"
+                           ".download", download):
+                    tjob.run()
+                load.assert_not_called()
+            self.assertEqual(stored, [])
+
+    def _run_postprocess(self, delays, fail=None):
+        threads = []
+
+        def download(_, url, pathfmt):
+            with pathfmt.open() as fp:
+                fp.write(b"")
+            return True
+
+        def execute(_, args, shell):
+            threads.append(threading.current_thread().name)
+            time.sleep(delays[args[0]])
+            if args[0] == fail:
+                raise ValueError(fail)
+            return 0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config.set((), "base-directory", tmpdir)
+            config.set((), "archive", tmpdir + "/archive.sqlite3")
+            config.set((), "archive-format", "{num}")
+            config.set((), "postprocessor-workers", 3)
+            config.set((), "postprocessors", [{
+                "name": "exec",
+                "event": "after",
+                "command": ["{num}"],
+            }])
+
+            tjob = self.jobclass(TestExtractor.from_url("test:"))
+            tjob.out = out = Mock()
+            with patch("gallery_dl.downloader.http.HttpDownloader.download",
+                       download), \
+                    patch("gallery_dl.postprocessor.exec.ExecPP._exec",
+                          execute):
+                status = tjob.run()
+
+            files = sorted(os.listdir(tmpdir + "/test_category"))
+            with sqlite3.connect(tmpdir + "/archive.sqlite3") as con:
+                entries = sorted(
+                    e for e, in con.execute("SELECT entry FROM archive"))
+
+        calls = [(name, os.path.basename(args[0]))
+                 for name, args, _ in out.mock_calls]
+        return status, calls, files, entries, threads
+
+    def test_postprocessor_workers(self):
+        status, calls, files, entries, threads = self._run_postprocess(
+            {"1": 0.3, "2": 0.2, "3": 0.1})
+
+        self.assertEqual(status, 0)
+        self.assertEqual(calls, [
+            ("success", "test_1.jpg"),
+            ("success", "test_2.jpg"),
+            ("success", "test_3.jpg"),
+        ])
+        self.assertEqual(files, ["test_1.jpg", "test_2.jpg", "test_3.jpg"])
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(t.startswith("postprocessor") for t in threads))
+
+    def test_postprocessor_workers_error(self):
+        status, calls, files, entries, threads = self._run_postprocess(
+            {"1": 0.0, "2": 0.1, "3": 0.0}, "2")
+
+        # same as running hooks in the main thread:
+        # the file got stored and added to the archive,
+        # but the exception stops everything afterwards
+        self.assertEqual(status, 1)
+        self.assertEqual(calls[:2], [
+            ("success", "test_1.jpg"),
+            ("success", "test_2.jpg"),
+        ])
+        self.assertIn("test_2.jpg", files)
+        self.assertEqual(entries[:2], ["test_category1", "test_category2"])
+
+    def test_postprocessor_workers_disabled(self):
+        config.set((), "postprocessor-workers", 3)
+        config.set((), "postprocessors", ["zip"])
+        tjob = self.jobclass(TestExtractor.from_url("test:"))
+        tjob.extractor.initialize()
+        tjob.initialize()
+        self.assertIsNone(tjob._pp_pending)
+
+        config.set((), "postprocessors", ["mtime"])
+        tjob = self.jobclass(TestExtractor.from_url("test:"))
+        tjob.extractor.initialize()
+        tjob.initialize()
+        self.assertIsNotNone(tjob._pp_pending)
+
+    def _assert_lstat(self, lstat, names):
+        # only files not found in a directory listing get looked up
+        paths = [args[0] for args, _ in lstat.call_args_list]
+        self.assertEqual(
+            [os.path.basename(p) for p in paths if "test_category" in p],
+            names)
+
 
 class TestKeywordJob(TestJob):
     jobclass = job.KeywordJob
@@ -165,6 +519,16 @@ https://example.org/2.jpg
 https://example.org/3.jpg
 """)
 
+    def test_checkpoint(self):
+        # only used by download jobs
+        with patch("gallery_dl.cache.checkpoint_load") as load, \
+                patch("gallery_dl.cache.checkpoint_store") as store:
+            load.return_value = 2
+            extr = TestExtractorCheckpoint.from_url("test:checkpoint")
+            self.assertEqual(self._capture_stdout(extr).count("\n"), 3)
+            load.assert_not_called()
+            store.assert_not_called()
+
 
 class TestInfoJob(TestJob):
     jobclass = job.InfoJob
@@ -360,6 +724,131 @@ class TestDataJob(TestJob):
         self.assertEqual(tjob.data[-1][2]["num"], "3")
 
 
+class TestProcessConcurrent(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log = Mock()
+
+    def tearDown(self):
+        util.FLAGS.__init__()
+        self.tmpdir.cleanup()
+
+    def _input_manager(self, lines, action="c"):
+        path = os.path.join(self.tmpdir.name, "input.txt")
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write("".join(line + "\n" for line in lines))
+
+        input_manager = gallery_dl.InputManager()
+        input_manager.log = Mock()
+        input_manager.add_file(path, action)
+        return input_manager, path
+
+    def _run(self, input_manager, workers=3):
+        return gallery_dl.process_concurrent(
+            ConcurrentJob, input_manager, workers, self.log)
+
+    def test_order(self):
+        # later URLs finish first
+        urls = ["0.3", "fail:0.2", "0.1", "fail:0", "0"]
+        input_manager, path = self._input_manager(urls)
+
+        retval = self._run(input_manager)
+        self.assertEqual(retval, 4)
+
+        with open(path, encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), (
+                "# 0.3\n"
+                "fail:0.2\n"
+                "# 0.1\n"
+                "fail:0\n"
+                "# 0\n"
+            ))
+
+    def test_rewrite(self):
+        input_manager, path = self._input_manager(
+            ["-filename=1", "0.1", "0", "fail:0"], "d")
+
+        with patch.object(input_manager, "_rewrite",
+                          wraps=input_manager._rewrite) as rewrite:
+            self._run(input_manager, 2)
+
+        items = [args[0] for args, _ in rewrite.call_args_list]
+        # URLs with options run on their own
+        self.assertEqual(len(items), 2)
+        self.assertEqual(str(items[0][0]), "0.1")
+        self.assertEqual(items[0][3], [0, 1])
+        self.assertEqual(str(items[1][0]), "0")
+        self.assertEqual(items[1][3], [2])
+
+        with open(path, encoding="utf-8") as fp:
+            self.assertEqual(fp.read(), "fail:0\n")
+
+    def test_status(self):
+        input_manager = gallery_dl.InputManager()
+        input_manager.err = Mock()
+        input_manager.add_list(
+            ["0", "fail:0", "unsupported", "stop", "fail16:0"])
+
+        retval = self._run(input_manager, 2)
+        self.assertEqual(retval, 4 | 16 | 64)
+        self.log.error.assert_called_once_with(
+            "Unsupported URL '%s'", "unsupported")
+        calls = input_manager.err.info.call_args_list
+        self.assertEqual(
+            sorted(args[0] for args, _ in calls),
+            ["fail16:0", "fail:0", "unsupported"])
+
+    def test_interrupt(self):
+        input_manager = gallery_dl.InputManager()
+        input_manager.add_list(["wait", "0", "0", "0", "0"])
+
+        entry = input_manager.entry
+        calls = []
+
+        def interrupt():
+            if len(calls) == 2:
+                raise KeyboardInterrupt()
+            calls.append(None)
+            return entry()
+
+        ConcurrentJob.stopped.clear()
+        with patch.object(input_manager, "entry", interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self._run(input_manager, 2)
+
+        # running jobs terminate instead of keeping gallery-dl alive
+        self.assertTrue(ConcurrentJob.stopped.wait(5))
+
+
+class ConcurrentJob():
+    stopped = threading.Event()
+
+    def __init__(self, url):
+        self.url = url
+
+    def run(self):
+        url = self.url
+        if url == "unsupported":
+            raise exception.NoExtractorError()
+        if url == "stop":
+            raise exception.StopExtraction()
+        if url == "wait":
+            try:
+                while True:
+                    if util.FLAGS.FILE is not None:
+                        util.FLAGS.process("FILE")
+                    time.sleep(0.01)
+            finally:
+                self.stopped.set()
+
+        status, _, delay = url.rpartition(":")
+        time.sleep(float(delay))
+        if status:
+            return int(status[4:] or 4)
+        return 0
+
+
 class TestExtractor(Extractor):
     category = "test_category"
     subcategory = "test_subcategory"
@@ -418,6 +907,42 @@ class TestExtractorException(Extractor):
         return 1/0
 
 
+class TestExtractorCheckpoint(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_checkpoint"
+    pattern = r"test:checkpoint(_fail)?$"
+
+    def items(self):
+        yield Message.Directory, "", {}
+        for i in range(self._checkpoint_load() or 1, 4):
+            yield Message.Url, f"https://example.org/{i}.jpg", {
+                "num": i, "filename": str(i), "extension": "jpg"}
+            self._checkpoint_store(i + 1)
+            if self.groups[0] and i == 2:
+                raise exception.HttpError("429 Too Many Requests")
+
+
+class TestExtractorWatermark(Extractor):
+    category = "test_category"
+    subcategory = "test_subcategory_watermark"
+    archive_fmt = "{num}"
+    pattern = r"test:watermark$"
+
+    def items(self):
+        self.ids = []
+        mark = self._watermark_load() or 0
+        for i in range(self.top, 0, -1):
+            self._watermark_update(i)
+            if i <= mark:
+                return
+            if i == self.stop:
+                raise exception.StopExtraction()
+            self.ids.append(i)
+            yield Message.Directory, "", {}
+            yield Message.Url, f"https://example.org/{i}.jpg", {
+                "num": i, "filename": str(i), "extension": "jpg"}
+
+
 class TestExtractorAlt(Extractor):
     category = "test_category_alt"
     subcategory = "test_subcategory"
@@ -12,10 +12,13 @@ import sys
 import unittest
 from unittest.mock import Mock, mock_open, patch, call
 
+import copy
 import shutil
 import logging
+import sqlite3
 import zipfile
 import tempfile
+import threading
 import collections
 from datetime import datetime
 
@@ -23,6 +26,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from gallery_dl import extractor, output, path, util, exception  # noqa E402
 from gallery_dl import postprocessor, config, archive  # noqa E402
 from gallery_dl.postprocessor.common import PostProcessor  # noqa E402
+from gallery_dl.postprocessor import dedup  # noqa E402
 
 
 class MockPostprocessorModule(Mock):
@@ -173,6 +177,101 @@ class ClassifyTest(BasePostprocessorTest):
         self.assertEqual(self.pathfmt.realpath, f"{path}/file.foo")
 
 
+class DedupTest(BasePostprocessorTest):
+
+    def tearDown(self):
+        dedup._close()
+        BasePostprocessorTest.tearDown(self)
+
+    def _file(self, name, content, stream=False):
+        pathfmt = self.pathfmt
+        pathfmt.set_filename({
+            "category": "test", "extension": "ext",
+            "filename": f"{self._testMethodName}_{name}"})
+        pathfmt.build_path()
+        pathfmt.part_enable()
+        with pathfmt.open("wb") as fp:
+            fp.write(content)
+        if stream:
+            for callback in self.job.hooks["stream"]:
+                callback(pathfmt)(content)
+        self._trigger(("file",))
+        pathfmt.finalize()
+        return pathfmt.realpath
+
+    def test_dedup_hardlink(self):
+        self._create()
+        a = self._file("a", b"foo" * 1000)
+        b = self._file("b", b"bar" * 1000)
+        c = self._file("c", b"foo" * 1000)
+
+        self.assertFalse(os.path.samefile(a, b))
+        self.assertTrue(os.path.samefile(a, c))
+        with open(c, "rb") as fp:
+            self.assertEqual(fp.read(), b"foo" * 1000)
+        self.assertFalse(os.path.exists(c + ".dedup"))
+
+    def test_dedup_skip(self):
+        self._create({"action": "skip"})
+        a = self._file("a", b"foo")
+        b = self._file("b", b"foo")
+
+        self.assertTrue(os.path.exists(a))
+        self.assertFalse(os.path.exists(b))
+        self.assertFalse(os.path.exists(b + ".part"))
+
+    def test_dedup_index(self):
+        index = os.path.join(self.dir.name, "dedup.sqlite3")
+        pp = self._create({"index": index})
+        a = self._file("a", b"foo" * 1000)
+        b = self._file("b", b"bar" * 1000, True)
+
+        with sqlite3.connect(index) as db:
+            entries = db.execute(
+                "SELECT path, size, partial IS NULL, digest IS NULL "
+                "FROM files ORDER BY path").fetchall()
+        self.assertEqual(entries, [
+            (a, 3000, 0, 1),  # partial hash when 'b' had the same size
+            (b, 3000, 0, 0),  # full hash from streamed data
+        ])
+
+        # new post processor instance, same index
+        self.job.hooks.clear()
+        self.assertIs(self._create({"index": index}).index, pp.index)
+        with patch("gallery_dl.postprocessor.dedup._hash") as hash:
+            c = self._file("c", b"bar" * 1000, True)
+        hash.assert_not_called()
+        self.assertTrue(os.path.samefile(b, c))
+
+        # removed files get dropped from the index
+        os.unlink(b)
+        os.unlink(c)
+        d = self._file("d", b"bar" * 1000)
+        self.assertFalse(os.path.samefile(a, d))
+
+        # new process
+        dedup._close()
+        self.job.hooks.clear()
+        self.assertIsNot(self._create({"index": index}).index, pp.index)
+        e = self._file("e", b"bar" * 1000)
+        self.assertTrue(os.path.samefile(d, e))
+
+    def test_dedup_memory(self):
+        # the default in-memory index is shared by all jobs of a run
+        pp = self._create()
+        a = self._file("a", b"foo" * 1000)
+
+        self.job.hooks.clear()
+        self.assertIs(self._create().index, pp.index)
+        b = self._file("b", b"foo" * 1000)
+        self.assertTrue(os.path.samefile(a, b))
+
+        with patch.object(pp.index, "close") as close:
+            dedup._close()
+        close.assert_called_once_with()
+        pp.index.close()
+
+
 class DirectoryTest(BasePostprocessorTest):
 
     def test_default(self):
@@ -314,6 +413,114 @@ class ExecTest(BasePostprocessorTest):
         self.assertTrue(p.called)
         self.assertFalse(i.wait.called)
 
+    def test_async_max_processes(self):
+        pp = self._create({
+            "async"  : True,
+            "command": ["echo", "{num}"],
+            "archive": ":memory:",
+            "archive-format": "{num}",
+            "max-processes": 2,
+        })
+        procs = []
+
+        def popen(args, **kwargs):
+            proc = Mock()
+            proc.poll.return_value = None
+            proc.wait.return_value = 1 if args[1] == "2" else 0
+            procs.append(proc)
+            return proc
+
+        with patch("gallery_dl.util.Popen", popen), \
+                patch.object(pp.archive, "close"), \
+                self.assertLogs() as log:
+            for num in range(1, 5):
+                self.pathfmt.kwdict["num"] = num
+                self._trigger(("after",))
+
+            # wait for the oldest process before starting a new one
+            self.assertEqual([p.wait.called for p in procs],
+                             [True, True, False, False])
+            self.assertEqual(len(pp.procs), 2)
+
+            self._trigger(("finalize",))
+            self.assertTrue(all(p.wait.called for p in procs))
+            self.assertEqual(len(pp.procs), 0)
+
+        self.assertEqual(log.output, [
+            "WARNING:postprocessor.exec:"
+            "'['echo', '2']' returned with non-zero exit status (1)"])
+        self.assertEqual(sorted(pp.archive.entries()),
+                         ["generic1", "generic3", "generic4"])
+        pp.archive.close()
+
+    def test_async_max_processes_finished(self):
+        pp = self._create({
+            "async"  : True,
+            "command": ["echo", "{num}"],
+            "max-processes": 2,
+        })
+        procs = []
+
+        def popen(args, **kwargs):
+            proc = Mock()
+            proc.poll.return_value = None
+            proc.wait.return_value = 0
+            procs.append(proc)
+            return proc
+
+        with patch("gallery_dl.util.Popen", popen):
+            for num in range(1, 3):
+                self.pathfmt.kwdict["num"] = num
+                self._trigger(("after",))
+
+            # finished processes do not count towards the limit,
+            # regardless of their position
+            procs[1].poll.return_value = 0
+            self.pathfmt.kwdict["num"] = 3
+            self._trigger(("after",))
+            self.assertFalse(procs[0].wait.called)
+            self.assertEqual([c.proc for c in pp.procs],
+                             [procs[0], procs[2]])
+
+            self._trigger(("finalize",))
+            self.assertEqual(len(pp.procs), 0)
+
+    def test_async_many(self):
+        pp = self._create({
+            "async"   : True,
+            "commands": [["echo", "a", "{num}"], ["echo", "b", "{num}"]],
+            "archive" : ":memory:",
+            "archive-format": "{num}",
+            "max-processes" : 0,
+        })
+        started = []
+
+        def popen(args, **kwargs):
+            started.append(" ".join(args[1:]))
+            proc = Mock()
+            proc.poll.return_value = None
+            proc.wait.return_value = 1 if args[1:] == ["a", "2"] else 0
+            return proc
+
+        with patch("gallery_dl.util.Popen", popen), \
+                patch.object(pp.archive, "close"), \
+                self.assertLogs() as log:
+            for num in range(1, 4):
+                self.pathfmt.kwdict["num"] = num
+                self._trigger(("after",))
+            self.assertEqual(started, ["a 1", "a 2", "a 3"])
+            self.assertEqual(len(pp.procs), 3)
+
+            # stop a chain after a non-zero exit status
+            self._trigger(("finalize",))
+            self.assertEqual(started, ["a 1", "a 2", "a 3", "b 1", "b 3"])
+            self.assertEqual(len(pp.procs), 0)
+
+        self.assertEqual(len(log.output), 1)
+        self.assertEqual(sorted(pp.archive.entries()),
+                         ["generic1", "generic3"])
+        pp.archive.close()
+
     @unittest.skipIf(util.WINDOWS, "not POSIX")
     def test_session_posix(self):
         self._create({
@@ -459,6 +666,45 @@ class HashTest(BasePostprocessorTest):
             "3e1095b50736c4fd1e2deea152e3c8ecd5993462a747208e4d842659935a1c62",
             kwdict["b"], "sha512")
 
+    def test_stream(self):
+        pp = self._create({"hashes": "md5"})
+        self.assertEqual(len(self.job.hooks["stream"]), 1)
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        update = self.job.hooks["stream"][0](self.pathfmt)
+        update(b"Foo ")
+        update(b"Bar\n")
+
+        with patch.object(pp, "_open") as open:
+            self._trigger()
+            open.assert_not_called()
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_stream_incomplete(self):
+        # fall back to reading the file when not all data was streamed
+        pp = self._create({"hashes": "md5"})
+
+        with self.pathfmt.open() as fp:
+            fp.write(b"Foo Bar\n")
+
+        update = self.job.hooks["stream"][0](self.pathfmt)
+        update(b"Bar\n")
+
+        with patch.object(pp, "_open", wraps=pp._open) as open:
+            self._trigger()
+            open.assert_called_once()
+        self.assertEqual(
+            "35c9c9c7c90ad764bae9e2623f522c24", self.pathfmt.kwdict["md5"])
+
+    def test_stream_disabled(self):
+        self._create({"stream": False})
+        self.assertNotIn("stream", self.job.hooks)
+        self._create({"event": "prepare"})
+        self.assertNotIn("stream", self.job.hooks)
+
 
 class MetadataTest(BasePostprocessorTest):
 
@@ -907,6 +1153,95 @@ class MetadataTest(BasePostprocessorTest):
         m_aa.assert_called_once_with(self.pathfmt.kwdict)
         m_ac.assert_called_once()
 
+    def test_metadata_jsonl(self):
+        path = os.path.join(self.dir.name, "test", "jsonl.jsonl")
+        pp = self._create({
+            "mode"    : "jsonl",
+            "filename": "jsonl.jsonl",
+            "include" : ["id"],
+        })
+
+        with patch("builtins.open", wraps=open) as m:
+            for i in range(3):
+                self.pathfmt.kwdict["id"] = i
+                self._trigger()
+        m.assert_called_once_with(path, "a", encoding="utf-8", newline=None)
+
+        # flush pending writes
+        pp._flush_time = 0.0
+        self.pathfmt.kwdict["id"] = 3
+        self._trigger()
+        with open(path) as fp:
+            self.assertEqual(fp.read(), '{"id": 0}\n{"id": 1}\n{"id": 2}\n'
+                                        '{"id": 3}\n')
+
+        self.pathfmt.kwdict["id"] = 4
+        self._trigger()
+        self._trigger(("finalize",))
+        self.assertEqual(pp._handles, {})
+        with open(path) as fp:
+            self.assertEqual(len(fp.readlines()), 5)
+
+    def test_metadata_sqlite(self):
+        path = os.path.join(self.dir.name, "test", "metadata.sqlite3")
+        self._create({"mode": "sqlite"}, {
+            "imageurl": "https://example.org/1.jpg",
+            "_private": "foo",
+        })
+
+        self._trigger()
+        self.pathfmt.kwdict["_archive_key"] = "test2"
+        self._trigger()
+        self.pathfmt.kwdict["filename"] = "file2"
+        self._trigger()
+        self._trigger(("finalize",))
+
+        with sqlite3.connect(path) as db:
+            rows = db.execute(
+                "SELECT key, data FROM metadata ORDER BY key").fetchall()
+        self.assertEqual(rows, [
+            ("generichttps://example.org/1.jpg",
+             '{"category": "test", "filename": "file", "extension": "ext", '
+             '"imageurl": "https://example.org/1.jpg"}'),
+            ("test2",
+             '{"category": "test", "filename": "file2", "extension": "ext", '
+             '"imageurl": "https://example.org/1.jpg"}'),
+        ])
+
+    def test_metadata_sqlite_nofmt(self):
+        path = os.path.join(self.dir.name, "test", "metadata.sqlite3")
+        if os.path.exists(path):
+            os.unlink(path)
+        with patch.object(self.job.extractor, "archive_fmt", ""):
+            self._create({"mode": "sqlite"})
+
+        self.pathfmt.kwdict["_archive_key"] = "test"
+        self._trigger()
+        path1 = self.pathfmt.realpath
+        self.pathfmt.set_filename({
+            "category": "test", "filename": "file2", "extension": "ext"})
+        self.pathfmt.build_path()
+        self.pathfmt.kwdict["_archive_key"] = "test"
+        self._trigger()
+        path2 = self.pathfmt.realpath
+        self._trigger(("finalize",))
+
+        with sqlite3.connect(path) as db:
+            rows = db.execute(
+                "SELECT key FROM metadata ORDER BY key").fetchall()
+        self.assertEqual(rows, [(path1,), (path2,)])
+
+    def test_metadata_sqlite_stdout(self):
+        with self.assertLogs("postprocessor.metadata", "WARNING"):
+            self._create({"mode": "sqlite", "filename": "-"})
+
+        with patch("sys.stdout", Mock()) as m:
+            self._trigger()
+
+        self.assertEqual(self._output(m), """\
+{"category": "test", "filename": "file", "extension": "ext"}
+""")
+
     def _output(self, mock):
         return "".join(
             call[1][0]
@@ -1065,6 +1400,111 @@ class RenameTest(BasePostprocessorTest):
         self.assertEqual(sorted(os.listdir(path)), ["12345.ext", "file.ext"])
 
 
+class UgoiraTest(BasePostprocessorTest):
+
+    def _frames(self, num):
+        frames = [{"file": f"{i:>06}.jpg", "delay": 100} for i in range(num)]
+        for index in range(num):
+            pathfmt = copy.copy(self.job.pathfmt)
+            pathfmt.set_filename({
+                "category": "test", "filename": f"frame{index}",
+                "extension": "jpg", "_ugoira_frame_data": frames,
+                "_ugoira_frame_index": index})
+            for callback in self.job.hooks["prepare"]:
+                callback(pathfmt)
+            util.remove_file(pathfmt.realpath)
+            yield pathfmt
+
+    def _store(self, pathfmt):
+        os.makedirs(pathfmt.realdirectory, exist_ok=True)
+        with open(pathfmt.realpath, "w"):
+            pass
+
+    def _after(self, pathfmt):
+        for callback in self.job.hooks["after"]:
+            callback(pathfmt)
+
+    def test_ugoira_frames_skip(self):
+        pp = self._create()
+
+        with patch.object(pp, "convert", return_value=False) as convert:
+            for pathfmt in self._frames(3):
+                self._store(pathfmt)
+                # first frame already exists and gets skipped
+                if pathfmt.kwdict["_ugoira_frame_index"]:
+                    self._after(pathfmt)
+
+        convert.assert_called_once()
+        frames = convert.call_args[0][2]
+        self.assertEqual([frame["index"] for frame in frames], [0, 1, 2])
+
+    def test_ugoira_frames_unordered(self):
+        pp = self._create()
+
+        with patch.object(pp, "convert", return_value=False) as convert:
+            first, second, last = self._frames(3)
+            self._store(first)
+            self._after(first)
+            self._store(last)
+            self._after(last)
+            convert.assert_not_called()
+
+            # convert after the last frame file is in place
+            self._store(second)
+            self._after(second)
+            convert.assert_called_once()
+
+            self._after(last)
+            convert.assert_called_once()
+
+    def test_ugoira_parallel(self):
+        pp = self._create({"mode": "archive"})
+        started = threading.Barrier(2, timeout=5)
+        results = {}
+
+        def copy_file(src, dst):
+            # both conversions are in progress at the same time
+            started.wait()
+            shutil.copyfile(src, dst)
+
+        def convert(num):
+            frames = [{"file": f"{i:>06}.jpg", "delay": 100 * num}
+                      for i in range(2)]
+            zpath = os.path.join(self.dir.name, f"{num}.zip")
+            with zipfile.ZipFile(zpath, "w") as zfile:
+                for frame in frames:
+                    zfile.writestr(frame["file"], b"")
+
+            pathfmt = copy.copy(self.job.pathfmt)
+            pathfmt.set_filename({
+                "category": "test", "filename": str(num),
+                "extension": "zip", "_ugoira_frame_data": frames})
+            pathfmt.temppath = zpath
+            os.makedirs(pathfmt.realdirectory, exist_ok=True)
+            pp.prepare(pathfmt)
+            pp.convert_from_zip(pathfmt)
+            results[num] = pathfmt.realdirectory + f"{num}.cbz"
+
+        with patch.object(pp, "_copy_file", copy_file), \
+                patch.object(pp, "delete", False), \
+                patch.object(pp, "extension", "cbz"):
+            threads = [threading.Thread(target=convert, args=(num,))
+                       for num in (1, 2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # each result only contains its own frames
+        self.assertEqual(sorted(results), [1, 2])
+        for num, zpath in results.items():
+            with zipfile.ZipFile(zpath) as zfile:
+                frames = util.json_loads(
+                    zfile.read("animation.json").decode())
+            self.assertEqual([frame["delay"] for frame in frames],
+                             [100 * num, 100 * num])
+
+
 class ZipTest(BasePostprocessorTest):
 
     def test_zip_default(self):
@@ -556,6 +556,11 @@ def load_test_config():
     except Exception as exc:
         sys.exit(f"Error when loading {path}: {exc.__class__.__name__}: {exc}")
 
+    # record or replay HTTP responses
+    for mode in ("record", "replay"):
+        if path := os.environ.get(f"GDL_TEST_{mode.upper()}"):
+            CONFIG.setdefault("extractor", {})[f"http-{mode}"] = path
+
 
 def result_categories(result):
     categories = result.get("#category")